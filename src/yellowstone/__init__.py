@@ -10,7 +10,7 @@ __author__ = "Ryan Sweet"
 
 from .models import CypherQuery, KQLQuery, TranslationContext
 from .translator.translator import CypherToKQLTranslator, translate
-from .main_translator import CypherTranslator, TranslationError
+from .main_translator import CypherTranslator, QueryRejectedError, TranslationError
 
 __all__ = [
     "CypherToKQLTranslator",
@@ -20,4 +20,5 @@ __all__ = [
     "TranslationContext",
     "CypherTranslator",
     "TranslationError",
+    "QueryRejectedError",
 ]
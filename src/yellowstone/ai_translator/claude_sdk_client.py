@@ -73,7 +73,7 @@ make-graph Syntax:
 
 graph-match Syntax:
   Graph | graph-match [cycles=all|none|unique_edges] Pattern [where Constraints] project Expression
-  - Pattern: (n:Label) for nodes, -[e:Type]-> for edges
+  - Pattern: (n:Label) for nodes, -[e]-> for edges; types as where e.EdgeType == 'Type'
   - Variable length: -[e*3..5]- for repeated patterns
   - Must include project clause for output
 
@@ -82,7 +82,7 @@ graph-match Syntax:
 Translation Pattern:
 1. Source table (e.g., IdentityInfo, SignInLogs)
 2. make-graph with node ID: | make-graph UserId with_node_id=AccountObjectId
-3. Pattern match: | graph-match (u:User)-[r:LOGGED_IN]->(d:Device)
+3. Pattern match: | graph-match (u:User)-[r]->(d:Device) where r.EdgeType == 'LOGGED_IN'
 4. Filters: | where u.dept == 'IT'
 5. Output: | project u.name, d.hostname
 
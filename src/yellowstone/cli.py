@@ -18,7 +18,7 @@ from rich.syntax import Syntax
 from rich.table import Table
 from rich.panel import Panel
 
-from .parser import parse_query
+from .parser import parse_query, parse_query_cached
 from .translator import translate, CypherToKQLTranslator
 from .schema import SchemaValidator, SchemaMapping
 from .models import KQLQuery
@@ -523,7 +523,7 @@ def _print_repl_help():
 def _repl_translate_query(query: str, translator: CypherToKQLTranslator):
     """Translate a query in REPL mode."""
     try:
-        ast = parse_query(query)
+        ast = parse_query_cached(query)
         kql_result = translate(ast)
 
         console.print("\n[green]Translation successful![/green]")
@@ -544,7 +544,7 @@ def _repl_translate_query(query: str, translator: CypherToKQLTranslator):
 def _repl_show_ast(query: str):
     """Show AST for a query in REPL mode."""
     try:
-        ast = parse_query(query)
+        ast = parse_query_cached(query)
         console.print("\n[green]AST:[/green]")
         console.print(Panel(str(ast), expand=False))
         console.print()
@@ -4,13 +4,56 @@ Main translator for Cypher and Gremlin to KQL.
 
 from typing import Optional
 import re
-from .models import CypherQuery, KQLQuery, TranslationContext, TranslationStrategy
+from .models import (
+    DEFAULT_MAX_SNAPSHOT_STALENESS,
+    CypherQuery,
+    KQLQuery,
+    TranslationContext,
+    TranslationStrategy,
+)
 from .parser.parser import parse_query
-from .parser.ast_nodes import Query, WhereClause
+from .parser.parse_cache import ParseCache, get_default_parse_cache
+from .parser.ast_nodes import (
+    AliasedExpression,
+    Identifier,
+    Property,
+    Query,
+    ReturnClause,
+    WhereClause,
+)
 from .schema.schema_mapper import SchemaMapper
 from .translator.graph_match import GraphMatchTranslator
 from .translator.where_clause import WhereClauseTranslator
 from .translator.return_clause import ReturnClauseTranslator
+from .translator.query_template import QueryTemplate, TemplateCache, UNTEMPLATABLE
+from .translator.cost_model import CostEstimate, CostEstimator
+from .translator.graph_snapshots import select_graph_snapshot
+from .translator.guardrails import GuardrailDecision, GuardrailEngine, QueryBudget
+from .translator.join_pipeline import JoinPlan, plan_join_pipeline, render_join_pipeline
+from .translator.paths import is_reachability_query
+from .translator.time_window import context_window_key, format_timespan, time_window_predicate
+from .translator.graph_construction import (
+    EdgeSource,
+    plan_edge_sources,
+    render_graph_construction,
+    table_pipeline,
+)
+from .translator.condition_optimizer import (
+    condition_properties,
+    condition_variables,
+    conjoin,
+    map_properties,
+    split_conjuncts,
+    type_literals,
+)
+from .translator.kql_formatter import format_kql, minify_kql
+from .translator.request_properties import request_property_statements
+from .translator.query_parameters import QueryParameter, declare_parameters, render_declaration
+from .translator.string_operators import select_string_operators
+
+# Relative error assumed for results over sampled source tables, which
+# depends on the data and so is not known exactly
+SAMPLE_ERROR = 0.2
 
 # Gremlin support (optional)
 try:
@@ -26,6 +69,18 @@ class TranslationError(Exception):
     pass
 
 
+class QueryRejectedError(TranslationError):
+    """Raised when guardrails reject a query.
+
+    Attributes:
+        decision: GuardrailDecision with the violations that caused the rejection
+    """
+
+    def __init__(self, decision: GuardrailDecision):
+        super().__init__(f"Query rejected by guardrails: {decision.reason}")
+        self.decision = decision
+
+
 class CypherTranslator:
     """
     Translates Cypher queries to KQL using native graph operators.
@@ -36,15 +91,71 @@ class CypherTranslator:
     - Fallback (5%): Join-based translation
     """
 
-    def __init__(self, enable_ai: bool = True, schema_path: Optional[str] = None):
+    def __init__(
+        self,
+        enable_ai: bool = True,
+        schema_path: Optional[str] = None,
+        enable_parse_cache: bool = True,
+        enable_template_cache: bool = True,
+        enable_predicate_pushdown: bool = True,
+        enable_projection_pruning: bool = True,
+        enable_aggregation_pushdown: bool = True,
+        enable_guardrails: bool = True,
+        enable_join_fallback: bool = True,
+        enable_shortest_paths: bool = True,
+        enable_materialize: bool = True,
+        enable_typed_literals: bool = True,
+        enable_approximate_contains: bool = False,
+        default_budget: Optional[QueryBudget] = None,
+        tenant_budgets: Optional[dict[str, QueryBudget]] = None,
+    ):
         """
         Initialize the translator.
 
         Args:
             enable_ai: Enable agentic AI translation for complex patterns
             schema_path: Path to schema YAML file (None for default)
+            enable_parse_cache: Reuse parsed ASTs from the shared parse cache
+            enable_template_cache: Reuse translations of queries that differ only
+                in literal values
+            enable_predicate_pushdown: Apply single-variable WHERE predicates to
+                source tables before make-graph
+            enable_projection_pruning: Project source tables down to the columns
+                the query uses before make-graph
+            enable_aggregation_pushdown: Summarize single-node patterns directly
+                on their source table instead of building a graph
+            enable_guardrails: Cap, downgrade or reject queries that exceed the
+                tenant's budget before translating them
+            enable_join_fallback: Translate fixed-length patterns as a pipeline of
+                shuffle joins when the cost model rates it cheaper than make-graph
+            enable_shortest_paths: Answer reachability queries, whose results
+                do not depend on how many paths connect two nodes, with
+                graph-shortest-paths instead of enumerating every path
+            enable_materialize: Wrap source tables the generated query reads
+                more than once in materialize(), so each is scanned once
+            enable_typed_literals: Type WHERE literals by their column's schema
+                type (datetime(), int(), ...) so comparisons can prune extents
+            enable_approximate_contains: Answer CONTAINS on whole terms from the
+                term index (has_cs), which misses matches inside longer terms
+                ('admin' in 'administrator'); off by default
+            default_budget: Budget for tenants without their own (None for QueryBudget())
+            tenant_budgets: Budgets by tenant id
         """
         self.enable_ai = enable_ai
+        self.enable_predicate_pushdown = enable_predicate_pushdown
+        self.enable_projection_pruning = enable_projection_pruning
+        self.enable_aggregation_pushdown = enable_aggregation_pushdown
+        self.enable_join_fallback = enable_join_fallback
+        self.enable_shortest_paths = enable_shortest_paths
+        self.enable_materialize = enable_materialize
+        self.enable_typed_literals = enable_typed_literals
+        self.enable_approximate_contains = enable_approximate_contains
+        self.parse_cache: Optional[ParseCache] = (
+            get_default_parse_cache() if enable_parse_cache else None
+        )
+        self.template_cache: Optional[TemplateCache] = (
+            TemplateCache() if enable_template_cache else None
+        )
 
         # Initialize schema mapper
         try:
@@ -52,6 +163,12 @@ class CypherTranslator:
         except Exception as e:
             raise TranslationError(f"Failed to load schema: {e}")
 
+        self.cost_estimator = CostEstimator(self.schema_mapper)
+        self.guardrails: Optional[GuardrailEngine] = (
+            GuardrailEngine(self.cost_estimator, default_budget, tenant_budgets)
+            if enable_guardrails else None
+        )
+
         # Initialize component translators
         self.graph_match_translator = GraphMatchTranslator()
         self.where_clause_translator = WhereClauseTranslator()
@@ -73,45 +190,98 @@ class CypherTranslator:
             Translated KQL query with metadata
 
         Raises:
+            QueryRejectedError: If guardrails reject the query
             TranslationError: If translation fails
         """
         try:
             # Step 1: Detect language and parse to AST
-            query_str = cypher.query.strip()
-
-            if query_str.startswith("g.") or query_str.startswith("g "):
-                # Gremlin query - parse and bridge to Cypher AST
-                if not GREMLIN_AVAILABLE:
-                    raise TranslationError("Gremlin support not available")
-
-                gremlin_ast = parse_gremlin(query_str)
-                ast = translate_gremlin_to_cypher(gremlin_ast)
-            else:
-                # Cypher query - parse directly
-                ast = parse_query(query_str)
-
-            # Step 2: Determine translation strategy
+            ast = self._parse(cypher)
+
+            # Step 1a: Route pure reachability queries to graph-shortest-paths
+            if self.enable_shortest_paths and is_reachability_query(ast):
+                path = ast.match_clause.paths[0].model_copy(update={"shortest": "any"})
+                match_clause = ast.match_clause.model_copy(update={"paths": [path]})
+                ast = ast.model_copy(update={"match_clause": match_clause})
+
+            # Step 1b: Type WHERE literals by the schema types of their columns
+            # and choose the cheapest string operators
+            if self.enable_typed_literals:
+                ast = self._type_literals(ast)
+            ast = self._select_string_operators(ast)
+
+            # Step 1c: Apply the tenant's guardrails, which may rewrite the
+            # query or narrow its time window
+            violations = []
+            estimate = None
+            if self.guardrails is not None:
+                decision = self.guardrails.evaluate(ast, context)
+                if not decision.allowed:
+                    raise QueryRejectedError(decision)
+                ast, context = decision.query, decision.context
+                violations, estimate = decision.violations, decision.estimate
+
+            # Step 2: Determine translation strategy; a join pipeline replaces
+            # make-graph when the cost model rates it cheaper
             strategy = self._classify_query_complexity(ast)
+            join_fallback = self._plan_join_fallback(ast, context, strategy)
+            if join_fallback is not None:
+                strategy = TranslationStrategy.FALLBACK
 
             # Step 3: Translate using fast path (for now, AI path not implemented)
-            if strategy == TranslationStrategy.FAST_PATH:
-                kql_query_str = self._translate_fast_path(ast, cypher)
+            if join_fallback is not None:
+                join_plan, estimate = join_fallback
+                kql_query_str = self._translate_join_pipeline(ast, join_plan, context)
+                confidence = 0.70
+            elif strategy == TranslationStrategy.FAST_PATH:
+                kql_query_str = self._translate_templated(ast, cypher, context)
                 confidence = 0.95
             elif strategy == TranslationStrategy.AI_PATH and self.enable_ai:
                 # AI path not yet implemented, fall back to fast path
-                kql_query_str = self._translate_fast_path(ast, cypher)
+                kql_query_str = self._translate_templated(ast, cypher, context)
                 confidence = 0.80
             else:
                 # Fallback path
-                kql_query_str = self._translate_fast_path(ast, cypher)
+                kql_query_str = self._translate_templated(ast, cypher, context)
                 confidence = 0.70
 
-            # Step 4: Create KQL query object
+            # Step 3a: Declare the query's parameters; their values are
+            # returned separately so the text is shared by every execution
+            parameters = self._declare_parameters(ast, cypher)
+            if parameters:
+                kql_query_str = f"{render_declaration(parameters)}\n{kql_query_str}"
+
+            # Step 3b: Set the context's request properties ahead of the query
+            statements = request_property_statements(context)
+            if statements:
+                kql_query_str = "\n".join(statements + [kql_query_str])
+
+            # Step 3c: Emit canonical text, so equal queries are equal bytes
+            kql_query_str = (
+                minify_kql(kql_query_str) if context.minify else format_kql(kql_query_str)
+            )
+
+            # Step 4: Create KQL query object with its cost estimate, flagged
+            # if the estimate is over the context's latency budget, and marked
+            # approximate if it uses estimating aggregates or sampled rows
+            if estimate is None:
+                estimate = self.cost_estimator.estimate(ast, context)
+            approximations = self.return_clause_translator.approximations(
+                ast.return_clause, context.approximate
+            )
+            if context.sample_rows is not None:
+                approximations.append("sample")
+            confidence = self._approximate_confidence(confidence, approximations, context)
             kql = KQLQuery(
                 query=kql_query_str,
                 strategy=strategy,
                 confidence=confidence,
-                estimated_execution_time_ms=None  # Could be estimated from query complexity
+                estimated_execution_time_ms=estimate.execution_time_ms,
+                estimated_scanned_rows=estimate.scanned_rows,
+                over_budget=not estimate.within_budget(context.max_execution_time_ms),
+                guardrail_violations=violations,
+                approximate=bool(approximations),
+                approximations=approximations,
+                parameters={p.kql_name: cypher.parameters[p.name] for p in parameters},
             )
 
             # Step 5: Validate the generated KQL
@@ -120,11 +290,165 @@ class CypherTranslator:
 
             return kql
 
+        except QueryRejectedError:
+            raise
         except SyntaxError as e:
             raise TranslationError(f"Failed to parse Cypher query: {e}")
         except Exception as e:
             raise TranslationError(f"Translation failed: {e}")
 
+    def _approximate_confidence(
+        self, confidence: float, approximations: list[str], context: TranslationContext
+    ) -> float:
+        """
+        Lower a translation's confidence by the error of its approximations.
+
+        Each estimating aggregate scales the confidence by one minus its
+        relative error (dcount's follows the context's accuracy level);
+        sampled source tables assume SAMPLE_ERROR.
+
+        Args:
+            confidence: Confidence of the exact translation
+            approximations: Approximations applied, as listed on KQLQuery
+            context: Translation context
+
+        Returns:
+            Confidence of the approximate translation
+        """
+        for approximation in approximations:
+            if approximation == "sample":
+                error = SAMPLE_ERROR
+            else:
+                error = self.return_clause_translator.approximation_error(
+                    approximation, context.dcount_accuracy
+                )
+            confidence *= 1 - error
+        return round(confidence, 4)
+
+    def _type_literals(self, ast: Query) -> Query:
+        """
+        Type the WHERE clause's literals by the schema types of their columns.
+
+        Args:
+            ast: Parsed query
+
+        Returns:
+            Query whose comparisons keep the property on the left and compare
+            it with literals of the column's type (see type_literals)
+        """
+        if ast.where_clause is None or ast.match_clause is None:
+            return ast
+
+        labels: dict[str, str] = {}
+        for path in ast.match_clause.paths:
+            for node in path.nodes:
+                if node.variable and node.labels:
+                    labels.setdefault(str(node.variable), str(node.labels[0]))
+
+        def resolve(variable: str, prop: str) -> Optional[str]:
+            if variable not in labels:
+                return None
+            field = self.schema_mapper.get_property_field(labels[variable], prop)
+            return field["type"] if field else None
+
+        conditions = type_literals(ast.where_clause.conditions, resolve)
+        if conditions == ast.where_clause.conditions:
+            return ast
+        where_clause = ast.where_clause.model_copy(update={"conditions": conditions})
+        return ast.model_copy(update={"where_clause": where_clause})
+
+    def _select_string_operators(self, ast: Query) -> Query:
+        """
+        Replace CONTAINS, STARTS WITH and ENDS WITH with KQL string operators.
+
+        Args:
+            ast: Parsed query
+
+        Returns:
+            Query using the cheapest operators allowed by
+            enable_approximate_contains (see select_string_operators)
+        """
+        if ast.where_clause is None:
+            return ast
+        conditions = select_string_operators(
+            ast.where_clause.conditions, approximate=self.enable_approximate_contains
+        )
+        if conditions == ast.where_clause.conditions:
+            return ast
+        where_clause = ast.where_clause.model_copy(update={"conditions": conditions})
+        return ast.model_copy(update={"where_clause": where_clause})
+
+    def _declare_parameters(self, ast: Query, cypher: CypherQuery) -> list[QueryParameter]:
+        """
+        Type the query parameters a query references.
+
+        Args:
+            ast: Parsed query
+            cypher: Original query, supplying parameter values
+
+        Returns:
+            QueryParameters to declare (see declare_parameters)
+        """
+        def resolve(label: str, prop: str) -> Optional[str]:
+            field = self.schema_mapper.get_property_field(label, prop)
+            return field["type"] if field else None
+
+        return declare_parameters(ast, cypher.parameters, resolve)
+
+    def estimate_cost(
+        self, cypher: CypherQuery, context: Optional[TranslationContext] = None
+    ) -> CostEstimate:
+        """
+        Estimate the cost of a query without translating it.
+
+        Use for admission control, e.g. comparing the estimate against
+        ``context.max_execution_time_ms`` before submitting the query.
+
+        Args:
+            cypher: Input Cypher query
+            context: Translation context supplying the time window
+
+        Returns:
+            Estimated scanned rows, matched paths and latency
+
+        Raises:
+            TranslationError: If the query cannot be parsed
+        """
+        try:
+            ast = self._parse(cypher)
+        except SyntaxError as e:
+            raise TranslationError(f"Failed to parse Cypher query: {e}")
+        return self.cost_estimator.estimate(ast, context)
+
+    def _parse(self, cypher: CypherQuery) -> Query:
+        """
+        Parse a Cypher or Gremlin query into a Cypher AST.
+
+        Args:
+            cypher: Input query
+
+        Returns:
+            Parsed query AST
+
+        Raises:
+            TranslationError: If Gremlin support is unavailable
+            SyntaxError: If the query cannot be parsed
+        """
+        query_str = cypher.query.strip()
+
+        if query_str.startswith("g.") or query_str.startswith("g "):
+            # Gremlin query - parse and bridge to Cypher AST
+            if not GREMLIN_AVAILABLE:
+                raise TranslationError("Gremlin support not available")
+
+            gremlin_ast = parse_gremlin(query_str)
+            return translate_gremlin_to_cypher(gremlin_ast)
+
+        # Cypher query - parse directly, reusing cached ASTs when enabled
+        if self.parse_cache is not None:
+            return self.parse_cache.get_or_parse(query_str)
+        return parse_query(query_str)
+
     def _classify_query_complexity(self, ast: Query) -> TranslationStrategy:
         """
         Classify query complexity to determine translation strategy.
@@ -161,143 +485,804 @@ class CypherTranslator:
         return TranslationStrategy.FALLBACK
 
     def _is_complex_condition(self, condition: dict, depth: int, max_depth: int = 3) -> bool:
-        """Check if a condition is complex (deeply nested)."""
-        if depth > max_depth:
-            return True
+        """Check if a condition is complex (deeply nested).
 
-        if condition.get("type") == "logical":
-            # Check operands recursively
-            operands = condition.get("operands", [])
-            for operand in operands:
-                if isinstance(operand, dict) and self._is_complex_condition(operand, depth + 1, max_depth):
-                    return True
+        Nesting is measured with an explicit stack, so very deep condition
+        trees are classified without recursion.
+        """
+        stack = [(condition, depth)]
+        while stack:
+            node, level = stack.pop()
+            if level > max_depth:
+                return True
+
+            if node.get("type") == "logical":
+                operands = node.get("operands")
+                if operands is None:
+                    operands = [node.get("left"), node.get("right")]
+                stack.extend(
+                    (operand, level + 1) for operand in operands if isinstance(operand, dict)
+                )
 
         return False
 
-    def _translate_fast_path(self, ast: Query, cypher: CypherQuery) -> str:
+    def _plan_join_fallback(
+        self,
+        ast: Query,
+        context: Optional[TranslationContext],
+        strategy: TranslationStrategy,
+    ) -> Optional[tuple[JoinPlan, CostEstimate]]:
+        """
+        Decide whether to translate a query as a join pipeline.
+
+        Queries classified as FALLBACK use a join pipeline whenever one can be
+        planned; others use it only when its estimated latency is lower than
+        the make-graph translation's.
+
+        Args:
+            ast: Parsed query AST
+            context: Translation context (supplies the time window)
+            strategy: Strategy chosen by complexity classification
+
+        Returns:
+            Tuple of (join plan, its cost estimate), or None to use make-graph
+        """
+        if not self.enable_join_fallback:
+            return None
+
+        plan = plan_join_pipeline(ast, self.schema_mapper, self.cost_estimator, context)
+        if plan is None:
+            return None
+
+        join_estimate = self.cost_estimator.estimate_joins(ast, plan.join_sizes(), context)
+        if strategy != TranslationStrategy.FALLBACK:
+            graph_estimate = self.cost_estimator.estimate(ast, context)
+            if join_estimate.execution_time_ms >= graph_estimate.execution_time_ms:
+                return None
+        return plan, join_estimate
+
+    def _translate_join_pipeline(
+        self,
+        ast: Query,
+        plan: JoinPlan,
+        context: Optional[TranslationContext] = None,
+    ) -> str:
+        """
+        Translate using a pipeline of joins instead of make-graph.
+
+        Each node variable's table is bounded to the time window and filtered
+        by the WHERE conjuncts that reference only that variable; remaining
+        conditions are applied after the joins. Properties the remaining
+        conditions and RETURN read are copied to columns named after them
+        before each row is packed, so ``u.username`` resolves in the packed
+        row as it does after graph-match.
+
+        Args:
+            ast: Parsed query AST
+            plan: Join plan from plan_join_pipeline
+            context: Translation context (supplies the time window)
+
+        Returns:
+            KQL query string
+        """
+        labels = {}
+        for path in ast.match_clause.paths:
+            for node in path.nodes:
+                if node.variable and node.labels:
+                    labels[str(node.variable)] = str(node.labels[0])
+
+        def resolve(variable: str, prop: str) -> Optional[str]:
+            field = self.schema_mapper.get_property_field(labels[variable], prop)
+            return field["sentinel_field"] if field else None
+
+        variable_filters: dict[str, list[str]] = {}
+        for variable, table in plan.tables.items():
+            window = self._time_window_filter(table, context)
+            if window:
+                variable_filters[variable] = [window]
+
+        conditions = ast.where_clause.conditions if ast.where_clause else None
+        pushed: dict[str, list] = {}
+        remaining = []
+        for conjunct in split_conjuncts(conditions):
+            variables = condition_variables(conjunct)
+            variable = next(iter(variables)) if len(variables) == 1 else None
+            mapped = None
+            if self.enable_predicate_pushdown and variable in labels:
+                mapped = map_properties(conjunct, resolve)
+            if mapped is None:
+                remaining.append(conjunct)
+            else:
+                pushed.setdefault(variable, []).append(mapped)
+
+        let_statements: list[str] = []
+        for variable, items in pushed.items():
+            table_kql, _ = self.where_clause_translator.translate_with_bindings(
+                conjoin(items), let_statements
+            )
+            variable_filters.setdefault(variable, []).append(table_kql)
+
+        residual = conjoin(remaining)
+        where_kql = ""
+        if residual:
+            where_kql, _ = self.where_clause_translator.translate_with_bindings(
+                residual, let_statements
+            )
+
+        node_tables = self._resolve_node_tables(ast.match_clause)
+        table_columns = self._plan_projection(ast, residual, node_tables, list(node_tables))
+        for variable, columns in plan.keys.items():
+            table = plan.tables[variable]
+            if table in table_columns:
+                table_columns[table] = table_columns[table] + [
+                    column for column in columns if column not in table_columns[table]
+                ]
+
+        references = condition_properties(residual) if residual else set()
+        references |= self._return_references(ast) or set()
+        variable_properties: dict[str, dict[str, str]] = {}
+        for variable, prop in sorted(references, key=lambda ref: (ref[0], ref[1] or "")):
+            if prop is None or variable not in plan.tables or variable not in labels:
+                continue
+            column = resolve(variable, prop)
+            if column is not None and column != prop:
+                variable_properties.setdefault(variable, {})[prop] = column
+
+        sample_rows = context.sample_rows if context is not None else None
+        kql_parts = list(let_statements)
+        kql_parts.append(
+            render_join_pipeline(
+                plan,
+                variable_filters,
+                table_columns,
+                sample_rows,
+                self.enable_materialize,
+                variable_properties,
+            )
+        )
+        if where_kql:
+            kql_parts.append(f"| where {where_kql}")
+        kql_parts.append(f"| {self._translate_return(ast.return_clause, context)}")
+        return "\n".join(kql_parts)
+
+    @staticmethod
+    def _return_references(ast: Query) -> Optional[set[tuple[str, Optional[str]]]]:
+        """
+        Collect the (variable, property) pairs RETURN items and ORDER BY use.
+
+        Args:
+            ast: Parsed query AST
+
+        Returns:
+            References, with None as the property of whole variables, or None
+            if a return item has an unsupported form
+        """
+        references: set[tuple[str, Optional[str]]] = set()
+        for item in ast.return_clause.items:
+            if isinstance(item, AliasedExpression):
+                item = item.expression
+            if isinstance(item, Property):
+                references.add((item.variable.name, item.property_name.name))
+            elif isinstance(item, Identifier):
+                references.add((item.name, None))
+            elif isinstance(item, dict):
+                item_references = condition_properties(item)
+                if str(item.get("name", "")).upper() == "COUNT":
+                    # count(n) counts rows and needs no columns of n
+                    item_references = {ref for ref in item_references if ref[1] is not None}
+                references |= item_references
+            else:
+                return None
+
+        for order in ast.return_clause.order_by or []:
+            variable, _, prop = str(order.get("expression", "")).partition(".")
+            references.add((variable, prop or None))
+        return references
+
+    def _translate_templated(
+        self,
+        ast: Query,
+        cypher: CypherQuery,
+        context: Optional[TranslationContext] = None,
+    ) -> str:
+        """
+        Translate via the template cache when enabled.
+
+        Literals are lifted out of the AST and the resulting skeleton is looked
+        up by fingerprint. On a miss the skeleton is translated once and checked
+        against a direct translation; shapes whose output depends on literal
+        values are remembered as untemplatable and always translated directly.
+        The context's time window, approximation, cycles and snapshot
+        staleness settings are part of the cache key.
+
+        Args:
+            ast: Parsed query AST
+            cypher: Original Cypher query
+            context: Translation context
+
+        Returns:
+            KQL query string
+        """
+        if self.template_cache is None:
+            return self._translate_fast_path(ast, cypher, context)
+
+        template = QueryTemplate.from_query(ast)
+        cache_key = template.fingerprint
+        window_key = context_window_key(context)
+        if window_key:
+            cache_key = f"{cache_key}|{window_key}"
+        if context is not None and context.approximate:
+            cache_key = (
+                f"{cache_key}|approximate={context.dcount_accuracy}:{context.sample_rows}"
+            )
+        if context is not None and context.path_cycles:
+            cache_key = f"{cache_key}|cycles={context.path_cycles}"
+        if (
+            context is not None
+            and context.max_snapshot_staleness != DEFAULT_MAX_SNAPSHOT_STALENESS
+        ):
+            cache_key = f"{cache_key}|staleness={context.max_snapshot_staleness}"
+        skeleton_kql = self.template_cache.get(cache_key)
+
+        if skeleton_kql is None:
+            skeleton_kql = self._translate_fast_path(template.skeleton, cypher, context)
+            direct_kql = self._translate_fast_path(ast, cypher, context)
+            if template.render(skeleton_kql) != direct_kql:
+                skeleton_kql = UNTEMPLATABLE
+            self.template_cache.put(cache_key, skeleton_kql)
+            return direct_kql
+
+        if skeleton_kql == UNTEMPLATABLE:
+            return self._translate_fast_path(ast, cypher, context)
+
+        return template.render(skeleton_kql)
+
+    def _translate_fast_path(
+        self,
+        ast: Query,
+        cypher: CypherQuery,
+        context: Optional[TranslationContext] = None,
+    ) -> str:
         """
         Translate using fast path (direct graph operator translation).
 
         Args:
             ast: Parsed query AST
             cypher: Original Cypher query
+            context: Translation context (supplies the time window)
 
         Returns:
-            KQL query string with proper make-graph preamble
+            KQL query string with proper make-graph preamble, or a graph()
+            reference when a declared snapshot covers the pattern
         """
+        table_aggregation = self._translate_table_aggregation(ast, context)
+        if table_aggregation is not None:
+            return table_aggregation
+
         kql_parts = []
 
+        # Graphs are built from every node table the pattern references, plus
+        # edge tables derived from the schema joins of its relationships. A
+        # covering graph snapshot reads no tables, so every WHERE condition
+        # stays on graph-match.
+        snapshot = select_graph_snapshot(ast.match_clause, self.schema_mapper, context)
+        node_tables = self._resolve_node_tables(ast.match_clause)
+        edge_sources = None
+        source_tables: list[str] = []
+        if snapshot is None:
+            edge_sources = plan_edge_sources(ast.match_clause, self.schema_mapper, node_tables)
+            has_relationships = any(path.relationships for path in ast.match_clause.paths)
+            if edge_sources is None and has_relationships and len(node_tables) > 1:
+                raise ValueError(
+                    f"Cannot build edges between tables {', '.join(node_tables)}: every "
+                    "relationship must have a type with a sentinel_join between them"
+                )
+            source_tables = list(node_tables)
+
+        # Source tables are filtered before make-graph: first to the time
+        # window, then by pushed-down WHERE predicates
+        table_filters: dict[str, list[str]] = {}
+        for table in source_tables:
+            window = self._time_window_filter(table, context)
+            if window:
+                table_filters.setdefault(table, []).append(window)
+
+        # Translate WHERE first: large value sets are hoisted into let
+        # statements that must precede the tabular expression
+        table_conditions, graph_conditions = self._plan_predicate_pushdown(ast, source_tables)
+
+        let_statements: list[str] = []
+        for table, conditions in table_conditions.items():
+            table_kql, _ = self.where_clause_translator.translate_with_bindings(
+                conditions, let_statements
+            )
+            table_filters.setdefault(table, []).append(table_kql)
+
+        where_kql = ""
+        if graph_conditions:
+            where_kql, _ = self.where_clause_translator.translate_with_bindings(
+                graph_conditions, let_statements
+            )
+        kql_parts.extend(let_statements)
+
+        # Keep only the columns the graph needs; filters above run first, so
+        # columns used solely by pushed-down predicates are dropped
+        table_columns = self._plan_projection(
+            ast, graph_conditions, node_tables, source_tables, edge_sources
+        )
+
         # Step 1: Generate make-graph preamble with proper table references
-        make_graph_kql = self._generate_make_graph_preamble(ast.match_clause)
+        if snapshot is not None:
+            make_graph_kql = snapshot.render()
+        else:
+            make_graph_kql = self._generate_make_graph_preamble(
+                ast.match_clause,
+                table_filters,
+                table_columns,
+                edge_sources,
+                context.sample_rows if context is not None else None,
+            )
         if make_graph_kql:
             kql_parts.append(make_graph_kql)
 
         # Step 2: Translate MATCH clause to graph-match pattern
-        match_kql = self.graph_match_translator.translate(ast.match_clause)
+        match_kql = self.graph_match_translator.translate(
+            ast.match_clause, context.path_cycles if context is not None else None
+        )
         kql_parts.append(f"| {match_kql}")
 
-        # Step 3: Translate WHERE clause if present
-        if ast.where_clause:
-            where_kql = self.where_clause_translator.translate(ast.where_clause.conditions)
-            if where_kql:
-                kql_parts.append(f"| where {where_kql}")
+        # Step 3: Apply the remaining WHERE filter if present
+        if where_kql:
+            kql_parts.append(f"| where {where_kql}")
 
         # Step 4: Translate RETURN clause
-        return_kql = self.return_clause_translator.translate(ast.return_clause)
+        return_kql = self._translate_return(ast.return_clause, context)
         kql_parts.append(f"| {return_kql}")
 
         # Combine all parts
         return "\n".join(kql_parts)
 
-    def _generate_make_graph_preamble(self, match_clause) -> str:
+    def _translate_table_aggregation(
+        self, ast: Query, context: Optional[TranslationContext] = None
+    ) -> Optional[str]:
         """
-        Generate KQL make-graph preamble from MATCH clause.
+        Translate an aggregate over a single node pattern directly on its table.
 
-        Extracts all node labels from the MATCH clause and generates the appropriate
-        Sentinel table references with make-graph statements.
+        ``MATCH (e:SecurityEvent) WHERE ... RETURN count(e)`` needs no graph:
+        the source table is filtered and summarized, so rows are reduced
+        before anything is materialized. Grouping keys are named as in the
+        graph translation (``u_domain`` for ``u.domain``), so both produce the
+        same columns. Patterns with relationships keep summarize after
+        graph-match, because their aggregates count paths, not rows.
 
         Args:
-            match_clause: MatchClause AST node
+            ast: Parsed query AST
+            context: Translation context (supplies the time window)
 
         Returns:
-            KQL make-graph preamble string, or empty string if no tables found
+            KQL query string, or None if the query is not a single labeled
+            node whose WHERE and RETURN properties all map to table columns
+        """
+        match_clause = ast.match_clause
+        if (
+            not self.enable_aggregation_pushdown
+            or match_clause.optional
+            or len(match_clause.paths) != 1
+            or len(match_clause.paths[0].nodes) != 1
+            or not self.return_clause_translator.has_aggregation(ast.return_clause)
+        ):
+            return None
+
+        node = match_clause.paths[0].nodes[0]
+        if not node.labels or node.properties:
+            return None
+        label = str(node.labels[0])
+        table = self.schema_mapper.get_sentinel_table(label)
+        if table is None:
+            return None
+        variable = str(node.variable) if node.variable else None
+
+        def resolve(name: str, prop: str) -> Optional[str]:
+            if name != variable:
+                return None
+            field = self.schema_mapper.get_property_field(label, prop)
+            return field["sentinel_field"] if field else None
+
+        def map_expression(expression) -> Optional[dict]:
+            if isinstance(expression, Property):
+                expression = {
+                    "type": "property",
+                    "variable": expression.variable.name,
+                    "property": expression.property_name.name,
+                }
+            if not isinstance(expression, dict):
+                return None
+            arguments = expression.get("arguments") or []
+            if (
+                expression.get("type") == "function"
+                and str(expression.get("name", "")).upper() == "COUNT"
+                and not expression.get("distinct")
+                and len(arguments) == 1
+                and isinstance(arguments[0], dict)
+                and arguments[0] == {"type": "identifier", "name": variable}
+            ):
+                # count(n) counts the rows bound to n
+                return {**expression, "arguments": []}
+            return map_properties(expression, resolve)
+
+        items = []
+        renamed: dict[str, str] = {}
+        for item in ast.return_clause.items:
+            if isinstance(item, AliasedExpression):
+                mapped = map_expression(item.expression)
+                if mapped is None:
+                    return None
+                items.append({"type": "alias", "expression": mapped, "alias": str(item.alias)})
+                continue
+            mapped = map_expression(item)
+            if mapped is None:
+                return None
+            if mapped.get("type") == "identifier":
+                # Property key: keep the column name the graph translation yields
+                name = str(item).replace(".", "_")
+                renamed[str(item)] = name
+                mapped = {"type": "alias", "expression": mapped, "alias": name}
+            items.append(mapped)
+
+        order_by = [
+            {**order, "expression": renamed.get(order.get("expression"), order.get("expression"))}
+            for order in ast.return_clause.order_by or []
+        ] or None
+
+        filters = []
+        window = self._time_window_filter(table, context)
+        if window:
+            filters.append(window)
+
+        let_statements: list[str] = []
+        if ast.where_clause is not None:
+            conditions = map_properties(ast.where_clause.conditions, resolve)
+            if conditions is None:
+                return None
+            where_kql, _ = self.where_clause_translator.translate_with_bindings(
+                conditions, let_statements
+            )
+            filters.append(where_kql)
 
-        Example:
-            For MATCH (n:User) returns:
-            "IdentityInfo\n| make-graph AccountObjectId with_node_id=AccountObjectId"
+        return_clause = ast.return_clause.model_copy(update={"items": items, "order_by": order_by})
+        sample_rows = context.sample_rows if context is not None else None
+        kql_parts = list(let_statements)
+        kql_parts.extend(table_pipeline(table, filters, sample_rows=sample_rows))
+        kql_parts.append(f"| {self._translate_return(return_clause, context)}")
+        return "\n".join(kql_parts)
+
+    def _translate_return(
+        self, return_clause: ReturnClause, context: Optional[TranslationContext]
+    ) -> str:
+        """
+        Translate a RETURN clause in the context's aggregation mode.
+
+        Args:
+            return_clause: ReturnClause AST node
+            context: Translation context, or None for exact aggregation
+
+        Returns:
+            KQL RETURN stage
+        """
+        if context is None or not context.approximate:
+            return self.return_clause_translator.translate(return_clause)
+        return self.return_clause_translator.translate(
+            return_clause, approximate=True, dcount_accuracy=context.dcount_accuracy
+        )
+
+    def _time_window_filter(
+        self, table: str, context: Optional[TranslationContext]
+    ) -> Optional[str]:
+        """
+        Build the time-window predicate for a source table.
+
+        The context's absolute range or lookback is used when set, otherwise
+        the table's default lookback from the schema.
+
+        Args:
+            table: Sentinel table name
+            context: Translation context, or None
+
+        Returns:
+            KQL predicate, or None if the table has no datetime column or no
+            window applies
+        """
+        column = self.schema_mapper.get_time_column(table)
+        if column is None:
+            return None
+
+        if context is not None and context.time_range is not None:
+            return time_window_predicate(column, time_range=context.time_range)
+        if context is not None and context.lookback is not None:
+            return time_window_predicate(column, lookback=format_timespan(context.lookback))
+        default_lookback = self.schema_mapper.get_default_lookback(table)
+        return time_window_predicate(column, lookback=default_lookback)
+
+    def _plan_predicate_pushdown(
+        self, ast: Query, tables: list[str]
+    ) -> tuple[dict[str, dict], Optional[dict]]:
+        """
+        Split WHERE conditions into source table filters and a graph filter.
+
+        A top-level AND conjunct is pushed down to a table when it references
+        a single variable, that variable is the only node in the MATCH bound to
+        the table, and every property it uses maps to a column through the
+        schema. Pushed conjuncts are rewritten in terms of table columns and
+        removed from the graph-match filter.
+
+        Pushdown is skipped for OPTIONAL MATCH and for patterns with unlabeled
+        nodes, which may bind to rows of any table.
+
+        Args:
+            ast: Parsed query AST
+            tables: Source tables read by the make-graph preamble
+
+        Returns:
+            Tuple of (conditions per table, remaining graph conditions or None)
+        """
+        conditions = ast.where_clause.conditions if ast.where_clause else None
+        if not conditions or not self.enable_predicate_pushdown or ast.match_clause.optional:
+            return {}, conditions or None
+
+        # Variable -> label, and table -> node variables bound to it
+        labels: dict[str, str] = {}
+        table_nodes: dict[str, set] = {}
+        for path in ast.match_clause.paths:
+            for node in path.nodes:
+                if not node.labels:
+                    return {}, conditions
+                label = str(node.labels[0])
+                table = self.schema_mapper.get_sentinel_table(label)
+                variable = str(node.variable) if node.variable else None
+                table_nodes.setdefault(table, set()).add(variable)
+                if variable:
+                    labels[variable] = label
+
+        def resolve(variable: str, prop: str) -> Optional[str]:
+            field = self.schema_mapper.get_property_field(labels[variable], prop)
+            return field["sentinel_field"] if field else None
+
+        pushed: dict[str, list] = {}
+        remaining = []
+        for conjunct in split_conjuncts(conditions):
+            variables = condition_variables(conjunct)
+            variable = next(iter(variables)) if len(variables) == 1 else None
+            table = None
+            if variable in labels:
+                table = self.schema_mapper.get_sentinel_table(labels[variable])
+
+            mapped = None
+            if table in tables and table_nodes.get(table) == {variable}:
+                mapped = map_properties(conjunct, resolve)
+
+            if mapped is None:
+                remaining.append(conjunct)
+            else:
+                pushed.setdefault(table, []).append(mapped)
+
+        if not pushed:
+            return {}, conditions
+
+        return (
+            {table: conjoin(items) for table, items in pushed.items()},
+            conjoin(remaining),
+        )
+
+    def _plan_projection(
+        self,
+        ast: Query,
+        graph_conditions: Optional[dict],
+        node_tables: dict[str, str],
+        source_tables: list[str],
+        edge_sources: Optional[list[EdgeSource]] = None,
+    ) -> dict[str, list[str]]:
         """
-        # Extract all unique labels from all paths
-        labels = set()
+        Choose the columns each source table must keep for graph construction.
+
+        Collects the properties referenced by MATCH property maps, the graph
+        WHERE filter, RETURN items, and ORDER BY, and resolves them to columns
+        through the schema. A table is left unprojected when the query uses a
+        whole node bound to it (e.g. ``RETURN n``) or a property that maps to
+        no known column, and nothing is projected if the pattern has unlabeled
+        nodes. Join key columns of derived edge tables are always kept.
+
+        Args:
+            ast: Parsed query AST
+            graph_conditions: WHERE conditions left for graph-match, or None
+            node_tables: Table name to node id field
+            source_tables: Source tables read by the make-graph preamble
+            edge_sources: Edge tables joined from the node tables, if any
+
+        Returns:
+            Dict of table name to columns to keep (node id first)
+        """
+        if not self.enable_projection_pruning:
+            return {}
+
+        labels: dict[str, str] = {}
+        references: set[tuple[Optional[str], Optional[str]]] = set()
+        anonymous: list[tuple[str, str]] = []
+
+        for path in ast.match_clause.paths:
+            for node in path.nodes:
+                if not node.labels:
+                    return {}
+                label = str(node.labels[0])
+                variable = str(node.variable) if node.variable else None
+                if variable:
+                    labels[variable] = label
+                for key in node.properties or {}:
+                    if variable:
+                        references.add((variable, key))
+                    else:
+                        anonymous.append((label, key))
+
+        if graph_conditions:
+            references |= condition_properties(graph_conditions)
+
+        return_references = self._return_references(ast)
+        if return_references is None:
+            return {}
+        references |= return_references
+
+        # Relationship variables are not bound to node tables and are skipped
+        needed = [(labels[variable], prop) for variable, prop in references if variable in labels]
+        needed.extend(anonymous)
+
+        columns: dict[str, set[str]] = {table: set() for table in source_tables}
+        for label, prop in needed:
+            table = self.schema_mapper.get_sentinel_table(label)
+            if table not in columns:
+                continue
+            column = None
+            if prop is not None:
+                field = self.schema_mapper.get_property_field(label, prop)
+                if field:
+                    column = field["sentinel_field"]
+                elif prop in self.schema_mapper.get_table_fields(table):
+                    column = prop
+            if column is None:
+                # Whole node or unknown column: keep every column of the table
+                del columns[table]
+                continue
+            columns[table].add(column)
+
+        for edge in edge_sources or []:
+            if edge.source_table in columns:
+                columns[edge.source_table].add(edge.source_key)
+            if edge.target_table in columns:
+                columns[edge.target_table].add(edge.target_key)
+
+        return {
+            table: [node_tables[table]] + sorted(table_columns - {node_tables[table]})
+            for table, table_columns in columns.items()
+        }
+
+    def _resolve_node_tables(self, match_clause) -> dict[str, str]:
+        """
+        Map the Sentinel tables behind the MATCH clause's labels to node id fields.
+
+        Args:
+            match_clause: MatchClause AST node
+
+        Returns:
+            Dict of table name to node id field, in order of first appearance
+        """
+        # Extract all unique labels from all paths, in query order
+        labels: dict[str, None] = {}
         for path in match_clause.paths:
             for node in path.nodes:
                 if node.labels:
                     for label in node.labels:
-                        labels.add(str(label))
-
-        if not labels:
-            # No labels specified, cannot generate make-graph
-            return ""
+                        labels[str(label)] = None
 
         # Map labels to Sentinel tables
         tables_info = {}
         for label in labels:
             table = self.schema_mapper.get_sentinel_table(label)
-            if table:
-                # Get the primary key field for this table
-                # For now, use the first required property's sentinel_field as node_id
-                props = self.schema_mapper.get_all_properties(label)
-                node_id_field = None
-                for prop_name, prop_info in props.items():
-                    if prop_info.get("required") and "id" in prop_name.lower():
-                        node_id_field = prop_info["sentinel_field"]
-                        break
-
-                # If no ID field found, use the first required field
-                if not node_id_field:
-                    for prop_name, prop_info in props.items():
-                        if prop_info.get("required"):
-                            node_id_field = prop_info["sentinel_field"]
-                            break
-
-                # Default fallback for common tables
-                if not node_id_field:
-                    if table == "IdentityInfo":
-                        node_id_field = "AccountObjectId"
-                    elif table == "DeviceInfo":
-                        node_id_field = "DeviceId"
-                    elif table == "SecurityEvent":
-                        node_id_field = "EventID"
-                    elif table == "ProcessEvents":
-                        node_id_field = "ProcessId"
-                    elif table == "FileEvents":
-                        node_id_field = "SHA256"
-                    else:
-                        # Generic fallback - use first field
-                        fields = self.schema_mapper.get_table_fields(table)
-                        if fields:
-                            node_id_field = fields[0]
-
+            if table and table not in tables_info:
+                node_id_field = self._node_id_field(label, table)
                 if node_id_field:
                     tables_info[table] = node_id_field
 
+        return tables_info
+
+    def _node_id_field(self, label: str, table: str) -> Optional[str]:
+        """
+        Choose the column that identifies nodes of a label.
+
+        Args:
+            label: Cypher node label
+            table: Sentinel table for the label
+
+        Returns:
+            Node id column name, or None if none can be determined
+        """
+        node_id_field = self.schema_mapper.get_node_id_field(label)
+        if node_id_field:
+            return node_id_field
+
+        # Default fallback for common tables
+        if table == "IdentityInfo":
+            return "AccountObjectId"
+        elif table == "DeviceInfo":
+            return "DeviceId"
+        elif table == "SecurityEvent":
+            return "EventID"
+        elif table == "ProcessEvents":
+            return "ProcessId"
+        elif table == "FileEvents":
+            return "SHA256"
+
+        # Generic fallback - use first field
+        fields = self.schema_mapper.get_table_fields(table)
+        return fields[0] if fields else None
+
+    def _generate_make_graph_preamble(
+        self,
+        match_clause,
+        table_filters: Optional[dict[str, list[str]]] = None,
+        table_columns: Optional[dict[str, list[str]]] = None,
+        edge_sources: Optional[list[EdgeSource]] = None,
+        sample_rows: Optional[int] = None,
+    ) -> str:
+        """
+        Generate KQL make-graph preamble from MATCH clause.
+
+        Extracts all node labels from the MATCH clause and generates the appropriate
+        Sentinel table references with make-graph statements. Patterns over
+        several tables are built from every node table they reference, with
+        edge tables joined from them (or no edges, if the pattern has no
+        relationships); single-table patterns read just that table.
+
+        Args:
+            match_clause: MatchClause AST node
+            table_filters: KQL filter expressions to apply to source tables
+                before make-graph, in order, by table name
+            table_columns: Columns to project source tables down to before
+                make-graph, by table name
+            edge_sources: Edge tables derived from schema joins, or None
+            sample_rows: Rows to sample from each source table, or None
+
+        Returns:
+            KQL make-graph preamble string, or empty string if no tables found
+
+        Example:
+            For MATCH (n:User) returns:
+            "IdentityInfo\n| make-graph AccountObjectId with_node_id=AccountObjectId"
+        """
+        tables_info = self._resolve_node_tables(match_clause)
         if not tables_info:
             return ""
 
-        # Generate make-graph statement
-        # For single table: TableName | make-graph NodeId with_node_id=NodeId
-        # For multiple tables: Use first table as base, then join others
-        table_names = list(tables_info.keys())
-        primary_table = table_names[0]
+        if edge_sources or len(tables_info) > 1:
+            return render_graph_construction(
+                edge_sources or [],
+                tables_info,
+                table_filters,
+                table_columns,
+                sample_rows,
+                self.enable_materialize,
+            )
+
+        # Single table without edges: TableName | make-graph NodeId with_node_id=NodeId
+        primary_table = next(iter(tables_info))
         primary_node_id = tables_info[primary_table]
 
-        make_graph_parts = [
-            f"{primary_table}",
+        make_graph_parts = table_pipeline(
+            primary_table,
+            (table_filters or {}).get(primary_table),
+            (table_columns or {}).get(primary_table),
+            sample_rows,
+        )
+        make_graph_parts.append(
             f"| make-graph {primary_node_id} with_node_id={primary_node_id}"
-        ]
-
-        # If multiple tables, we need to handle relationships
-        # For now, just use the primary table (multi-table support will be added later)
-        # TODO: Add proper join logic for multi-table queries
+        )
 
         return "\n".join(make_graph_parts)
 
@@ -319,7 +1304,8 @@ class CypherTranslator:
                 return False
 
             # Check for required keywords
-            if "graph-match" not in query.lower() and "project" not in query.lower():
+            lowered = query.lower()
+            if not any(keyword in lowered for keyword in ("graph-match", "project", "summarize")):
                 return False
 
             # Validate table references against schema
@@ -335,7 +1321,8 @@ class CypherTranslator:
             for table in potential_tables:
                 # Skip common KQL keywords
                 if table.lower() in {'graph', 'match', 'where', 'project', 'sort',
-                                     'by', 'limit', 'offset', 'distinct', 'asc', 'desc'}:
+                                     'by', 'limit', 'top', 'summarize', 'serialize',
+                                     'distinct', 'asc', 'desc'}:
                     continue
 
                 # If it looks like a table reference and isn't in our schema,
@@ -2,7 +2,8 @@
 Core data models for Yellowstone.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Optional, Dict, Any
 
@@ -14,6 +15,14 @@ class TranslationStrategy(Enum):
     FALLBACK = "fallback"  # Join-based fallback (5%)
 
 
+# graph-match cycles options, from strictest to most permissive: no repeated
+# nodes, no repeated edges (Cypher's semantics, and KQL's default), anything
+PATH_CYCLES_MODES = ("none", "unique_edges", "all")
+
+# Oldest graph snapshot a query reads by default instead of rebuilding the graph
+DEFAULT_MAX_SNAPSHOT_STALENESS = timedelta(hours=1)
+
+
 @dataclass
 class CypherQuery:
     """Represents a Cypher query input."""
@@ -28,6 +37,16 @@ class KQLQuery:
     strategy: TranslationStrategy
     confidence: float  # 0.0-1.0
     estimated_execution_time_ms: Optional[int] = None
+    estimated_scanned_rows: Optional[int] = None
+    # True if the estimate exceeds the context's max_execution_time_ms
+    over_budget: bool = False
+    # GuardrailViolations for the caps and downgrades applied before translation
+    guardrail_violations: list[Any] = field(default_factory=list)
+    # True if results are estimates (approximate aggregates or sampled rows)
+    approximate: bool = False
+    approximations: list[str] = field(default_factory=list)  # e.g. ["dcount", "sample"]
+    # Values of the parameters the query declares, to send with the query text
+    parameters: Dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -38,3 +57,64 @@ class TranslationContext:
     permissions: list[str]
     max_execution_time_ms: int = 60000
     enable_ai_translation: bool = True
+    lookback: Optional[timedelta] = None  # Relative time window ending now
+    # Absolute (start, end) time window; takes precedence over lookback
+    time_range: Optional[tuple[datetime, datetime]] = None
+    # Trade exactness for speed: count(DISTINCT) uses dcount, and source
+    # tables may be sampled before graph construction
+    approximate: bool = False
+    dcount_accuracy: Optional[int] = None  # dcount accuracy level 0-4 (None for KQL's default)
+    sample_rows: Optional[int] = None  # Rows sampled per source table (approximate only)
+    # graph-match cycles option for variable-length patterns (None chooses per query)
+    path_cycles: Optional[str] = None
+    # Longest a persistent graph snapshot may lag its tables to be read in place
+    # of make-graph (None always rebuilds the graph)
+    max_snapshot_staleness: Optional[timedelta] = DEFAULT_MAX_SNAPSHOT_STALENESS
+    # Request properties, emitted as set statements: the longest a cached
+    # result may be reused by Sentinel's query results cache, and limits on
+    # the rows a result may hold
+    results_cache_max_age: Optional[timedelta] = None
+    no_truncation: bool = False
+    truncation_max_records: Optional[int] = None
+    take_max_records: Optional[int] = None
+    # Emit the query on one line without optional whitespace
+    minify: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the time window, approximation, path, snapshot and request settings."""
+        if self.lookback is not None and self.lookback <= timedelta(0):
+            raise ValueError(f"lookback must be positive, got {self.lookback}")
+        if self.time_range is not None:
+            # Naive datetimes are taken to be UTC
+            start, end = (
+                value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+                for value in self.time_range
+            )
+            if start >= end:
+                raise ValueError(f"time_range start must precede end, got {start} >= {end}")
+        if self.dcount_accuracy is not None and not 0 <= self.dcount_accuracy <= 4:
+            raise ValueError(f"dcount_accuracy must be 0-4, got {self.dcount_accuracy}")
+        if self.sample_rows is not None:
+            if self.sample_rows <= 0:
+                raise ValueError(f"sample_rows must be positive, got {self.sample_rows}")
+            if not self.approximate:
+                raise ValueError("sample_rows requires approximate=True")
+        if self.max_snapshot_staleness is not None and self.max_snapshot_staleness < timedelta(0):
+            raise ValueError(
+                f"max_snapshot_staleness must not be negative, got {self.max_snapshot_staleness}"
+            )
+        if self.results_cache_max_age is not None and self.results_cache_max_age <= timedelta(0):
+            raise ValueError(
+                f"results_cache_max_age must be positive, got {self.results_cache_max_age}"
+            )
+        for name in ("truncation_max_records", "take_max_records"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}")
+        if self.no_truncation and self.truncation_max_records is not None:
+            raise ValueError("no_truncation and truncation_max_records are mutually exclusive")
+        if self.path_cycles is not None and self.path_cycles not in PATH_CYCLES_MODES:
+            raise ValueError(
+                f"path_cycles must be one of {', '.join(PATH_CYCLES_MODES)}, "
+                f"got {self.path_cycles!r}"
+            )
@@ -7,8 +7,10 @@ into an Abstract Syntax Tree (AST) for further processing and translation.
 Main Components:
     - CypherParser: The main parser class using recursive descent
     - parse_query(): Convenience function for parsing queries
+    - ParseCache / parse_query_cached(): LRU cache of parsed queries
     - AST Nodes: Complete set of node types (Query, MatchClause, etc.)
     - Visitor: Pattern for traversing and transforming the AST
+    - fast_ast: Slotted, validation-free node classes (parse_query(..., fast_ast=True))
 
 Example:
     >>> from yellowstone.parser import parse_query
@@ -18,7 +20,15 @@ Example:
     'Person'
 """
 
+from . import fast_ast
 from .parser import CypherParser, parse_query, Lexer
+from .parse_cache import (
+    ParseCache,
+    ParseCacheStats,
+    get_default_parse_cache,
+    normalize_query_text,
+    parse_query_cached,
+)
 from .ast_nodes import (
     Query,
     MatchClause,
@@ -31,6 +41,7 @@ from .ast_nodes import (
     AliasedExpression,
     Identifier,
     Literal,
+    Parameter,
 )
 from .visitor import (
     Visitor,
@@ -45,6 +56,13 @@ __all__ = [
     "CypherParser",
     "parse_query",
     "Lexer",
+    "fast_ast",
+    # Parse cache
+    "ParseCache",
+    "ParseCacheStats",
+    "get_default_parse_cache",
+    "normalize_query_text",
+    "parse_query_cached",
     # AST node classes
     "Query",
     "MatchClause",
@@ -57,6 +75,7 @@ __all__ = [
     "AliasedExpression",
     "Identifier",
     "Literal",
+    "Parameter",
     # Visitor classes
     "Visitor",
     "DefaultVisitor",
@@ -4,10 +4,15 @@ Abstract Syntax Tree (AST) node definitions for Cypher queries.
 This module defines the complete set of AST nodes used to represent parsed
 Cypher query structures. All nodes are Pydantic BaseModel subclasses for
 validation, serialization, and type safety.
+
+Nodes are frozen: once built they cannot be reassigned, which lets parsed
+queries be cached and shared between callers and threads. Nested containers
+(lists and condition dictionaries) must likewise be treated as read-only; the
+parse cache stores read-only copies, so mutating a cached query raises TypeError.
 """
 
 from typing import Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ============================================================================
@@ -27,6 +32,8 @@ class Identifier(BaseModel):
         name: The identifier string
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="The identifier name")
 
     def __str__(self) -> str:
@@ -50,6 +57,8 @@ class Literal(BaseModel):
         Literal(value=42, value_type='number')
     """
 
+    model_config = ConfigDict(frozen=True)
+
     value: Any = Field(description="The literal value")
     value_type: str = Field(
         description="Type of the literal: 'string', 'number', 'boolean', or 'null'"
@@ -62,6 +71,29 @@ class Literal(BaseModel):
         return str(self.value)
 
 
+class Parameter(BaseModel):
+    """Represents a query parameter (``$name``) in a Cypher query.
+
+    Parameters appear as node property map values; in WHERE condition trees
+    they are ``{"type": "parameter", "name": ...}`` dictionaries.
+
+    Attributes:
+        name: The parameter name, without the leading ``$``
+
+    Example:
+        >>> str(Parameter(name='user'))
+        '$user'
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(description="The parameter name, without '$'")
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"${self.name}"
+
+
 # ============================================================================
 # Property and Expression Nodes
 # ============================================================================
@@ -80,6 +112,8 @@ class Property(BaseModel):
         >>> Property(variable=Identifier('n'), property_name=Identifier('name'))
     """
 
+    model_config = ConfigDict(frozen=True)
+
     variable: Identifier = Field(description="Variable or entity being accessed")
     property_name: Identifier = Field(description="The property name")
 
@@ -104,6 +138,8 @@ class AliasedExpression(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     expression: Any = Field(description="The expression being aliased")
     alias: Identifier = Field(description="The alias name")
 
@@ -120,6 +156,8 @@ class RelationshipPattern(BaseModel):
         relationship_type: Optional relationship type (e.g., 'KNOWS', 'ACTED_IN')
         directed: Whether the relationship is directed (True for ->, False for --)
         direction: 'out' for outgoing, 'in' for incoming, 'both' for undirected
+        length: Variable-length specification after '*' (e.g., '1..3', '..5',
+            '2'), '*' for an unbounded path, or None for a single hop
 
     Example:
         >>> RelationshipPattern(
@@ -130,6 +168,8 @@ class RelationshipPattern(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     variable: Optional[Identifier] = Field(
         default=None, description="Optional relationship variable"
     )
@@ -141,16 +181,21 @@ class RelationshipPattern(BaseModel):
         default="out",
         description="Direction: 'out' (->), 'in' (<-), or 'both' (--)",
     )
+    length: Optional[str] = Field(
+        default=None, description="Variable-length specification, or None for one hop"
+    )
 
     def __str__(self) -> str:
         """Return string representation."""
         rel_part = ""
-        if self.variable or self.relationship_type:
+        if self.variable or self.relationship_type or self.length:
             rel_part = "["
             if self.variable:
                 rel_part += str(self.variable)
             if self.relationship_type:
                 rel_part += f":{self.relationship_type}"
+            if self.length:
+                rel_part += "*" if self.length == "*" else f"*{self.length}"
             rel_part += "]"
 
         if self.direction == "in":
@@ -177,6 +222,8 @@ class NodePattern(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     variable: Optional[Identifier] = Field(
         default=None, description="Optional node variable"
     )
@@ -205,6 +252,9 @@ class PathExpression(BaseModel):
     Attributes:
         nodes: List of node patterns
         relationships: List of relationship patterns between nodes
+        variable: Optional path variable (``p`` in ``p = (a)-->(b)``)
+        shortest: 'any' for ``shortestPath(...)``, 'all' for
+            ``allShortestPaths(...)``, None to match every path
 
     Example:
         >>> PathExpression(
@@ -221,10 +271,16 @@ class PathExpression(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     nodes: list[NodePattern] = Field(description="Node patterns in the path")
     relationships: list[RelationshipPattern] = Field(
         description="Relationship patterns between nodes"
     )
+    variable: Optional[Identifier] = Field(default=None, description="Path variable")
+    shortest: Optional[str] = Field(
+        default=None, description="Shortest path mode: 'any', 'all', or None"
+    )
 
     def validate_structure(self) -> bool:
         """Validate that the path structure is valid.
@@ -263,6 +319,8 @@ class MatchClause(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     paths: list[PathExpression] = Field(description="Path patterns to match")
     optional: bool = Field(
         default=False, description="Whether this is an OPTIONAL MATCH"
@@ -286,6 +344,8 @@ class WhereClause(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     conditions: dict[str, Any] = Field(
         description="Predicate expressions (nested dictionary)"
     )
@@ -309,6 +369,8 @@ class ReturnClause(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     items: list[Any] = Field(description="Items to return")
     distinct: bool = Field(default=False, description="Whether to use DISTINCT")
     order_by: Optional[list[dict[str, Any]]] = Field(
@@ -341,6 +403,8 @@ class Query(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     match_clause: MatchClause = Field(description="MATCH clause")
     where_clause: Optional[WhereClause] = Field(
         default=None, description="Optional WHERE clause"
@@ -0,0 +1,92 @@
+"""
+Benchmark comparing pydantic and fast (slotted) AST construction.
+
+Parses the same queries with ``fast_ast=False`` and ``fast_ast=True`` and
+reports per-parse latency and the memory retained by the resulting trees.
+Run with: python -m yellowstone.parser.examples.fast_ast_benchmark
+"""
+
+import gc
+import timeit
+import tracemalloc
+from typing import Callable
+
+from yellowstone.parser import parse_query
+
+
+def build_multi_path_query(num_paths: int) -> str:
+    """Build a MATCH with ``num_paths`` comma-separated two-hop paths."""
+    paths = ", ".join(
+        f"(u{i}:User {{domain: 'corp'}})-[r{i}:LOGGED_IN]->(d{i}:Device)-[c{i}:CONNECTED_TO]->(ip{i}:IP)"
+        for i in range(num_paths)
+    )
+    returns = ", ".join(f"u{i}.username, d{i}.device_name" for i in range(num_paths))
+    return f"MATCH {paths} WHERE u0.username = 'alice' RETURN {returns} LIMIT 100"
+
+
+QUERIES = {
+    "simple": "MATCH (n:User) RETURN n",
+    "two_hop": (
+        "MATCH (u:User)-[r:LOGGED_IN]->(d:Device) "
+        "WHERE u.username = 'alice' AND d.os_platform = 'Windows' "
+        "RETURN u.username, d.device_name ORDER BY u.username LIMIT 10"
+    ),
+    "multi_path_10": build_multi_path_query(10),
+    "multi_path_50": build_multi_path_query(50),
+}
+
+
+def measure_latency_us(parse: Callable[[], object], number: int) -> float:
+    """Return the best mean latency of ``parse`` in microseconds."""
+    runs = timeit.repeat(parse, number=number, repeat=5)
+    return min(runs) / number * 1_000_000
+
+
+def measure_retained_bytes(parse: Callable[[], object], copies: int = 100) -> float:
+    """Return the mean bytes retained per parsed tree."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    trees = [parse() for _ in range(copies)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del trees
+    return retained / copies
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    print("\n" + "=" * 86)
+    print("Fast AST benchmark: pydantic ast_nodes vs slotted fast_ast")
+    print("=" * 86)
+    print(
+        f"{'query':<16}{'pydantic us':>14}{'fast us':>12}{'speedup':>10}"
+        f"{'pydantic B':>14}{'fast B':>12}{'saved':>8}"
+    )
+
+    for name, query in QUERIES.items():
+        number = 50 if name.startswith("multi") else 500
+
+        def slow() -> object:
+            return parse_query(query)
+
+        def fast() -> object:
+            return parse_query(query, fast_ast=True)
+
+        slow_us = measure_latency_us(slow, number)
+        fast_us = measure_latency_us(fast, number)
+        slow_bytes = measure_retained_bytes(slow)
+        fast_bytes = measure_retained_bytes(fast)
+
+        print(
+            f"{name:<16}{slow_us:>14.1f}{fast_us:>12.1f}{slow_us / fast_us:>9.2f}x"
+            f"{slow_bytes:>14.0f}{fast_bytes:>12.0f}{1 - fast_bytes / slow_bytes:>8.0%}"
+        )
+
+    print("=" * 86 + "\n")
+
+
+if __name__ == "__main__":
+    main()
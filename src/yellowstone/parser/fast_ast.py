@@ -0,0 +1,334 @@
+"""
+Lightweight AST node definitions for Cypher queries.
+
+This module mirrors ``ast_nodes`` with frozen, slotted dataclasses. Nodes have
+the same class names, attribute names, and ``__str__`` output as their pydantic
+counterparts, but are built without validation and without a per-instance
+``__dict__``, which makes parsing of large multi-path queries considerably
+cheaper.
+
+Use ``CypherParser(query, fast_ast=True)`` or ``parse_query(query, fast_ast=True)``
+to build these nodes, and ``to_pydantic``/``from_pydantic`` to convert between
+the two representations when validation is wanted.
+
+Example:
+    >>> from yellowstone.parser import parse_query
+    >>> fast = parse_query("MATCH (n:Person) RETURN n", fast_ast=True)
+    >>> str(fast.match_clause.paths[0].nodes[0])
+    '(n:Person)'
+    >>> to_pydantic(fast) == parse_query("MATCH (n:Person) RETURN n")
+    True
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from . import ast_nodes
+
+
+def _fields_str(node: Any) -> str:
+    """Format fields the way pydantic's default ``__str__`` does."""
+    return " ".join(f"{name}={getattr(node, name)!r}" for name in type(node).__slots__)
+
+
+# ============================================================================
+# Literal and Identifier Nodes
+# ============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class Identifier:
+    """Represents a named identifier in a Cypher query."""
+
+    name: str
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return self.name
+
+
+@dataclass(frozen=True, slots=True)
+class Literal:
+    """Represents a literal value in a Cypher query."""
+
+    value: Any
+    value_type: str
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        if self.value_type == "string":
+            return f"'{self.value}'"
+        return str(self.value)
+
+
+@dataclass(frozen=True, slots=True)
+class Parameter:
+    """Represents a query parameter (``$name``) in a Cypher query."""
+
+    name: str
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"${self.name}"
+
+
+# ============================================================================
+# Property and Expression Nodes
+# ============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class Property:
+    """Represents a property access expression."""
+
+    variable: Identifier
+    property_name: Identifier
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"{self.variable}.{self.property_name}"
+
+
+@dataclass(frozen=True, slots=True)
+class AliasedExpression:
+    """Represents an aliased expression (e.g., n.name AS userName)."""
+
+    expression: Any
+    alias: Identifier
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"{self.expression} AS {self.alias}"
+
+
+@dataclass(frozen=True, slots=True)
+class RelationshipPattern:
+    """Represents a relationship pattern in a Cypher query."""
+
+    variable: Optional[Identifier] = None
+    relationship_type: Optional[Identifier] = None
+    directed: bool = True
+    direction: str = "out"
+    length: Optional[str] = None
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        rel_part = ""
+        if self.variable or self.relationship_type or self.length:
+            rel_part = "["
+            if self.variable:
+                rel_part += str(self.variable)
+            if self.relationship_type:
+                rel_part += f":{self.relationship_type}"
+            if self.length:
+                rel_part += "*" if self.length == "*" else f"*{self.length}"
+            rel_part += "]"
+
+        if self.direction == "in":
+            return f"<-{rel_part}-"
+        elif self.direction == "both":
+            return f"-{rel_part}-"
+        else:  # out
+            return f"-{rel_part}->"
+
+
+@dataclass(frozen=True, slots=True)
+class NodePattern:
+    """Represents a node pattern in a Cypher query."""
+
+    variable: Optional[Identifier] = None
+    labels: list[Identifier] = field(default_factory=list)
+    properties: Optional[dict[str, Any]] = None
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        result = "("
+        if self.variable:
+            result += str(self.variable)
+        if self.labels:
+            labels_str = ":".join(str(label) for label in self.labels)
+            result += f":{labels_str}"
+        result += ")"
+        return result
+
+
+@dataclass(frozen=True, slots=True)
+class PathExpression:
+    """Represents a path pattern in a Cypher query."""
+
+    nodes: list[NodePattern]
+    relationships: list[RelationshipPattern]
+    variable: Optional[Identifier] = None
+    shortest: Optional[str] = None
+
+    def validate_structure(self) -> bool:
+        """Validate that the path structure is valid.
+
+        Returns:
+            True if valid (n nodes require n-1 relationships)
+
+        Raises:
+            ValueError: If structure is invalid
+        """
+        if len(self.nodes) != len(self.relationships) + 1:
+            raise ValueError(
+                f"Invalid path structure: {len(self.nodes)} nodes "
+                f"requires {len(self.nodes) - 1} relationships, "
+                f"got {len(self.relationships)}"
+            )
+        return True
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return _fields_str(self)
+
+
+# ============================================================================
+# Clause Nodes
+# ============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class MatchClause:
+    """Represents a MATCH clause in a Cypher query."""
+
+    paths: list[PathExpression]
+    optional: bool = False
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return _fields_str(self)
+
+
+@dataclass(frozen=True, slots=True)
+class WhereClause:
+    """Represents a WHERE clause in a Cypher query."""
+
+    conditions: dict[str, Any]
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return _fields_str(self)
+
+
+@dataclass(frozen=True, slots=True)
+class ReturnClause:
+    """Represents a RETURN clause in a Cypher query."""
+
+    items: list[Any]
+    distinct: bool = False
+    order_by: Optional[list[dict[str, Any]]] = None
+    limit: Optional[int] = None
+    skip: Optional[int] = None
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return _fields_str(self)
+
+
+# ============================================================================
+# Query Node
+# ============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class Query:
+    """Represents a complete Cypher query."""
+
+    match_clause: MatchClause
+    return_clause: ReturnClause
+    where_clause: Optional[WhereClause] = None
+
+    def __str__(self) -> str:
+        """Return string representation of the query."""
+        parts = [f"MATCH {self.match_clause}"]
+        if self.where_clause:
+            parts.append(f"WHERE {self.where_clause}")
+        parts.append(f"RETURN {self.return_clause}")
+        return "\n".join(parts)
+
+
+# ============================================================================
+# Conversion
+# ============================================================================
+
+
+# Pydantic class -> fast class, and the reverse
+_TO_FAST: dict[type, type] = {}
+_TO_PYDANTIC: dict[type, type] = {}
+
+for _fast_cls in (
+    Identifier,
+    Literal,
+    Parameter,
+    Property,
+    AliasedExpression,
+    RelationshipPattern,
+    NodePattern,
+    PathExpression,
+    MatchClause,
+    WhereClause,
+    ReturnClause,
+    Query,
+):
+    _pydantic_cls = getattr(ast_nodes, _fast_cls.__name__)
+    _TO_FAST[_pydantic_cls] = _fast_cls
+    _TO_PYDANTIC[_fast_cls] = _pydantic_cls
+
+
+def _convert(value: Any, mapping: dict[type, type], fields_of: Any) -> Any:
+    """Convert a node (or container of nodes) using a class mapping.
+
+    WHERE condition trees hold only plain dictionaries, so they are shared
+    rather than copied; this also keeps very deep condition chains off the
+    Python stack.
+    """
+    target = mapping.get(type(value))
+    if target is not None:
+        kwargs = {}
+        for name in fields_of(value):
+            item = getattr(value, name)
+            kwargs[name] = item if name == "conditions" else _convert(item, mapping, fields_of)
+        return target(**kwargs)
+    if isinstance(value, list):
+        return [_convert(item, mapping, fields_of) for item in value]
+    if isinstance(value, dict):
+        return {key: _convert(item, mapping, fields_of) for key, item in value.items()}
+    return value
+
+
+def _pydantic_fields(node: Any) -> Any:
+    """Return the field names of a pydantic AST node."""
+    return type(node).model_fields
+
+
+def _fast_fields(node: Any) -> Any:
+    """Return the field names of a fast AST node."""
+    return type(node).__slots__
+
+
+def to_pydantic(node: Any) -> Any:
+    """Convert a fast AST node into the equivalent validated pydantic node.
+
+    Args:
+        node: Fast AST node (typically a Query)
+
+    Returns:
+        The equivalent ``ast_nodes`` model
+
+    Raises:
+        pydantic.ValidationError: If the tree does not satisfy the model schemas
+    """
+    return _convert(node, _TO_PYDANTIC, _fast_fields)
+
+
+def from_pydantic(node: Any) -> Any:
+    """Convert a pydantic AST node into the equivalent fast AST node.
+
+    Args:
+        node: ``ast_nodes`` model (typically a Query)
+
+    Returns:
+        The equivalent fast AST node
+    """
+    return _convert(node, _TO_FAST, _pydantic_fields)
@@ -0,0 +1,305 @@
+"""
+Structural parse cache for Cypher queries.
+
+Hunting workloads send the same small set of queries over and over. This
+module keeps a bounded, thread-safe LRU cache of parsed ``Query`` trees keyed
+on normalized query text, so repeated queries skip lexing and AST
+construction entirely.
+
+Normalization collapses whitespace runs and upper-cases keywords while leaving
+string literals and identifiers untouched, so ``match (n)  RETURN n`` and
+``MATCH (n) RETURN n`` share one entry. Cached ``Query`` objects are
+returned as-is to every caller, so they are deep-frozen when stored: besides
+the frozen nodes themselves, their lists and condition dictionaries reject
+mutation. Frozen containers are ``list`` and ``dict`` subclasses, so code that
+reads the AST is unaffected, and ``dict(...)``/``list(...)`` give mutable
+copies.
+
+Example:
+    >>> cache = ParseCache(max_size=128)
+    >>> first = cache.get_or_parse("MATCH (n:User) RETURN n")
+    >>> second = cache.get_or_parse("match (n:User)   return n")
+    >>> first is second
+    True
+    >>> cache.stats().hits
+    1
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from .ast_nodes import Query
+from .parser import Lexer, parse_query
+
+
+# Strings are matched first so whitespace and keywords inside them are kept verbatim
+_NORMALIZE_PATTERN = re.compile(
+    "(?P<STRING>{string})|(?P<WORD>[A-Za-z_][A-Za-z0-9_]*)|(?P<SPACE>\\s+)".format(
+        string=dict(Lexer.TOKEN_PATTERNS)["STRING"]
+    )
+)
+
+
+def _normalize_match(match: re.Match) -> str:
+    """Return the normalized replacement for a single normalization match."""
+    kind = match.lastgroup
+    text = match.group()
+
+    if kind == "SPACE":
+        return " "
+    if kind == "WORD":
+        upper = text.upper()
+        return upper if upper in Lexer.KEYWORDS else text
+    return text
+
+
+def normalize_query_text(query_string: str) -> str:
+    """Normalize a Cypher query string for use as a cache key.
+
+    Args:
+        query_string: The Cypher query text
+
+    Returns:
+        Query text with whitespace collapsed and keywords upper-cased
+
+    Example:
+        >>> normalize_query_text("match (n)\\n  where n.name = 'a  b'  return n")
+        "MATCH (n) WHERE n.name = 'a  b' RETURN n"
+    """
+    return _NORMALIZE_PATTERN.sub(_normalize_match, query_string).strip()
+
+
+def _read_only(self, *args, **kwargs):
+    """Reject mutation of a frozen container."""
+    raise TypeError(f"cached {type(self).__bases__[0].__name__} is read-only")
+
+
+class _FrozenList(list):
+    """A list that rejects mutation; copies are plain lists."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+class _FrozenDict(dict):
+    """A dict that rejects mutation; copies are plain dicts."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    pop = popitem = setdefault = update = clear = _read_only
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+def _assign(parent: Any, key: Any, value: Any) -> None:
+    """Set an item of a plain or frozen container while it is being built."""
+    if isinstance(parent, dict):
+        dict.__setitem__(parent, key, value)
+    else:
+        list.__setitem__(parent, key, value)
+
+
+def _freeze(query: Query) -> Query:
+    """Return a copy of a query whose nested lists and dicts are read-only.
+
+    The tree is rebuilt with an explicit stack, so arbitrarily deep condition
+    chains do not hit the recursion limit. Nodes are rebuilt after their
+    children, so each copy is created with its frozen fields in place.
+    """
+    root: list[Any] = [None]
+    stack: list[tuple[Any, Any, Any]] = [(query, root, 0)]
+    models: list[tuple[BaseModel, dict[str, Any], Any, Any]] = []
+
+    while stack:
+        source, parent, key = stack.pop()
+
+        if isinstance(source, BaseModel):
+            fields = dict(source.__dict__)
+            models.append((source, fields, parent, key))
+            for name, value in fields.items():
+                stack.append((value, fields, name))
+
+        elif isinstance(source, dict):
+            frozen_dict = _FrozenDict(dict.fromkeys(source))
+            _assign(parent, key, frozen_dict)
+            for child_key, value in source.items():
+                stack.append((value, frozen_dict, child_key))
+
+        elif isinstance(source, list):
+            frozen_list = _FrozenList([None] * len(source))
+            _assign(parent, key, frozen_list)
+            for index, value in enumerate(source):
+                stack.append((value, frozen_list, index))
+
+        else:
+            _assign(parent, key, source)
+
+    for source, fields, parent, key in reversed(models):
+        _assign(parent, key, source.model_copy(update=fields))
+
+    return root[0]
+
+
+@dataclass(frozen=True)
+class ParseCacheStats:
+    """Snapshot of parse cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ParseCache:
+    """Bounded, thread-safe LRU cache of parsed Cypher queries.
+
+    Lookups and insertions are serialized by a lock; parsing itself runs
+    outside the lock, so concurrent misses on the same query may both parse
+    and the last writer wins. Queries that fail to parse are never cached.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """Initialize the parse cache.
+
+        Args:
+            max_size: Maximum number of parsed queries to keep
+
+        Raises:
+            ValueError: If max_size is not positive
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Query] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, query_string: str) -> Optional[Query]:
+        """Look up a previously parsed query.
+
+        Args:
+            query_string: The Cypher query text
+
+        Returns:
+            The cached Query, or None on a miss
+        """
+        key = normalize_query_text(query_string)
+        with self._lock:
+            query = self._entries.get(key)
+            if query is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return query
+
+    def put(self, query_string: str, query: Query) -> Query:
+        """Store a deep-frozen copy of a parsed query, evicting the LRU entry if full.
+
+        Args:
+            query_string: The Cypher query text
+            query: The parsed Query AST
+
+        Returns:
+            The frozen copy that was stored
+        """
+        key = normalize_query_text(query_string)
+        frozen = _freeze(query)
+        with self._lock:
+            self._entries[key] = frozen
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return frozen
+
+    def get_or_parse(self, query_string: str) -> Query:
+        """Return the cached AST for a query, parsing and caching it on a miss.
+
+        Args:
+            query_string: The Cypher query text
+
+        Returns:
+            The (shared, deep-frozen) Query AST
+
+        Raises:
+            SyntaxError: If the query syntax is invalid
+        """
+        query = self.get(query_string)
+        if query is None:
+            query = self.put(query_string, parse_query(query_string))
+        return query
+
+    def stats(self) -> ParseCacheStats:
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            ParseCacheStats with hit, miss, and eviction counts
+        """
+        with self._lock:
+            return ParseCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached queries."""
+        with self._lock:
+            return len(self._entries)
+
+
+_default_cache = ParseCache()
+
+
+def get_default_parse_cache() -> ParseCache:
+    """Return the process-wide parse cache used by ``parse_query_cached``."""
+    return _default_cache
+
+
+def parse_query_cached(query_string: str, cache: Optional[ParseCache] = None) -> Query:
+    """Parse a Cypher query, reusing a cached AST when available.
+
+    Args:
+        query_string: The Cypher query to parse
+        cache: Cache to use (defaults to the process-wide parse cache)
+
+    Returns:
+        The root Query AST node, shared with other callers of the same query
+
+    Raises:
+        SyntaxError: If the query syntax is invalid
+    """
+    if cache is None:
+        cache = _default_cache
+    return cache.get_or_parse(query_string)
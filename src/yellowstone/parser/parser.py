@@ -10,13 +10,18 @@ Supported patterns:
     - MATCH (n:Label) RETURN n
     - MATCH (n:Label {prop: value}) RETURN n
     - MATCH (n:Label)-[r:REL]->(m:Label) RETURN n, m
+    - MATCH p = shortestPath((a)-[*..5]->(b)) RETURN a, b
     - WHERE with comparison operators and logical operators
     - RETURN with DISTINCT, ORDER BY, LIMIT, SKIP
+
+The parser builds validated pydantic nodes from ast_nodes.py by default, or
+lightweight slotted nodes from fast_ast.py when ``fast_ast=True``.
 """
 
 import re
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Iterator, Optional, Union
+from . import ast_nodes, fast_ast
 from .ast_nodes import (
     Query,
     MatchClause,
@@ -29,6 +34,7 @@ from .ast_nodes import (
     AliasedExpression,
     Identifier,
     Literal,
+    Parameter,
 )
 
 
@@ -37,7 +43,7 @@ from .ast_nodes import (
 # ============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Token:
     """Represents a single token from the input."""
 
@@ -53,15 +59,30 @@ class Token:
 class Lexer:
     """Tokenizes Cypher query strings.
 
-    Recognizes keywords, identifiers, operators, and delimiters.
+    Recognizes keywords, identifiers, operators, and delimiters. All token
+    patterns are combined into a single precompiled alternation, so each input
+    position is matched once; keywords are recognized by looking up IDENTIFIER
+    tokens in ``KEYWORDS``.
+
+    By default the whole input is tokenized up front. With ``lazy=True`` tokens
+    are pulled from ``iter_tokens`` on demand as ``peek``/``consume`` need them.
     """
 
+    # Reserved words, matched case-insensitively against IDENTIFIER tokens
+    KEYWORDS = frozenset(
+        {
+            "MATCH", "WHERE", "RETURN", "OPTIONAL", "DISTINCT", "ORDER", "BY",
+            "ASC", "DESC", "LIMIT", "SKIP", "AND", "OR", "NOT", "AS", "TRUE",
+            "FALSE", "NULL", "IN",
+        }
+    )
+
     # Token type patterns (order matters - longer patterns must come first)
     TOKEN_PATTERNS = [
-        ("KEYWORD", r"\b(MATCH|WHERE|RETURN|OPTIONAL|DISTINCT|ORDER|BY|ASC|DESC|LIMIT|SKIP|AND|OR|NOT|AS|TRUE|FALSE|NULL)\b"),
         ("NUMBER", r"\d+(\.\d+)?"),
         ("STRING", r"'([^'\\\\]|\\\\.)*'|\"([^\"\\\\]|\\\\.)*\""),
         ("IDENTIFIER", r"[a-zA-Z_][a-zA-Z0-9_]*"),
+        ("PARAMETER", r"\$[a-zA-Z_][a-zA-Z0-9_]*"),
         # Multi-character operators must come before single-char variants
         ("ARROW_OUT", r"->"),
         ("ARROW_IN", r"<-"),
@@ -76,57 +97,96 @@ class Lexer:
         ("LBRACE", r"\{"),
         ("RBRACE", r"\}"),
         ("COLON", r":"),
+        ("RANGE", r"\.\."),
         ("DOT", r"\."),
         ("COMMA", r","),
         ("SEMICOLON", r";"),
         ("DASH", r"-"),
         ("PIPE", r"\|"),
+        ("STAR", r"\*"),
         ("EQUALS", r"="),
         ("LT", r"<"),
         ("GT", r">"),
         ("WHITESPACE", r"\s+"),
     ]
 
-    def __init__(self, query: str):
+    # Single alternation of all token patterns, compiled once per process
+    MASTER_PATTERN = re.compile(
+        "|".join(f"(?P<{name}>{pattern})" for name, pattern in TOKEN_PATTERNS)
+    )
+
+    def __init__(self, query: str, lazy: bool = False):
         """Initialize lexer with a query string.
 
         Args:
             query: The Cypher query to tokenize
+            lazy: If True, tokenize incrementally as tokens are requested
         """
         self.query = query
         self.tokens: list[Token] = []
         self.position = 0
-        self._tokenize()
-
-    def _tokenize(self) -> None:
-        """Tokenize the input query string."""
-        position = 0
+        self._pending: Optional[Iterator[Token]] = None
 
-        while position < len(self.query):
-            match_found = False
+        if lazy:
+            self._pending = self.iter_tokens(query)
+        else:
+            self._tokenize()
 
-            for token_type, pattern in self.TOKEN_PATTERNS:
-                regex = re.compile(pattern, re.IGNORECASE)
-                match = regex.match(self.query, position)
+    @classmethod
+    def iter_tokens(cls, query: str) -> Iterator[Token]:
+        """Lazily yield tokens from a query string.
 
-                if match:
-                    value = match.group(0)
+        Args:
+            query: The Cypher query to tokenize
 
-                    # Skip whitespace tokens but track position
-                    if token_type != "WHITESPACE":
-                        self.tokens.append(
-                            Token(type=token_type, value=value, position=position)
-                        )
+        Yields:
+            Tokens in input order (whitespace is skipped)
 
-                    position = match.end()
-                    match_found = True
-                    break
+        Raises:
+            SyntaxError: When an invalid character is reached
+        """
+        match_at = cls.MASTER_PATTERN.match
+        keywords = cls.KEYWORDS
+        position = 0
+        length = len(query)
 
-            if not match_found:
+        while position < length:
+            match = match_at(query, position)
+            if match is None:
                 raise SyntaxError(
-                    f"Invalid character at position {position}: '{self.query[position]}'"
+                    f"Invalid character at position {position}: '{query[position]}'"
                 )
 
+            token_type = match.lastgroup
+            if token_type != "WHITESPACE":
+                value = match.group()
+                if token_type == "IDENTIFIER" and value.upper() in keywords:
+                    token_type = "KEYWORD"
+                yield Token(type=token_type, value=value, position=position)
+
+            position = match.end()
+
+    def _tokenize(self) -> None:
+        """Tokenize the input query string."""
+        self.tokens = list(self.iter_tokens(self.query))
+
+    def _fill(self, index: int) -> bool:
+        """Pull tokens from the pending iterator until ``index`` is buffered.
+
+        Args:
+            index: Token index that must be available
+
+        Returns:
+            True if a token exists at index, False if input is exhausted
+        """
+        while index >= len(self.tokens) and self._pending is not None:
+            token = next(self._pending, None)
+            if token is None:
+                self._pending = None
+            else:
+                self.tokens.append(token)
+        return index < len(self.tokens)
+
     def peek(self, offset: int = 0) -> Optional[Token]:
         """Look ahead at a token without consuming it.
 
@@ -137,7 +197,7 @@ class Lexer:
             The token at offset, or None if beyond the end
         """
         index = self.position + offset
-        if index < len(self.tokens):
+        if index < len(self.tokens) or self._fill(index):
             return self.tokens[index]
         return None
 
@@ -153,7 +213,7 @@ class Lexer:
         Raises:
             SyntaxError: If expected_type is provided and doesn't match
         """
-        if self.position >= len(self.tokens):
+        if self.position >= len(self.tokens) and not self._fill(self.position):
             raise SyntaxError("Unexpected end of input")
 
         token = self.tokens[self.position]
@@ -189,7 +249,7 @@ class Lexer:
         Returns:
             True if at end of input
         """
-        return self.position >= len(self.tokens)
+        return not self._fill(self.position)
 
 
 # ============================================================================
@@ -197,6 +257,17 @@ class Lexer:
 # ============================================================================
 
 
+# Module alias used inside CypherParser, where ``fast_ast`` is a parameter name
+_FAST_AST = fast_ast
+
+
+# Binding strength of logical operators in WHERE conditions
+_CONDITION_PRECEDENCE = {"OR": 1, "AND": 2, "NOT": 3}
+
+# Path functions (lowercase) to the PathExpression.shortest mode they select
+SHORTEST_PATH_FUNCTIONS = {"shortestpath": "any", "allshortestpaths": "all"}
+
+
 class CypherParser:
     """Recursive descent parser for Cypher queries.
 
@@ -207,17 +278,20 @@ class CypherParser:
         - RETURN clauses with various options
     """
 
-    def __init__(self, query: str):
+    def __init__(self, query: str, fast_ast: bool = False):
         """Initialize parser with a query string.
 
         Args:
             query: The Cypher query to parse
+            fast_ast: Build lightweight ``fast_ast`` nodes instead of validated
+                pydantic ``ast_nodes`` models
 
         Raises:
             SyntaxError: If query contains invalid tokens
         """
         self.lexer = Lexer(query)
         self.query = query
+        self.ast = _FAST_AST if fast_ast else ast_nodes
 
     def parse(self) -> Query:
         """Parse the query and return the AST root node.
@@ -246,7 +320,7 @@ class CypherParser:
                 f"at position {token.position}"
             )
 
-        return Query(
+        return self.ast.Query(
             match_clause=match_clause,
             where_clause=where_clause,
             return_clause=return_clause,
@@ -283,16 +357,63 @@ class CypherParser:
             self.lexer.consume()  # Consume comma
             paths.append(self.parse_path())
 
-        return MatchClause(paths=paths, optional=optional)
+        return self.ast.MatchClause(paths=paths, optional=optional)
 
     def parse_path(self) -> PathExpression:
         """Parse a path expression.
 
         Syntax:
-            path := node [relationship node]*
+            path := [variable =] pattern
+                  | [variable =] shortestPath(pattern)
+                  | [variable =] allShortestPaths(pattern)
+            pattern := node [relationship node]*
 
         Returns:
             A PathExpression AST node
+
+        Raises:
+            SyntaxError: If a shortest path pattern is not a single relationship
+                between two nodes
+        """
+        variable = None
+        token = self.lexer.peek()
+        next_token = self.lexer.peek(1)
+        if token and token.type == "IDENTIFIER" and next_token and next_token.type == "EQUALS":
+            variable = self.ast.Identifier(name=self.lexer.consume().value)
+            self.lexer.consume()
+
+        token = self.lexer.peek()
+        shortest = None
+        if token and token.type == "IDENTIFIER":
+            shortest = SHORTEST_PATH_FUNCTIONS.get(token.value.lower())
+            if shortest is None:
+                raise SyntaxError(f"Expected node or shortestPath(), got '{token.value}'")
+            self.lexer.consume()
+            self.lexer.consume("LPAREN")
+
+        nodes, relationships = self.parse_pattern()
+
+        if shortest is not None:
+            self.lexer.consume("RPAREN")
+            if len(relationships) != 1:
+                raise SyntaxError(
+                    f"{token.value}() requires a single relationship between two nodes"
+                )
+
+        path = self.ast.PathExpression(
+            nodes=nodes, relationships=relationships, variable=variable, shortest=shortest
+        )
+        path.validate_structure()
+        return path
+
+    def parse_pattern(self) -> tuple[list[NodePattern], list[RelationshipPattern]]:
+        """Parse the alternating nodes and relationships of a path.
+
+        Syntax:
+            pattern := node [relationship node]*
+
+        Returns:
+            Tuple of (node patterns, relationship patterns)
         """
         nodes = []
         relationships = []
@@ -314,9 +435,7 @@ class CypherParser:
 
             nodes.append(self.parse_node())
 
-        path = PathExpression(nodes=nodes, relationships=relationships)
-        path.validate_structure()
-        return path
+        return nodes, relationships
 
     def parse_node(self) -> NodePattern:
         """Parse a node pattern.
@@ -338,14 +457,14 @@ class CypherParser:
 
         # Parse optional variable
         if self.lexer.peek() and self.lexer.peek().type == "IDENTIFIER":
-            variable = Identifier(name=self.lexer.consume().value)
+            variable = self.ast.Identifier(name=self.lexer.consume().value)
 
         # Parse optional labels
         while self.lexer.peek() and self.lexer.peek().type == "COLON":
             self.lexer.consume()  # Consume colon
             if not self.lexer.peek() or self.lexer.peek().type != "IDENTIFIER":
                 raise SyntaxError("Expected label name after ':'")
-            labels.append(Identifier(name=self.lexer.consume().value))
+            labels.append(self.ast.Identifier(name=self.lexer.consume().value))
 
         # Parse optional properties
         if self.lexer.peek() and self.lexer.peek().type == "LBRACE":
@@ -353,7 +472,7 @@ class CypherParser:
 
         self.lexer.consume("RPAREN")
 
-        return NodePattern(variable=variable, labels=labels, properties=properties)
+        return self.ast.NodePattern(variable=variable, labels=labels, properties=properties)
 
     def parse_properties(self) -> dict[str, Any]:
         """Parse a properties dictionary.
@@ -393,6 +512,7 @@ class CypherParser:
 
         Syntax:
             rel := -[variable:type]-> | <-[variable:type]- | -[variable:type]-
+            with an optional length after the type: *, *n, *min..max, *..max, *min..
 
         Returns:
             A RelationshipPattern AST node
@@ -423,6 +543,7 @@ class CypherParser:
 
         variable: Optional[Identifier] = None
         relationship_type: Optional[Identifier] = None
+        length: Optional[str] = None
 
         # Parse optional [variable:type]
         if self.lexer.peek() and self.lexer.peek().type == "LBRACKET":
@@ -430,14 +551,19 @@ class CypherParser:
 
             # Parse optional variable
             if self.lexer.peek() and self.lexer.peek().type == "IDENTIFIER":
-                variable = Identifier(name=self.lexer.consume().value)
+                variable = self.ast.Identifier(name=self.lexer.consume().value)
 
             # Parse optional type
             if self.lexer.peek() and self.lexer.peek().type == "COLON":
                 self.lexer.consume()
                 if not self.lexer.peek() or self.lexer.peek().type != "IDENTIFIER":
                     raise SyntaxError("Expected relationship type after ':'")
-                relationship_type = Identifier(name=self.lexer.consume().value)
+                relationship_type = self.ast.Identifier(name=self.lexer.consume().value)
+
+            # Parse optional variable length
+            if self.lexer.peek() and self.lexer.peek().type == "STAR":
+                self.lexer.consume()
+                length = self.parse_path_length()
 
             self.lexer.consume("RBRACKET")
 
@@ -456,55 +582,169 @@ class CypherParser:
         else:
             raise SyntaxError("Expected arrow or dash to close relationship")
 
-        return RelationshipPattern(
+        return self.ast.RelationshipPattern(
             variable=variable,
             relationship_type=relationship_type,
             directed=(direction != "both"),
             direction=direction,
+            length=length,
         )
 
+    def parse_path_length(self) -> str:
+        """Parse the hop bounds that follow '*' in a relationship.
+
+        Syntax:
+            length := [min] [.. [max]]
+
+        Returns:
+            Length specification ('1..3', '..5', '2', '2..') or '*' if unbounded
+
+        Raises:
+            SyntaxError: If a bound is not an integer or min exceeds max
+        """
+        bounds = []
+        for token_type in ("NUMBER", "RANGE", "NUMBER"):
+            token = self.lexer.peek()
+            if not token or token.type != token_type:
+                if token_type == "RANGE":
+                    break
+                continue
+            if token_type == "NUMBER" and not token.value.isdigit():
+                raise SyntaxError(f"Expected integer hop count at position {token.position}")
+            bounds.append(self.lexer.consume().value)
+
+        spec = "".join(bounds)
+        if not spec:
+            return "*"
+        low, _, high = spec.partition("..")
+        if low and high and int(low) > int(high):
+            raise SyntaxError(f"Invalid path length *{spec}: minimum exceeds maximum")
+        return spec
+
     def parse_where(self) -> WhereClause:
         """Parse a WHERE clause.
 
         Syntax:
-            WHERE condition [AND condition]*
+            WHERE condition [(AND | OR) condition]*
 
         Returns:
             A WhereClause AST node
         """
         conditions = self.parse_condition()
-        return WhereClause(conditions=conditions)
+        return self.ast.WhereClause(conditions=conditions)
 
     def parse_condition(self) -> dict[str, Any]:
         """Parse a condition expression.
 
-        Handles comparison and logical operators.
+        Handles comparisons combined with NOT, AND, and OR (in decreasing
+        order of precedence) and parenthesized groups. Operators are resolved
+        with an explicit operator stack rather than recursion, so conditions
+        with tens of thousands of terms parse without hitting the recursion
+        limit. Chains of the same binary operator are flattened into a single
+        n-ary node:
+
+            {"type": "logical", "operator": "OR", "operands": [c1, c2, c3]}
+
+        NOT produces a logical node with a single operand.
 
         Returns:
             Dictionary representing the condition tree
+
+        Raises:
+            SyntaxError: If parentheses are unbalanced or an operand is missing
         """
-        left = self.parse_comparison()
+        operands: list[dict[str, Any]] = []
+        operators: list[str] = []
+        open_groups = 0
 
-        # Handle AND/OR operators
-        while self.lexer.peek() and self.lexer.peek().type == "KEYWORD":
-            if self.lexer.peek().value.upper() in ("AND", "OR"):
-                operator = self.lexer.consume().value.upper()
-                right = self.parse_comparison()
-                left = {
-                    "type": "logical",
-                    "operator": operator,
-                    "left": left,
-                    "right": right,
-                }
-            else:
+        while True:
+            # Operand position: prefix NOT, an opening group, or a comparison
+            token = self.lexer.peek()
+            if token and token.type == "KEYWORD" and token.value.upper() == "NOT":
+                self.lexer.consume()
+                operators.append("NOT")
+                continue
+            if token and token.type == "LPAREN":
+                self.lexer.consume()
+                operators.append("(")
+                open_groups += 1
+                continue
+            operands.append(self.parse_comparison())
+
+            # Operator position: close groups, then a binary operator or the end
+            token = self.lexer.peek()
+            while token and token.type == "RPAREN" and open_groups:
+                self.lexer.consume()
+                while operators[-1] != "(":
+                    self._reduce_condition(operators.pop(), operands)
+                operators.pop()
+                open_groups -= 1
+                token = self.lexer.peek()
+
+            if not (
+                token
+                and token.type == "KEYWORD"
+                and token.value.upper() in _CONDITION_PRECEDENCE
+                and token.value.upper() != "NOT"
+            ):
                 break
 
-        return left
+            operator = self.lexer.consume().value.upper()
+            precedence = _CONDITION_PRECEDENCE[operator]
+            while (
+                operators
+                and operators[-1] != "("
+                and _CONDITION_PRECEDENCE[operators[-1]] >= precedence
+            ):
+                self._reduce_condition(operators.pop(), operands)
+            operators.append(operator)
+
+        if open_groups:
+            raise SyntaxError("Unbalanced parentheses in WHERE condition")
+
+        while operators:
+            self._reduce_condition(operators.pop(), operands)
+
+        return operands[0]
+
+    @staticmethod
+    def _reduce_condition(operator: str, operands: list[dict[str, Any]]) -> None:
+        """Apply a logical operator to the top of the operand stack.
+
+        Binary operators extend an existing node for the same operator in
+        place, which keeps long chains flat and linear to build.
+
+        Args:
+            operator: NOT, AND, or OR
+            operands: Operand stack, updated in place
+        """
+        if operator == "NOT":
+            operands.append(
+                {"type": "logical", "operator": "NOT", "operands": [operands.pop()]}
+            )
+            return
+
+        right = operands.pop()
+        left = operands.pop()
+
+        if left.get("type") == "logical" and left.get("operator") == operator:
+            node = left
+        else:
+            node = {"type": "logical", "operator": operator, "operands": [left]}
+
+        if right.get("type") == "logical" and right.get("operator") == operator:
+            node["operands"].extend(right["operands"])
+        else:
+            node["operands"].append(right)
+
+        operands.append(node)
 
     def parse_comparison(self) -> dict[str, Any]:
         """Parse a comparison expression.
 
-        Handles: =, <>, !=, <, >, <=, >=, property access, etc.
+        Handles: =, <>, !=, <, >, <=, >=, IN [list] or IN $list, CONTAINS, STARTS WITH,
+        ENDS WITH, property access, etc. The string predicates are not reserved
+        words, so properties may still be named ``contains`` or ``starts``.
 
         Returns:
             Dictionary representing the comparison
@@ -513,6 +753,29 @@ class CypherParser:
 
         # Check for comparison operators
         token = self.lexer.peek()
+        if token and token.type == "KEYWORD" and token.value.upper() == "IN":
+            self.lexer.consume()
+            following = self.lexer.peek()
+            return {
+                "type": "comparison",
+                "operator": "IN",
+                "left": left,
+                "right": (
+                    self.parse_expression()
+                    if following and following.type == "PARAMETER"
+                    else self.parse_list()
+                ),
+            }
+
+        string_operator = self._string_predicate(token)
+        if string_operator:
+            return {
+                "type": "comparison",
+                "operator": string_operator,
+                "left": left,
+                "right": self.parse_expression(),
+            }
+
         if token and token.type in ("EQUALS", "NOT_EQUALS", "LT", "GT", "LTE", "GTE"):
             operator = self.lexer.consume().value
             right = self.parse_expression()
@@ -525,8 +788,62 @@ class CypherParser:
 
         return left
 
+    def _string_predicate(self, token: Optional[Token]) -> Optional[str]:
+        """Consume a CONTAINS, STARTS WITH or ENDS WITH operator if one follows.
+
+        Args:
+            token: Current token
+
+        Returns:
+            Operator name ('CONTAINS', 'STARTS_WITH' or 'ENDS_WITH'), or None
+        """
+        if not token or token.type != "IDENTIFIER":
+            return None
+        word = token.value.upper()
+        if word == "CONTAINS":
+            self.lexer.consume()
+            return "CONTAINS"
+        following = self.lexer.peek(1)
+        if (
+            word in ("STARTS", "ENDS")
+            and following is not None
+            and following.type == "IDENTIFIER"
+            and following.value.upper() == "WITH"
+        ):
+            self.lexer.consume()
+            self.lexer.consume()
+            return f"{word}_WITH"
+        return None
+
+    def parse_list(self) -> dict[str, Any]:
+        """Parse a list of expressions.
+
+        Syntax:
+            [expression [, expression]*]
+
+        Returns:
+            Dictionary with type 'list' and the parsed 'items'
+        """
+        token = self.lexer.peek()
+        if not token or token.type != "LBRACKET":
+            raise SyntaxError("Expected '[' to start list")
+        self.lexer.consume()
+
+        items = []
+        if self.lexer.peek() and self.lexer.peek().type != "RBRACKET":
+            items.append(self.parse_expression())
+            while self.lexer.peek() and self.lexer.peek().type == "COMMA":
+                self.lexer.consume()
+                items.append(self.parse_expression())
+
+        if not self.lexer.peek() or self.lexer.peek().type != "RBRACKET":
+            raise SyntaxError("Expected ']' to close list")
+        self.lexer.consume()
+
+        return {"type": "list", "items": items}
+
     def parse_expression(self) -> dict[str, Any]:
-        """Parse an expression (property, identifier, or literal).
+        """Parse an expression (property, identifier, parameter, or literal).
 
         Returns:
             Dictionary representing the expression
@@ -554,6 +871,9 @@ class CypherParser:
 
             return {"type": "identifier", "name": variable_name}
 
+        if token.type == "PARAMETER":
+            return {"type": "parameter", "name": self.lexer.consume().value[1:]}
+
         # Parse literal values
         if token.type == "STRING":
             value = self.lexer.consume().value
@@ -649,46 +969,87 @@ class CypherParser:
             else:
                 break
 
-        return ReturnClause(
+        return self.ast.ReturnClause(
             items=items, distinct=distinct, order_by=order_by, limit=limit, skip=skip
         )
 
     def parse_return_item(self) -> Any:
-        """Parse a single return item (identifier, property, or aliased expression).
+        """Parse a single return item (identifier, property, function, or alias).
 
         Supports:
             - Simple identifiers: n
             - Property access: n.name
+            - Function calls: count(*), count(DISTINCT n), sum(n.size)
             - Aliases: n.name AS userName
 
         Returns:
-            An Identifier, Property, or AliasedExpression node
+            An Identifier, Property, function dict, or AliasedExpression node
         """
         if not self.lexer.peek() or self.lexer.peek().type != "IDENTIFIER":
             raise SyntaxError("Expected identifier in RETURN clause")
 
         variable_name = self.lexer.consume().value
-        variable = Identifier(name=variable_name)
+        variable = self.ast.Identifier(name=variable_name)
 
-        # Check for property access
+        # Check for a function call or property access
         expression = variable
-        if self.lexer.peek() and self.lexer.peek().type == "DOT":
+        if self.lexer.peek() and self.lexer.peek().type == "LPAREN":
+            expression = self.parse_function_call(variable_name)
+        elif self.lexer.peek() and self.lexer.peek().type == "DOT":
             self.lexer.consume()  # Consume dot
             if not self.lexer.peek() or self.lexer.peek().type != "IDENTIFIER":
                 raise SyntaxError("Expected property name after '.'")
-            property_name = Identifier(name=self.lexer.consume().value)
-            expression = Property(variable=variable, property_name=property_name)
+            property_name = self.ast.Identifier(name=self.lexer.consume().value)
+            expression = self.ast.Property(variable=variable, property_name=property_name)
 
         # Check for AS alias
         if self.lexer.peek() and self.lexer.match_keyword("AS"):
             self.lexer.consume()  # Consume AS
             if not self.lexer.peek() or self.lexer.peek().type != "IDENTIFIER":
                 raise SyntaxError("Expected alias name after 'AS'")
-            alias = Identifier(name=self.lexer.consume().value)
-            return AliasedExpression(expression=expression, alias=alias)
+            alias = self.ast.Identifier(name=self.lexer.consume().value)
+            return self.ast.AliasedExpression(expression=expression, alias=alias)
 
         return expression
 
+    def parse_function_call(self, name: str) -> dict[str, Any]:
+        """Parse the argument list of a function call in a RETURN item.
+
+        Syntax:
+            name([DISTINCT] expression [, expression]*) | name(*) | name()
+
+        Args:
+            name: Function name, already consumed
+
+        Returns:
+            Dictionary with 'type' 'function', 'name', 'arguments' and
+            'distinct'; ``count(*)`` has no arguments
+        """
+        self.lexer.consume("LPAREN")
+
+        distinct = False
+        if self.lexer.peek() and self.lexer.match_keyword("DISTINCT"):
+            self.lexer.consume()
+            distinct = True
+
+        arguments = []
+        token = self.lexer.peek()
+        if token and token.type == "STAR":
+            if distinct:
+                raise SyntaxError("DISTINCT cannot be applied to '*'")
+            self.lexer.consume()
+        elif token and token.type != "RPAREN":
+            arguments.append(self.parse_expression())
+            while self.lexer.peek() and self.lexer.peek().type == "COMMA":
+                self.lexer.consume()
+                arguments.append(self.parse_expression())
+
+        if not self.lexer.peek() or self.lexer.peek().type != "RPAREN":
+            raise SyntaxError(f"Expected ')' to close {name}(")
+        self.lexer.consume()
+
+        return {"type": "function", "name": name, "arguments": arguments, "distinct": distinct}
+
     def parse_order_by(self) -> list[dict[str, Any]]:
         """Parse ORDER BY clause items.
 
@@ -733,37 +1094,40 @@ class CypherParser:
 
         return items
 
-    def parse_literal(self) -> Literal:
-        """Parse a literal value.
+    def parse_literal(self) -> Union[Literal, Parameter]:
+        """Parse a literal value or parameter.
 
         Returns:
-            A Literal AST node
+            A Literal or Parameter AST node
         """
         token = self.lexer.peek()
 
         if not token:
             raise SyntaxError("Expected literal value")
 
+        if token.type == "PARAMETER":
+            return self.ast.Parameter(name=self.lexer.consume().value[1:])
+
         if token.type == "STRING":
             value = self.lexer.consume().value
             cleaned = value[1:-1]  # Remove quotes
-            return Literal(value=cleaned, value_type="string")
+            return self.ast.Literal(value=cleaned, value_type="string")
 
         if token.type == "NUMBER":
             value = self.lexer.consume().value
             num_value = float(value) if "." in value else int(value)
-            return Literal(value=num_value, value_type="number")
+            return self.ast.Literal(value=num_value, value_type="number")
 
         if token.type == "KEYWORD":
             if token.value.upper() == "TRUE":
                 self.lexer.consume()
-                return Literal(value=True, value_type="boolean")
+                return self.ast.Literal(value=True, value_type="boolean")
             elif token.value.upper() == "FALSE":
                 self.lexer.consume()
-                return Literal(value=False, value_type="boolean")
+                return self.ast.Literal(value=False, value_type="boolean")
             elif token.value.upper() == "NULL":
                 self.lexer.consume()
-                return Literal(value=None, value_type="null")
+                return self.ast.Literal(value=None, value_type="null")
 
         raise SyntaxError(
             f"Unexpected token in literal: {token.type} "
@@ -771,13 +1135,14 @@ class CypherParser:
         )
 
 
-def parse_query(query_string: str) -> Query:
+def parse_query(query_string: str, fast_ast: bool = False) -> Query:
     """Parse a Cypher query string into an AST.
 
     This is the main entry point for parsing Cypher queries.
 
     Args:
         query_string: The Cypher query to parse
+        fast_ast: Return lightweight ``fast_ast`` nodes instead of pydantic models
 
     Returns:
         The root Query AST node
@@ -790,5 +1155,5 @@ def parse_query(query_string: str) -> Query:
         >>> query.match_clause.paths[0].nodes[0].labels[0].name
         'Person'
     """
-    parser = CypherParser(query_string)
+    parser = CypherParser(query_string, fast_ast=fast_ast)
     return parser.parse()
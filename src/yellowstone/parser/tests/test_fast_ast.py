@@ -0,0 +1,99 @@
+"""
+Tests for the lightweight slotted AST representation.
+
+Tests cover:
+    - Parsing into fast AST nodes
+    - Attribute and string-representation parity with pydantic nodes
+    - Conversion to and from pydantic models
+    - Immutability and slot layout
+"""
+
+import dataclasses
+
+import pytest
+from pydantic import ValidationError
+
+from yellowstone.parser import CypherParser, ast_nodes, fast_ast, parse_query
+
+
+QUERIES = [
+    "MATCH (n:Person) RETURN n",
+    "MATCH (n:Person {name: 'John', age: 30, active: true}) RETURN n.name AS name",
+    "MATCH (a:User)-[r:KNOWS]->(b:User)<-[:FOLLOWS]-(c) WHERE a.age > 30 AND b.name = 'x' "
+    "RETURN DISTINCT a, b.name ORDER BY b.name DESC LIMIT 5 SKIP 2",
+    "OPTIONAL MATCH (a)-[r]-(b), (c:Device) RETURN a, c",
+    "MATCH (a:User)-[r:KNOWS*1..3]->(b)-[*]-(c) RETURN a",
+    "MATCH p = shortestPath((a:User)-[:KNOWS*..5]->(b)) RETURN b",
+    "MATCH (n:Person {name: $name}) WHERE n.age > $age RETURN n",
+]
+
+
+class TestFastAstParsing:
+    """Test suite for parsing into fast AST nodes."""
+
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_same_string_output(self, query: str) -> None:
+        """Test that fast and pydantic trees print identically."""
+        assert str(parse_query(query, fast_ast=True)) == str(parse_query(query))
+
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_round_trip_conversion(self, query: str) -> None:
+        """Test that conversions in both directions preserve the tree."""
+        slow = parse_query(query)
+        fast = parse_query(query, fast_ast=True)
+
+        assert fast_ast.to_pydantic(fast) == slow
+        assert fast_ast.from_pydantic(slow) == fast
+
+    def test_builds_fast_node_types(self) -> None:
+        """Test that the parser builds fast node classes throughout."""
+        query = parse_query("MATCH (n:Person {name: 'J'})-[r:KNOWS]->(m) RETURN n.name", True)
+        path = query.match_clause.paths[0]
+
+        assert isinstance(query, fast_ast.Query)
+        assert isinstance(path, fast_ast.PathExpression)
+        assert isinstance(path.nodes[0].labels[0], fast_ast.Identifier)
+        assert isinstance(path.nodes[0].properties["name"], fast_ast.Literal)
+        assert isinstance(path.relationships[0], fast_ast.RelationshipPattern)
+        assert isinstance(query.return_clause.items[0], fast_ast.Property)
+
+    def test_parser_flag(self) -> None:
+        """Test that CypherParser exposes the fast_ast flag."""
+        parser = CypherParser("MATCH (n) RETURN n", fast_ast=True)
+        assert parser.ast is fast_ast
+        assert CypherParser("MATCH (n) RETURN n").ast is ast_nodes
+
+    def test_path_validation(self) -> None:
+        """Test that fast paths keep structural validation."""
+        path = fast_ast.PathExpression(nodes=[fast_ast.NodePattern()], relationships=[])
+        assert path.validate_structure()
+
+        bad = fast_ast.PathExpression(nodes=[], relationships=[fast_ast.RelationshipPattern()])
+        with pytest.raises(ValueError):
+            bad.validate_structure()
+
+
+class TestFastAstNodes:
+    """Test suite for fast AST node classes."""
+
+    def test_nodes_are_frozen(self) -> None:
+        """Test that fast nodes cannot be reassigned."""
+        node = fast_ast.Identifier(name="n")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            node.name = "m"
+
+    def test_nodes_have_no_instance_dict(self) -> None:
+        """Test that fast nodes use slots instead of a per-instance dict."""
+        assert not hasattr(fast_ast.Identifier(name="n"), "__dict__")
+        assert not hasattr(fast_ast.NodePattern(), "__dict__")
+
+    def test_same_attribute_names(self) -> None:
+        """Test that every fast node has the same fields as its pydantic twin."""
+        for name in ("Identifier", "Literal", "NodePattern", "RelationshipPattern", "Query"):
+            fast_fields = {f.name for f in dataclasses.fields(getattr(fast_ast, name))}
+            assert fast_fields == set(getattr(ast_nodes, name).model_fields)
+
+    def test_to_pydantic_validates(self) -> None:
+        """Test that converting an invalid fast tree raises a validation error."""
+        with pytest.raises(ValidationError):
+            fast_ast.to_pydantic(fast_ast.Identifier(name=None))
@@ -0,0 +1,194 @@
+"""
+Tests for the structural parse cache.
+
+Tests cover:
+    - Query text normalization
+    - Hit/miss/eviction accounting and LRU order
+    - Immutability of shared Query objects
+    - Thread safety under concurrent access
+"""
+
+import threading
+
+import pytest
+from pydantic import ValidationError
+
+from yellowstone.parser import (
+    ParseCache,
+    Query,
+    get_default_parse_cache,
+    normalize_query_text,
+    parse_query,
+    parse_query_cached,
+)
+
+
+class TestNormalizeQueryText:
+    """Test suite for cache key normalization."""
+
+    def test_collapses_whitespace(self) -> None:
+        """Test that whitespace runs collapse to a single space."""
+        assert normalize_query_text("MATCH  (n)\n\tRETURN   n ") == "MATCH (n) RETURN n"
+
+    def test_uppercases_keywords(self) -> None:
+        """Test that keywords are upper-cased."""
+        assert normalize_query_text("match (n) return n") == "MATCH (n) RETURN n"
+
+    def test_preserves_identifier_case(self) -> None:
+        """Test that identifiers and labels keep their case."""
+        assert normalize_query_text("MATCH (Node:user) RETURN Node") == (
+            "MATCH (Node:user) RETURN Node"
+        )
+
+    def test_preserves_string_literals(self) -> None:
+        """Test that string contents are not normalized."""
+        normalized = normalize_query_text("MATCH (n) WHERE n.name = 'and  or' RETURN n")
+        assert "'and  or'" in normalized
+
+
+class TestParseCache:
+    """Test suite for ParseCache behavior."""
+
+    def test_miss_then_hit(self) -> None:
+        """Test that the second lookup of a query is a hit."""
+        cache = ParseCache()
+        first = cache.get_or_parse("MATCH (n:User) RETURN n")
+        second = cache.get_or_parse("MATCH (n:User) RETURN n")
+
+        assert first is second
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+
+    def test_normalized_variants_share_entry(self) -> None:
+        """Test that whitespace and keyword-case variants hit the same entry."""
+        cache = ParseCache()
+        first = cache.get_or_parse("MATCH (n:User) RETURN n")
+        second = cache.get_or_parse("match (n:User)\n   return n")
+
+        assert first is second
+        assert len(cache) == 1
+
+    def test_cached_ast_matches_parse_query(self) -> None:
+        """Test that cached ASTs equal freshly parsed ones."""
+        query = "MATCH (n:User)-[r:KNOWS]->(m) WHERE n.age > 30 RETURN n.name LIMIT 5"
+        assert ParseCache().get_or_parse(query) == parse_query(query)
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted."""
+        cache = ParseCache(max_size=2)
+        cache.get_or_parse("MATCH (a) RETURN a")
+        cache.get_or_parse("MATCH (b) RETURN b")
+        cache.get_or_parse("MATCH (a) RETURN a")  # refresh a
+        cache.get_or_parse("MATCH (c) RETURN c")  # evicts b
+
+        assert cache.stats().evictions == 1
+        assert cache.get("MATCH (a) RETURN a") is not None
+        assert cache.get("MATCH (b) RETURN b") is None
+
+    def test_syntax_errors_not_cached(self) -> None:
+        """Test that invalid queries raise and leave the cache empty."""
+        cache = ParseCache()
+        with pytest.raises(SyntaxError):
+            cache.get_or_parse("MATCH (n RETURN n")
+        assert len(cache) == 0
+
+    def test_cached_query_is_frozen(self) -> None:
+        """Test that shared Query objects cannot be reassigned."""
+        query = ParseCache().get_or_parse("MATCH (n:User) RETURN n")
+        with pytest.raises(ValidationError):
+            query.where_clause = None
+        with pytest.raises(ValidationError):
+            query.match_clause.paths[0].nodes[0].variable = None
+
+    def test_cached_containers_are_read_only(self) -> None:
+        """Test that mutating a returned AST fails and leaves the next hit unchanged."""
+        cache = ParseCache()
+        text = "MATCH (n:User {name: 'a'}) WHERE n.age > 30 AND n.x = 1 RETURN n"
+        query = cache.get_or_parse(text)
+
+        with pytest.raises(TypeError):
+            query.where_clause.conditions["operator"] = "OR"
+        with pytest.raises(TypeError):
+            query.where_clause.conditions["operands"].pop()
+        with pytest.raises(TypeError):
+            query.match_clause.paths[0].nodes[0].properties.clear()
+        with pytest.raises(TypeError):
+            query.return_clause.items.append(None)
+
+        assert cache.get_or_parse(text) == parse_query(text)
+
+    def test_copies_of_cached_containers_are_mutable(self) -> None:
+        """Test that callers can still build modified copies of a cached AST."""
+        query = ParseCache().get_or_parse("MATCH (n:User) WHERE n.age > 30 RETURN n")
+
+        conditions = dict(query.where_clause.conditions)
+        conditions["operator"] = "<"
+        copied = query.model_copy(deep=True)
+        copied.where_clause.conditions["operator"] = "<"
+
+        assert query.where_clause.conditions["operator"] == ">"
+
+    def test_put_does_not_freeze_caller_ast(self) -> None:
+        """Test that storing a query freezes a copy, not the caller's AST."""
+        query = parse_query("MATCH (n:User) RETURN n")
+        ParseCache().put("MATCH (n:User) RETURN n", query)
+
+        query.return_clause.items.append(None)
+
+    def test_clear_resets_counters(self) -> None:
+        """Test that clear empties the cache and resets stats."""
+        cache = ParseCache()
+        cache.get_or_parse("MATCH (n) RETURN n")
+        cache.clear()
+
+        stats = cache.stats()
+        assert stats.size == 0
+        assert stats.misses == 0
+
+    def test_invalid_max_size(self) -> None:
+        """Test that a non-positive max_size is rejected."""
+        with pytest.raises(ValueError):
+            ParseCache(max_size=0)
+
+    def test_concurrent_access(self) -> None:
+        """Test that concurrent lookups keep the cache consistent."""
+        cache = ParseCache(max_size=8)
+        queries = [f"MATCH (n{i}) RETURN n{i}" for i in range(16)]
+        errors = []
+
+        def worker() -> None:
+            try:
+                for _ in range(20):
+                    for query in queries:
+                        assert isinstance(cache.get_or_parse(query), Query)
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        assert not errors
+        assert stats.size <= 8
+        assert stats.hits + stats.misses == 4 * 20 * 16
+
+
+class TestParseQueryCached:
+    """Test suite for the module-level cached parse function."""
+
+    def test_uses_default_cache(self) -> None:
+        """Test that parse_query_cached populates the default cache."""
+        query = "MATCH (n:DefaultCacheProbe) RETURN n"
+        first = parse_query_cached(query)
+        assert get_default_parse_cache().get(query) is first
+
+    def test_explicit_empty_cache_is_used(self) -> None:
+        """Test that an explicitly passed (empty) cache is not ignored."""
+        cache = ParseCache()
+        parse_query_cached("MATCH (n) RETURN n", cache=cache)
+        assert len(cache) == 1
@@ -24,6 +24,7 @@ from yellowstone.parser import (
     NodePattern,
     RelationshipPattern,
 )
+from yellowstone.parser.ast_nodes import AliasedExpression, Parameter, Property
 
 
 # ============================================================================
@@ -56,6 +57,11 @@ class TestLexer:
         assert "LT" in types
         assert "GT" in types
 
+    def test_parameter_tokenization(self) -> None:
+        """Test that $name is a single parameter token."""
+        lexer = Lexer("n.name = $user_1")
+        assert (lexer.tokens[-1].type, lexer.tokens[-1].value) == ("PARAMETER", "$user_1")
+
     def test_arrow_tokenization(self) -> None:
         """Test that arrows are recognized."""
         lexer = Lexer("-> <- --")
@@ -97,6 +103,55 @@ class TestLexer:
         with pytest.raises(SyntaxError):
             Lexer("@invalid#token$")
 
+    def test_keywords_case_insensitive(self) -> None:
+        """Test that keywords are recognized regardless of case."""
+        lexer = Lexer("match Where rEtUrN")
+        assert [token.type for token in lexer.tokens] == ["KEYWORD"] * 3
+        assert lexer.tokens[0].value == "match"
+
+    def test_keyword_prefix_is_identifier(self) -> None:
+        """Test that identifiers starting with a keyword stay identifiers."""
+        lexer = Lexer("ordering android notes")
+        assert all(token.type == "IDENTIFIER" for token in lexer.tokens)
+
+    def test_token_positions(self) -> None:
+        """Test that tokens record their offset in the input."""
+        lexer = Lexer("MATCH  (n)")
+        assert [token.position for token in lexer.tokens] == [0, 7, 8, 9]
+
+    def test_iter_tokens_is_lazy(self) -> None:
+        """Test that iter_tokens yields tokens before reaching invalid input."""
+        tokens = Lexer.iter_tokens("MATCH (n) @")
+        assert next(tokens).type == "KEYWORD"
+        assert next(tokens).type == "LPAREN"
+        with pytest.raises(SyntaxError):
+            list(tokens)
+
+    def test_lazy_lexer_peek_and_consume(self) -> None:
+        """Test that lazy mode buffers only the tokens that were requested."""
+        lexer = Lexer("MATCH (n) RETURN n", lazy=True)
+        assert lexer.tokens == []
+        assert lexer.peek(1).type == "LPAREN"
+        assert len(lexer.tokens) == 2
+        assert lexer.consume("KEYWORD").value == "MATCH"
+        assert not lexer.is_at_end()
+
+    def test_lazy_lexer_matches_eager(self) -> None:
+        """Test that lazy and eager modes produce the same tokens."""
+        query = "MATCH (n:User)-[r:KNOWS]->(m) WHERE n.age >= 30 RETURN n.name"
+        lazy = Lexer(query, lazy=True)
+        consumed = []
+        while not lazy.is_at_end():
+            consumed.append(lazy.consume())
+        assert consumed == Lexer(query).tokens
+
+    def test_lazy_lexer_parses_query(self) -> None:
+        """Test that the parser works on top of a lazy lexer."""
+        parser = CypherParser("MATCH (n:Person) RETURN n")
+        parser.lexer = Lexer(parser.query, lazy=True)
+        query = parser.parse()
+        assert query.match_clause.paths[0].nodes[0].labels[0].name == "Person"
+
 
 # ============================================================================
 # Node Pattern Tests
@@ -125,6 +180,14 @@ class TestNodePatterns:
         assert len(node.labels) == 1
         assert node.labels[0].name == "Person"
 
+    def test_node_with_parameter_property(self) -> None:
+        """Test parsing a parameter as a property map value."""
+        query = parse_query("MATCH (n:Person {name: $name, age: 30}) RETURN n")
+
+        properties = query.match_clause.paths[0].nodes[0].properties
+        assert properties["name"] == Parameter(name="name")
+        assert str(properties["name"]) == "$name"
+
     def test_node_with_multiple_labels(self) -> None:
         """Test parsing node with multiple labels."""
         query_str = "MATCH (n:Person:Actor) RETURN n"
@@ -238,6 +301,32 @@ class TestRelationshipPatterns:
         rel = query.match_clause.paths[0].relationships[0]
         assert rel.direction == "out"
 
+    @pytest.mark.parametrize(
+        "pattern,length",
+        [
+            ("-[r:KNOWS*1..3]->", "1..3"),
+            ("-[*..5]->", "..5"),
+            ("-[*2..]-", "2.."),
+            ("<-[:KNOWS*2]-", "2"),
+            ("-[*]->", "*"),
+            ("-[r:KNOWS]->", None),
+        ],
+    )
+    def test_variable_length_relationship(self, pattern: str, length) -> None:
+        """Test parsing variable-length hop bounds."""
+        query = parse_query(f"MATCH (n){pattern}(m) RETURN n")
+
+        rel = query.match_clause.paths[0].relationships[0]
+        assert rel.length == length
+        assert str(rel) == pattern
+
+    def test_variable_length_bounds_validated(self) -> None:
+        """Test that a minimum above the maximum is rejected."""
+        with pytest.raises(SyntaxError):
+            parse_query("MATCH (n)-[*3..1]->(m) RETURN n")
+        with pytest.raises(SyntaxError):
+            parse_query("MATCH (n)-[*1.5]->(m) RETURN n")
+
 
 # ============================================================================
 # Path Expression Tests
@@ -274,6 +363,40 @@ class TestPathExpressions:
         with pytest.raises(ValueError):
             path.validate_structure()
 
+    def test_named_path(self) -> None:
+        """Test a path assigned to a variable."""
+        query = parse_query("MATCH p = (a)-[:KNOWS]->(b) RETURN p")
+
+        path = query.match_clause.paths[0]
+        assert path.variable.name == "p"
+        assert path.shortest is None
+
+    @pytest.mark.parametrize(
+        "function,mode", [("shortestPath", "any"), ("allShortestPaths", "all")]
+    )
+    def test_shortest_path(self, function: str, mode: str) -> None:
+        """Test shortestPath() and allShortestPaths() around a pattern."""
+        query = parse_query(f"MATCH p = {function}((a:User)-[*..5]->(b)) RETURN b")
+
+        path = query.match_clause.paths[0]
+        assert path.shortest == mode
+        assert path.variable.name == "p"
+        assert path.relationships[0].length == "..5"
+
+    @pytest.mark.parametrize(
+        "query_str",
+        [
+            "MATCH shortestPath((a)-[*]->(b)-[*]->(c)) RETURN a",
+            "MATCH shortestPath((a)) RETURN a",
+            "MATCH longestPath((a)-[*]->(b)) RETURN a",
+            "MATCH shortestPath((a)-[*]->(b) RETURN a",
+        ],
+    )
+    def test_shortest_path_errors(self, query_str: str) -> None:
+        """Test multi-hop, node-only, unknown and unclosed path functions."""
+        with pytest.raises(SyntaxError):
+            parse_query(query_str)
+
 
 # ============================================================================
 # WHERE Clause Tests
@@ -341,6 +464,108 @@ class TestWhereClauses:
         assert conditions["type"] == "logical"
         assert conditions["operator"] == "OR"
 
+    def test_same_operator_chain_is_flattened(self) -> None:
+        """Test that chains of one operator become a single n-ary node."""
+        query = parse_query("MATCH (n) WHERE n.a = 1 OR n.a = 2 OR n.a = 3 RETURN n")
+
+        conditions = query.where_clause.conditions
+        assert conditions["operator"] == "OR"
+        assert [op["right"]["value"] for op in conditions["operands"]] == [1, 2, 3]
+
+    def test_and_binds_tighter_than_or(self) -> None:
+        """Test operator precedence between AND and OR."""
+        query = parse_query("MATCH (n) WHERE n.a = 1 OR n.b = 2 AND n.c = 3 RETURN n")
+
+        conditions = query.where_clause.conditions
+        assert conditions["operator"] == "OR"
+        assert conditions["operands"][0]["type"] == "comparison"
+        assert conditions["operands"][1]["operator"] == "AND"
+        assert len(conditions["operands"][1]["operands"]) == 2
+
+    def test_parentheses_override_precedence(self) -> None:
+        """Test that parenthesized groups are parsed as a unit."""
+        query = parse_query("MATCH (n) WHERE (n.a = 1 OR n.b = 2) AND n.c = 3 RETURN n")
+
+        conditions = query.where_clause.conditions
+        assert conditions["operator"] == "AND"
+        assert conditions["operands"][0]["operator"] == "OR"
+        assert conditions["operands"][1]["type"] == "comparison"
+
+    def test_not_operator(self) -> None:
+        """Test that NOT produces a unary logical node binding tighter than AND."""
+        query = parse_query("MATCH (n) WHERE NOT n.a = 1 AND n.b = 2 RETURN n")
+
+        conditions = query.where_clause.conditions
+        assert conditions["operator"] == "AND"
+        negated = conditions["operands"][0]
+        assert negated["operator"] == "NOT"
+        assert negated["operands"][0]["type"] == "comparison"
+
+    def test_in_list(self) -> None:
+        """Test that IN parses against a literal list."""
+        query = parse_query("MATCH (n) WHERE n.status IN ['a', 'b', 3] RETURN n")
+
+        conditions = query.where_clause.conditions
+        assert conditions["type"] == "comparison"
+        assert conditions["operator"] == "IN"
+        assert conditions["right"]["type"] == "list"
+        assert [item["value"] for item in conditions["right"]["items"]] == ["a", "b", 3]
+
+    def test_in_requires_list(self) -> None:
+        """Test that IN without a bracketed list raises SyntaxError."""
+        with pytest.raises(SyntaxError):
+            parse_query("MATCH (n) WHERE n.status IN 'a' RETURN n")
+
+    def test_parameters(self) -> None:
+        """Test parameters as comparison operands and IN lists."""
+        query = parse_query("MATCH (n) WHERE n.a = $a AND n.b IN $bs RETURN n")
+
+        operands = query.where_clause.conditions["operands"]
+        assert operands[0]["right"] == {"type": "parameter", "name": "a"}
+        assert operands[1]["operator"] == "IN"
+        assert operands[1]["right"] == {"type": "parameter", "name": "bs"}
+
+    def test_string_predicates(self) -> None:
+        """Test CONTAINS, STARTS WITH and ENDS WITH comparisons."""
+        query = parse_query(
+            "MATCH (n) WHERE n.a CONTAINS 'x' OR n.b starts with 'y' OR n.c ENDS WITH 'z' RETURN n"
+        )
+
+        operands = query.where_clause.conditions["operands"]
+        assert [operand["operator"] for operand in operands] == [
+            "CONTAINS", "STARTS_WITH", "ENDS_WITH"
+        ]
+        assert operands[1]["right"] == {"type": "literal", "value": "y", "value_type": "string"}
+
+    def test_string_predicate_words_are_not_reserved(self) -> None:
+        """Test that properties may be named like the string predicates."""
+        query = parse_query("MATCH (n) WHERE n.contains = 1 AND n.starts = 2 RETURN n")
+
+        operands = query.where_clause.conditions["operands"]
+        assert [operand["left"]["property"] for operand in operands] == ["contains", "starts"]
+
+    def test_unbalanced_parentheses(self) -> None:
+        """Test that an unclosed group raises SyntaxError."""
+        with pytest.raises(SyntaxError):
+            parse_query("MATCH (n) WHERE (n.a = 1 OR n.b = 2 RETURN n")
+
+    def test_very_long_condition_chain(self) -> None:
+        """Test that tens of thousands of terms parse without recursion."""
+        terms = " OR ".join(f"n.id = {i}" for i in range(20000))
+        query = parse_query(f"MATCH (n) WHERE {terms} RETURN n")
+
+        assert len(query.where_clause.conditions["operands"]) == 20000
+
+    def test_deeply_nested_groups(self) -> None:
+        """Test that deeply nested parentheses parse without recursion."""
+        depth = 5000
+        query = parse_query(
+            "MATCH (n) WHERE " + "(n.a = 1 AND " * depth + "n.b = 2" + ")" * depth + " RETURN n"
+        )
+
+        # Same-operator groups collapse into one flat node
+        assert len(query.where_clause.conditions["operands"]) == depth + 1
+
 
 # ============================================================================
 # RETURN Clause Tests
@@ -422,6 +647,41 @@ class TestReturnClauses:
         assert return_clause.order_by is not None
         assert return_clause.order_by[0]["direction"] == "DESC"
 
+    def test_return_count_star(self) -> None:
+        """Test RETURN count(*), which has no arguments."""
+        query = parse_query("MATCH (n) RETURN count(*)")
+
+        assert query.return_clause.items[0] == {
+            "type": "function", "name": "count", "arguments": [], "distinct": False
+        }
+
+    def test_return_function_distinct_argument(self) -> None:
+        """Test a DISTINCT aggregate over a property."""
+        query = parse_query("MATCH (n) RETURN count(DISTINCT n.role)")
+
+        item = query.return_clause.items[0]
+        assert item["distinct"] is True
+        assert item["arguments"] == [{"type": "property", "variable": "n", "property": "role"}]
+
+    def test_return_aliased_function_with_group_key(self) -> None:
+        """Test a grouping key next to an aliased aggregate."""
+        query = parse_query("MATCH (n) RETURN n.role, collect(n.name) AS names")
+
+        items = query.return_clause.items
+        assert isinstance(items[0], Property)
+        assert isinstance(items[1], AliasedExpression)
+        assert items[1].alias.name == "names"
+        assert items[1].expression["name"] == "collect"
+
+    @pytest.mark.parametrize(
+        "query_str",
+        ["MATCH (n) RETURN count(DISTINCT *)", "MATCH (n) RETURN count(n"],
+    )
+    def test_return_function_errors(self, query_str: str) -> None:
+        """Test malformed function calls."""
+        with pytest.raises(SyntaxError):
+            parse_query(query_str)
+
 
 # ============================================================================
 # Complex Query Tests
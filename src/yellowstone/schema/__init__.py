@@ -14,6 +14,11 @@ from .models import (
     PropertyMapping,
     SchemaValidationResult,
     LabelMappingCache,
+    SchemaStatistics,
+    TableStatistics,
+    RelationshipStatistics,
+    GraphModel,
+    GraphSnapshot,
 )
 
 __all__ = [
@@ -25,4 +30,9 @@ __all__ = [
     "PropertyMapping",
     "SchemaValidationResult",
     "LabelMappingCache",
+    "SchemaStatistics",
+    "TableStatistics",
+    "RelationshipStatistics",
+    "GraphModel",
+    "GraphSnapshot",
 ]
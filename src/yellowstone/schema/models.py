@@ -2,6 +2,7 @@
 Pydantic models for schema validation and type safety.
 """
 
+import re
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
@@ -69,11 +70,73 @@ class EdgeMapping(BaseModel):
         return v
 
 
+# KQL timespan literal, e.g. 7d, 12h, 30m, 1.5h
+KQL_TIMESPAN_PATTERN = re.compile(r"^\d+(\.\d+)?(d|h|m|s|ms)$")
+
+
 class TableMetadata(BaseModel):
     """Metadata about a Sentinel table."""
     description: str = Field(..., description="Table description")
     retention_days: int = Field(..., description="Data retention period in days")
     fields: List[str] = Field(default_factory=list, description="Available fields")
+    time_column: Optional[str] = Field(
+        None,
+        description="Datetime column used for time-window filters"
+    )
+    default_lookback: Optional[str] = Field(
+        None,
+        description="Default lookback as a KQL timespan (e.g. 7d) when no window is given"
+    )
+
+    @field_validator('default_lookback')
+    @classmethod
+    def validate_default_lookback(cls, v):
+        """Validate that the default lookback is a KQL timespan literal."""
+        if v is not None and not KQL_TIMESPAN_PATTERN.match(v):
+            raise ValueError(f"default_lookback must be a KQL timespan like '7d', got {v}")
+        return v
+
+
+class GraphSnapshot(BaseModel):
+    """A named snapshot of a persistent graph model."""
+    max_age: str = Field(
+        ...,
+        description="Longest the snapshot lags its source tables, as a KQL timespan (e.g. 1h)"
+    )
+
+    @field_validator('max_age')
+    @classmethod
+    def validate_max_age(cls, v):
+        """Validate that the maximum age is a KQL timespan literal."""
+        if not KQL_TIMESPAN_PATTERN.match(v):
+            raise ValueError(f"max_age must be a KQL timespan like '1h', got {v}")
+        return v
+
+
+class GraphModel(BaseModel):
+    """A persistent graph model maintained in the workspace."""
+    description: str = Field(default="", description="Human-readable description")
+    labels: List[str] = Field(..., description="Node labels the model holds")
+    relationships: List[str] = Field(
+        default_factory=list,
+        description="Relationship types the model holds"
+    )
+    lookback: Optional[str] = Field(
+        None,
+        description="Window its snapshots hold as a KQL timespan (None for table defaults)"
+    )
+    snapshots: Dict[str, GraphSnapshot] = Field(
+        default_factory=dict,
+        description="Snapshots kept of the model, by name"
+    )
+
+    @field_validator('lookback')
+    @classmethod
+    def validate_lookback(cls, v):
+        """Validate that the lookback is a KQL timespan literal."""
+        if v is not None and not KQL_TIMESPAN_PATTERN.match(v):
+            raise ValueError(f"lookback must be a KQL timespan like '7d', got {v}")
+        return v
 
 
 class SchemaMapping(BaseModel):
@@ -94,6 +157,41 @@ class SchemaMapping(BaseModel):
         default_factory=dict,
         description="Sentinel table metadata"
     )
+    graphs: Dict[str, GraphModel] = Field(
+        default_factory=dict,
+        description="Persistent graph models and their snapshots"
+    )
+
+
+class TableStatistics(BaseModel):
+    """Size and cardinality statistics for a Sentinel table."""
+    row_count: int = Field(..., ge=0, description="Rows held over the table's retention")
+    rows_per_day: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Typical rows ingested per day, used to size time windows"
+    )
+    distinct_counts: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Number of distinct values per column"
+    )
+
+
+class RelationshipStatistics(BaseModel):
+    """Fan-out statistics for a Cypher relationship type."""
+    avg_degree: float = Field(..., gt=0, description="Average edges per source node")
+
+
+class SchemaStatistics(BaseModel):
+    """Optional statistics loaded alongside a schema for cost estimation."""
+    tables: Dict[str, TableStatistics] = Field(
+        default_factory=dict,
+        description="Statistics per Sentinel table"
+    )
+    relationships: Dict[str, RelationshipStatistics] = Field(
+        default_factory=dict,
+        description="Statistics per relationship type"
+    )
 
 
 class SchemaValidationResult(BaseModel):
@@ -11,7 +11,14 @@ from typing import Dict, List, Optional, Set, Tuple, Any
 
 import yaml
 
-from .models import SchemaMapping, LabelMappingCache
+from .models import (
+    GraphModel,
+    SchemaMapping,
+    LabelMappingCache,
+    RelationshipStatistics,
+    SchemaStatistics,
+    TableStatistics,
+)
 from .schema_validator import SchemaValidator
 
 
@@ -38,6 +45,7 @@ class SchemaMapper:
             >>> assert table == 'IdentityInfo'
         """
         self.schema: Optional[SchemaMapping] = None
+        self.statistics = SchemaStatistics()
         self.cache = LabelMappingCache()
         self.validator = SchemaValidator()
 
@@ -93,6 +101,56 @@ class SchemaMapper:
         # Build cache
         self._build_cache()
 
+        # Load optional statistics kept next to the schema
+        self.statistics = SchemaStatistics()
+        stats_path = self.get_statistics_path(schema_path)
+        if os.path.exists(stats_path):
+            self.load_statistics(stats_path)
+
+    @staticmethod
+    def get_statistics_path(schema_path: str) -> str:
+        """
+        Get the path of the statistics file that accompanies a schema.
+
+        Args:
+            schema_path: Path to YAML schema file
+
+        Returns:
+            Path with the schema's suffix replaced by ``.stats.yaml``
+
+        Example:
+            >>> SchemaMapper.get_statistics_path('/schemas/sentinel.yaml')
+            '/schemas/sentinel.stats.yaml'
+        """
+        path = Path(schema_path)
+        return str(path.with_name(f"{path.stem}.stats.yaml"))
+
+    def load_statistics(self, stats_path: str) -> None:
+        """
+        Load table and relationship statistics from YAML.
+
+        Args:
+            stats_path: Path to YAML statistics file
+
+        Raises:
+            FileNotFoundError: If statistics file doesn't exist
+            yaml.YAMLError: If YAML is malformed
+            ValueError: If statistics validation fails
+        """
+        if not os.path.exists(stats_path):
+            raise FileNotFoundError(f"Statistics file not found: {stats_path}")
+
+        try:
+            with open(stats_path, "r") as f:
+                stats_dict = yaml.safe_load(f) or {}
+        except yaml.YAMLError as e:
+            raise yaml.YAMLError(f"Failed to parse YAML statistics: {e}")
+
+        try:
+            self.statistics = SchemaStatistics(**stats_dict)
+        except Exception as e:
+            raise ValueError(f"Statistics validation failed: {e}")
+
     def _build_cache(self) -> None:
         """Build in-memory cache for fast lookups."""
         if not self.schema:
@@ -165,6 +223,101 @@ class SchemaMapper:
         """
         return self.cache.table_to_fields.get(table_name, [])
 
+    def get_time_column(self, table_name: str) -> Optional[str]:
+        """
+        Get the datetime column used to bound a table to a time window.
+
+        Uses the table's explicit ``time_column`` if set, then ``TimeGenerated``
+        if it is a listed field, then the first datetime property mapped to the
+        table.
+
+        Args:
+            table_name: Sentinel table name
+
+        Returns:
+            Column name, or None if the table has no known datetime column
+
+        Example:
+            >>> mapper = SchemaMapper()
+            >>> mapper.get_time_column('SecurityEvent')
+            'TimeGenerated'
+        """
+        if not self.schema:
+            return None
+
+        table_meta = self.schema.tables.get(table_name)
+        if table_meta is not None:
+            if table_meta.time_column:
+                return table_meta.time_column
+            if "TimeGenerated" in table_meta.fields:
+                return "TimeGenerated"
+
+        for node_mapping in self.schema.nodes.values():
+            if node_mapping.sentinel_table != table_name:
+                continue
+            for prop_mapping in node_mapping.properties.values():
+                if prop_mapping.type == "datetime":
+                    return prop_mapping.sentinel_field
+
+        return None
+
+    def get_default_lookback(self, table_name: str) -> Optional[str]:
+        """
+        Get the default lookback for a table as a KQL timespan.
+
+        Args:
+            table_name: Sentinel table name
+
+        Returns:
+            Timespan literal (e.g. '7d'), or None if the table has no default
+
+        Example:
+            >>> mapper = SchemaMapper('tenant_schema.yaml')
+            >>> mapper.get_default_lookback('SecurityEvent')
+            '7d'
+        """
+        if not self.schema or table_name not in self.schema.tables:
+            return None
+        return self.schema.tables[table_name].default_lookback
+
+    def get_table_statistics(self, table_name: str) -> Optional[TableStatistics]:
+        """
+        Get row-count and cardinality statistics for a table.
+
+        Args:
+            table_name: Sentinel table name
+
+        Returns:
+            TableStatistics, or None if no statistics are loaded for the table
+
+        Example:
+            >>> mapper = SchemaMapper()
+            >>> mapper.get_table_statistics('IdentityInfo').row_count > 0
+            True
+        """
+        return self.statistics.tables.get(table_name)
+
+    def get_relationship_statistics(self, rel_type: str) -> Optional[RelationshipStatistics]:
+        """
+        Get fan-out statistics for a relationship type.
+
+        Args:
+            rel_type: Cypher relationship type
+
+        Returns:
+            RelationshipStatistics, or None if none are loaded for the type
+        """
+        return self.statistics.relationships.get(rel_type)
+
+    def get_graph_models(self) -> Dict[str, GraphModel]:
+        """
+        Get the persistent graph models declared in the schema.
+
+        Returns:
+            GraphModel per model name, empty if the schema declares none
+        """
+        return dict(self.schema.graphs) if self.schema else {}
+
     def get_relationship_mapping(self, rel_type: str) -> Optional[Dict[str, Any]]:
         """
         Get the join condition for a Cypher relationship.
@@ -261,6 +414,33 @@ class SchemaMapper:
 
         return result
 
+    def get_node_id_field(self, cypher_label: str) -> Optional[str]:
+        """
+        Get the column that identifies nodes of a label.
+
+        The first required property whose name mentions an id is preferred,
+        then the first required property.
+
+        Args:
+            cypher_label: Cypher node label
+
+        Returns:
+            Sentinel field name, or None if the label has no required property
+
+        Example:
+            >>> mapper = SchemaMapper()
+            >>> mapper.get_node_id_field('User')
+            'AccountObjectId'
+        """
+        props = self.get_all_properties(cypher_label)
+        for prop_name, prop_info in props.items():
+            if prop_info.get("required") and "id" in prop_name.lower():
+                return prop_info["sentinel_field"]
+        for prop_info in props.values():
+            if prop_info.get("required"):
+                return prop_info["sentinel_field"]
+        return None
+
     def find_path_tables(
         self, start_label: str, end_label: str
     ) -> Optional[Tuple[str, str]]:
@@ -40,6 +40,7 @@ class SchemaValidator:
         self._validate_edge_mappings(schema)
         self._validate_table_consistency(schema)
         self._validate_referential_integrity(schema)
+        self._validate_graph_models(schema)
 
         is_valid = len(self.errors) == 0
 
@@ -176,6 +177,20 @@ class SchemaValidator:
                         f"Edge '{rel_type}' references unknown table '{join.right_table}'"
                     )
 
+    def _validate_graph_models(self, schema: SchemaMapping) -> None:
+        """Validate that graph models hold known labels and relationships."""
+        for name, model in schema.graphs.items():
+            for label in model.labels:
+                if label not in schema.nodes:
+                    self.errors.append(f"Graph '{name}' references unknown label '{label}'")
+            for rel_type in model.relationships:
+                if rel_type not in schema.edges:
+                    self.errors.append(
+                        f"Graph '{name}' references unknown relationship '{rel_type}'"
+                    )
+            if not model.snapshots:
+                self.warnings.append(f"Graph '{name}' declares no snapshots")
+
     def validate_property_access(
         self, schema: SchemaMapping, label: str, property_name: str
     ) -> Tuple[bool, str]:
@@ -124,6 +124,13 @@ class TestPropertyFieldMapping:
         assert "domain" in props
         assert props["username"]["sentinel_field"] == "AccountName"
 
+    def test_get_node_id_field(self):
+        """Test that the node id prefers required id properties."""
+        mapper = SchemaMapper()
+        assert mapper.get_node_id_field("User") == "AccountObjectId"
+        assert mapper.get_node_id_field("IP") == "RemoteIp"
+        assert mapper.get_node_id_field("UnknownLabel") is None
+
 
 class TestRelationshipMappings:
     """Test Cypher relationship to Sentinel join mappings."""
@@ -238,6 +245,174 @@ class TestTableMetadata:
         assert fields == []
 
 
+class TestTimeWindowMetadata:
+    """Test time column and default lookback lookups."""
+
+    def test_explicit_time_column(self):
+        """Test that tables declare their datetime column."""
+        mapper = SchemaMapper()
+        assert mapper.get_time_column("IdentityInfo") == "TimeGenerated"
+        assert mapper.get_time_column("NonExistentTable") is None
+
+    def test_default_lookback_unset(self):
+        """Test that the default schema leaves every table unbounded."""
+        mapper = SchemaMapper()
+        assert mapper.get_default_lookback("SecurityEvent") is None
+        assert mapper.get_default_lookback("IdentityInfo") is None
+        assert mapper.get_default_lookback("NonExistentTable") is None
+
+    def test_default_lookback_opt_in(self, tmp_path):
+        """Test that a custom schema can set a table's default lookback."""
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(
+            "version: '1.0'\n"
+            "description: test\n"
+            "tables:\n"
+            "  Events: {description: events, retention_days: 30, default_lookback: 7d}\n"
+        )
+
+        mapper = SchemaMapper(schema_path=str(schema_file))
+
+        assert mapper.get_default_lookback("Events") == "7d"
+
+    def test_time_column_inferred_from_datetime_property(self, tmp_path):
+        """Test falling back to a datetime property mapped to the table."""
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(
+            "version: '1.0'\n"
+            "description: test\n"
+            "nodes:\n"
+            "  Event:\n"
+            "    sentinel_table: Events\n"
+            "    properties:\n"
+            "      at: {sentinel_field: EventTime, type: datetime}\n"
+            "tables:\n"
+            "  Events: {description: events, retention_days: 30, fields: [EventTime]}\n"
+        )
+
+        mapper = SchemaMapper(schema_path=str(schema_file))
+
+        assert mapper.get_time_column("Events") == "EventTime"
+
+    def test_invalid_default_lookback(self, tmp_path):
+        """Test that a malformed default lookback is rejected."""
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(
+            "version: '1.0'\n"
+            "description: test\n"
+            "tables:\n"
+            "  Events: {description: events, retention_days: 30, default_lookback: week}\n"
+        )
+
+        with pytest.raises(Exception):
+            SchemaMapper(schema_path=str(schema_file))
+
+
+class TestStatistics:
+    """Test loading of the optional statistics file next to the schema."""
+
+    MINIMAL_SCHEMA = (
+        "version: '1.0'\n"
+        "description: test\n"
+        "tables:\n"
+        "  Events: {description: events, retention_days: 30}\n"
+    )
+
+    def test_default_statistics(self):
+        """Test that the default schema ships with statistics."""
+        mapper = SchemaMapper()
+        stats = mapper.get_table_statistics("SecurityEvent")
+        assert stats.row_count > 0
+        assert stats.rows_per_day > 0
+        assert mapper.get_table_statistics("IdentityInfo").distinct_counts["AccountName"] > 0
+        assert mapper.get_relationship_statistics("LOGGED_IN").avg_degree > 0
+        assert mapper.get_table_statistics("NonExistentTable") is None
+
+    def test_statistics_path(self):
+        """Test that the statistics file sits next to the schema."""
+        assert SchemaMapper.get_statistics_path("/schemas/sentinel.yaml") == (
+            "/schemas/sentinel.stats.yaml"
+        )
+
+    def test_statistics_are_optional(self, tmp_path):
+        """Test that a schema without a statistics file loads with none."""
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(self.MINIMAL_SCHEMA)
+
+        mapper = SchemaMapper(schema_path=str(schema_file))
+
+        assert mapper.get_table_statistics("Events") is None
+
+    def test_statistics_loaded_from_sibling_file(self, tmp_path):
+        """Test that statistics are read from <schema>.stats.yaml."""
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(self.MINIMAL_SCHEMA)
+        (tmp_path / "schema.stats.yaml").write_text(
+            "tables:\n"
+            "  Events: {row_count: 1000, rows_per_day: 10, distinct_counts: {Id: 1000}}\n"
+        )
+
+        mapper = SchemaMapper(schema_path=str(schema_file))
+
+        stats = mapper.get_table_statistics("Events")
+        assert (stats.row_count, stats.rows_per_day, stats.distinct_counts) == (
+            1000,
+            10,
+            {"Id": 1000},
+        )
+
+    def test_invalid_statistics(self, tmp_path):
+        """Test that malformed statistics are rejected."""
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(self.MINIMAL_SCHEMA)
+        (tmp_path / "schema.stats.yaml").write_text("tables:\n  Events: {row_count: -1}\n")
+
+        with pytest.raises(ValueError):
+            SchemaMapper(schema_path=str(schema_file))
+
+
+class TestGraphModels:
+    """Test persistent graph model declarations."""
+
+    SCHEMA = (
+        "version: '1.0'\n"
+        "description: test\n"
+        "nodes:\n"
+        "  Event: {{sentinel_table: Events}}\n"
+        "tables:\n"
+        "  Events: {{description: events, retention_days: 30}}\n"
+        "graphs:\n"
+        "  EventGraph:\n"
+        "    labels: [{label}]\n"
+        "    lookback: 7d\n"
+        "    snapshots:\n"
+        "      hourly: {{max_age: {max_age}}}\n"
+    )
+
+    def test_default_schema_declares_none(self):
+        """Test that the default schema declares no graph models."""
+        assert SchemaMapper().get_graph_models() == {}
+
+    def test_graph_models_loaded(self, tmp_path):
+        """Test that models, lookbacks and snapshots are read from the schema."""
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(self.SCHEMA.format(label="Event", max_age="1h"))
+
+        model = SchemaMapper(schema_path=str(schema_file)).get_graph_models()["EventGraph"]
+
+        assert (model.labels, model.relationships, model.lookback) == (["Event"], [], "7d")
+        assert model.snapshots["hourly"].max_age == "1h"
+
+    @pytest.mark.parametrize("label,max_age", [("Unknown", "1h"), ("Event", "hourly")])
+    def test_invalid_graph_models(self, tmp_path, label, max_age):
+        """Test that unknown labels and malformed ages are rejected."""
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(self.SCHEMA.format(label=label, max_age=max_age))
+
+        with pytest.raises(ValueError):
+            SchemaMapper(schema_path=str(schema_file))
+
+
 class TestSchemaInfo:
     """Test schema information methods."""
 
@@ -7,5 +7,6 @@ variable-length paths and complex expressions.
 """
 
 from .translator import translate, CypherToKQLTranslator
+from .query_template import QueryTemplate, TemplateCache, TemplateSlot
 
-__all__ = ["translate", "CypherToKQLTranslator"]
+__all__ = ["translate", "CypherToKQLTranslator", "QueryTemplate", "TemplateCache", "TemplateSlot"]
@@ -0,0 +1,434 @@
+"""
+Optimization passes over WHERE condition trees.
+
+Passes take the condition dictionaries produced by the parser and return new,
+semantically equivalent trees that translate into cheaper KQL. The module also
+provides the helpers used to split conditions for predicate pushdown. Input
+trees are never modified, and every walk uses an explicit stack so very deep
+or wide conditions are handled without recursion.
+
+Example:
+    >>> conditions = parse_query(
+    ...     "MATCH (f:File) WHERE f.sha = 'a' OR f.sha = 'b' OR f.sha = 'c' RETURN f"
+    ... ).where_clause.conditions
+    >>> collapse_equality_sets(conditions)["operator"]
+    'IN'
+"""
+
+import re
+from typing import Any, Callable, Dict, Optional
+
+# Literal types that may be gathered into an IN set
+IN_SET_VALUE_TYPES = frozenset({"string", "number", "datetime", "int", "real"})
+
+# Default number of values an equality disjunction needs before it is collapsed
+DEFAULT_IN_SET_MIN_SIZE = 3
+
+# Operator to use when the operands of a comparison are swapped
+_SWAPPED_OPERATORS = {"=": "=", "==": "==", "!=": "!=", "<>": "<>", "<": ">", ">": "<",
+                      "<=": ">=", ">=": "<="}
+
+# Values typed literals are rendered from unquoted, so they must match exactly
+_DATETIME_VALUE = re.compile(
+    r"^\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d{1,7})?)?)?(Z|[+-]\d{2}:\d{2})?$"
+)
+_INT_VALUE = re.compile(r"^[+-]?\d+$")
+_REAL_VALUE = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+
+
+def collapse_equality_sets(
+    conditions: Dict[str, Any],
+    min_size: int = DEFAULT_IN_SET_MIN_SIZE,
+) -> Dict[str, Any]:
+    """Collapse same-property equality disjunctions into IN comparisons.
+
+    Within every OR node, equality comparisons between the same property (or
+    column) and literals of the same type, and IN comparisons against such
+    literal lists, are merged into a single ``IN`` comparison placed where the
+    first member appeared:
+
+        n.sha = 'a' OR n.sha = 'b' OR n.sha = 'c' OR n.size > 10
+        -> n.sha IN ['a', 'b', 'c'] OR n.size > 10
+
+    Values keep their original order and duplicates are kept, so the result
+    lines up one-to-one with the literals of the input.
+
+    Args:
+        conditions: Condition tree from a WhereClause
+        min_size: Minimum number of values a group needs to be collapsed
+
+    Returns:
+        Rewritten condition tree (the input itself if nothing was collapsed)
+    """
+    if not conditions or not isinstance(conditions, dict):
+        return conditions
+
+    # Post-order rebuild: (node, None) schedules children, (node, count) combines
+    work: list[tuple[Dict[str, Any], Optional[int]]] = [(conditions, None)]
+    results: list[Dict[str, Any]] = []
+
+    while work:
+        node, count = work.pop()
+
+        if count is None:
+            operands = node.get("operands") if _is_logical(node) else None
+            if not isinstance(operands, list):
+                results.append(node)
+                continue
+            work.append((node, len(operands)))
+            work.extend((operand, None) for operand in reversed(operands))
+            continue
+
+        children = results[len(results) - count:]
+        del results[len(results) - count:]
+
+        if str(node.get("operator", "")).upper() == "OR":
+            children = _merge_equalities(children, min_size)
+            if len(children) == 1:
+                results.append(children[0])
+                continue
+
+        operands = node["operands"]
+        if len(children) == len(operands) and all(
+            new is old for new, old in zip(children, operands)
+        ):
+            results.append(node)
+        else:
+            results.append(dict(node, operands=children))
+
+    return results[0]
+
+
+def _is_logical(node: Any) -> bool:
+    """Return True if ``node`` is a logical condition dictionary."""
+    return isinstance(node, dict) and node.get("type") == "logical"
+
+
+def _subject_key(node: Dict[str, Any]) -> Optional[tuple]:
+    """Return a hashable key for a property or column reference, if ``node`` is one."""
+    if node.get("type") == "property":
+        return ("property", node.get("variable"), node.get("property"))
+    if node.get("type") == "identifier":
+        return ("identifier", node.get("name"))
+    return None
+
+
+def _equality_set(condition: Any) -> Optional[tuple[tuple, Dict[str, Any], list]]:
+    """Return the (group key, subject, literal items) of a collapsible comparison."""
+    if not isinstance(condition, dict) or condition.get("type") != "comparison":
+        return None
+
+    operator = str(condition.get("operator", "")).upper()
+    left = condition.get("left") or {}
+    right = condition.get("right") or {}
+
+    if operator in ("=", "=="):
+        if _subject_key(left) is None:
+            left, right = right, left
+        if _subject_key(left) is None or right.get("type") != "literal":
+            return None
+        items = [right]
+    elif operator == "IN":
+        if _subject_key(left) is None or right.get("type") != "list":
+            return None
+        items = right.get("items") or []
+        if not items or any(
+            not isinstance(item, dict) or item.get("type") != "literal" for item in items
+        ):
+            return None
+    else:
+        return None
+
+    value_types = {item.get("value_type") for item in items}
+    if len(value_types) != 1 or not value_types <= IN_SET_VALUE_TYPES:
+        return None
+
+    return (_subject_key(left), value_types.pop()), left, items
+
+
+def _merge_equalities(operands: list[Dict[str, Any]], min_size: int) -> list[Dict[str, Any]]:
+    """Merge collapsible comparisons among the operands of one OR node."""
+    groups: dict[tuple, list[int]] = {}
+    sets: list[Optional[tuple[tuple, Dict[str, Any], list]]] = []
+
+    for index, operand in enumerate(operands):
+        found = _equality_set(operand)
+        sets.append(found)
+        if found is not None:
+            groups.setdefault(found[0], []).append(index)
+
+    merged: dict[int, Dict[str, Any]] = {}
+    dropped: set[int] = set()
+
+    for indices in groups.values():
+        items = [item for index in indices for item in sets[index][2]]
+        if len(items) < min_size:
+            continue
+        merged[indices[0]] = {
+            "type": "comparison",
+            "operator": "IN",
+            "left": sets[indices[0]][1],
+            "right": {"type": "list", "items": items},
+        }
+        dropped.update(indices[1:])
+
+    if not merged:
+        return operands
+
+    return [
+        merged.get(index, operand)
+        for index, operand in enumerate(operands)
+        if index not in dropped
+    ]
+
+
+def split_conjuncts(conditions: Optional[Dict[str, Any]]) -> list[Dict[str, Any]]:
+    """Return the top-level AND operands of a condition tree.
+
+    Args:
+        conditions: Condition tree from a WhereClause, or None
+
+    Returns:
+        List of conjuncts (a single-item list if the root is not an AND)
+    """
+    if not conditions:
+        return []
+    if _is_logical(conditions) and str(conditions.get("operator", "")).upper() == "AND":
+        operands = conditions.get("operands")
+        if operands is None:
+            operands = [conditions.get("left"), conditions.get("right")]
+        return [operand for operand in operands if operand]
+    return [conditions]
+
+
+def conjoin(conjuncts: list[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Combine conditions with AND.
+
+    Args:
+        conjuncts: Conditions to combine
+
+    Returns:
+        The single condition, an n-ary AND node, or None for an empty list
+    """
+    if not conjuncts:
+        return None
+    if len(conjuncts) == 1:
+        return conjuncts[0]
+    return {"type": "logical", "operator": "AND", "operands": list(conjuncts)}
+
+
+def condition_properties(condition: Dict[str, Any]) -> set[tuple[str, Optional[str]]]:
+    """Return the properties referenced by a condition.
+
+    Args:
+        condition: Condition tree
+
+    Returns:
+        Set of (variable, property) pairs; a bare identifier (``n``), which
+        refers to the whole variable, appears as (variable, None)
+    """
+    references: set[tuple[str, Optional[str]]] = set()
+    stack: list[Any] = [condition]
+
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, dict):
+            node_type = node.get("type")
+            if node_type == "property":
+                references.add((node.get("variable"), node.get("property")))
+            elif node_type == "identifier":
+                references.add((node.get("name"), None))
+            else:
+                stack.extend(value for value in node.values() if isinstance(value, (dict, list)))
+
+    return references
+
+
+def condition_variables(condition: Dict[str, Any]) -> set[str]:
+    """Return the query variables referenced by a condition.
+
+    Both property accesses (``n.name``) and bare identifiers (``n``) count as
+    references to their variable.
+
+    Args:
+        condition: Condition tree
+
+    Returns:
+        Set of variable names
+    """
+    return {variable for variable, _ in condition_properties(condition)}
+
+
+def map_properties(
+    condition: Dict[str, Any],
+    resolve: Callable[[str, str], Optional[str]],
+) -> Optional[Dict[str, Any]]:
+    """Rewrite property accesses in a condition into table column references.
+
+    Each ``{"type": "property", ...}`` node is replaced by an identifier node
+    naming the column returned by ``resolve(variable, property)``. The tree is
+    copied with an explicit stack, so deep conditions are handled without
+    recursion.
+
+    Args:
+        condition: Condition tree
+        resolve: Maps (variable, property) to a column name, or None if the
+            property has no column
+
+    Returns:
+        Rewritten copy of the condition, or None if any property cannot be
+        resolved or the condition refers to a whole variable
+    """
+    root: list[Any] = [None]
+    stack: list[tuple[Any, Any, Any]] = [(condition, root, 0)]
+
+    while stack:
+        source, parent, key = stack.pop()
+
+        if isinstance(source, dict):
+            node_type = source.get("type")
+            if node_type == "identifier":
+                return None
+            if node_type == "property":
+                column = resolve(source.get("variable"), source.get("property"))
+                if column is None:
+                    return None
+                parent[key] = {"type": "identifier", "name": column}
+                continue
+
+            copy = dict(source)
+            parent[key] = copy
+            for child_key, value in source.items():
+                if isinstance(value, (dict, list)):
+                    stack.append((value, copy, child_key))
+
+        elif isinstance(source, list):
+            copy_list = list(source)
+            parent[key] = copy_list
+            for index, value in enumerate(source):
+                if isinstance(value, (dict, list)):
+                    stack.append((value, copy_list, index))
+
+        else:
+            parent[key] = source
+
+    return root[0]
+
+
+def type_literals(
+    conditions: Dict[str, Any],
+    resolve_type: Callable[[str, str], Optional[str]],
+) -> Dict[str, Any]:
+    """Type comparison literals by the schema type of the property they meet.
+
+    Literals compared with a property are rewritten so the comparison uses the
+    column's own type, letting Sentinel prune extents and use its indexes
+    rather than comparing strings:
+
+        e.timestamp > '2024-01-01'  ->  value_type 'datetime', datetime(2024-01-01)
+        d.port = '443'              ->  value_type 'int', int(443)
+        u.user_id = 42              ->  value_type 'string', '42'
+
+    Comparisons written value-first, or parameter-first, are swapped so the
+    property stays on the left (``5 < n.x`` becomes ``n.x > 5``). Lists compared for equality with
+    an ``array`` property are marked ``dynamic``, and each value of an ``IN``
+    list is typed like a single literal. Values that do not parse as the
+    column's type are left unchanged.
+
+    Args:
+        conditions: Condition tree from a WhereClause
+        resolve_type: Maps (variable, property) to its schema type ('string',
+            'int', 'float', 'bool', 'datetime', 'array', ...), or None
+
+    Returns:
+        Rewritten copy of the condition tree
+    """
+    if not conditions or not isinstance(conditions, dict):
+        return conditions
+
+    root: list[Any] = [None]
+    stack: list[tuple[Any, Any, Any]] = [(conditions, root, 0)]
+
+    while stack:
+        source, parent, key = stack.pop()
+
+        if isinstance(source, dict):
+            if source.get("type") == "comparison":
+                parent[key] = _type_comparison(source, resolve_type)
+                continue
+            copy = dict(source)
+            parent[key] = copy
+            for child_key, value in source.items():
+                if isinstance(value, (dict, list)):
+                    stack.append((value, copy, child_key))
+
+        elif isinstance(source, list):
+            copy_list = list(source)
+            parent[key] = copy_list
+            for index, value in enumerate(source):
+                if isinstance(value, (dict, list)):
+                    stack.append((value, copy_list, index))
+
+        else:
+            parent[key] = source
+
+    return root[0]
+
+
+def _type_comparison(
+    comparison: Dict[str, Any], resolve_type: Callable[[str, str], Optional[str]]
+) -> Dict[str, Any]:
+    """Put the property of a comparison on the left and type its literal."""
+    operator = str(comparison.get("operator", "")).upper()
+    left, right = comparison.get("left"), comparison.get("right")
+    if not isinstance(left, dict) or not isinstance(right, dict):
+        return comparison
+
+    if (
+        operator in _SWAPPED_OPERATORS
+        and left.get("type") in ("literal", "parameter")
+        and right.get("type") in ("property", "identifier")
+    ):
+        left, right = right, left
+        comparison = dict(
+            comparison, operator=_SWAPPED_OPERATORS[operator], left=left, right=right
+        )
+
+    if left.get("type") != "property" or (operator not in _SWAPPED_OPERATORS and operator != "IN"):
+        return comparison
+    schema_type = resolve_type(left.get("variable"), left.get("property"))
+    if schema_type is None:
+        return comparison
+
+    if right.get("type") == "literal":
+        typed = _typed_literal(right, schema_type)
+    elif right.get("type") == "list" and operator == "IN":
+        typed = dict(right, items=[_typed_literal(item, schema_type) for item in right["items"]])
+    elif right.get("type") == "list" and schema_type == "array":
+        typed = dict(right, dynamic=True)
+    else:
+        return comparison
+    return dict(comparison, right=typed) if typed != right else comparison
+
+
+def _typed_literal(literal: Any, schema_type: str) -> Any:
+    """Retype a literal for a column of the given schema type."""
+    if not isinstance(literal, dict) or literal.get("type") != "literal":
+        return literal
+    value, value_type = literal.get("value"), literal.get("value_type")
+
+    if value_type == "number" and schema_type == "string":
+        return dict(literal, value=str(value), value_type="string")
+    if value_type != "string" or not isinstance(value, str):
+        return literal
+    if schema_type == "datetime" and _DATETIME_VALUE.match(value):
+        return dict(literal, value_type="datetime")
+    if schema_type == "int" and _INT_VALUE.match(value):
+        return dict(literal, value_type="int")
+    if schema_type == "float" and _REAL_VALUE.match(value):
+        return dict(literal, value_type="real")
+    if schema_type == "bool" and value.lower() in ("true", "false"):
+        return dict(literal, value=value.lower() == "true", value_type="boolean")
+    return literal
@@ -0,0 +1,556 @@
+"""
+Cost estimation for translated queries.
+
+Estimates how much work a query makes Sentinel do, from per-table statistics
+(row counts, daily ingestion, distinct values per column and relationship
+fan-out, loaded from the optional ``<schema>.stats.yaml`` next to the schema)
+combined with the shape of the pattern: the tables scanned within their time
+windows, predicate selectivity, the number of hops and their variable-length
+bounds, and aggregation. Queries served by a persistent graph snapshot read
+no tables and build no graph, so only their matching is charged.
+
+The model is deliberately coarse. It is meant to rank queries and to reject
+ones that are orders of magnitude over budget, not to predict latency to the
+millisecond. Tables and relationships without statistics fall back to the
+module defaults below.
+
+Example:
+    >>> estimator = CostEstimator(SchemaMapper())
+    >>> estimate = estimator.estimate(parse_query("MATCH (u:User) RETURN u"))
+    >>> estimate.scanned_rows
+    50000
+    >>> estimate.within_budget(context.max_execution_time_ms)
+    True
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from ..models import TranslationContext
+from ..parser.ast_nodes import AliasedExpression, Query
+from .condition_optimizer import condition_variables, split_conjuncts
+from .graph_snapshots import select_graph_snapshot
+from .paths import UNBOUNDED_MAX_HOPS, PathTranslator
+from .time_window import parse_timespan
+
+# Rows assumed for a table without statistics
+DEFAULT_ROW_COUNT = 1_000_000
+
+# Edges per node assumed for a relationship type without statistics
+DEFAULT_AVG_DEGREE = 10.0
+
+# Selectivity of predicates whose column cardinality is unknown
+DEFAULT_EQUALITY_SELECTIVITY = 0.1
+RANGE_SELECTIVITY = 1 / 3
+DEFAULT_SELECTIVITY = 0.5
+
+# Fraction of matched rows assumed to survive grouping or DISTINCT
+DEFAULT_GROUP_RATIO = 0.1
+
+AGGREGATION_FUNCTIONS = frozenset(
+    {"COUNT", "SUM", "AVG", "MIN", "MAX", "COLLECT", "PERCENTILECONT", "PERCENTILEDISC"}
+)
+
+_RANGE_OPERATORS = frozenset({"<", ">", "<=", ">="})
+
+
+@dataclass(frozen=True)
+class CostCoefficients:
+    """Per-unit latency costs used to turn row counts into milliseconds."""
+
+    base_ms: float = 50.0
+    scan_ms_per_row: float = 1e-5
+    build_ms_per_row: float = 1e-3
+    match_ms_per_path: float = 1e-3
+    aggregate_ms_per_row: float = 1e-4
+    join_ms_per_row: float = 2e-4
+    # Fixed cost of a shuffle join stage, which make-graph avoids
+    join_overhead_ms: float = 500.0
+
+
+@dataclass(frozen=True)
+class CostEstimate:
+    """Estimated work and latency of a translated query.
+
+    Attributes:
+        scanned_rows: Rows read from source tables within their time windows
+        graph_rows: Rows entering graph construction after source filters
+        matched_paths: Pattern matches produced by graph-match
+        result_rows: Rows returned after aggregation, DISTINCT and LIMIT
+        execution_time_ms: Estimated latency in milliseconds
+    """
+
+    scanned_rows: int
+    graph_rows: int
+    matched_paths: int
+    result_rows: int
+    execution_time_ms: int
+
+    def within_budget(self, max_execution_time_ms: int) -> bool:
+        """Check the estimate against a latency budget.
+
+        Args:
+            max_execution_time_ms: Budget, e.g. TranslationContext.max_execution_time_ms
+
+        Returns:
+            True if the estimated latency fits the budget
+        """
+        return self.execution_time_ms <= max_execution_time_ms
+
+
+@dataclass(frozen=True)
+class _PatternStatistics:
+    """Table sizes and predicate selectivity shared by the estimates."""
+
+    labels: dict[str, str]
+    table_variables: dict[str, set]
+    table_rows: dict[str, int]
+    variable_selectivity: dict[str, float]
+    residual: float
+
+
+class CostEstimator:
+    """Estimates query cost from schema statistics and pattern shape."""
+
+    def __init__(self, schema_mapper, coefficients: Optional[CostCoefficients] = None):
+        """Initialize the estimator.
+
+        Args:
+            schema_mapper: SchemaMapper supplying tables, columns and statistics
+            coefficients: Latency coefficients (defaults to CostCoefficients())
+        """
+        self.schema_mapper = schema_mapper
+        self.coefficients = coefficients or CostCoefficients()
+        self.path_translator = PathTranslator()
+
+    def estimate(self, ast: Query, context: Optional[TranslationContext] = None) -> CostEstimate:
+        """Estimate the cost of a query.
+
+        Args:
+            ast: Parsed query AST
+            context: Translation context supplying the time window, or None
+
+        Returns:
+            CostEstimate for the query
+        """
+        stats = self._pattern_statistics(ast, context)
+        labels, table_rows = stats.labels, stats.table_rows
+        total_rows = sum(table_rows.values()) or DEFAULT_ROW_COUNT
+        sample_rows = context.sample_rows if context is not None else None
+
+        def label_of(node) -> Optional[str]:
+            """Return a node's label, including one given elsewhere in the MATCH."""
+            if node.labels:
+                return str(node.labels[0])
+            return labels.get(str(node.variable)) if node.variable else None
+
+        def table_rows_of(node) -> float:
+            """Return the unfiltered row count behind a node pattern."""
+            label = label_of(node)
+            table = self.schema_mapper.get_sentinel_table(label) if label else None
+            return float(table_rows.get(table, total_rows))
+
+        def node_rows(node) -> float:
+            """Return the distinct nodes behind a node pattern, as make-graph keys them."""
+            label = label_of(node)
+            table = self.schema_mapper.get_sentinel_table(label) if label else None
+            column = self.schema_mapper.get_node_id_field(label) if label else None
+            rows = table_rows_of(node)
+            return self._column_distinct(table, column, rows) if table and column else rows
+
+        def candidates(node, distinct: bool = False) -> float:
+            """Estimate the rows, or distinct nodes, a node pattern can bind to."""
+            label = label_of(node)
+            rows = node_rows(node) if distinct else table_rows_of(node)
+            for key in node.properties or {}:
+                rows *= self._equality_selectivity(label, key, 1)
+            if node.variable:
+                rows *= stats.variable_selectivity.get(str(node.variable), 1.0)
+            return min(rows, sample_rows) if sample_rows else rows
+
+        # Sampled tables contribute at most sample_rows rows to the graph
+        graph_rows = 0.0
+        for table, rows in table_rows.items():
+            variables = stats.table_variables[table]
+            if len(variables) == 1 and None not in variables:
+                rows *= stats.variable_selectivity.get(next(iter(variables)), 1.0)
+            graph_rows += min(rows, sample_rows) if sample_rows else rows
+
+        matched = 1.0
+        seen: dict[str, float] = {}
+        for path in ast.match_clause.paths:
+            # Hops run between distinct nodes, not between the rows behind them
+            distinct = bool(path.relationships)
+            first, last = candidates(path.nodes[0], distinct), candidates(path.nodes[-1], distinct)
+            count = first
+            for relationship, node in zip(path.relationships, path.nodes[1:]):
+                reachable = candidates(node, distinct=True)
+                fan_out = self._hop_factor(relationship) * reachable / max(node_rows(node), 1.0)
+                if not relationship.length:
+                    # A single hop reaches each matching target at most once
+                    fan_out = min(fan_out, reachable)
+                count *= fan_out
+            if path.shortest:
+                # At most one (or a few equally short) paths per node pair
+                count = min(count, first * last)
+            # Variables shared with earlier paths join rather than multiply
+            for node in path.nodes:
+                variable = str(node.variable) if node.variable else None
+                if variable in seen:
+                    count /= max(seen[variable], 1.0)
+                elif variable:
+                    seen[variable] = candidates(node, distinct)
+            matched *= count
+        matched *= stats.residual
+
+        scanned = sum(table_rows.values())
+        if select_graph_snapshot(ast.match_clause, self.schema_mapper, context) is not None:
+            scanned, graph_rows = 0, 0.0
+        coefficients = self.coefficients
+        latency = (
+            coefficients.base_ms
+            + scanned * coefficients.scan_ms_per_row
+            + graph_rows * coefficients.build_ms_per_row
+            + matched * coefficients.match_ms_per_path
+        )
+        return self._finish(ast, scanned, graph_rows, matched, latency)
+
+    def estimate_joins(
+        self,
+        ast: Query,
+        steps: list[tuple[float, float, float]],
+        context: Optional[TranslationContext] = None,
+    ) -> CostEstimate:
+        """Estimate the cost of evaluating a query as a pipeline of joins.
+
+        No graph is built; each join pays a fixed shuffle overhead plus a
+        per-row cost for its inputs and output.
+
+        Args:
+            ast: Parsed query AST
+            steps: (left rows, right rows, output rows) of each join, in order
+            context: Translation context supplying the time window, or None
+
+        Returns:
+            CostEstimate for the join pipeline, with graph_rows of 0
+        """
+        stats = self._pattern_statistics(ast, context)
+        scanned = sum(stats.table_rows.values())
+        matched = (steps[-1][2] if steps else 0.0) * stats.residual
+
+        coefficients = self.coefficients
+        latency = coefficients.base_ms + scanned * coefficients.scan_ms_per_row
+        for left_rows, right_rows, output_rows in steps:
+            latency += coefficients.join_overhead_ms + (
+                left_rows + right_rows + output_rows
+            ) * coefficients.join_ms_per_row
+        return self._finish(ast, scanned, 0.0, matched, latency)
+
+    def node_candidates(
+        self, ast: Query, context: Optional[TranslationContext] = None
+    ) -> dict[str, float]:
+        """Estimate the rows each labeled node variable can bind to.
+
+        Rows are those of the variable's table inside its time window, reduced
+        by the variable's single-variable WHERE conjuncts and property maps,
+        and capped at the context's sample_rows.
+
+        Args:
+            ast: Parsed query AST
+            context: Translation context supplying the time window, or None
+
+        Returns:
+            Dict of variable name to estimated rows
+        """
+        stats = self._pattern_statistics(ast, context)
+        rows: dict[str, float] = {}
+        for path in ast.match_clause.paths:
+            for node in path.nodes:
+                variable = str(node.variable) if node.variable else None
+                label = stats.labels.get(variable) if variable else None
+                if label is None:
+                    continue
+                table = self.schema_mapper.get_sentinel_table(label)
+                count = rows.get(variable, float(stats.table_rows.get(table, DEFAULT_ROW_COUNT)))
+                for key in node.properties or {}:
+                    count *= self._equality_selectivity(label, key, 1)
+                rows[variable] = count
+        sample_rows = context.sample_rows if context is not None else None
+        return {
+            variable: min(
+                count * stats.variable_selectivity.get(variable, 1.0), sample_rows or float("inf")
+            )
+            for variable, count in rows.items()
+        }
+
+    def join_rows(
+        self,
+        left_rows: float,
+        left_table: str,
+        left_key: str,
+        right_rows: float,
+        right_table: str,
+        right_key: str,
+    ) -> float:
+        """Estimate the output of an equi-join.
+
+        Uses the textbook ``|L| * |R| / max(ndv(L.key), ndv(R.key))``, with
+        each side's distinct count capped at its row count and defaulting to
+        it when the column has no statistics.
+
+        Args:
+            left_rows: Rows on the left side
+            left_table: Table of the left key column
+            left_key: Left key column
+            right_rows: Rows on the right side
+            right_table: Table of the right key column
+            right_key: Right key column
+
+        Returns:
+            Estimated joined rows
+        """
+        distinct = max(
+            self._column_distinct(left_table, left_key, left_rows),
+            self._column_distinct(right_table, right_key, right_rows),
+            1.0,
+        )
+        return left_rows * right_rows / distinct
+
+    def _column_distinct(self, table: str, column: str, rows: float) -> float:
+        """Return a column's distinct count, capped at the rows it is drawn from."""
+        stats = self.schema_mapper.get_table_statistics(table)
+        distinct = stats.distinct_counts.get(column) if stats else None
+        return min(float(distinct), rows) if distinct else rows
+
+    def _pattern_statistics(
+        self, ast: Query, context: Optional[TranslationContext]
+    ) -> "_PatternStatistics":
+        """Collect labels, table sizes and predicate selectivity for a pattern."""
+        labels: dict[str, str] = {}
+        table_variables: dict[str, set] = {}
+        for path in ast.match_clause.paths:
+            for node in path.nodes:
+                variable = str(node.variable) if node.variable else None
+                if not node.labels:
+                    continue
+                label = str(node.labels[0])
+                if variable:
+                    labels[variable] = label
+                table = self.schema_mapper.get_sentinel_table(label)
+                if table:
+                    table_variables.setdefault(table, set()).add(variable)
+
+        table_rows = {table: self._table_rows(table, context) for table in table_variables}
+
+        # Single-variable conjuncts filter that variable's candidates; the
+        # rest apply to the matched paths
+        variable_selectivity: dict[str, float] = {}
+        residual = 1.0
+        conditions = ast.where_clause.conditions if ast.where_clause else None
+        for conjunct in split_conjuncts(conditions):
+            variables = condition_variables(conjunct)
+            selectivity = self._condition_selectivity(conjunct, labels)
+            if len(variables) == 1:
+                variable = next(iter(variables))
+                variable_selectivity[variable] = (
+                    variable_selectivity.get(variable, 1.0) * selectivity
+                )
+            else:
+                residual *= selectivity
+
+        return _PatternStatistics(
+            labels, table_variables, table_rows, variable_selectivity, residual
+        )
+
+    def _finish(
+        self, ast: Query, scanned: float, graph_rows: float, matched: float, latency: float
+    ) -> CostEstimate:
+        """Apply RETURN shaping to matched rows and build the estimate."""
+        aggregated = self._has_aggregation(ast)
+        result = matched
+        if aggregated:
+            has_keys = any(not self._is_aggregate(item) for item in ast.return_clause.items)
+            result = max(matched * DEFAULT_GROUP_RATIO, 1.0) if has_keys else 1.0
+        elif ast.return_clause.distinct:
+            result = matched * DEFAULT_GROUP_RATIO
+        if ast.return_clause.limit is not None:
+            result = min(result, ast.return_clause.limit)
+
+        if aggregated or ast.return_clause.distinct:
+            latency += matched * self.coefficients.aggregate_ms_per_row
+
+        return CostEstimate(
+            scanned_rows=int(scanned),
+            graph_rows=int(graph_rows),
+            matched_paths=int(matched),
+            result_rows=int(result),
+            execution_time_ms=int(latency),
+        )
+
+    def _table_rows(self, table: str, context: Optional[TranslationContext]) -> int:
+        """Estimate the rows of a table inside its time window."""
+        stats = self.schema_mapper.get_table_statistics(table)
+        rows = stats.row_count if stats else DEFAULT_ROW_COUNT
+
+        window = self.time_window(table, context)
+        if window is None:
+            return rows
+
+        days = window / timedelta(days=1)
+        if stats and stats.rows_per_day is not None:
+            return min(rows, int(stats.rows_per_day * days))
+
+        table_meta = self.schema_mapper.schema.tables.get(table)
+        if table_meta and table_meta.retention_days > 0:
+            return min(rows, int(rows * days / table_meta.retention_days))
+        return rows
+
+    def time_window(
+        self, table: str, context: Optional[TranslationContext]
+    ) -> Optional[timedelta]:
+        """Return the duration a table is bounded to, mirroring the translator.
+
+        Args:
+            table: Sentinel table name
+            context: Translation context, or None
+
+        Returns:
+            Window duration, or None if the table is read over its whole retention
+        """
+        if self.schema_mapper.get_time_column(table) is None:
+            return None
+        if context is not None and context.time_range is not None:
+            start, end = context.time_range
+            return end - start
+        if context is not None and context.lookback is not None:
+            return context.lookback
+        default_lookback = self.schema_mapper.get_default_lookback(table)
+        return parse_timespan(default_lookback) if default_lookback else None
+
+    def _hop_factor(self, relationship) -> float:
+        """Estimate paths reached from one node across a relationship.
+
+        Fixed hops multiply by the type's average degree; a variable-length
+        relationship sums ``degree ** k`` over its hop bounds, with unbounded
+        paths costed up to UNBOUNDED_MAX_HOPS.
+        """
+        degree = DEFAULT_AVG_DEGREE
+        if relationship.relationship_type is not None:
+            stats = self.schema_mapper.get_relationship_statistics(
+                str(relationship.relationship_type)
+            )
+            if stats:
+                degree = stats.avg_degree
+
+        if not relationship.length:
+            return degree
+
+        bounds = self.path_translator.parse_path_length_specification(relationship.length)
+        min_hops = 1 if bounds.min_length is None else bounds.min_length
+        max_hops = UNBOUNDED_MAX_HOPS if bounds.max_length is None else bounds.max_length
+        return sum(degree ** hops for hops in range(min_hops, max(max_hops, min_hops) + 1))
+
+    def _equality_selectivity(
+        self, label: Optional[str], prop: Optional[str], values: int
+    ) -> float:
+        """Estimate the fraction of rows matching one of ``values`` equal values."""
+        distinct = self._distinct_count(label, prop)
+        if distinct:
+            return min(1.0, values / distinct)
+        return min(1.0, values * DEFAULT_EQUALITY_SELECTIVITY)
+
+    def _distinct_count(self, label: Optional[str], prop: Optional[str]) -> Optional[int]:
+        """Look up the distinct-value count of the column behind a property."""
+        if label is None or prop is None:
+            return None
+        table = self.schema_mapper.get_sentinel_table(label)
+        stats = self.schema_mapper.get_table_statistics(table) if table else None
+        if not stats:
+            return None
+        field = self.schema_mapper.get_property_field(label, prop)
+        column = field["sentinel_field"] if field else prop
+        return stats.distinct_counts.get(column)
+
+    def _condition_selectivity(self, condition: Dict[str, Any], labels: dict[str, str]) -> float:
+        """Estimate the fraction of rows satisfying a condition tree.
+
+        AND multiplies, OR combines as independent events, and NOT takes the
+        complement. The tree is evaluated post-order with an explicit stack.
+        """
+        work: list[tuple[Dict[str, Any], Optional[int]]] = [(condition, None)]
+        results: list[float] = []
+
+        while work:
+            node, count = work.pop()
+
+            if count is None:
+                if isinstance(node, dict) and node.get("type") == "logical":
+                    operands = node.get("operands")
+                    if operands is None:
+                        operands = [node.get("left"), node.get("right")]
+                    operands = [operand for operand in operands if isinstance(operand, dict)]
+                    work.append((node, len(operands)))
+                    work.extend((operand, None) for operand in operands)
+                else:
+                    results.append(self._comparison_selectivity(node, labels))
+                continue
+
+            children = results[len(results) - count:]
+            del results[len(results) - count:]
+            operator = str(node.get("operator", "")).upper()
+            combined = 1.0
+            if operator == "OR":
+                for child in children:
+                    combined *= 1.0 - child
+                combined = 1.0 - combined
+            else:
+                for child in children:
+                    combined *= child
+                if operator == "NOT":
+                    combined = 1.0 - combined
+            results.append(combined)
+
+        return results[0] if results else 1.0
+
+    def _comparison_selectivity(self, condition: Any, labels: dict[str, str]) -> float:
+        """Estimate the selectivity of a single comparison."""
+        if not isinstance(condition, dict) or condition.get("type") != "comparison":
+            return DEFAULT_SELECTIVITY
+
+        operator = str(condition.get("operator", "")).upper()
+        left = condition.get("left") or {}
+        right = condition.get("right") or {}
+        if left.get("type") != "property":
+            left, right = right, left
+
+        label = labels.get(left.get("variable")) if left.get("type") == "property" else None
+        prop = left.get("property")
+
+        if operator in ("=", "=="):
+            if right.get("type") == "property":
+                return DEFAULT_EQUALITY_SELECTIVITY
+            return self._equality_selectivity(label, prop, 1)
+        if operator in ("<>", "!="):
+            return 1.0 - self._equality_selectivity(label, prop, 1)
+        if operator == "IN":
+            values = len(right.get("items") or []) if right.get("type") == "list" else 1
+            return self._equality_selectivity(label, prop, values)
+        if operator in _RANGE_OPERATORS:
+            return RANGE_SELECTIVITY
+        return DEFAULT_SELECTIVITY
+
+    def _has_aggregation(self, ast: Query) -> bool:
+        """Check whether the RETURN clause aggregates."""
+        return any(self._is_aggregate(item) for item in ast.return_clause.items)
+
+    @staticmethod
+    def _is_aggregate(item: Any) -> bool:
+        """Check whether a return item is an aggregation function call."""
+        if isinstance(item, AliasedExpression):
+            item = item.expression
+        return (
+            isinstance(item, dict)
+            and item.get("type") == "function"
+            and str(item.get("name", "")).upper() in AGGREGATION_FUNCTIONS
+        )
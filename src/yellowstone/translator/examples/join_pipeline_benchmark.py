@@ -0,0 +1,75 @@
+"""
+Benchmark comparing make-graph and join-pipeline translations.
+
+Translates the same queries with the join fallback disabled (always make-graph)
+and enabled, and reports the strategy chosen, translation latency, KQL size and
+the cost model's estimated execution time of each output. Estimates come from
+the statistics next to the schema (``default_sentinel_schema.stats.yaml`` by
+default); replace them with your workspace's figures, or run both outputs
+against the workspace, to compare real latencies.
+Run with: python -m yellowstone.translator.examples.join_pipeline_benchmark
+"""
+
+import timeit
+
+from yellowstone.main_translator import CypherTranslator
+from yellowstone.models import CypherQuery, TranslationContext
+
+QUERIES = {
+    "entity_hop": "MATCH (u:User)-[:LOGGED_IN]->(d:Device) RETURN u.username, d",
+    "event_hop": (
+        "MATCH (d:Device)-[:CONNECTED_TO]->(ip:IP) "
+        "WHERE d.os_platform = 'Windows' RETURN d.device_name, ip"
+    ),
+    "event_chain": (
+        "MATCH (u:User)-[:LOGGED_IN]->(d:Device)-[:CONNECTED_TO]->(ip:IP) "
+        "WHERE u.username = 'alice' RETURN u.username, ip"
+    ),
+    "long_chain": (
+        "MATCH (u:User)-[:LOGGED_IN]->(d:Device)-[:CONNECTED_TO]->(ip:IP), "
+        "(d)<-[:LOGGED_IN]-(v:User) RETURN u.username, v.username, ip LIMIT 100"
+    ),
+}
+
+
+def measure_latency_us(translate, number: int = 200) -> float:
+    """Return the best mean latency of ``translate`` in microseconds."""
+    runs = timeit.repeat(translate, number=number, repeat=5)
+    return min(runs) / number * 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    context = TranslationContext(user_id="bench", tenant_id="bench", permissions=[])
+    graph_translator = CypherTranslator(
+        enable_ai=False, enable_template_cache=False, enable_join_fallback=False
+    )
+    join_translator = CypherTranslator(enable_ai=False, enable_template_cache=False)
+
+    print("\n" + "=" * 92)
+    print("Join pipeline benchmark: make-graph vs join fallback")
+    print("=" * 92)
+    print(
+        f"{'query':<14}{'chosen':>12}{'graph us':>11}{'join us':>10}"
+        f"{'graph chars':>13}{'join chars':>12}{'graph est ms':>14}{'join est ms':>13}"
+    )
+
+    for name, query in QUERIES.items():
+        cypher = CypherQuery(query=query)
+        graph = graph_translator.translate(cypher, context)
+        joined = join_translator.translate(cypher, context)
+
+        graph_us = measure_latency_us(lambda: graph_translator.translate(cypher, context))
+        join_us = measure_latency_us(lambda: join_translator.translate(cypher, context))
+
+        print(
+            f"{name:<14}{joined.strategy.value:>12}{graph_us:>11.1f}{join_us:>10.1f}"
+            f"{len(graph.query):>13}{len(joined.query):>12}"
+            f"{graph.estimated_execution_time_ms:>14}{joined.estimated_execution_time_ms:>13}"
+        )
+
+    print("=" * 92 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark of graph-match cycles modes on a lateral-movement graph.
+
+Builds a seeded synthetic network in the shape of the Sentinel integration
+lateral-movement scenario (a compromised workstation, peers it reaches over
+the network, and shared servers every host talks to and back) and counts the
+paths ``(a:IP)-[:COMMUNICATES_WITH*1..k]->(b:IP)`` matches from patient zero
+under each cycles mode. The path count is what graph-match enumerates, so it
+drives the operator's latency and memory. The KQL the translator emits for
+each mode, and its translation latency, are printed alongside.
+Run with: python -m yellowstone.translator.examples.path_cycles_benchmark
+"""
+
+import random
+import timeit
+
+from yellowstone.main_translator import CypherTranslator
+from yellowstone.models import PATH_CYCLES_MODES, CypherQuery, TranslationContext
+
+QUERY = (
+    "MATCH (a:IP)-[:COMMUNICATES_WITH*1..{hops}]->(b:IP) "
+    "WHERE a.ip_address = '10.0.0.1' RETURN b.ip_address, count(*) AS routes"
+)
+
+
+def lateral_movement_graph(
+    hosts: int = 60, servers: int = 3, peers: int = 2, seed: int = 7
+) -> dict[int, list[int]]:
+    """Build a directed host graph; host 0 is patient zero, hosts 1..servers are servers."""
+    rng = random.Random(seed)
+    edges: dict[int, list[int]] = {host: [] for host in range(hosts)}
+    for host in range(servers + 1, hosts):
+        for server in range(1, servers + 1):
+            edges[host].append(server)
+            edges[server].append(host)
+    for host in range(hosts):
+        candidates = [peer for peer in range(hosts) if peer != host]
+        edges[host].extend(rng.sample(candidates, peers))
+    return edges
+
+
+def count_paths(edges: dict[int, list[int]], start: int, max_hops: int, mode: str) -> int:
+    """Count the paths of 1..max_hops edges from ``start`` allowed by a cycles mode."""
+    if mode == "all":
+        # Walks: count by hop instead of enumerating them
+        walks = {start: 1}
+        total = 0
+        for _ in range(max_hops):
+            reached: dict[int, int] = {}
+            for node, count in walks.items():
+                for target in edges[node]:
+                    reached[target] = reached.get(target, 0) + count
+            walks = reached
+            total += sum(walks.values())
+        return total
+
+    total = 0
+    stack = [(start, frozenset([start]), frozenset())]
+    while stack:
+        node, nodes, used = stack.pop()
+        for index, target in enumerate(edges[node]):
+            edge = (node, index)
+            if edge in used or (mode == "none" and target in nodes):
+                continue
+            total += 1
+            if len(used) + 1 < max_hops:
+                stack.append((target, nodes | {target}, used | {edge}))
+    return total
+
+
+def measure_latency_us(translate, number: int = 200) -> float:
+    """Return the best mean latency of ``translate`` in microseconds."""
+    runs = timeit.repeat(translate, number=number, repeat=5)
+    return min(runs) / number * 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark and print path counts and the emitted graph-match."""
+    edges = lateral_movement_graph()
+    translator = CypherTranslator(enable_ai=False, enable_template_cache=False)
+
+    print("\n" + "=" * 72)
+    print("graph-match cycles benchmark: lateral-movement paths from patient zero")
+    print("=" * 72)
+    print(f"{'hops':<6}" + "".join(f"{mode + ' paths':>22}" for mode in PATH_CYCLES_MODES))
+    for hops in range(2, 7):
+        counts = [count_paths(edges, 0, hops, mode) for mode in PATH_CYCLES_MODES]
+        print(f"{hops:<6}" + "".join(f"{count:>22,}" for count in counts))
+
+    print("-" * 72)
+    cypher = CypherQuery(query=QUERY.format(hops=4))
+    for mode in (None,) + PATH_CYCLES_MODES:
+        context = TranslationContext(
+            user_id="bench", tenant_id="bench", permissions=[], path_cycles=mode
+        )
+        kql = translator.translate(cypher, context).query
+        match_line = next(line for line in kql.split("\n") if "graph-match" in line)
+        latency = measure_latency_us(lambda: translator.translate(cypher, context))
+        print(f"{mode or 'auto':<14}{latency:>8.1f} us  {match_line}")
+    print("=" * 72 + "\n")
+
+
+if __name__ == "__main__":
+    main()
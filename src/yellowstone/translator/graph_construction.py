@@ -0,0 +1,218 @@
+"""
+Graph construction planning for make-graph preambles.
+
+A pattern whose nodes live in several Sentinel tables is built from one node
+table per referenced label table and an edge table derived from the
+``sentinel_join`` definitions of the pattern's relationship types. Only the
+tables the pattern references are read, so graph size follows the pattern
+rather than the whole schema.
+
+Each relationship type becomes a ``let`` bound edge table joining the two node
+tables on the schema's join keys and projecting ``SourceId``/``TargetId``
+columns; several types are combined with ``union``. Node tables are read by
+both the edge joins and make-graph, so they are materialized (see LetPlan):
+
+    let Nodes_IdentityInfo = materialize(IdentityInfo);
+    let Nodes_DeviceInfo = materialize(DeviceInfo);
+    let Edges_LOGGED_IN = Nodes_IdentityInfo
+    | project SourceId = AccountObjectId, JoinKey = AccountName
+    | join kind=inner (Nodes_DeviceInfo | project TargetId = DeviceId, JoinKey = UserName)
+        on JoinKey
+    | project SourceId, TargetId, EdgeType = 'LOGGED_IN';
+    Edges_LOGGED_IN
+    | make-graph SourceId --> TargetId with Nodes_IdentityInfo on AccountObjectId, ...
+
+Patterns without relationships (``MATCH (u:User), (d:Device)``) still read
+every node table: make-graph is given an empty edge table (EMPTY_EDGES).
+
+Example:
+    >>> edges = plan_edge_sources(match_clause, schema_mapper, node_tables)
+    >>> edges[0]
+    EdgeSource(relationship_type='LOGGED_IN', source_table='IdentityInfo', ...)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from ..parser.ast_nodes import MatchClause
+from .shared_subexpressions import LetPlan
+
+# Edge table of graphs whose pattern has no relationships
+EMPTY_EDGES = "datatable(SourceId: string, TargetId: string, EdgeType: string) []"
+
+# "Table.Column == Table.Column", as written in sentinel_join definitions
+_JOIN_CONDITION_PATTERN = re.compile(r"^\s*(\w+)\.(\w+)\s*==?\s*(\w+)\.(\w+)\s*$")
+
+
+@dataclass(frozen=True)
+class EdgeSource:
+    """Edge rows of one relationship type, derived from a table join."""
+
+    relationship_type: str
+    source_table: str
+    source_key: str
+    target_table: str
+    target_key: str
+
+
+def parse_join_condition(
+    condition: Optional[str], left_table: str, right_table: str
+) -> Optional[tuple[str, str]]:
+    """Extract the join key columns from a ``sentinel_join`` condition.
+
+    Args:
+        condition: Join condition such as 'IdentityInfo.AccountName == DeviceInfo.UserName'
+        left_table: Table on the source side of the join
+        right_table: Table on the target side of the join
+
+    Returns:
+        Tuple of (left key column, right key column), or None if the condition
+        is not a single column equality between the two tables
+    """
+    match = _JOIN_CONDITION_PATTERN.match(condition or "")
+    if not match:
+        return None
+
+    first_table, first_column, second_table, second_column = match.groups()
+    if (first_table, second_table) == (left_table, right_table):
+        return first_column, second_column
+    if (first_table, second_table) == (right_table, left_table):
+        return second_column, first_column
+    return None
+
+
+def plan_edge_sources(
+    match_clause: MatchClause, schema_mapper, node_tables: dict[str, str]
+) -> Optional[list[EdgeSource]]:
+    """Derive edge tables for the relationships of a MATCH clause.
+
+    Args:
+        match_clause: MatchClause AST node
+        schema_mapper: SchemaMapper supplying relationship join definitions
+        node_tables: Node tables of the pattern (table name to node id field)
+
+    Returns:
+        One EdgeSource per relationship type in query order, or None if the
+        pattern has no relationships or any relationship is untyped, has no
+        usable join definition, or joins tables the pattern does not reference
+    """
+    edges: dict[str, EdgeSource] = {}
+
+    for path in match_clause.paths:
+        for relationship in path.relationships:
+            if relationship.relationship_type is None:
+                return None
+            rel_type = str(relationship.relationship_type)
+            if rel_type in edges:
+                continue
+
+            mapping = schema_mapper.get_relationship_mapping(rel_type)
+            if not mapping:
+                return None
+            left_table = mapping.get("left_table")
+            right_table = mapping.get("right_table")
+            if left_table not in node_tables or right_table not in node_tables:
+                return None
+
+            keys = parse_join_condition(mapping.get("join_condition"), left_table, right_table)
+            if keys is None:
+                return None
+
+            edges[rel_type] = EdgeSource(rel_type, left_table, keys[0], right_table, keys[1])
+
+    return list(edges.values()) or None
+
+
+def table_pipeline(
+    table: str,
+    filters: Optional[list[str]] = None,
+    columns: Optional[list[str]] = None,
+    sample_rows: Optional[int] = None,
+) -> list[str]:
+    """Build the lines that read, filter, sample and project one source table.
+
+    Args:
+        table: Sentinel table name
+        filters: KQL predicates applied in order
+        columns: Columns to keep, or None/empty to keep all
+        sample_rows: Rows to sample after filtering, or None to keep all
+
+    Returns:
+        KQL lines, starting with the table name
+    """
+    lines = [table]
+    lines.extend(f"| where {table_filter}" for table_filter in filters or [])
+    if sample_rows is not None:
+        lines.append(f"| sample {sample_rows}")
+    if columns:
+        lines.append(f"| project {', '.join(columns)}")
+    return lines
+
+
+def node_table_name(table: str) -> str:
+    """Return the ``let`` name bound to a node table."""
+    return f"Nodes_{table}"
+
+
+def edge_table_name(rel_type: str) -> str:
+    """Return the ``let`` name bound to a relationship type's edge table."""
+    return f"Edges_{rel_type}"
+
+
+def render_graph_construction(
+    edges: list[EdgeSource],
+    node_tables: dict[str, str],
+    table_filters: Optional[dict[str, list[str]]] = None,
+    table_columns: Optional[dict[str, list[str]]] = None,
+    sample_rows: Optional[int] = None,
+    materialize: bool = True,
+) -> str:
+    """Render the multi-table make-graph preamble.
+
+    Args:
+        edges: Edge sources from plan_edge_sources; empty for a graph of nodes only
+        node_tables: Node tables of the pattern (table name to node id field)
+        table_filters: KQL predicates per table, applied before make-graph
+        table_columns: Columns to keep per table
+        sample_rows: Rows to sample from each node table, or None
+        materialize: Materialize node tables referenced more than once
+
+    Returns:
+        KQL ``let`` statements followed by the make-graph expression
+    """
+    table_filters = table_filters or {}
+    table_columns = table_columns or {}
+    lets = LetPlan(materialize)
+
+    node_names = {
+        table: lets.bind(
+            node_table_name(table),
+            table_pipeline(table, table_filters.get(table), table_columns.get(table), sample_rows),
+        )
+        for table in node_tables
+    }
+
+    edge_names = []
+    for edge in edges:
+        source_id = node_tables[edge.source_table]
+        target_id = node_tables[edge.target_table]
+        edge_names.append(lets.bind(edge_table_name(edge.relationship_type), [
+            node_names[edge.source_table],
+            f"| project SourceId = {source_id}, JoinKey = {edge.source_key}",
+            f"| join kind=inner ({node_names[edge.target_table]}"
+            f" | project TargetId = {target_id}, JoinKey = {edge.target_key}) on JoinKey",
+            f"| project SourceId, TargetId, EdgeType = '{edge.relationship_type}'",
+        ]))
+
+    if not edge_names:
+        body = [EMPTY_EDGES]
+    elif len(edge_names) == 1:
+        body = [edge_names[0]]
+    else:
+        body = [f"union {', '.join(edge_names)}"]
+    node_sources = ", ".join(
+        f"{node_names[table]} on {node_id}" for table, node_id in node_tables.items()
+    )
+    body.append(f"| make-graph SourceId --> TargetId with {node_sources}")
+    return "\n".join(lets.render(body))
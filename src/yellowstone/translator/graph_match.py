@@ -6,11 +6,94 @@ Handles translation of MATCH clauses to KQL graph-match syntax, including:
 - Multi-hop paths
 - Optional MATCH patterns
 - Multiple disjoint patterns (comma-separated)
+- shortestPath()/allShortestPaths() patterns, as graph-shortest-paths
+- Path uniqueness (the graph-match ``cycles`` option) for variable-length patterns
+- Relationship types, as ``EdgeType`` constraints on named edges
+
+Relationship types are not part of the edge pattern: graphs built from several
+edge tables carry each edge's type in an ``EdgeType`` column (see
+graph_construction), so every typed hop is bound to an edge variable and
+constrained in the graph-match ``where`` clause. Unnamed typed hops get
+generated variables (``e1``, ``e2``, ...), so two hops never share an edge by
+accident:
+
+    graph-match (u:User)-[e1]->(d:Device), (u)-[e2]->(o:Device)
+        where e1.EdgeType == 'LOGGED_IN' and e2.EdgeType == 'OWNS'
 """
 
 from typing import Any, Dict, List, Optional
-from ..parser.ast_nodes import MatchClause, PathExpression, NodePattern, RelationshipPattern
-from .paths import PathTranslator
+from ..parser.ast_nodes import (
+    Identifier,
+    Literal,
+    Parameter,
+    MatchClause,
+    PathExpression,
+    NodePattern,
+    RelationshipPattern,
+)
+from ..models import PATH_CYCLES_MODES
+from .paths import UNBOUNDED_MAX_HOPS, PathTranslator
+from .query_parameters import kql_parameter_name
+
+
+def cycles_mode(match_clause: MatchClause, requested: Optional[str] = None) -> Optional[str]:
+    """Choose the graph-match cycles option for a MATCH clause.
+
+    An explicit request is used as given. Otherwise patterns with a
+    variable-length relationship use ``none``, which stops paths from
+    revisiting nodes and keeps their number from exploding on dense graphs,
+    unless the pattern itself needs repetition: a relationship variable used
+    twice must match the same edge twice (``all``), and a node variable used
+    twice closes a cycle through that node (``unique_edges``).
+
+    Args:
+        match_clause: MatchClause AST node
+        requested: Mode from the translation context, or None to choose
+
+    Returns:
+        One of PATH_CYCLES_MODES, or None to leave KQL's default for patterns
+        without variable-length relationships
+
+    Raises:
+        ValueError: If the requested mode is unknown
+    """
+    if requested is not None:
+        if requested not in PATH_CYCLES_MODES:
+            raise ValueError(
+                f"cycles must be one of {', '.join(PATH_CYCLES_MODES)}, got {requested!r}"
+            )
+        return requested
+
+    relationships = [rel for path in match_clause.paths for rel in path.relationships]
+    if not any(rel.length for rel in relationships):
+        return None
+
+    relationship_variables = [str(rel.variable) for rel in relationships if rel.variable]
+    if len(relationship_variables) != len(set(relationship_variables)):
+        return "all"
+
+    node_variables = [
+        str(node.variable) for path in match_clause.paths for node in path.nodes if node.variable
+    ]
+    if len(node_variables) != len(set(node_variables)):
+        return "unique_edges"
+    return "none"
+
+
+def edge_type_constraint(variable: str, relationship: RelationshipPattern) -> str:
+    """Build the graph-match constraint restricting an edge to its relationship type.
+
+    Args:
+        variable: Edge variable the relationship is bound to
+        relationship: Typed RelationshipPattern
+
+    Returns:
+        KQL constraint; variable-length edges require every hop to have the type
+    """
+    rel_type = str(relationship.relationship_type)
+    if relationship.length:
+        return f"all({variable}, EdgeType == '{rel_type}')"
+    return f"{variable}.EdgeType == '{rel_type}'"
 
 
 class GraphMatchTranslator:
@@ -20,14 +103,16 @@ class GraphMatchTranslator:
         """Initialize the graph match translator."""
         self.path_translator = PathTranslator()
 
-    def translate(self, match_clause: MatchClause) -> str:
+    def translate(self, match_clause: MatchClause, cycles: Optional[str] = None) -> str:
         """Translate MATCH clause to KQL graph-match syntax.
 
         Args:
             match_clause: MatchClause AST node with paths and optional flag
+            cycles: graph-match cycles option, or None to choose with cycles_mode
 
         Returns:
-            KQL graph-match expression (e.g., "graph-match pattern ...")
+            KQL graph-match expression (e.g., "graph-match pattern ..."), or a
+            graph-shortest-paths expression for a shortest path pattern
 
         Raises:
             ValueError: If match clause structure is invalid
@@ -38,6 +123,20 @@ class GraphMatchTranslator:
         if not match_clause.paths:
             raise ValueError("MATCH clause must have at least one path")
 
+        if any(path.shortest for path in match_clause.paths):
+            if match_clause.optional or len(match_clause.paths) != 1:
+                raise ValueError("shortestPath() must be the only pattern of a non-optional MATCH")
+            return self._translate_shortest_path(match_clause.paths[0])
+
+        # Bind typed hops to edge variables, collecting their type constraints
+        match_clause = self._name_typed_edges(match_clause)
+        constraints = dict.fromkeys(
+            edge_type_constraint(str(rel.variable), rel)
+            for path in match_clause.paths
+            for rel in path.relationships
+            if rel.relationship_type is not None
+        )
+
         # Translate all paths in the match clause
         translated_paths = []
         for path in match_clause.paths:
@@ -50,12 +149,45 @@ class GraphMatchTranslator:
         # Join multiple paths with comma
         pattern_str = ", ".join(translated_paths)
 
+        mode = cycles_mode(match_clause, cycles)
+        if mode is not None:
+            pattern_str = f"cycles={mode} {pattern_str}"
+        if constraints:
+            pattern_str = f"{pattern_str} where {' and '.join(constraints)}"
+
         # Add optional modifier if needed
         if match_clause.optional:
             return f"graph-match(optional) {pattern_str}"
         else:
             return f"graph-match {pattern_str}"
 
+    def _name_typed_edges(self, match_clause: MatchClause) -> MatchClause:
+        """Give every unnamed typed relationship a generated edge variable.
+
+        Args:
+            match_clause: MatchClause AST node
+
+        Returns:
+            MatchClause whose typed relationships all have variables; names
+            used by the pattern are skipped
+        """
+        used = set(self.extract_variable_names(match_clause))
+        counter = 0
+
+        paths = []
+        for path in match_clause.paths:
+            relationships = []
+            for rel in path.relationships:
+                if rel.variable is None and rel.relationship_type is not None:
+                    counter += 1
+                    while f"e{counter}" in used:
+                        counter += 1
+                    rel = rel.model_copy(update={"variable": Identifier(name=f"e{counter}")})
+                relationships.append(rel)
+            paths.append(path.model_copy(update={"relationships": relationships}))
+
+        return match_clause.model_copy(update={"paths": paths})
+
     def _translate_path_expression(self, path: PathExpression) -> str:
         """Translate a single path expression to KQL format.
 
@@ -92,6 +224,45 @@ class GraphMatchTranslator:
 
         return "".join(result_parts)
 
+    def _translate_shortest_path(self, path: PathExpression) -> str:
+        """Translate a shortest path pattern to KQL graph-shortest-paths.
+
+        graph-shortest-paths needs a variable-length edge, so fixed single
+        hops become ``*1``. A named path lends its name to an unnamed edge,
+        which binds the path's edges. Otherwise the edge is named, rendered
+        and constrained to its relationship type exactly as in graph-match.
+
+        Args:
+            path: PathExpression with shortest set and a single relationship
+
+        Returns:
+            KQL graph-shortest-paths expression; ``output=all`` for
+            allShortestPaths
+
+        Raises:
+            ValueError: If the path is not a single relationship
+        """
+        if len(path.relationships) != 1:
+            raise ValueError("shortestPath() requires a single relationship between two nodes")
+
+        relationship = path.relationships[0]
+        update: Dict[str, Any] = {"length": relationship.length or "1"}
+        if relationship.variable is None and path.variable is not None:
+            update["variable"] = path.variable
+        path = path.model_copy(update={"relationships": [relationship.model_copy(update=update)]})
+        path = self._name_typed_edges(MatchClause(paths=[path])).paths[0]
+        relationship = path.relationships[0]
+
+        pattern = (
+            self._translate_node_pattern(path.nodes[0])
+            + self._translate_relationship_pattern(relationship)
+            + self._translate_node_pattern(path.nodes[1])
+        )
+        if relationship.relationship_type is not None:
+            pattern += f" where {edge_type_constraint(str(relationship.variable), relationship)}"
+        output = " output=all" if path.shortest == "all" else ""
+        return f"graph-shortest-paths{output} {pattern}"
+
     def _translate_node_pattern(self, node: NodePattern) -> str:
         """Translate a node pattern to KQL format.
 
@@ -138,7 +309,8 @@ class GraphMatchTranslator:
             relationship: RelationshipPattern with variable, type, direction, and length
 
         Returns:
-            KQL relationship pattern (e.g., "-[r:KNOWS]->", "-[*1..3]->")
+            KQL relationship pattern (e.g., "-[r]->", "-[*1..3]->"); the
+            relationship type is left to an edge_type_constraint
 
         Raises:
             ValueError: If relationship structure is invalid
@@ -153,11 +325,9 @@ class GraphMatchTranslator:
         if relationship.variable:
             inner += str(relationship.variable)
 
-        # Add relationship type
-        if relationship.relationship_type:
-            if relationship.variable:
-                inner += ":"
-            inner += str(relationship.relationship_type)
+        # Add variable-length hop range
+        if relationship.length:
+            inner += self._format_hop_range(relationship.length)
 
         inner += "]"
 
@@ -169,6 +339,27 @@ class GraphMatchTranslator:
         else:  # out (default)
             return f"-{inner}->"
 
+    def _format_hop_range(self, length: str) -> str:
+        """Format a variable-length specification as a graph-match hop range.
+
+        Args:
+            length: Length specification from the relationship (e.g., '..5', '*')
+
+        Returns:
+            Hop range (e.g., "*1..5", "*2"); the minimum defaults to 1, and
+            ranges without a maximum end UNBOUNDED_MAX_HOPS hops (or at the
+            minimum, if that is larger)
+        """
+        path_length = self.path_translator.parse_path_length_specification(length)
+        min_hops = 1 if path_length.min_length is None else path_length.min_length
+        max_hops = path_length.max_length
+        if max_hops is None:
+            max_hops = max(min_hops, UNBOUNDED_MAX_HOPS)
+
+        if max_hops == min_hops:
+            return f"*{min_hops}"
+        return f"*{min_hops}..{max_hops}"
+
     def _format_properties(self, properties: Dict[str, Any]) -> str:
         """Format property constraints for nodes or relationships.
 
@@ -188,8 +379,14 @@ class GraphMatchTranslator:
         prop_parts = []
         for key, value in properties.items():
             # Format value based on type
-            if isinstance(value, str):
-                formatted_value = f"'{value}'"
+            if isinstance(value, Literal):
+                formatted_value = self._format_literal(value)
+            elif isinstance(value, Parameter):
+                # Declared under its KQL name with declare query_parameters
+                formatted_value = kql_parameter_name(value.name)
+            elif isinstance(value, str):
+                escaped = value.replace("'", "\\'")
+                formatted_value = f"'{escaped}'"
             elif isinstance(value, bool):
                 formatted_value = "true" if value else "false"
             elif value is None:
@@ -203,6 +400,24 @@ class GraphMatchTranslator:
             return " {" + ", ".join(prop_parts) + "}"
         return ""
 
+    def _format_literal(self, literal: Literal) -> str:
+        """Format a Literal property value according to its value type.
+
+        Args:
+            literal: Literal AST node from a node property map
+
+        Returns:
+            KQL literal text (strings quoted and escaped)
+        """
+        if literal.value_type == "string":
+            escaped = str(literal.value).replace("'", "\\'")
+            return f"'{escaped}'"
+        elif literal.value_type == "boolean":
+            return "true" if literal.value else "false"
+        elif literal.value_type == "null":
+            return "null"
+        return str(literal.value)
+
     def extract_variable_names(self, match_clause: MatchClause) -> List[str]:
         """Extract all variable names from a MATCH clause.
 
@@ -0,0 +1,132 @@
+"""
+Persistent graph snapshot selection.
+
+Tenants that maintain persistent graph models declare them in the schema's
+``graphs`` section, with the labels and relationship types each holds and the
+snapshots kept of it:
+
+    graphs:
+      SecurityGraph:
+        labels: [User, Device]
+        relationships: [LOGGED_IN]
+        snapshots:
+          hourly: {max_age: 1h}
+
+A query whose labels and relationship types one model covers reads a snapshot
+with ``graph('SecurityGraph', 'hourly')`` instead of building its graph from
+raw tables with make-graph. A snapshot is only used when its ``max_age`` is
+within the context's ``max_snapshot_staleness`` and it holds the window the
+query asks for: the model's ``lookback`` must match the context's lookback, or
+both be unset (the snapshot then holds each table's default window).
+
+Example:
+    >>> snapshot = select_graph_snapshot(match_clause, schema_mapper, context)
+    >>> snapshot.render()
+    "graph('SecurityGraph', 'hourly')"
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional
+
+from ..models import DEFAULT_MAX_SNAPSHOT_STALENESS, TranslationContext
+from ..parser.ast_nodes import MatchClause
+from .time_window import parse_timespan
+
+
+@dataclass(frozen=True)
+class GraphSnapshotRef:
+    """A snapshot of a persistent graph model that can serve a query."""
+
+    model: str
+    snapshot: str
+    max_age: timedelta
+
+    def render(self) -> str:
+        """Return the KQL graph() reference to the snapshot."""
+        return f"graph('{self.model}', '{self.snapshot}')"
+
+
+def pattern_elements(match_clause: MatchClause) -> Optional[tuple[set[str], set[str]]]:
+    """Collect the labels and relationship types a MATCH clause reads.
+
+    Args:
+        match_clause: MatchClause AST node
+
+    Returns:
+        Tuple of (labels, relationship types), or None if a node has no label
+        (directly or through its variable) or a relationship has no type, in
+        which case the pattern may match anything in a graph
+    """
+    variable_labels: dict[str, str] = {}
+    for path in match_clause.paths:
+        for node in path.nodes:
+            if node.variable and node.labels:
+                variable_labels.setdefault(str(node.variable), str(node.labels[0]))
+
+    labels: set[str] = set()
+    relationship_types: set[str] = set()
+    for path in match_clause.paths:
+        for node in path.nodes:
+            if node.labels:
+                labels.update(str(label) for label in node.labels)
+            elif node.variable and str(node.variable) in variable_labels:
+                labels.add(variable_labels[str(node.variable)])
+            else:
+                return None
+        for relationship in path.relationships:
+            if relationship.relationship_type is None:
+                return None
+            relationship_types.add(str(relationship.relationship_type))
+    return labels, relationship_types
+
+
+def select_graph_snapshot(
+    match_clause: MatchClause,
+    schema_mapper,
+    context: Optional[TranslationContext] = None,
+) -> Optional[GraphSnapshotRef]:
+    """Choose the freshest declared snapshot that can serve a MATCH clause.
+
+    Args:
+        match_clause: MatchClause AST node
+        schema_mapper: SchemaMapper declaring the graph models
+        context: Translation context supplying the staleness threshold and
+            time window, or None for the defaults
+
+    Returns:
+        GraphSnapshotRef, or None if the graph must be built with make-graph
+    """
+    max_staleness = (
+        context.max_snapshot_staleness if context is not None else DEFAULT_MAX_SNAPSHOT_STALENESS
+    )
+    if max_staleness is None:
+        return None
+    # Sampling and absolute ranges apply to source tables, which snapshots skip
+    if context is not None and (context.sample_rows is not None or context.time_range):
+        return None
+    lookback = context.lookback if context is not None else None
+
+    models = schema_mapper.get_graph_models()
+    if not models:
+        return None
+    elements = pattern_elements(match_clause)
+    if elements is None:
+        return None
+    labels, relationship_types = elements
+
+    candidates = []
+    for name, model in models.items():
+        model_lookback = parse_timespan(model.lookback) if model.lookback else None
+        if model_lookback != lookback:
+            continue
+        if not labels <= set(model.labels) or not relationship_types <= set(model.relationships):
+            continue
+        for snapshot_name, snapshot in model.snapshots.items():
+            max_age = parse_timespan(snapshot.max_age)
+            if max_age <= max_staleness:
+                candidates.append(GraphSnapshotRef(name, snapshot_name, max_age))
+
+    if not candidates:
+        return None
+    return min(candidates, key=lambda ref: (ref.max_age, ref.model, ref.snapshot))
@@ -0,0 +1,458 @@
+"""
+Query guardrails applied before translation.
+
+Some query shapes reliably time out in Sentinel and use up workspace query
+capacity: unbounded variable-length paths, very long hop ranges, cartesian
+products of disconnected MATCH paths, and anything the cost model puts far over
+budget. The guardrail engine inspects the AST and its cost estimate against a
+per-tenant QueryBudget and decides, rule by rule, to allow the query, cap it
+(clamp hop ranges, add a row limit), downgrade it (narrow the time window until
+the estimate fits), or reject it.
+
+Every rule that fires is reported as a GuardrailViolation, so callers can show
+why a query was changed or retry a rejected query in a tighter form.
+
+Example:
+    >>> engine = GuardrailEngine(CostEstimator(SchemaMapper()))
+    >>> decision = engine.evaluate(parse_query("MATCH (a)-[*]->(b) RETURN a"), context)
+    >>> decision.action, str(decision.query.match_clause.paths[0].relationships[0])
+    (<GuardrailAction.CAP: 'cap'>, '-[*1..10]->')
+"""
+
+import dataclasses
+from dataclasses import dataclass, field
+from datetime import timedelta
+from enum import Enum
+from typing import Any, Optional
+
+from ..models import TranslationContext
+from ..parser.ast_nodes import Query
+from .condition_optimizer import condition_variables, split_conjuncts
+from .cost_model import CostEstimate, CostEstimator
+from .paths import PathTranslator
+from .time_window import format_timespan
+
+
+class GuardrailAction(Enum):
+    """Outcome of a guardrail rule, in increasing order of severity."""
+
+    ALLOW = "allow"
+    CAP = "cap"
+    DOWNGRADE = "downgrade"
+    REJECT = "reject"
+
+
+_SEVERITY = {action: rank for rank, action in enumerate(GuardrailAction)}
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    """Limits a tenant's queries must respect.
+
+    Attributes:
+        max_path_hops: Largest hop count a variable-length relationship may reach
+        unbounded_path_action: CAP to clamp ``*`` paths to max_path_hops, or REJECT
+        long_path_action: CAP or REJECT for ranges whose maximum exceeds max_path_hops
+        cartesian_product_action: CAP to limit MATCH paths that share no variable
+            to cap_rows results, REJECT them, or ALLOW them unchecked
+        max_result_rows: Row limit added to (or lowered on) the RETURN clause
+        max_execution_time_ms: Estimated latency limit; the context's
+            max_execution_time_ms applies on its own and lowers this one
+        max_scanned_rows: Estimated scanned-row limit
+        over_budget_action: CAP to limit over-budget queries to cap_rows results,
+            DOWNGRADE to narrow the time window until the query fits, or REJECT
+        min_lookback: Narrowest window a downgrade may produce
+        cap_rows: Row limit added (as ``take``) when a cartesian product or an
+            over-budget query is capped
+    """
+
+    max_path_hops: int = 10
+    unbounded_path_action: GuardrailAction = GuardrailAction.CAP
+    long_path_action: GuardrailAction = GuardrailAction.CAP
+    cartesian_product_action: GuardrailAction = GuardrailAction.CAP
+    max_result_rows: Optional[int] = None
+    max_execution_time_ms: Optional[int] = None
+    max_scanned_rows: Optional[int] = None
+    over_budget_action: GuardrailAction = GuardrailAction.CAP
+    min_lookback: timedelta = timedelta(hours=1)
+    cap_rows: int = 1000
+
+
+@dataclass(frozen=True)
+class GuardrailViolation:
+    """A guardrail rule that fired.
+
+    Attributes:
+        rule: Rule name (unbounded_path, path_length, cartesian_product,
+            result_rows, execution_time, scanned_rows)
+        action: What was done about it
+        message: Human-readable explanation
+        details: Rule-specific values, e.g. the limit and the offending value
+    """
+
+    rule: str
+    action: GuardrailAction
+    message: str
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class GuardrailDecision:
+    """Result of evaluating a query against its budget.
+
+    Attributes:
+        action: Most severe action taken
+        query: Query to translate, with any caps applied
+        context: Context to translate with, with any downgrade applied
+        violations: Rules that fired, in evaluation order
+        estimate: Cost estimate of ``query`` under ``context``
+    """
+
+    action: GuardrailAction
+    query: Query
+    context: TranslationContext
+    violations: list[GuardrailViolation]
+    estimate: CostEstimate
+
+    @property
+    def allowed(self) -> bool:
+        """Return True unless the query was rejected."""
+        return self.action != GuardrailAction.REJECT
+
+    @property
+    def reason(self) -> str:
+        """Summarize the violations in one line."""
+        return "; ".join(violation.message for violation in self.violations)
+
+
+class GuardrailEngine:
+    """Checks queries against per-tenant budgets before translation."""
+
+    def __init__(
+        self,
+        cost_estimator: CostEstimator,
+        default_budget: Optional[QueryBudget] = None,
+        tenant_budgets: Optional[dict[str, QueryBudget]] = None,
+    ):
+        """Initialize the engine.
+
+        Args:
+            cost_estimator: Estimator used for the cost rules
+            default_budget: Budget for tenants without their own (defaults to QueryBudget())
+            tenant_budgets: Budgets by tenant id
+        """
+        self.cost_estimator = cost_estimator
+        self.default_budget = default_budget or QueryBudget()
+        self.tenant_budgets: dict[str, QueryBudget] = dict(tenant_budgets or {})
+        self.path_translator = PathTranslator()
+
+    def set_tenant_budget(self, tenant_id: str, budget: QueryBudget) -> None:
+        """Set the budget for a tenant.
+
+        Args:
+            tenant_id: Tenant identifier
+            budget: Budget to apply to the tenant's queries
+        """
+        self.tenant_budgets[tenant_id] = budget
+
+    def budget_for(self, tenant_id: str) -> QueryBudget:
+        """Return the budget that applies to a tenant.
+
+        Args:
+            tenant_id: Tenant identifier
+
+        Returns:
+            The tenant's budget, or the default budget
+        """
+        return self.tenant_budgets.get(tenant_id, self.default_budget)
+
+    def evaluate(self, query: Query, context: TranslationContext) -> GuardrailDecision:
+        """Evaluate a query against the budget of the context's tenant.
+
+        Structural rules run first (hop ranges, cartesian products, result
+        rows); the cost rules then run on the capped query.
+
+        Args:
+            query: Parsed query AST
+            context: Translation context
+
+        Returns:
+            GuardrailDecision with the (possibly rewritten) query and context
+        """
+        budget = self.budget_for(context.tenant_id)
+        violations: list[GuardrailViolation] = []
+
+        query = self._check_path_lengths(query, budget, violations)
+        query = self._check_cartesian_product(query, budget, violations)
+        query = self._check_result_rows(query, budget, violations)
+
+        estimate = self.cost_estimator.estimate(query, context)
+        if not any(v.action == GuardrailAction.REJECT for v in violations):
+            query, context, estimate = self._check_cost(
+                query, context, estimate, budget, violations
+            )
+
+        action = max(
+            (violation.action for violation in violations),
+            key=_SEVERITY.__getitem__,
+            default=GuardrailAction.ALLOW,
+        )
+        return GuardrailDecision(action, query, context, violations, estimate)
+
+    def _check_path_lengths(
+        self, query: Query, budget: QueryBudget, violations: list[GuardrailViolation]
+    ) -> Query:
+        """Clamp or reject variable-length relationships beyond max_path_hops."""
+        paths = []
+        changed = False
+
+        for path in query.match_clause.paths:
+            relationships = []
+            for relationship in path.relationships:
+                if not relationship.length:
+                    relationships.append(relationship)
+                    continue
+
+                bounds = self.path_translator.parse_path_length_specification(
+                    relationship.length
+                )
+                min_hops = 1 if bounds.min_length is None else bounds.min_length
+                max_hops = bounds.max_length
+                limit = budget.max_path_hops
+
+                if max_hops is not None and max_hops <= limit:
+                    relationships.append(relationship)
+                    continue
+
+                pattern = str(relationship)
+                if max_hops is None:
+                    rule, action = "unbounded_path", budget.unbounded_path_action
+                    message = f"Unbounded path {pattern} exceeds the {limit}-hop limit"
+                else:
+                    rule, action = "path_length", budget.long_path_action
+                    message = f"Path {pattern} exceeds the {limit}-hop limit"
+                if min_hops > limit:
+                    action = GuardrailAction.REJECT
+
+                if action == GuardrailAction.CAP:
+                    capped = _replace(relationship, length=f"{min_hops}..{limit}")
+                    message += f"; capped to {capped}"
+                    relationships.append(capped)
+                    changed = True
+                else:
+                    action = GuardrailAction.REJECT
+                    relationships.append(relationship)
+
+                violations.append(
+                    GuardrailViolation(
+                        rule, action, message,
+                        {"pattern": pattern, "max_hops": max_hops, "limit": limit},
+                    )
+                )
+
+            paths.append(_replace(path, relationships=relationships) if changed else path)
+
+        if not changed:
+            return query
+        return _replace(query, match_clause=_replace(query.match_clause, paths=paths))
+
+    def _check_cartesian_product(
+        self, query: Query, budget: QueryBudget, violations: list[GuardrailViolation]
+    ) -> Query:
+        """Cap or reject MATCH paths that share no variable, directly or through WHERE."""
+        if budget.cartesian_product_action == GuardrailAction.ALLOW:
+            return query
+
+        # Union-find over variables; each path and each WHERE conjunct links
+        # the variables it mentions
+        parent: dict[str, str] = {}
+
+        def find(variable: str) -> str:
+            root = variable
+            while parent.setdefault(root, root) != root:
+                root = parent[root]
+            while parent[variable] != root:
+                parent[variable], variable = root, parent[variable]
+            return root
+
+        def link(variables: list[str]) -> None:
+            for other in variables[1:]:
+                parent[find(other)] = find(variables[0])
+
+        path_keys = []
+        for index, path in enumerate(query.match_clause.paths):
+            variables = [str(node.variable) for node in path.nodes if node.variable]
+            variables.extend(str(rel.variable) for rel in path.relationships if rel.variable)
+            # Anonymous paths still form their own component
+            key = f"\0path{index}"
+            link([key] + variables)
+            path_keys.append(key)
+
+        conditions = query.where_clause.conditions if query.where_clause else None
+        for conjunct in split_conjuncts(conditions):
+            link(sorted(condition_variables(conjunct)))
+
+        components = {find(key) for key in path_keys}
+        if len(components) <= 1:
+            return query
+
+        message = (
+            f"MATCH has {len(components)} disconnected patterns, which form a "
+            "cartesian product; connect them with a relationship or a WHERE join"
+        )
+        details: dict[str, Any] = {"components": len(components)}
+        action = budget.cartesian_product_action
+        if action == GuardrailAction.CAP:
+            query = _limit_rows(query, budget.cap_rows)
+            message += f"; results limited to {query.return_clause.limit} rows"
+            details["rows"] = query.return_clause.limit
+        else:
+            action = GuardrailAction.REJECT
+
+        violations.append(GuardrailViolation("cartesian_product", action, message, details))
+        return query
+
+    def _check_result_rows(
+        self, query: Query, budget: QueryBudget, violations: list[GuardrailViolation]
+    ) -> Query:
+        """Add or lower the RETURN limit to max_result_rows."""
+        limit = budget.max_result_rows
+        current = query.return_clause.limit
+        if limit is None or (current is not None and current <= limit):
+            return query
+
+        violations.append(
+            GuardrailViolation(
+                "result_rows",
+                GuardrailAction.CAP,
+                f"Results limited to {limit} rows",
+                {"limit": limit, "requested": current},
+            )
+        )
+        return _limit_rows(query, limit)
+
+    def _check_cost(
+        self,
+        query: Query,
+        context: TranslationContext,
+        estimate: CostEstimate,
+        budget: QueryBudget,
+        violations: list[GuardrailViolation],
+    ) -> tuple[Query, TranslationContext, CostEstimate]:
+        """Cap, downgrade or reject queries whose estimate exceeds the budget.
+
+        The context's max_execution_time_ms always applies; a tenant budget
+        can only tighten it.
+        """
+        time_limit = context.max_execution_time_ms
+        if budget.max_execution_time_ms is not None:
+            time_limit = min(time_limit, budget.max_execution_time_ms)
+
+        def over_budget(candidate: CostEstimate) -> Optional[GuardrailViolation]:
+            if not candidate.within_budget(time_limit):
+                return GuardrailViolation(
+                    "execution_time",
+                    GuardrailAction.REJECT,
+                    f"Estimated {candidate.execution_time_ms} ms exceeds the "
+                    f"{time_limit} ms budget",
+                    {"estimate": candidate.execution_time_ms, "limit": time_limit},
+                )
+            if (
+                budget.max_scanned_rows is not None
+                and candidate.scanned_rows > budget.max_scanned_rows
+            ):
+                return GuardrailViolation(
+                    "scanned_rows",
+                    GuardrailAction.REJECT,
+                    f"Estimated {candidate.scanned_rows} scanned rows exceeds the "
+                    f"{budget.max_scanned_rows} row budget",
+                    {"estimate": candidate.scanned_rows, "limit": budget.max_scanned_rows},
+                )
+            return None
+
+        violation = over_budget(estimate)
+        if violation is None:
+            return query, context, estimate
+
+        if budget.over_budget_action == GuardrailAction.CAP:
+            query = _limit_rows(query, budget.cap_rows)
+            rows = query.return_clause.limit
+            violations.append(
+                dataclasses.replace(
+                    violation,
+                    action=GuardrailAction.CAP,
+                    message=f"{violation.message}; results limited to {rows} rows",
+                    details={**violation.details, "rows": rows},
+                )
+            )
+            return query, context, self.cost_estimator.estimate(query, context)
+
+        if budget.over_budget_action == GuardrailAction.DOWNGRADE:
+            window = self._current_window(query, context)
+            while window is not None and window / 2 >= budget.min_lookback:
+                window = window / 2
+                narrowed = _narrow_window(context, window)
+                candidate = self.cost_estimator.estimate(query, narrowed)
+                if over_budget(candidate) is None:
+                    violations.append(
+                        dataclasses.replace(
+                            violation,
+                            action=GuardrailAction.DOWNGRADE,
+                            message=f"{violation.message}; time window narrowed to "
+                            f"{format_timespan(window)}",
+                            details={**violation.details, "window": format_timespan(window)},
+                        )
+                    )
+                    return query, narrowed, candidate
+
+        violations.append(violation)
+        return query, context, estimate
+
+    def _current_window(
+        self, query: Query, context: TranslationContext
+    ) -> Optional[timedelta]:
+        """Return the widest time window the query currently scans, if any.
+
+        Time-bounded tables without a default lookback are read over their
+        whole retention.
+        """
+        estimator = self.cost_estimator
+        schema_mapper = estimator.schema_mapper
+        widest: Optional[timedelta] = None
+        for path in query.match_clause.paths:
+            for node in path.nodes:
+                if not node.labels:
+                    continue
+                table = schema_mapper.get_sentinel_table(str(node.labels[0]))
+                table_meta = schema_mapper.schema.tables.get(table) if table else None
+                if table_meta is None or schema_mapper.get_time_column(table) is None:
+                    continue
+                window = estimator.time_window(table, context) or timedelta(
+                    days=table_meta.retention_days
+                )
+                if widest is None or window > widest:
+                    widest = window
+        return widest
+
+
+def _narrow_window(context: TranslationContext, window: timedelta) -> TranslationContext:
+    """Return a copy of the context scanning only the most recent ``window``."""
+    if context.time_range is not None:
+        _, end = context.time_range
+        return dataclasses.replace(context, time_range=(end - window, end))
+    return dataclasses.replace(context, lookback=window)
+
+
+def _limit_rows(query: Query, limit: int) -> Query:
+    """Return the query with its RETURN limit lowered to at most ``limit``."""
+    current = query.return_clause.limit
+    if current is not None and current <= limit:
+        return query
+    return _replace(query, return_clause=_replace(query.return_clause, limit=limit))
+
+
+def _replace(node: Any, **changes: Any) -> Any:
+    """Copy a pydantic or fast AST node with some fields changed."""
+    if hasattr(node, "model_copy"):
+        return node.model_copy(update=changes)
+    return dataclasses.replace(node, **changes)
@@ -0,0 +1,331 @@
+"""
+Join-pipeline translation for the FALLBACK strategy.
+
+``make-graph`` materializes every node and edge of the source tables before
+``graph-match`` runs, which is wasteful for fixed-length chains over large event
+tables. A join pipeline evaluates such patterns directly: each node variable
+reads its own table (time-windowed and filtered), packs its row into a dynamic
+column named after the variable, and each hop becomes a shuffle join on the
+columns of the relationship's ``sentinel_join`` condition:
+
+    let Match_u = IdentityInfo
+    | where AccountName == 'alice'
+    | project u = pack_all(), u_AccountName = AccountName;
+    let Match_d = DeviceInfo
+    | project d = pack_all(), d_UserName = UserName;
+    Match_u
+    | join kind=inner hint.strategy=shuffle (Match_d) on $left.u_AccountName == $right.d_UserName
+
+Properties read after the joins are copied to columns named after them before
+packing (``| extend username = AccountName``), so variables stay addressable
+as ``u.<property>`` and the WHERE and RETURN translations are shared with the
+graph path. Joins start from the
+variable with the fewest estimated rows and greedily add the hop with the
+smallest estimated output.
+
+Only tree-shaped patterns of typed, fixed-length relationships with usable join
+definitions are planned; anything else is left to make-graph.
+
+Example:
+    >>> plan = plan_join_pipeline(ast, schema_mapper, CostEstimator(schema_mapper))
+    >>> plan.order
+    ['u', 'd']
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from ..models import TranslationContext
+from ..parser.ast_nodes import Query
+from .graph_construction import parse_join_condition, table_pipeline
+from .paths import referenced_variables
+from .shared_subexpressions import LetPlan
+
+
+@dataclass(frozen=True)
+class JoinHop:
+    """A relationship of the pattern, oriented by its schema join definition."""
+
+    relationship_type: str
+    left: str
+    left_key: str
+    right: str
+    right_key: str
+
+
+@dataclass(frozen=True)
+class JoinStep:
+    """A join adding one variable to the pipeline.
+
+    Attributes:
+        variable: Variable joined in on the right
+        left_column: Key column already in the pipeline
+        right_column: Key column of the joined variable
+        left_rows: Estimated rows of the pipeline before the join
+        right_rows: Estimated rows of the joined variable
+        output_rows: Estimated rows after the join
+    """
+
+    variable: str
+    left_column: str
+    right_column: str
+    left_rows: float
+    right_rows: float
+    output_rows: float
+
+
+@dataclass(frozen=True)
+class JoinPlan:
+    """Join order and source tables for a pattern.
+
+    Attributes:
+        tables: Variable to Sentinel table, for every node variable
+        keys: Variable to the join key columns it must expose
+        start: Variable the pipeline starts from
+        steps: Joins in execution order
+    """
+
+    tables: dict[str, str]
+    keys: dict[str, list[str]]
+    start: str
+    steps: list[JoinStep]
+
+    @property
+    def order(self) -> list[str]:
+        """Return the variables in the order they enter the pipeline."""
+        return [self.start] + [step.variable for step in self.steps]
+
+    def join_sizes(self) -> list[tuple[float, float, float]]:
+        """Return (left rows, right rows, output rows) of each join."""
+        return [(step.left_rows, step.right_rows, step.output_rows) for step in self.steps]
+
+
+def key_column(variable: str, column: str) -> str:
+    """Return the name a variable's join key column has in the pipeline."""
+    return f"{variable}_{column}"
+
+
+def match_table_name(variable: str) -> str:
+    """Return the ``let`` name bound to a variable's source rows."""
+    return f"Match_{variable}"
+
+
+def plan_join_pipeline(
+    query: Query,
+    schema_mapper,
+    cost_estimator,
+    context: Optional[TranslationContext] = None,
+) -> Optional[JoinPlan]:
+    """Plan a pattern as a pipeline of joins.
+
+    Args:
+        query: Parsed query AST
+        schema_mapper: SchemaMapper supplying labels and join definitions
+        cost_estimator: CostEstimator used to order the joins
+        context: Translation context supplying the time window
+
+    Returns:
+        JoinPlan, or None if the pattern is not a connected tree of typed,
+        fixed-length, schema-joined relationships between labeled nodes
+        (OPTIONAL MATCH, shortest paths, inline property maps and referenced
+        relationship variables are also left to make-graph)
+    """
+    match_clause = query.match_clause
+    if match_clause.optional or any(path.shortest for path in match_clause.paths):
+        return None
+
+    # Name anonymous nodes so every hop has two endpoints
+    used = {
+        str(node.variable) for path in match_clause.paths for node in path.nodes if node.variable
+    }
+    tables: dict[str, str] = {}
+    path_variables: list[list[str]] = []
+    anonymous = 0
+    for path in match_clause.paths:
+        names = []
+        for node in path.nodes:
+            if node.properties:
+                return None
+            if node.variable:
+                name = str(node.variable)
+            else:
+                while f"node{anonymous}" in used:
+                    anonymous += 1
+                name = f"node{anonymous}"
+                used.add(name)
+            if node.labels:
+                table = schema_mapper.get_sentinel_table(str(node.labels[0]))
+                if table is None or tables.setdefault(name, table) != table:
+                    return None
+            names.append(name)
+        path_variables.append(names)
+
+    if any(name not in tables for names in path_variables for name in names):
+        return None
+
+    referenced = referenced_variables(query)
+    hops: list[JoinHop] = []
+    for path, names in zip(match_clause.paths, path_variables):
+        for index, relationship in enumerate(path.relationships):
+            if relationship.relationship_type is None or relationship.length:
+                return None
+            if relationship.variable and str(relationship.variable) in referenced:
+                return None
+
+            rel_type = str(relationship.relationship_type)
+            mapping = schema_mapper.get_relationship_mapping(rel_type)
+            if not mapping:
+                return None
+            left_table, right_table = mapping.get("left_table"), mapping.get("right_table")
+            keys = parse_join_condition(mapping.get("join_condition"), left_table, right_table)
+            if keys is None:
+                return None
+
+            first, second = names[index], names[index + 1]
+            if relationship.direction == "in":
+                first, second = second, first
+            elif relationship.direction == "both":
+                if left_table == right_table:
+                    # Either orientation of a self-join may match
+                    return None
+                if (tables[first], tables[second]) == (right_table, left_table):
+                    first, second = second, first
+
+            if (tables[first], tables[second]) != (left_table, right_table):
+                return None
+            hops.append(JoinHop(rel_type, first, keys[0], second, keys[1]))
+
+    if not hops:
+        return None
+
+    # Each hop must join two previously unconnected groups of variables
+    parent = {name: name for name in tables}
+
+    def find(name: str) -> str:
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    for hop in hops:
+        left_root, right_root = find(hop.left), find(hop.right)
+        if left_root == right_root:
+            return None
+        parent[left_root] = right_root
+    if len({find(name) for name in tables}) > 1:
+        return None
+
+    candidates = cost_estimator.node_candidates(query, context)
+    rows_of = {name: candidates.get(name, 1.0) for name in tables}
+
+    start = min(tables, key=rows_of.__getitem__)
+    joined = {start}
+    rows = rows_of[start]
+    steps: list[JoinStep] = []
+    keys: dict[str, list[str]] = {name: [] for name in tables}
+    remaining = list(hops)
+
+    while remaining:
+        best: Optional[tuple[float, JoinHop, str, str, str, str]] = None
+        for hop in remaining:
+            if hop.left in joined and hop.right not in joined:
+                inside, inside_key, outside, outside_key = (
+                    hop.left, hop.left_key, hop.right, hop.right_key
+                )
+            elif hop.right in joined and hop.left not in joined:
+                inside, inside_key, outside, outside_key = (
+                    hop.right, hop.right_key, hop.left, hop.left_key
+                )
+            else:
+                continue
+            output = cost_estimator.join_rows(
+                rows, tables[inside], inside_key,
+                rows_of[outside], tables[outside], outside_key,
+            )
+            if best is None or output < best[0]:
+                best = (output, hop, inside, inside_key, outside, outside_key)
+
+        output, hop, inside, inside_key, outside, outside_key = best
+        remaining.remove(hop)
+        for name, column in ((inside, inside_key), (outside, outside_key)):
+            if column not in keys[name]:
+                keys[name].append(column)
+        steps.append(
+            JoinStep(
+                variable=outside,
+                left_column=key_column(inside, inside_key),
+                right_column=key_column(outside, outside_key),
+                left_rows=rows,
+                right_rows=rows_of[outside],
+                output_rows=output,
+            )
+        )
+        joined.add(outside)
+        rows = output
+
+    return JoinPlan(tables=tables, keys=keys, start=start, steps=steps)
+
+
+def render_join_pipeline(
+    plan: JoinPlan,
+    variable_filters: Optional[dict[str, list[str]]] = None,
+    table_columns: Optional[dict[str, list[str]]] = None,
+    sample_rows: Optional[int] = None,
+    materialize: bool = True,
+    variable_properties: Optional[dict[str, dict[str, str]]] = None,
+) -> str:
+    """Render the source tables and joins of a join plan.
+
+    Variables whose tables are read with identical filters (``(u:User)`` and
+    ``(v:User)`` without predicates, say) share one ``Scan_<table>`` binding,
+    materialized so the table is scanned once.
+
+    Args:
+        plan: Plan from plan_join_pipeline
+        variable_filters: KQL predicates per variable, applied to its table
+        table_columns: Columns to keep per table before packing rows
+        sample_rows: Rows to sample from each variable's table, or None
+        materialize: Materialize scans shared by several variables
+        variable_properties: Per variable, the column each property read
+            after the joins maps to; copied into the packed row under the
+            property's name
+
+    Returns:
+        KQL ``let`` statements followed by the join pipeline; WHERE and RETURN
+        operators are appended by the caller
+    """
+    variable_filters = variable_filters or {}
+    table_columns = table_columns or {}
+    variable_properties = variable_properties or {}
+    lets = LetPlan(materialize)
+
+    scans = {
+        variable: table_pipeline(
+            plan.tables[variable],
+            variable_filters.get(variable),
+            table_columns.get(plan.tables[variable]),
+            sample_rows,
+        )
+        for variable in plan.order
+    }
+    for variable in plan.order:
+        scan = scans[variable]
+        packed = [f"{variable} = pack_all()"]
+        packed.extend(
+            f"{key_column(variable, column)} = {column}" for column in plan.keys[variable]
+        )
+        if materialize and list(scans.values()).count(scan) > 1:
+            scan = [lets.bind(f"Scan_{plan.tables[variable]}", scan)]
+        properties = variable_properties.get(variable)
+        if properties:
+            copies = ", ".join(f"{prop} = {column}" for prop, column in properties.items())
+            scan = scan + [f"| extend {copies}"]
+        lets.bind(match_table_name(variable), scan + [f"| project {', '.join(packed)}"])
+
+    body = [match_table_name(plan.start)]
+    for step in plan.steps:
+        body.append(
+            f"| join kind=inner hint.strategy=shuffle ({match_table_name(step.variable)})"
+            f" on $left.{step.left_column} == $right.{step.right_column}"
+        )
+    return "\n".join(lets.render(body))
@@ -0,0 +1,113 @@
+"""
+Canonical KQL formatting.
+
+Caches downstream of the translator (Sentinel's query results cache, client
+caches keyed by query text) only match if the same query shape always yields
+the same bytes. ``format_kql`` puts translated KQL into one canonical layout:
+
+- pipeline stages that start a line begin with ``| ``
+- single spaces between tokens, none before ``,`` or ``;`` or inside
+  brackets, and one after every ``,``
+- no leading or trailing whitespace, blank lines or comments
+
+Line breaks are kept where the translator puts them, and the translator emits
+tables, labels and projected columns in a fixed order, so formatting only
+removes incidental whitespace.
+
+``minify_kql`` renders the same query on a single line with the optional
+whitespace removed, for sending over the wire:
+
+    IdentityInfo|where AccountName == 'alice'|project AccountName
+
+String literals are never changed, and both functions are idempotent.
+
+Example:
+    >>> format_kql("IdentityInfo  \\n|where   AccountName=='a' ")
+    "IdentityInfo\\n| where AccountName=='a'"
+"""
+
+import re
+
+# String literals ('...' or "..." with backslash escapes) and // comments
+_LITERAL_OR_COMMENT = re.compile(r"'(?:[^'\\\n]|\\.)*'|\"(?:[^\"\\\n]|\\.)*\"|//[^\n]*")
+
+_SPACES = re.compile(r"[ \t\r\f\v]+")
+_SPACE_BEFORE = re.compile(r" ([,;)\]}])")
+_SPACE_AFTER = re.compile(r"([(\[{]) ")
+_COMMA = re.compile(r",(?=[^ \n])")
+_PIPE = re.compile(r"^\|(?=[^ ])", re.MULTILINE)
+
+# Whitespace minified text can drop: around separators, inside brackets
+_TIGHT = re.compile(r" ?([|,;]) ?|([(\[{]) | ([)\]}])")
+
+
+def _split(kql: str) -> list[tuple[bool, str]]:
+    """Split KQL into (is_code, text) segments, dropping comments."""
+    segments: list[tuple[bool, str]] = []
+    position = 0
+    for match in _LITERAL_OR_COMMENT.finditer(kql):
+        segments.append((True, kql[position:match.start()]))
+        if not match.group().startswith("//"):
+            segments.append((False, match.group()))
+        position = match.end()
+    segments.append((True, kql[position:]))
+    return segments
+
+
+def _rewrite_code(kql: str, rewrite) -> str:
+    """Apply ``rewrite`` to the code of a query, with literals masked out.
+
+    Literals are replaced by NUL-delimited indexes while the code is rewritten,
+    so patterns that span a literal's edges still see its surrounding code.
+    """
+    literals: list[str] = []
+    parts = []
+    for is_code, text in _split(kql):
+        if is_code:
+            parts.append(text)
+        else:
+            parts.append(f"\x00{len(literals)}\x00")
+            literals.append(text)
+    code = rewrite("".join(parts))
+    return re.sub("\x00(\\d+)\x00", lambda match: literals[int(match.group(1))], code)
+
+
+def _canonical(code: str) -> str:
+    """Normalize the whitespace of literal-free KQL code."""
+    code = _SPACES.sub(" ", code)
+    lines = [line.strip() for line in code.split("\n")]
+    code = "\n".join(line for line in lines if line)
+    code = _SPACE_BEFORE.sub(r"\1", code)
+    code = _SPACE_AFTER.sub(r"\1", code)
+    code = _COMMA.sub(", ", code)
+    return _PIPE.sub("| ", code)
+
+
+def _minified(code: str) -> str:
+    """Remove the optional whitespace of literal-free KQL code."""
+    code = _SPACES.sub(" ", code.replace("\n", " ")).strip()
+    return _TIGHT.sub(lambda match: match.group(1) or match.group(2) or match.group(3), code)
+
+
+def format_kql(kql: str) -> str:
+    """Format KQL in the canonical layout.
+
+    Args:
+        kql: KQL query text
+
+    Returns:
+        Canonically formatted KQL
+    """
+    return _rewrite_code(kql, _canonical)
+
+
+def minify_kql(kql: str) -> str:
+    """Render KQL on one line without optional whitespace.
+
+    Args:
+        kql: KQL query text
+
+    Returns:
+        Minified KQL
+    """
+    return _rewrite_code(kql, _minified)
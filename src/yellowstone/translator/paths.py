@@ -5,11 +5,28 @@ Translates Cypher path patterns including:
 - Simple paths: (n)-[r]->(m)
 - Variable-length paths: (n)-[r*1..3]->(m), (n)-[r*..5]->(m)
 - Unbounded paths: (n)-[r*]->(m)
+
+It also decides when a variable-length pattern is a pure reachability query,
+which ``graph-shortest-paths`` answers without enumerating every path.
 """
 
 from typing import Optional, Tuple, Dict, Any
 from dataclasses import dataclass
 
+from ..parser.ast_nodes import AliasedExpression, Identifier, Property, Query
+from .condition_optimizer import condition_properties
+
+# Upper hop bound given to variable-length paths without one; graph-match
+# requires a finite range
+UNBOUNDED_MAX_HOPS = 10
+
+# Aggregates whose result does not change when input rows are repeated
+_DUPLICATE_INSENSITIVE_AGGREGATES = frozenset({"MIN", "MAX"})
+_DISTINCT_AGGREGATES = frozenset({"COUNT", "COLLECT"})
+_AGGREGATES = frozenset(
+    {"COUNT", "SUM", "AVG", "MIN", "MAX", "COLLECT", "PERCENTILECONT", "PERCENTILEDISC"}
+)
+
 
 @dataclass
 class PathLength:
@@ -283,3 +300,77 @@ class PathTranslator:
         # This is a simplified version - full optimization would require
         # parsing and reconstructing the path AST
         return path_str
+
+
+def referenced_variables(query: Query) -> set[str]:
+    """Return the variables the WHERE and RETURN clauses refer to.
+
+    Args:
+        query: Parsed query AST
+
+    Returns:
+        Variable names used by WHERE conditions, RETURN items and ORDER BY
+    """
+    references: set[tuple[str, Optional[str]]] = set()
+    if query.where_clause is not None:
+        references |= condition_properties(query.where_clause.conditions)
+
+    items: list[Any] = list(query.return_clause.items)
+    items.extend(query.return_clause.order_by or [])
+    for item in items:
+        if isinstance(item, AliasedExpression):
+            item = item.expression
+        if isinstance(item, Property):
+            references.add((item.variable.name, None))
+        elif isinstance(item, Identifier):
+            references.add((item.name, None))
+        elif isinstance(item, dict):
+            references |= condition_properties(item)
+            expression = item.get("expression")
+            if expression is not None:
+                references.add((str(expression).partition(".")[0], None))
+
+    return {variable for variable, _ in references}
+
+
+def is_reachability_query(query: Query) -> bool:
+    """Check whether a query only asks which nodes a variable-length path connects.
+
+    Such queries can be answered with one shortest path per node pair instead
+    of every path. This holds when the MATCH is a single variable-length
+    relationship between two nodes whose relationship and path variables are
+    unused, and the RETURN result does not depend on how many paths connect a
+    pair: it is DISTINCT without aggregates, or every aggregate is min, max,
+    or count/collect of DISTINCT values.
+
+    Args:
+        query: Parsed query AST
+
+    Returns:
+        True if the query can be routed to graph-shortest-paths
+    """
+    match_clause = query.match_clause
+    if match_clause.optional or len(match_clause.paths) != 1:
+        return False
+    path = match_clause.paths[0]
+    if path.shortest or len(path.relationships) != 1 or not path.relationships[0].length:
+        return False
+
+    referenced = referenced_variables(query)
+    for variable in (path.variable, path.relationships[0].variable):
+        if variable is not None and str(variable) in referenced:
+            return False
+
+    aggregates = []
+    for item in query.return_clause.items:
+        if isinstance(item, AliasedExpression):
+            item = item.expression
+        if isinstance(item, dict) and str(item.get("name", "")).upper() in _AGGREGATES:
+            aggregates.append(item)
+    if not aggregates:
+        return query.return_clause.distinct
+    return all(
+        str(item["name"]).upper() in _DUPLICATE_INSENSITIVE_AGGREGATES
+        or (str(item["name"]).upper() in _DISTINCT_AGGREGATES and item.get("distinct"))
+        for item in aggregates
+    )
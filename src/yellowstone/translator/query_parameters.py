@@ -0,0 +1,225 @@
+"""
+Query parameter declarations.
+
+Cypher parameters (``$name``) are not inlined into the generated KQL. They are
+declared with their KQL types and referenced by name, and their values travel
+next to the query text in ``KQLQuery.parameters``, to be sent as query
+parameters of the request:
+
+    declare query_parameters(cypher_user:string, cypher_since:datetime);
+    IdentityInfo
+    | where AccountName == cypher_user
+    ...
+
+KQL names carry the ``cypher_`` prefix: a column of the same name would
+otherwise shadow the parameter inside ``where`` (``$DeviceId`` would compare
+DeviceId with itself), and names such as ``$limit`` are KQL keywords.
+
+Every execution of a query shape therefore shares one KQL text, and with it
+the translation cache entry and Sentinel's query results cache. Declarations
+carry no defaults, since a default is a value and would make the text differ
+again.
+
+A parameter takes the KQL type of the schema property it is compared with or
+constrains in a property map; a parameter used as an ``IN`` list is
+``dynamic``. Parameters without such a property are typed from their value.
+
+Example:
+    >>> parameters = declare_parameters(ast, {"user": "alice"}, resolve_type)
+    >>> render_declaration(parameters)
+    'declare query_parameters(cypher_user:string);'
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+from ..parser.ast_nodes import Parameter, Query
+
+# Prefix of the KQL names of Cypher parameters, keeping them apart from
+# column names and keywords
+PARAMETER_PREFIX = "cypher_"
+
+# KQL type of each schema property type
+KQL_PARAMETER_TYPES = {
+    "string": "string",
+    "int": "long",
+    "float": "real",
+    "bool": "bool",
+    "datetime": "datetime",
+    "array": "dynamic",
+}
+
+# Comparisons that relate a parameter to the property on their other side
+_COMPARISONS = frozenset({"=", "==", "!=", "<>", "<", ">", "<=", ">="})
+
+
+@dataclass(frozen=True)
+class QueryParameter:
+    """A declared query parameter.
+
+    Attributes:
+        name: Cypher parameter name (without ``$``)
+        kql_type: KQL scalar type ('string', 'long', 'datetime', ...)
+    """
+
+    name: str
+    kql_type: str
+
+    @property
+    def kql_name(self) -> str:
+        """Name the parameter is declared and referenced by in KQL."""
+        return kql_parameter_name(self.name)
+
+    def render(self) -> str:
+        """Return the parameter's entry in a query_parameters declaration."""
+        return f"{self.kql_name}:{self.kql_type}"
+
+
+def kql_parameter_name(name: str) -> str:
+    """Return the KQL name of the Cypher parameter ``$name``."""
+    return f"{PARAMETER_PREFIX}{name}"
+
+
+def value_type(value: Any) -> Optional[str]:
+    """Return the KQL type of a Python parameter value, or None if unsupported."""
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "long"
+    if isinstance(value, float):
+        return "real"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, datetime):
+        return "datetime"
+    if isinstance(value, timedelta):
+        return "timespan"
+    if isinstance(value, (list, tuple, dict)):
+        return "dynamic"
+    return None
+
+
+def parameter_references(
+    ast: Query,
+) -> list[tuple[str, Optional[tuple[str, str]], bool]]:
+    """List the parameters a query references, in reading order.
+
+    Args:
+        ast: Parsed query
+
+    Returns:
+        List of (name, (label, property) it is compared with or constrains,
+        or None, whether it is used as an IN list) tuples
+    """
+    references: list[tuple[str, Optional[tuple[str, str]], bool]] = []
+    variable_labels: dict[str, str] = {}
+    for path in ast.match_clause.paths:
+        for node in path.nodes:
+            label = str(node.labels[0]) if node.labels else None
+            if node.variable and label:
+                variable_labels.setdefault(str(node.variable), label)
+            for key, value in (node.properties or {}).items():
+                if isinstance(value, Parameter):
+                    references.append((value.name, (label, key) if label else None, False))
+
+    if ast.where_clause is None:
+        return references
+
+    stack: list[Any] = [ast.where_clause.conditions]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(reversed(item))
+            continue
+        if not isinstance(item, dict):
+            continue
+        if item.get("type") == "parameter":
+            references.append((item["name"], None, False))
+            continue
+        if item.get("type") == "comparison":
+            reference = _compared_parameter(item, variable_labels)
+            if reference is not None:
+                references.append(reference)
+                continue
+        children = [value for value in item.values() if isinstance(value, (dict, list))]
+        stack.extend(reversed(children))
+    return references
+
+
+def _compared_parameter(
+    comparison: Dict[str, Any], variable_labels: dict[str, str]
+) -> Optional[tuple[str, Optional[tuple[str, str]], bool]]:
+    """Return the parameter reference of a parameter-to-property comparison."""
+    operator = str(comparison.get("operator", "")).upper()
+    left, right = comparison.get("left"), comparison.get("right")
+    if not isinstance(left, dict) or not isinstance(right, dict):
+        return None
+    if operator == "IN":
+        sides = [(right, left)]
+    elif operator in _COMPARISONS:
+        sides = [(right, left), (left, right)]
+    else:
+        return None
+
+    for parameter, other in sides:
+        if parameter.get("type") == "parameter" and other.get("type") == "property":
+            label = variable_labels.get(other.get("variable"))
+            target = (label, other["property"]) if label else None
+            return parameter["name"], target, operator == "IN"
+    return None
+
+
+def declare_parameters(
+    ast: Query,
+    values: Optional[Dict[str, Any]],
+    resolve_type: Callable[[str, str], Optional[str]],
+) -> list[QueryParameter]:
+    """Type the parameters a query references.
+
+    Args:
+        ast: Parsed query
+        values: Parameter values by name (CypherQuery.parameters)
+        resolve_type: Maps (label, property) to its schema type, or None
+
+    Returns:
+        QueryParameters in order of first reference
+
+    Raises:
+        ValueError: If a parameter has no value, or its type cannot be
+            determined from the schema or from its value
+    """
+    values = values or {}
+    types: dict[str, Optional[str]] = {}
+    for name, target, is_list in parameter_references(ast):
+        if types.get(name):
+            continue
+        kql_type = None
+        if is_list:
+            kql_type = "dynamic"
+        elif target is not None:
+            kql_type = KQL_PARAMETER_TYPES.get(resolve_type(*target) or "")
+        types[name] = kql_type
+
+    missing = [f"${name}" for name in types if name not in values]
+    if missing:
+        raise ValueError(f"No value supplied for parameter {', '.join(missing)}")
+
+    parameters = []
+    for name, kql_type in types.items():
+        if kql_type is None:
+            kql_type = value_type(values[name])
+        if kql_type is None:
+            raise ValueError(
+                f"Cannot determine the type of parameter ${name}: compare it with a "
+                "schema property or supply a string, number, boolean, datetime or list value"
+            )
+        parameters.append(QueryParameter(name, kql_type))
+    return parameters
+
+
+def render_declaration(parameters: list[QueryParameter]) -> str:
+    """Render a ``declare query_parameters`` statement, or '' if there are none."""
+    if not parameters:
+        return ""
+    return f"declare query_parameters({', '.join(p.render() for p in parameters)});"
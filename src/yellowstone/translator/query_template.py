@@ -0,0 +1,344 @@
+"""
+Literal-abstracted query templates for translation caching.
+
+Most traffic is the same query shape with different literal values. This module
+lifts string and number literals out of WHERE condition dictionaries and node
+property maps into numbered slots, producing a skeleton ``Query`` whose
+fingerprint is shared by every query of that shape. The skeleton is translated
+once; later queries fill their escaped literal values into the cached KQL.
+
+Slot placeholders are NUL-delimited slot numbers. The lexer rejects NUL
+characters, so placeholders can never collide with text from a real query.
+
+Boolean and null literals stay in the skeleton: their KQL rendering depends on
+the value itself, and they have too few values to be worth abstracting.
+
+Example:
+    >>> template = QueryTemplate.from_query(parse_query(
+    ...     "MATCH (u:User) WHERE u.username = 'alice' RETURN u"))
+    >>> template.slots
+    (TemplateSlot(value='alice', value_type='string'),)
+    >>> template.render("where u.username == '\\x000\\x00'")
+    "where u.username == 'alice'"
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from ..parser.ast_nodes import (
+    Literal,
+    MatchClause,
+    NodePattern,
+    PathExpression,
+    Query,
+    WhereClause,
+)
+
+# Literal value types that are lifted into slots
+SLOTTED_VALUE_TYPES = frozenset({"string", "number"})
+
+_SLOT_PATTERN = re.compile("\x00(\\d+)\x00")
+
+
+def slot_placeholder(index: int) -> str:
+    """Return the placeholder text used for slot ``index`` in skeletons."""
+    return f"\x00{index}\x00"
+
+
+@dataclass(frozen=True)
+class TemplateSlot:
+    """A literal value lifted out of a query."""
+
+    value: Any
+    value_type: str
+
+    def render(self) -> str:
+        """Render the slot value as it appears inside the skeleton KQL.
+
+        String values are escaped but not quoted, because the skeleton already
+        carries the quotes around the placeholder.
+        """
+        if self.value_type == "string":
+            return str(self.value).replace("'", "\\'")
+        return str(self.value)
+
+
+@dataclass(frozen=True)
+class QueryTemplate:
+    """A query skeleton with its literal values lifted into slots.
+
+    Templates are immutable; use ``dataclasses.replace`` to fill in other values.
+
+    Attributes:
+        skeleton: Query AST with slotted literals replaced by placeholders
+        slots: Lifted literal values, indexed by slot number
+        fingerprint: Stable hash of the skeleton, shared by same-shape queries
+    """
+
+    skeleton: Query
+    slots: tuple[TemplateSlot, ...] = ()
+    fingerprint: str = ""
+
+    @classmethod
+    def from_query(cls, query: Query) -> "QueryTemplate":
+        """Build a template by lifting literals out of a parsed query.
+
+        Args:
+            query: Parsed Query AST
+
+        Returns:
+            QueryTemplate whose skeleton has placeholders in place of literals
+        """
+        slots: list[TemplateSlot] = []
+
+        match_clause = MatchClause(
+            paths=[_lift_path(path, slots) for path in query.match_clause.paths],
+            optional=query.match_clause.optional,
+        )
+
+        where_clause = None
+        if query.where_clause is not None:
+            where_clause = WhereClause(
+                conditions=_lift_conditions(query.where_clause.conditions, slots)
+            )
+
+        skeleton = Query(
+            match_clause=match_clause,
+            where_clause=where_clause,
+            return_clause=query.return_clause,
+        )
+        return cls(skeleton=skeleton, slots=tuple(slots), fingerprint=_fingerprint(skeleton))
+
+    def render(self, skeleton_kql: str) -> str:
+        """Fill this template's literal values into translated skeleton KQL.
+
+        Args:
+            skeleton_kql: KQL translated from a skeleton with the same fingerprint
+
+        Returns:
+            KQL with every placeholder replaced by its escaped literal value
+        """
+        if not self.slots:
+            return skeleton_kql
+        return _SLOT_PATTERN.sub(lambda m: self.slots[int(m.group(1))].render(), skeleton_kql)
+
+
+def _fingerprint(skeleton: Query) -> str:
+    """Hash a skeleton query into a stable fingerprint.
+
+    Clause models are hashed through their JSON form; the condition tree is
+    walked with an explicit stack because deep chains exceed the serializer's
+    depth limit.
+    """
+    digest = hashlib.sha256()
+    digest.update(skeleton.match_clause.model_dump_json().encode("utf-8"))
+    digest.update(skeleton.return_clause.model_dump_json().encode("utf-8"))
+
+    if skeleton.where_clause is not None:
+        stack: list[Any] = [skeleton.where_clause.conditions]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                digest.update(b"{")
+                stack.append(_CLOSE_DICT)
+                for key in reversed(list(item)):
+                    stack.append(item[key])
+                    stack.append(_DictKey(key))
+            elif isinstance(item, list):
+                digest.update(b"[")
+                stack.append(_CLOSE_LIST)
+                stack.extend(reversed(item))
+            elif item is _CLOSE_DICT:
+                digest.update(b"}")
+            elif item is _CLOSE_LIST:
+                digest.update(b"]")
+            else:
+                digest.update(repr(item).encode("utf-8"))
+                digest.update(b",")
+
+    return digest.hexdigest()
+
+
+class _DictKey(str):
+    """Marks a dictionary key while hashing, so keys and values cannot be confused."""
+
+    def __repr__(self) -> str:
+        return f"{str.__repr__(self)}:"
+
+
+_CLOSE_DICT = object()
+_CLOSE_LIST = object()
+
+
+def _lift_path(path: PathExpression, slots: list[TemplateSlot]) -> PathExpression:
+    """Return a copy of a path whose node property literals are slotted."""
+    if not any(node.properties for node in path.nodes):
+        return path
+
+    nodes = []
+    for node in path.nodes:
+        if not node.properties:
+            nodes.append(node)
+            continue
+
+        properties = {}
+        for key, value in node.properties.items():
+            if isinstance(value, Literal) and value.value_type in SLOTTED_VALUE_TYPES:
+                placeholder = slot_placeholder(len(slots))
+                slots.append(TemplateSlot(value=value.value, value_type=value.value_type))
+                value = Literal(value=placeholder, value_type=value.value_type)
+            properties[key] = value
+
+        nodes.append(
+            NodePattern(variable=node.variable, labels=node.labels, properties=properties)
+        )
+
+    return path.model_copy(update={"nodes": nodes})
+
+
+def _lift_conditions(conditions: dict[str, Any], slots: list[TemplateSlot]) -> dict[str, Any]:
+    """Return a copy of a condition tree whose literals are slotted.
+
+    The tree is rebuilt with an explicit stack, so arbitrarily deep condition
+    chains do not hit the recursion limit. Slots are numbered in reading order.
+    """
+    root: list[Any] = [None]
+    stack: list[tuple[Any, Any, Any]] = [(conditions, root, 0)]
+
+    while stack:
+        source, parent, key = stack.pop()
+
+        if isinstance(source, dict):
+            if (
+                source.get("type") == "literal"
+                and source.get("value_type") in SLOTTED_VALUE_TYPES
+            ):
+                slot = TemplateSlot(value=source.get("value"), value_type=source["value_type"])
+                lifted = dict(source, value=slot_placeholder(len(slots)))
+                slots.append(slot)
+                parent[key] = lifted
+                continue
+
+            copy = dict.fromkeys(source)
+            parent[key] = copy
+            for child_key in reversed(list(source)):
+                stack.append((source[child_key], copy, child_key))
+
+        elif isinstance(source, list):
+            copy_list: list[Any] = [None] * len(source)
+            parent[key] = copy_list
+            for index in range(len(source) - 1, -1, -1):
+                stack.append((source[index], copy_list, index))
+
+        else:
+            parent[key] = source
+
+    return root[0]
+
+
+@dataclass(frozen=True)
+class TemplateCacheStats:
+    """Snapshot of template cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# Cached in place of skeleton KQL for shapes whose translation depends on literal values
+UNTEMPLATABLE = ""
+
+
+class TemplateCache:
+    """Bounded, thread-safe LRU cache of translated skeleton KQL by fingerprint.
+
+    A cached value of ``UNTEMPLATABLE`` records that the shape must always be
+    translated directly.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """Initialize the template cache.
+
+        Args:
+            max_size: Maximum number of skeletons to keep
+
+        Raises:
+            ValueError: If max_size is not positive
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+
+        self.max_size = max_size
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, fingerprint: str) -> Optional[str]:
+        """Look up translated skeleton KQL.
+
+        Args:
+            fingerprint: Template fingerprint
+
+        Returns:
+            Skeleton KQL (or ``UNTEMPLATABLE``), or None on a miss
+        """
+        with self._lock:
+            kql = self._entries.get(fingerprint)
+            if kql is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(fingerprint)
+            self._hits += 1
+            return kql
+
+    def put(self, fingerprint: str, skeleton_kql: str) -> None:
+        """Store translated skeleton KQL, evicting the LRU entry if full.
+
+        Args:
+            fingerprint: Template fingerprint
+            skeleton_kql: Translated skeleton KQL, or ``UNTEMPLATABLE``
+        """
+        with self._lock:
+            self._entries[fingerprint] = skeleton_kql
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> TemplateCacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return TemplateCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached skeletons."""
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,48 @@
+"""
+Request property directives.
+
+Client request properties can be set from the query text itself with ``set``
+statements placed before the query. ``request_property_statements`` renders
+the ones a TranslationContext asks for:
+
+    set query_results_cache_max_age = time(5m);
+    set truncationmaxrecords = 10000;
+    set query_take_max_records = 1000;
+    IdentityInfo
+    ...
+
+``query_results_cache_max_age`` lets Sentinel answer a query from its results
+cache when the same query text ran within that age, so dashboards that re-issue
+identical queries are served without re-running them. The cache is keyed by the
+query text, so statements are always emitted in the same order and format.
+"""
+
+from typing import Optional
+
+from ..models import TranslationContext
+from .time_window import format_timespan
+
+
+def request_property_statements(context: Optional[TranslationContext]) -> list[str]:
+    """Render the ``set`` statements for a context's request properties.
+
+    Args:
+        context: Translation context, or None for no statements
+
+    Returns:
+        KQL ``set`` statements in canonical order
+    """
+    if context is None:
+        return []
+
+    statements = []
+    if context.results_cache_max_age is not None:
+        age = format_timespan(context.results_cache_max_age)
+        statements.append(f"set query_results_cache_max_age = time({age});")
+    if context.no_truncation:
+        statements.append("set notruncation;")
+    if context.truncation_max_records is not None:
+        statements.append(f"set truncationmaxrecords = {context.truncation_max_records};")
+    if context.take_max_records is not None:
+        statements.append(f"set query_take_max_records = {context.take_max_records};")
+    return statements
@@ -5,13 +5,24 @@ Handles translation of RETURN clauses, including:
 - Simple variable returns
 - Property projections
 - Distinct modifier
-- Order by clauses
-- Limit and skip (offset)
-- Aggregation functions
+- Order by clauses, as top N when limited
+- Limit and skip (row-number windows)
+- Aggregation functions, as summarize ... by (exact, or approximate with
+  dcount for exploratory queries)
 """
 
 from typing import Any, Dict, List, Optional
-from ..parser.ast_nodes import ReturnClause, Identifier, Property
+from ..parser.ast_nodes import AliasedExpression, ReturnClause, Identifier, Property
+
+# Column holding row numbers while SKIP drops leading rows
+ROW_NUMBER_COLUMN = "_row"
+
+# Relative error of dcount() by accuracy level 0-4; KQL defaults to level 1
+DCOUNT_ERROR = (0.016, 0.008, 0.004, 0.0028, 0.002)
+DEFAULT_DCOUNT_ACCURACY = 1
+
+# Typical relative error of percentile(), a t-digest estimate
+PERCENTILE_ERROR = 0.01
 
 
 class ReturnClauseTranslator:
@@ -27,16 +38,41 @@ class ReturnClauseTranslator:
             "MAX",
             "COLLECT",
             "DISTINCT",
+            "PERCENTILECONT",
+            "PERCENTILEDISC",
         }
 
-    def translate(self, return_clause: ReturnClause) -> str:
-        """Translate RETURN clause to KQL project statement.
+    def translate(
+        self,
+        return_clause: ReturnClause,
+        approximate: bool = False,
+        dcount_accuracy: Optional[int] = None,
+    ) -> str:
+        """Translate RETURN clause to KQL projection and row-shaping operators.
+
+        The RETURN stage is emitted in Cypher's order (projection, DISTINCT,
+        ORDER BY, SKIP, LIMIT) using the cheapest KQL operators for it:
+
+        - Aggregation functions become ``summarize <aggregates> by <keys>``,
+          grouping by the non-aggregate items
+        - DISTINCT projections become ``summarize by``, which aggregates
+          partially on each shard instead of deduplicating a full projection
+        - Grouped properties are named explicitly (``u_username = u.username``)
+          and ORDER BY refers to projected properties by their column name,
+          since ``u`` itself is gone after the projection
+        - ORDER BY with LIMIT becomes ``top N by``, which keeps only N rows
+          per shard instead of sorting the whole result
+        - SKIP numbers the ordered rows with ``serialize``/``row_number()``
+          and drops the first ones; with LIMIT, only SKIP + LIMIT rows are
+          kept before numbering
 
         Args:
             return_clause: ReturnClause AST node with items, distinct, order_by, limit, skip
+            approximate: Use estimating aggregates (``dcount``) where KQL has them
+            dcount_accuracy: dcount accuracy level 0-4, or None for KQL's default
 
         Returns:
-            KQL projection string (e.g., "project n, m.name | sort by n.age desc")
+            KQL string (e.g., "project n, m.name | top 10 by n.age desc")
 
         Raises:
             ValueError: If return clause structure is invalid
@@ -47,39 +83,214 @@ class ReturnClauseTranslator:
         if not return_clause.items:
             raise ValueError("RETURN clause must have at least one item")
 
-        # Build the project clause
-        project_items = []
-        for item in return_clause.items:
-            project_item = self._translate_return_item(item)
-            project_items.append(project_item)
+        limit, skip = return_clause.limit, return_clause.skip
+        if limit is not None and limit < 0:
+            raise ValueError(f"LIMIT must be non-negative, got {limit}")
+        if skip is not None and skip < 0:
+            raise ValueError(f"SKIP must be non-negative, got {skip}")
+
+        # Build the projection; aggregates and DISTINCT both group, and
+        # grouped rows are already distinct. Columns maps projected property
+        # expressions to the column names ORDER BY must use.
+        columns: Dict[str, str] = {}
+        if self.has_aggregation(return_clause):
+            aggregates = []
+            group_keys = []
+            for item in return_clause.items:
+                if self.is_aggregate(item):
+                    aggregates.append(
+                        self._translate_aggregate(item, approximate, dcount_accuracy)
+                    )
+                else:
+                    group_keys.append(self._translate_group_key(item, columns))
+            summarize = f"summarize {', '.join(aggregates)}"
+            if group_keys:
+                summarize += f" by {', '.join(group_keys)}"
+            operators = [summarize]
+        elif return_clause.distinct:
+            group_keys = [
+                self._translate_group_key(item, columns) for item in return_clause.items
+            ]
+            operators = [f"summarize by {', '.join(group_keys)}"]
+        else:
+            project_items = []
+            for item in return_clause.items:
+                expression = self._translate_return_item(item)
+                column = self._column_name(item)
+                if column is not None:
+                    # project names u.username's column u_username
+                    columns[expression] = column
+                project_items.append(expression)
+            operators = [f"project {', '.join(project_items)}"]
+
+        # Rows needed before SKIP is applied
+        kept = None
+        if limit is not None:
+            kept = limit + (skip or 0)
+
+        if return_clause.order_by:
+            sort_clause = self._translate_order_by(return_clause.order_by, columns)
+            if kept is not None:
+                operators.append(sort_clause.replace("sort by", f"top {kept} by", 1))
+            else:
+                operators.append(sort_clause)
+        elif kept is not None:
+            operators.append(f"limit {kept}")
 
-        # Handle DISTINCT
-        distinct_modifier = ""
-        if return_clause.distinct:
-            distinct_modifier = "distinct "
+        if skip:
+            operators.append(f"serialize {ROW_NUMBER_COLUMN} = row_number()")
+            operators.append(f"where {ROW_NUMBER_COLUMN} > {skip}")
+            operators.append(f"project-away {ROW_NUMBER_COLUMN}")
 
-        result = f"{distinct_modifier}project {', '.join(project_items)}"
+        return " | ".join(operators)
 
-        # Add sort/order by if specified
-        if return_clause.order_by:
-            sort_clause = self._translate_order_by(return_clause.order_by)
-            result += f" | {sort_clause}"
+    def is_aggregate(self, item: Any) -> bool:
+        """Check whether a return item is an aggregation function call.
 
-        # Add limit if specified
-        if return_clause.limit is not None:
-            if return_clause.limit < 0:
-                raise ValueError(f"LIMIT must be non-negative, got {return_clause.limit}")
-            result += f" | limit {return_clause.limit}"
+        Args:
+            item: A return item, possibly aliased
 
-        # Add skip (offset) if specified
-        if return_clause.skip is not None:
-            if return_clause.skip < 0:
-                raise ValueError(f"SKIP must be non-negative, got {return_clause.skip}")
-            # In KQL, skip is achieved with 'limit' or offset-based pagination
-            # We'll use offset semantic if available
-            result += f" | offset {return_clause.skip}"
+        Returns:
+            True if the item (or the expression it aliases) is an aggregate
+        """
+        if isinstance(item, AliasedExpression):
+            item = item.expression
+        elif isinstance(item, dict) and item.get("type") == "alias":
+            item = item.get("expression")
+        return (
+            isinstance(item, dict)
+            and item.get("type") == "function"
+            and str(item.get("name", "")).upper() in self.aggregation_functions
+        )
+
+    def has_aggregation(self, return_clause: ReturnClause) -> bool:
+        """Check whether a RETURN clause aggregates.
 
-        return result
+        Args:
+            return_clause: ReturnClause AST node
+
+        Returns:
+            True if any return item is an aggregation function call
+        """
+        return any(self.is_aggregate(item) for item in return_clause.items)
+
+    def approximations(self, return_clause: ReturnClause, approximate: bool = False) -> List[str]:
+        """List the KQL aggregates of a RETURN clause whose results are estimates.
+
+        Args:
+            return_clause: ReturnClause AST node
+            approximate: Whether the clause is translated in approximate mode
+
+        Returns:
+            Estimating aggregates used ("dcount", "percentile"), in order
+        """
+        names: List[str] = []
+        for item in return_clause.items:
+            if not self.is_aggregate(item):
+                continue
+            function = self._unalias(item)[1]
+            name = str(function["name"]).upper()
+            if name == "COUNT" and function.get("distinct") and approximate:
+                names.append("dcount")
+            elif name in ("PERCENTILECONT", "PERCENTILEDISC"):
+                # KQL has no exact percentile; percentile() is a t-digest estimate
+                names.append("percentile")
+        return list(dict.fromkeys(names))
+
+    @staticmethod
+    def approximation_error(approximation: str, dcount_accuracy: Optional[int] = None) -> float:
+        """Return the relative error of an estimating aggregate.
+
+        Args:
+            approximation: Name from approximations() ("dcount" or "percentile")
+            dcount_accuracy: dcount accuracy level, or None for KQL's default
+
+        Returns:
+            Relative error of the aggregate's results
+        """
+        if approximation == "dcount":
+            level = DEFAULT_DCOUNT_ACCURACY if dcount_accuracy is None else dcount_accuracy
+            return DCOUNT_ERROR[level]
+        if approximation == "percentile":
+            return PERCENTILE_ERROR
+        raise ValueError(f"Unknown approximation: {approximation}")
+
+    @staticmethod
+    def _unalias(item: Any) -> tuple:
+        """Split a return item into (alias or None, expression)."""
+        if isinstance(item, AliasedExpression):
+            return str(item.alias), item.expression
+        if isinstance(item, dict) and item.get("type") == "alias":
+            return item.get("alias"), item.get("expression")
+        return None, item
+
+    def _translate_aggregate(
+        self, item: Any, approximate: bool = False, dcount_accuracy: Optional[int] = None
+    ) -> str:
+        """Translate an aggregation return item into a summarize aggregate.
+
+        ``count(*)`` and ``count(n)`` of a whole variable count rows,
+        ``count(x)`` counts non-null values, ``count(DISTINCT x)`` becomes
+        ``count_distinct`` (``dcount`` in approximate mode), ``collect``
+        becomes ``make_list`` (``make_set`` with DISTINCT), and
+        ``percentileCont``/``percentileDisc`` become ``percentile``.
+
+        Args:
+            item: Aggregation function dict, possibly aliased
+            approximate: Use dcount for count(DISTINCT x)
+            dcount_accuracy: dcount accuracy level, or None for KQL's default
+
+        Returns:
+            KQL aggregate expression, prefixed with ``alias = `` if aliased
+
+        Raises:
+            ValueError: If DISTINCT is used with a function that has no
+                distinct KQL counterpart, or a percentile is not in [0, 1]
+        """
+        alias, item = self._unalias(item)
+
+        name = str(item["name"]).upper()
+        arguments = item.get("arguments") or []
+        distinct = bool(item.get("distinct"))
+        argument = self._translate_return_item(arguments[0]) if arguments else ""
+
+        if name == "COUNT":
+            if distinct and approximate:
+                accuracy = "" if dcount_accuracy is None else f", {dcount_accuracy}"
+                expression = f"dcount({argument}{accuracy})"
+            elif distinct:
+                expression = f"count_distinct({argument})"
+            elif not arguments or self._is_variable(arguments[0]):
+                expression = "count()"
+            else:
+                expression = f"countif(isnotnull({argument}))"
+        elif name == "COLLECT":
+            expression = f"{'make_set' if distinct else 'make_list'}({argument})"
+        elif distinct:
+            raise ValueError(f"DISTINCT is not supported in {name.lower()}()")
+        elif name in ("PERCENTILECONT", "PERCENTILEDISC"):
+            expression = f"percentile({argument}, {self._percentile(item['name'], arguments)})"
+        else:
+            expression = self._translate_function_item(item)
+
+        return f"{alias} = {expression}" if alias else expression
+
+    @staticmethod
+    def _percentile(name: str, arguments: List[Any]) -> str:
+        """Convert a Cypher percentile argument (0-1) to KQL's 0-100 scale."""
+        value = arguments[1] if len(arguments) == 2 else None
+        if isinstance(value, dict) and value.get("type") == "literal":
+            value = value.get("value")
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 <= value <= 1:
+            raise ValueError(f"{name}() requires a percentile between 0 and 1, got {value!r}")
+        return f"{value * 100:g}"
+
+    @staticmethod
+    def _is_variable(item: Any) -> bool:
+        """Check whether an expression is a bare variable reference."""
+        return isinstance(item, (Identifier, str)) or (
+            isinstance(item, dict) and item.get("type") == "identifier"
+        )
 
     def _translate_return_item(self, item: Any) -> str:
         """Translate a single return item.
@@ -89,7 +300,7 @@ class ReturnClauseTranslator:
         - Properties: n.name, m.age
         - Function calls: COUNT(n), SUM(m.age)
         - Literals: 'constant_value', 42
-        - Aliases: n.name as actor_name
+        - Aliases: n.name AS actor_name, as actor_name = n.name
 
         Args:
             item: A return item (could be dict, Identifier, Property, or other)
@@ -108,6 +319,10 @@ class ReturnClauseTranslator:
         if isinstance(item, Property):
             return str(item)
 
+        # Handle AliasedExpression objects: alias = expr
+        if isinstance(item, AliasedExpression):
+            return f"{item.alias} = {self._translate_return_item(item.expression)}"
+
         # Handle dictionary items (for more complex structures)
         if isinstance(item, dict):
             item_type = item.get("type")
@@ -127,10 +342,10 @@ class ReturnClauseTranslator:
                 return self._translate_literal_item(item)
 
             elif item_type == "alias":
-                # Handle aliased expressions: expr as alias_name
+                # Handle aliased expressions: alias_name = expr
                 expr = self._translate_return_item(item.get("expression"))
                 alias = item.get("alias", "")
-                return f"{expr} as {alias}"
+                return f"{alias} = {expr}"
 
             else:
                 raise ValueError(f"Unsupported return item type: {item_type}")
@@ -230,13 +445,43 @@ class ReturnClauseTranslator:
         else:
             raise ValueError(f"Unsupported literal type: {value_type}")
 
-    def _translate_order_by(self, order_by_items: List[Dict[str, Any]]) -> str:
+    def _translate_group_key(self, item: Any, columns: Dict[str, str]) -> str:
+        """Translate a grouping key, naming property keys explicitly.
+
+        Args:
+            item: A non-aggregate return item
+            columns: Collects the column name of each aliased property
+
+        Returns:
+            KQL grouping key (e.g., "u_username = u.username")
+        """
+        expression = self._translate_return_item(item)
+        column = self._column_name(item)
+        if column is None:
+            return expression
+        columns[expression] = column
+        return f"{column} = {expression}"
+
+    @staticmethod
+    def _column_name(item: Any) -> Optional[str]:
+        """Return the column a projected property gets (n.name -> n_name), if any."""
+        if isinstance(item, Property):
+            return f"{item.variable}_{item.property_name}"
+        if isinstance(item, dict) and item.get("type") == "property":
+            return f"{item.get('variable', '')}_{item.get('property', '')}"
+        return None
+
+    def _translate_order_by(
+        self, order_by_items: List[Dict[str, Any]], columns: Optional[Dict[str, str]] = None
+    ) -> str:
         """Translate order by specification to KQL sort clause.
 
         Args:
             order_by_items: List of order by specifications, each with either:
                            - 'item' and 'direction' (explicit format)
                            - 'expression' and 'direction' (parser format)
+            columns: Column names of projected property expressions, which
+                replace those expressions in the sort keys
 
         Returns:
             KQL sort clause (e.g., "sort by n.age desc, m.name asc")
@@ -265,6 +510,9 @@ class ReturnClauseTranslator:
             else:
                 raise KeyError("Order by item requires either 'item' or 'expression' field")
 
+            if columns:
+                item_str = columns.get(item_str, item_str)
+
             direction = order_spec.get("direction", "asc").lower()
 
             # Validate direction
@@ -0,0 +1,88 @@
+"""
+Common subexpression sharing for generated KQL.
+
+Translations bind their source tables to ``let`` names: node tables read by
+edge joins and by make-graph, and per-variable tables of join pipelines. KQL
+inlines a ``let`` at every reference, so a node table joined into an edge
+table and then passed to make-graph is read and filtered twice. LetPlan
+collects these bindings, folds identical expressions into one name, and wraps
+expressions referenced more than once downstream in ``materialize()`` so the
+engine computes them once per query:
+
+    let Nodes_NetworkSession = materialize(NetworkSession
+    | where TimeGenerated between (ago(7d) .. now()));
+    let Edges_COMMUNICATES_WITH = Nodes_NetworkSession
+    | ...
+    | join kind=inner (Nodes_NetworkSession | ...) on JoinKey
+    ...
+    | make-graph SourceId --> TargetId with Nodes_NetworkSession on RemoteIp
+
+Example:
+    >>> lets = LetPlan()
+    >>> name = lets.bind("Nodes_IdentityInfo", ["IdentityInfo", "| where ..."])
+    >>> lines = lets.render([name, "| make-graph ..."])
+"""
+
+import re
+from dataclasses import dataclass, field
+
+
+@dataclass
+class LetPlan:
+    """Named subexpressions of a query, rendered as shared ``let`` statements.
+
+    Attributes:
+        materialize: Wrap expressions referenced more than once in materialize()
+        bindings: KQL lines of each bound expression, in binding order
+    """
+
+    materialize: bool = True
+    bindings: dict[str, list[str]] = field(default_factory=dict)
+
+    def bind(self, name: str, lines: list[str]) -> str:
+        """Bind an expression to a name, reusing an identical earlier binding.
+
+        Args:
+            name: Preferred ``let`` name; a numeric suffix is added if it is
+                already bound to a different expression
+            lines: KQL lines of the expression
+
+        Returns:
+            Name to reference the expression by
+        """
+        for existing, expression in self.bindings.items():
+            if expression == lines:
+                return existing
+
+        unique, suffix = name, 2
+        while unique in self.bindings:
+            unique, suffix = f"{name}_{suffix}", suffix + 1
+        self.bindings[unique] = list(lines)
+        return unique
+
+    def references(self, name: str, body: list[str]) -> int:
+        """Count references to a binding from later bindings and the body."""
+        names = list(self.bindings)
+        later = [line for other in names[names.index(name) + 1:] for line in self.bindings[other]]
+        pattern = re.compile(rf"\b{re.escape(name)}\b")
+        return sum(len(pattern.findall(line)) for line in later + body)
+
+    def render(self, body: list[str]) -> list[str]:
+        """Render the bindings as ``let`` statements followed by the body.
+
+        Args:
+            body: KQL lines of the tabular expression that uses the bindings
+
+        Returns:
+            KQL lines
+        """
+        lines: list[str] = []
+        for name, expression in self.bindings.items():
+            statement = list(expression)
+            if self.materialize and self.references(name, body) > 1:
+                statement[0] = f"materialize({statement[0]}"
+                statement[-1] += ")"
+            statement[0] = f"let {name} = {statement[0]}"
+            statement[-1] += ";"
+            lines.extend(statement)
+        return lines + list(body)
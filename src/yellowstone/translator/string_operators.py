@@ -0,0 +1,169 @@
+"""
+Term-index-aware string operator selection.
+
+Kusto indexes string columns by term: maximal runs of ASCII letters and digits,
+with terms of three or more characters kept in the index. ``has``-family
+operators look terms up in that index and skip extents that cannot match,
+while ``contains``, ``startswith`` and ``endswith`` scan every value, and the
+case-insensitive variants also fold case on every row.
+
+Cypher's CONTAINS, STARTS WITH and ENDS WITH are case-sensitive, so the case of
+the literal is always known and the ``_cs`` operators apply. Among the
+operators that answer a predicate exactly, ``select_string_operators`` picks
+the cheapest by ``STRING_OPERATOR_COSTS``, relative per-row costs:
+
+    ==             1   exact match on the term index
+    has_cs         1   whole-term lookup on the term index
+    hasprefix_cs   2   term-prefix lookup on the term index
+    has            2   case-insensitive whole-term lookup
+    hasprefix      3   case-insensitive term-prefix lookup
+    startswith_cs  5   anchored scan of each value
+    endswith_cs    5
+    startswith     6   anchored scan, folding case
+    endswith       6
+    contains_cs    8   substring scan of each value
+    contains      10   substring scan, folding case
+
+A value starting with a whole-term literal has a term starting with it, so
+``STARTS WITH 'svc'`` becomes ``hasprefix_cs 'svc' and startswith_cs 'svc'``:
+the term index skips extents without such a term, and the anchored scan keeps
+the exact result. A conjunction costs as much as its first operator, which
+decides which rows the others read.
+
+``has_cs`` only matches whole terms: ``CONTAINS 'admin'`` as ``has_cs 'admin'``
+matches 'corp\\admin' but not 'administrator'. It is used only when the caller
+passes ``approximate=True``; by default CONTAINS scans with ``contains_cs``.
+
+Example:
+    >>> conditions = parse_query(
+    ...     "MATCH (u:User) WHERE u.username STARTS WITH 'svc' RETURN u"
+    ... ).where_clause.conditions
+    >>> [c["operator"] for c in select_string_operators(conditions)["operands"]]
+    ['HASPREFIX_CS', 'STARTSWITH_CS']
+"""
+
+import re
+from typing import Any, Dict
+
+# Relative per-row cost of each KQL string operator
+STRING_OPERATOR_COSTS = {
+    "==": 1,
+    "has_cs": 1,
+    "hasprefix_cs": 2,
+    "has": 2,
+    "hasprefix": 3,
+    "startswith_cs": 5,
+    "endswith_cs": 5,
+    "startswith": 6,
+    "endswith": 6,
+    "contains_cs": 8,
+    "contains": 10,
+}
+
+# Shortest term Kusto keeps in its term index
+MIN_INDEXED_TERM_LENGTH = 3
+
+_TERM = re.compile(rf"^[A-Za-z0-9]{{{MIN_INDEXED_TERM_LENGTH},}}$")
+
+# Operators that can answer each Cypher string predicate, as
+# (operators combined with 'and', needs a whole-term literal, exact)
+_CANDIDATES = {
+    "CONTAINS": [(("has_cs",), True, False), (("contains_cs",), False, True)],
+    "STARTS_WITH": [
+        (("hasprefix_cs", "startswith_cs"), True, True),
+        (("startswith_cs",), False, True),
+    ],
+    "ENDS_WITH": [(("endswith_cs",), False, True)],
+}
+
+
+def string_operator(operator: str, value: str, approximate: bool = False) -> tuple[str, ...]:
+    """Choose the cheapest KQL operators for a Cypher string predicate.
+
+    Args:
+        operator: Cypher predicate ('CONTAINS', 'STARTS_WITH' or 'ENDS_WITH')
+        value: String literal the property is compared with
+        approximate: Also consider operators that only match whole terms
+
+    Returns:
+        KQL operator names to combine with 'and', e.g. ('contains_cs',)
+
+    Raises:
+        ValueError: If the operator is not a string predicate
+    """
+    if operator not in _CANDIDATES:
+        raise ValueError(f"Not a string predicate: {operator}")
+    is_term = bool(_TERM.match(value))
+    candidates = [
+        names
+        for names, needs_term, exact in _CANDIDATES[operator]
+        if (is_term or not needs_term) and (exact or approximate)
+    ]
+    return min(candidates, key=lambda names: STRING_OPERATOR_COSTS[names[0]])
+
+
+def select_string_operators(
+    conditions: Dict[str, Any], approximate: bool = False
+) -> Dict[str, Any]:
+    """Replace Cypher string predicates with the cheapest KQL operators.
+
+    Comparisons of a value with a string literal by CONTAINS, STARTS WITH or
+    ENDS WITH get the upper-cased KQL operators chosen by ``string_operator``
+    (e.g. 'CONTAINS_CS'), which the WHERE translator emits as is; several
+    operators become an AND of comparisons. Comparisons with a query parameter
+    get the scanning ``_cs`` operator. Other predicates keep their operator.
+
+    Args:
+        conditions: Condition tree from a WhereClause
+        approximate: Also use ``has_cs``, which only matches whole terms
+
+    Returns:
+        Rewritten copy of the condition tree
+    """
+    if not conditions or not isinstance(conditions, dict):
+        return conditions
+
+    root: list[Any] = [None]
+    stack: list[tuple[Any, Any, Any]] = [(conditions, root, 0)]
+
+    while stack:
+        source, parent, key = stack.pop()
+
+        if isinstance(source, dict):
+            copy = dict(source)
+            parent[key] = copy
+            right = source.get("right")
+            operator = str(source.get("operator", "")).upper()
+            if (
+                source.get("type") == "comparison"
+                and operator in _CANDIDATES
+                and isinstance(right, dict)
+            ):
+                if right.get("type") == "literal" and right.get("value_type") == "string":
+                    names = string_operator(operator, right["value"], approximate)
+                elif right.get("type") == "parameter":
+                    # The value is unknown, so only scans apply
+                    names = string_operator(operator, "")
+                else:
+                    continue
+                comparisons = [dict(copy, operator=name.upper()) for name in names]
+                if len(comparisons) > 1:
+                    parent[key] = {"type": "logical", "operator": "AND", "operands": comparisons}
+                else:
+                    parent[key] = comparisons[0]
+                continue
+            for child_key, value in source.items():
+                if isinstance(value, (dict, list)):
+                    stack.append((value, copy, child_key))
+
+        elif isinstance(source, list):
+            copy_list = list(source)
+            parent[key] = copy_list
+            for index, value in enumerate(source):
+                if isinstance(value, (dict, list)):
+                    stack.append((value, copy_list, index))
+
+        else:
+            parent[key] = source
+
+    return root[0]
@@ -0,0 +1,253 @@
+"""Tests for WHERE condition optimization passes."""
+
+from yellowstone.parser import parse_query
+from yellowstone.translator.condition_optimizer import (
+    collapse_equality_sets,
+    condition_properties,
+    condition_variables,
+    conjoin,
+    map_properties,
+    split_conjuncts,
+    type_literals,
+)
+
+
+def where(condition_text: str) -> dict:
+    """Parse a WHERE condition into its condition tree."""
+    return parse_query(f"MATCH (n) WHERE {condition_text} RETURN n").where_clause.conditions
+
+
+def values(condition: dict) -> list:
+    """Return the literal values of an IN comparison."""
+    return [item["value"] for item in condition["right"]["items"]]
+
+
+class TestCollapseEqualitySets:
+    """Test suite for collapse_equality_sets."""
+
+    def test_collapses_same_property_disjunction(self):
+        """Test that equality disjunctions on one property become IN."""
+        result = collapse_equality_sets(where("n.a = 'x' OR n.a = 'y' OR n.a = 'z'"))
+
+        assert result["type"] == "comparison"
+        assert result["operator"] == "IN"
+        assert result["left"] == {"type": "property", "variable": "n", "property": "a"}
+        assert values(result) == ["x", "y", "z"]
+
+    def test_keeps_other_operands_in_place(self):
+        """Test that unrelated operands keep their position."""
+        result = collapse_equality_sets(
+            where("n.b > 1 OR n.a = 1 OR n.c = 'q' OR n.a = 2 OR n.a = 3")
+        )
+
+        assert result["operator"] == "OR"
+        operands = result["operands"]
+        assert len(operands) == 3
+        assert operands[0]["operator"] == ">"
+        assert operands[1]["operator"] == "IN"
+        assert values(operands[1]) == [1, 2, 3]
+        assert operands[2]["left"]["property"] == "c"
+
+    def test_merges_existing_in_lists(self):
+        """Test that IN lists and equalities on the same property merge."""
+        result = collapse_equality_sets(where("n.a IN ['x', 'y'] OR n.a = 'z'"))
+
+        assert result["operator"] == "IN"
+        assert values(result) == ["x", "y", "z"]
+
+    def test_literal_on_left_side(self):
+        """Test that reversed equalities are recognized."""
+        result = collapse_equality_sets(where("'x' = n.a OR 'y' = n.a OR n.a = 'z'"))
+
+        assert values(result) == ["x", "y", "z"]
+
+    def test_below_min_size_is_unchanged(self):
+        """Test that small sets are left alone."""
+        conditions = where("n.a = 'x' OR n.a = 'y'")
+
+        assert collapse_equality_sets(conditions) is conditions
+
+    def test_does_not_mix_value_types_or_properties(self):
+        """Test that groups are keyed by property and literal type."""
+        result = collapse_equality_sets(
+            where("n.a = 1 OR n.a = 'x' OR n.b = 2 OR m.a = 3"), min_size=2
+        )
+
+        assert result is not None
+        assert all(operand["operator"] == "=" for operand in result["operands"])
+
+    def test_only_disjunctions_are_collapsed(self):
+        """Test that conjunctions of equalities are not rewritten."""
+        conditions = where("n.a = 1 AND n.a = 2 AND n.a = 3")
+
+        assert collapse_equality_sets(conditions) is conditions
+
+    def test_nested_disjunction_inside_and(self):
+        """Test that OR groups below other operators are collapsed."""
+        result = collapse_equality_sets(where("n.b = 1 AND (n.a = 1 OR n.a = 2 OR n.a = 3)"))
+
+        assert result["operator"] == "AND"
+        assert result["operands"][1]["operator"] == "IN"
+
+    def test_input_is_not_modified(self):
+        """Test that the pass returns a new tree."""
+        conditions = where("n.b = 1 AND (n.a = 1 OR n.a = 2 OR n.a = 3)")
+
+        collapse_equality_sets(conditions)
+
+        assert conditions["operands"][1]["operator"] == "OR"
+
+    def test_collapses_column_references(self):
+        """Test that equalities on table columns collapse like properties."""
+        column = {"type": "identifier", "name": "AccountName"}
+        conditions = {
+            "type": "logical",
+            "operator": "OR",
+            "operands": [
+                {
+                    "type": "comparison",
+                    "operator": "=",
+                    "left": column,
+                    "right": {"type": "literal", "value": value, "value_type": "string"},
+                }
+                for value in ("a", "b", "c")
+            ],
+        }
+
+        result = collapse_equality_sets(conditions)
+
+        assert result["left"] == column
+        assert values(result) == ["a", "b", "c"]
+
+    def test_large_disjunction(self):
+        """Test that very large disjunctions collapse without recursion."""
+        terms = " OR ".join(f"n.sha = 'h{i}'" for i in range(20000))
+
+        result = collapse_equality_sets(where(terms))
+
+        assert len(result["right"]["items"]) == 20000
+
+
+class TestPushdownHelpers:
+    """Test suite for the predicate pushdown helpers."""
+
+    def test_split_and_conjoin(self):
+        """Test splitting top-level conjuncts and joining them back."""
+        conditions = where("n.a = 1 AND (n.b = 2 OR m.c = 3) AND m.d = 4")
+
+        conjuncts = split_conjuncts(conditions)
+
+        assert len(conjuncts) == 3
+        assert conjoin(conjuncts) == conditions
+        assert conjoin(conjuncts[:1]) is conjuncts[0]
+        assert conjoin([]) is None
+        assert split_conjuncts(None) == []
+
+    def test_split_non_conjunction(self):
+        """Test that a non-AND root is a single conjunct."""
+        conditions = where("n.a = 1 OR n.b = 2")
+
+        assert split_conjuncts(conditions) == [conditions]
+
+    def test_condition_variables(self):
+        """Test collecting the variables referenced by a condition."""
+        assert condition_variables(where("n.a = 1 OR (m.b = 2 AND NOT n.c = 3)")) == {"n", "m"}
+        assert condition_variables(where("n.a = 1")) == {"n"}
+
+    def test_condition_properties(self):
+        """Test collecting property references, with whole-variable references as None."""
+        conditions = where("n.a = 1 OR (m.b = n.c AND NOT x = 3)")
+
+        assert condition_properties(conditions) == {("n", "a"), ("m", "b"), ("n", "c"), ("x", None)}
+
+    def test_map_properties_to_columns(self):
+        """Test rewriting property accesses into column references."""
+        conditions = where("n.name = 'x' OR n.age > 3")
+        columns = {("n", "name"): "AccountName", ("n", "age"): "Age"}
+
+        mapped = map_properties(conditions, lambda var, prop: columns.get((var, prop)))
+
+        assert mapped["operands"][0]["left"] == {"type": "identifier", "name": "AccountName"}
+        assert mapped["operands"][1]["left"] == {"type": "identifier", "name": "Age"}
+        assert conditions["operands"][0]["left"]["type"] == "property"
+
+    def test_map_properties_fails_on_unknown_property(self):
+        """Test that an unresolvable property prevents mapping."""
+        conditions = where("n.name = 'x' AND n.unknown = 1")
+
+        def resolve(variable, prop):
+            return "Col" if prop == "name" else None
+
+        assert map_properties(conditions, resolve) is None
+
+
+class TestTypeLiterals:
+    """Test suite for typing literals by their column's schema type."""
+
+    TYPES = {
+        "when": "datetime", "port": "int", "ratio": "float", "ok": "bool",
+        "name": "string", "tags": "array",
+    }
+
+    def typed(self, condition_text: str) -> dict:
+        """Type a WHERE condition against the test schema types."""
+        return type_literals(where(condition_text), lambda var, prop: self.TYPES.get(prop))
+
+    def test_datetime_column(self):
+        """Test that ISO date strings compared with datetime columns become datetimes."""
+        for value in ("2024-01-01", "2024-01-01T08:30:00Z", "2024-01-01 08:30:00.123+02:00"):
+            typed = self.typed(f"n.when > '{value}'")
+            assert typed["right"] == {"type": "literal", "value": value, "value_type": "datetime"}
+
+    def test_numeric_and_bool_columns(self):
+        """Test typing string literals for int, float and bool columns."""
+        assert self.typed("n.port = '443'")["right"]["value_type"] == "int"
+        assert self.typed("n.ratio >= '0.5'")["right"]["value_type"] == "real"
+        assert self.typed("n.ok = 'True'")["right"] == {
+            "type": "literal", "value": True, "value_type": "boolean"
+        }
+
+    def test_number_compared_with_string_column(self):
+        """Test that numbers compared with string columns are quoted."""
+        assert self.typed("n.name = 42")["right"] == {
+            "type": "literal", "value": "42", "value_type": "string"
+        }
+
+    def test_unparseable_values_unchanged(self):
+        """Test that values that are not of the column's type are left alone."""
+        for condition in (
+            "n.when > 'yesterday'", "n.when > '2024-01-01); drop'", "n.port = '44x'",
+            "n.ok = 'yes'", "n.other = '1'",
+        ):
+            assert self.typed(condition) == where(condition)
+
+    def test_value_first_comparisons_swapped(self):
+        """Test that the property is moved to the left with the operator flipped."""
+        typed = self.typed("'2024-01-01' < n.when")
+
+        assert typed["operator"] == ">"
+        assert typed["left"] == {"type": "property", "variable": "n", "property": "when"}
+        assert typed["right"]["value_type"] == "datetime"
+        assert self.typed("5 <= n.port")["operator"] == ">="
+        assert self.typed("$since < n.when")["left"]["property"] == "when"
+
+    def test_in_lists_and_arrays(self):
+        """Test typing IN list items and marking array comparisons dynamic."""
+        typed = self.typed("n.port IN ['80', '443']")
+        assert [item["value_type"] for item in typed["right"]["items"]] == ["int", "int"]
+
+        tags = {"type": "property", "variable": "n", "property": "tags"}
+        items = [{"type": "literal", "value": "a", "value_type": "string"}]
+        condition = {"type": "comparison", "operator": "=", "left": tags,
+                     "right": {"type": "list", "items": items}}
+        typed = type_literals(condition, lambda var, prop: self.TYPES.get(prop))
+        assert typed["right"]["dynamic"] is True
+
+    def test_nested_conditions_are_copied(self):
+        """Test that nested comparisons are typed without changing the input."""
+        conditions = where("n.name = 'x' AND NOT n.port = '22'")
+
+        typed = type_literals(conditions, lambda var, prop: self.TYPES.get(prop))
+
+        assert typed["operands"][1]["operands"][0]["right"]["value_type"] == "int"
+        assert conditions["operands"][1]["operands"][0]["right"]["value_type"] == "string"
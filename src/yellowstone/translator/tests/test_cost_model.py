@@ -0,0 +1,309 @@
+"""Tests for query cost estimation."""
+
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from yellowstone.models import TranslationContext
+from yellowstone.parser import parse_query
+from yellowstone.schema.schema_mapper import SchemaMapper
+from yellowstone.translator.cost_model import (
+    DEFAULT_ROW_COUNT,
+    CostCoefficients,
+    CostEstimate,
+    CostEstimator,
+)
+
+
+@pytest.fixture(scope="module")
+def estimator() -> CostEstimator:
+    """Create an estimator over the default schema and statistics."""
+    return CostEstimator(SchemaMapper())
+
+
+def estimate(estimator: CostEstimator, query: str, **context) -> CostEstimate:
+    """Estimate a query, optionally with time-window context settings."""
+    ctx = TranslationContext(user_id="u", tenant_id="t", permissions=[], **context)
+    return estimator.estimate(parse_query(query), ctx)
+
+
+class TestScannedRows:
+    """Test suite for source table sizing."""
+
+    def test_table_without_window_scans_all_rows(self, estimator):
+        """Test that entity tables without a default lookback are read in full."""
+        assert estimate(estimator, "MATCH (u:User) RETURN u").scanned_rows == 50_000
+
+    def test_event_table_unbounded_by_default(self, estimator):
+        """Test that event tables are read over their full retention by default."""
+        result = estimate(estimator, "MATCH (e:SecurityEvent) RETURN e")
+        assert result.scanned_rows == 90 * 10_000_000
+
+    def test_default_lookback_bounds_scan(self, tmp_path):
+        """Test that a schema default lookback sizes event tables."""
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(
+            "version: '1.0'\n"
+            "description: test\n"
+            "nodes:\n"
+            "  Event: {sentinel_table: Events}\n"
+            "tables:\n"
+            "  Events:\n"
+            "    description: events\n"
+            "    retention_days: 30\n"
+            "    time_column: TimeGenerated\n"
+            "    default_lookback: 7d\n"
+        )
+        estimator = CostEstimator(SchemaMapper(schema_path=str(schema_file)))
+
+        result = estimate(estimator, "MATCH (e:Event) RETURN e")
+
+        assert result.scanned_rows == DEFAULT_ROW_COUNT * 7 // 30
+
+    def test_context_window_bounds_scan(self, estimator):
+        """Test that lookbacks and absolute ranges override the default."""
+        query = "MATCH (e:SecurityEvent) RETURN e"
+        assert estimate(estimator, query, lookback=timedelta(days=1)).scanned_rows == 10_000_000
+        ranged = estimate(
+            estimator, query, time_range=(datetime(2024, 1, 1), datetime(2024, 1, 3))
+        )
+        assert ranged.scanned_rows == 20_000_000
+
+    def test_each_table_scanned_once(self, estimator):
+        """Test that tables shared by several nodes are counted once."""
+        result = estimate(estimator, "MATCH (a:User)-[:KNOWS]->(b:User) RETURN a")
+        assert result.scanned_rows == 50_000
+
+    def test_table_without_statistics(self, tmp_path):
+        """Test the default row count for tables missing from the statistics."""
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(
+            "version: '1.0'\n"
+            "description: test\n"
+            "nodes:\n"
+            "  Event: {sentinel_table: Events}\n"
+            "tables:\n"
+            "  Events: {description: events, retention_days: 30}\n"
+        )
+        estimator = CostEstimator(SchemaMapper(schema_path=str(schema_file)))
+
+        assert estimate(estimator, "MATCH (e:Event) RETURN e").scanned_rows == DEFAULT_ROW_COUNT
+
+
+class TestSelectivity:
+    """Test suite for predicate selectivity."""
+
+    def test_equality_uses_distinct_counts(self, estimator):
+        """Test that an equality on a unique column matches about one row."""
+        result = estimate(estimator, "MATCH (u:User) WHERE u.username = 'a' RETURN u")
+        assert result.scanned_rows == 50_000
+        assert result.graph_rows == 1
+        assert result.matched_paths == 1
+
+    def test_property_map_filters_candidates(self, estimator):
+        """Test that inline property maps are treated as equalities."""
+        result = estimate(estimator, "MATCH (u:User {risk_level: 'High'}) RETURN u")
+        assert result.matched_paths == 50_000 // 4
+
+    def test_logical_combinations(self, estimator):
+        """Test AND, OR and NOT selectivity."""
+        base = "MATCH (u:User) WHERE {} RETURN u"
+        level = "u.risk_level = 'High'"
+        assert estimate(estimator, base.format(level)).graph_rows == 12_500
+        assert estimate(estimator, base.format(f"NOT {level}")).graph_rows == 37_500
+        assert estimate(
+            estimator, base.format(f"{level} OR u.risk_level = 'Low'")
+        ).graph_rows == 21_875
+        assert estimate(
+            estimator, base.format(f"{level} AND u.domain = 'corp'")
+        ).graph_rows == 625
+
+    def test_in_list_scales_with_values(self, estimator):
+        """Test that IN lists match one distinct value per item."""
+        result = estimate(
+            estimator, "MATCH (u:User) WHERE u.risk_level IN ['High', 'Low'] RETURN u"
+        )
+        assert result.graph_rows == 25_000
+
+    def test_deep_condition_does_not_recurse(self, estimator):
+        """Test that very deep condition trees are estimated iteratively."""
+        conditions = " OR ".join(f"u.username = 'user{i}'" for i in range(5000))
+        result = estimate(estimator, f"MATCH (u:User) WHERE {conditions} RETURN u")
+        assert 0 < result.graph_rows < 50_000
+
+
+class TestPatternShape:
+    """Test suite for hops, variable-length bounds and result shaping."""
+
+    def test_hops_multiply_by_degree(self, estimator):
+        """Test that each hop fans out by the relationship's average degree."""
+        one_hop = estimate(estimator, "MATCH (u:User)-[:LOGGED_IN]->(d:Device) RETURN u")
+        assert one_hop.matched_paths == 50_000 * 3
+
+    def test_chained_hops_stay_plausible(self, estimator):
+        """Test that chained hops fan out per distinct node, not per event row."""
+        one_hop = estimate(estimator, "MATCH (a:IP)-[:COMMUNICATES_WITH]->(b:IP) RETURN a")
+        two_hops = estimate(
+            estimator,
+            "MATCH (a:IP)-[:COMMUNICATES_WITH]->(b:IP)-[:COMMUNICATES_WITH]->(c:IP) RETURN a",
+        )
+        assert one_hop.execution_time_ms < two_hops.execution_time_ms < 86_400_000
+
+    def test_variable_length_bounds(self, estimator):
+        """Test that longer hop bounds cost more and unbounded paths cost most."""
+        costs = [
+            estimate(estimator, f"MATCH (a:IP)-[:COMMUNICATES_WITH{spec}]->(b:IP) RETURN a")
+            for spec in ("", "*1..2", "*1..4", "*")
+        ]
+        paths = [cost.matched_paths for cost in costs]
+        assert paths == sorted(paths)
+        assert len(set(paths)) == 4
+
+    def test_shortest_paths_bounded_by_pairs(self, estimator):
+        """Test that shortest paths are capped at one per endpoint pair."""
+        where = "WHERE a.ip_address = '10.0.0.1' AND b.ip_address = '10.0.0.9' RETURN b"
+        pattern = "(a:IP)-[:COMMUNICATES_WITH*1..6]->(b:IP)"
+
+        every = estimate(estimator, f"MATCH {pattern} {where}")
+        shortest = estimate(estimator, f"MATCH shortestPath({pattern}) {where}")
+
+        assert shortest.matched_paths < every.matched_paths
+
+    def test_disconnected_paths_multiply(self, estimator):
+        """Test that disconnected paths form a cartesian product."""
+        result = estimate(estimator, "MATCH (u:User), (d:Device) RETURN u, d")
+        assert result.matched_paths == 50_000 * 20_000
+
+    def test_shared_variables_join(self, estimator):
+        """Test that paths sharing a variable cost the same as one chained path."""
+        chained = estimate(
+            estimator,
+            "MATCH (u:User)-[:LOGGED_IN]->(d:Device)-[:CONNECTED_TO]->(ip:IP) RETURN u",
+        )
+        split = estimate(
+            estimator,
+            "MATCH (u:User)-[:LOGGED_IN]->(d:Device), (d)-[:CONNECTED_TO]->(ip:IP) RETURN u",
+        )
+        assert split.matched_paths == chained.matched_paths
+
+    def test_limit_and_distinct_bound_results(self, estimator):
+        """Test that LIMIT and DISTINCT reduce returned rows but not matches."""
+        limited = estimate(estimator, "MATCH (u:User) RETURN u LIMIT 10")
+        distinct = estimate(estimator, "MATCH (u:User) RETURN DISTINCT u.domain")
+        assert (limited.matched_paths, limited.result_rows) == (50_000, 10)
+        assert distinct.result_rows == 5_000
+
+    def test_aggregation_reduces_results(self, estimator):
+        """Test that aggregate-only returns produce a single row."""
+        ast = parse_query("MATCH (u:User) RETURN u")
+        ast = ast.model_copy(
+            update={
+                "return_clause": ast.return_clause.model_copy(
+                    update={"items": [{"type": "function", "name": "count", "arguments": []}]}
+                )
+            }
+        )
+
+        result = estimator.estimate(ast)
+
+        assert result.result_rows == 1
+        assert result.execution_time_ms > estimator.estimate(parse_query(
+            "MATCH (u:User) RETURN u"
+        )).execution_time_ms
+
+
+class TestGraphSnapshots:
+    """Test suite for queries served by persistent graph snapshots."""
+
+    def test_snapshot_skips_scan_and_build(self, tmp_path):
+        """Test that a covering snapshot charges only for matching."""
+        default = Path(SchemaMapper._get_default_schema_path())
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(
+            default.read_text()
+            + "graphs:\n"
+            "  NetworkGraph:\n"
+            "    labels: [IP]\n"
+            "    relationships: [COMMUNICATES_WITH]\n"
+            "    snapshots: {hourly: {max_age: 1h}}\n"
+        )
+        shutil.copy(SchemaMapper.get_statistics_path(str(default)), tmp_path / "schema.stats.yaml")
+        estimator = CostEstimator(SchemaMapper(schema_path=str(schema_file)))
+        query = "MATCH (a:IP)-[:COMMUNICATES_WITH]->(b:IP) RETURN a"
+
+        snapshot = estimate(estimator, query)
+        rebuilt = estimate(estimator, query, max_snapshot_staleness=None)
+
+        assert (snapshot.scanned_rows, snapshot.graph_rows) == (0, 0)
+        assert snapshot.matched_paths == rebuilt.matched_paths
+        assert snapshot.execution_time_ms < rebuilt.execution_time_ms
+
+
+class TestLatency:
+    """Test suite for latency estimates and budgets."""
+
+    def test_latency_from_coefficients(self):
+        """Test the latency formula against explicit coefficients."""
+        coefficients = CostCoefficients(
+            base_ms=10, scan_ms_per_row=0.001, build_ms_per_row=0.01, match_ms_per_path=0.1
+        )
+        estimator = CostEstimator(SchemaMapper(), coefficients)
+
+        result = estimator.estimate(parse_query("MATCH (u:User) RETURN u"))
+
+        assert result.execution_time_ms == int(10 + 50 + 500 + 5000)
+
+    def test_within_budget(self, estimator):
+        """Test admission checks against a context budget."""
+        cheap = estimate(estimator, "MATCH (u:User) WHERE u.username = 'a' RETURN u")
+        costly = estimate(estimator, "MATCH (a:IP)-[*]->(b:IP) RETURN a")
+
+        assert cheap.within_budget(60_000)
+        assert not costly.within_budget(60_000)
+
+
+class TestJoinEstimates:
+    """Test suite for join-pipeline cardinality and cost."""
+
+    def test_node_candidates(self, estimator):
+        """Test per-variable candidates after filters and time windows."""
+        ast = parse_query(
+            "MATCH (u:User)-[:LOGGED_IN]->(d:Device)-[:CONNECTED_TO]->(ip:IP) "
+            "WHERE u.risk_level = 'High' RETURN ip"
+        )
+
+        assert estimator.node_candidates(ast) == {
+            "u": 12_500, "d": 20_000, "ip": 600_000_000
+        }
+
+    def test_join_rows_uses_distinct_counts(self, estimator):
+        """Test the equi-join estimate against key column cardinality."""
+        rows = estimator.join_rows(
+            50_000, "IdentityInfo", "AccountName", 20_000, "DeviceInfo", "UserName"
+        )
+
+        assert rows == 50_000 * 20_000 / 50_000
+
+    def test_join_rows_caps_distinct_at_rows(self, estimator):
+        """Test that filtered inputs do not keep their table's full cardinality."""
+        rows = estimator.join_rows(
+            1, "IdentityInfo", "AccountName", 20_000, "DeviceInfo", "UserName"
+        )
+
+        assert rows == 20_000 / 15_000
+
+    def test_estimate_joins(self):
+        """Test join latency from overheads and per-row costs, without a graph."""
+        coefficients = CostCoefficients(
+            base_ms=10, scan_ms_per_row=0.001, join_ms_per_row=0.01, join_overhead_ms=100
+        )
+        estimator = CostEstimator(SchemaMapper(), coefficients)
+        ast = parse_query("MATCH (u:User)-[:LOGGED_IN]->(d:Device) RETURN u LIMIT 5")
+
+        result = estimator.estimate_joins(ast, [(1_000, 2_000, 3_000)])
+
+        assert result.scanned_rows == 70_000
+        assert result.graph_rows == 0
+        assert (result.matched_paths, result.result_rows) == (3_000, 5)
+        assert result.execution_time_ms == int(10 + 70 + 100 + 60)
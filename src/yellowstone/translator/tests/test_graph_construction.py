@@ -0,0 +1,145 @@
+"""Tests for multi-table graph construction planning."""
+
+import pytest
+from yellowstone.parser import parse_query
+from yellowstone.schema.schema_mapper import SchemaMapper
+from yellowstone.translator.graph_construction import (
+    EMPTY_EDGES,
+    EdgeSource,
+    parse_join_condition,
+    plan_edge_sources,
+    render_graph_construction,
+    table_pipeline,
+)
+
+NODE_TABLES = {
+    "IdentityInfo": "AccountObjectId",
+    "DeviceInfo": "DeviceId",
+    "NetworkSession": "RemoteIp",
+}
+
+
+@pytest.fixture(scope="module")
+def schema_mapper() -> SchemaMapper:
+    """Create a schema mapper over the default schema."""
+    return SchemaMapper()
+
+
+def match_clause(query: str):
+    """Parse a query and return its MATCH clause."""
+    return parse_query(query).match_clause
+
+
+class TestParseJoinCondition:
+    """Test suite for parse_join_condition."""
+
+    def test_keys_in_table_order(self):
+        """Test that keys are returned left table first."""
+        condition = "IdentityInfo.AccountName == DeviceInfo.UserName"
+        assert parse_join_condition(condition, "IdentityInfo", "DeviceInfo") == (
+            "AccountName",
+            "UserName",
+        )
+        assert parse_join_condition(condition, "DeviceInfo", "IdentityInfo") == (
+            "UserName",
+            "AccountName",
+        )
+
+    def test_self_join(self):
+        """Test that a same-table condition keeps its written order."""
+        condition = "NetworkSession.RemoteIp == NetworkSession.SourceIp"
+        assert parse_join_condition(condition, "NetworkSession", "NetworkSession") == (
+            "RemoteIp",
+            "SourceIp",
+        )
+
+    @pytest.mark.parametrize(
+        "condition",
+        [None, "", "A.x == C.y", "A.x == B.y and A.z == B.w", "A.x > B.y"],
+    )
+    def test_unsupported_conditions(self, condition):
+        """Test that other tables or compound conditions are rejected."""
+        assert parse_join_condition(condition, "A", "B") is None
+
+
+class TestPlanEdgeSources:
+    """Test suite for plan_edge_sources."""
+
+    def test_one_edge_per_relationship_type(self, schema_mapper):
+        """Test that repeated types share one edge source."""
+        clause = match_clause(
+            "MATCH (a:User)-[:LOGGED_IN]->(d:Device), (b:User)-[:LOGGED_IN]->(d) RETURN a"
+        )
+
+        assert plan_edge_sources(clause, schema_mapper, NODE_TABLES) == [
+            EdgeSource("LOGGED_IN", "IdentityInfo", "AccountName", "DeviceInfo", "UserName")
+        ]
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (u:User) RETURN u",
+            "MATCH (u:User)-[r]->(d:Device) RETURN u",
+            "MATCH (u:User)-[:UNKNOWN]->(d:Device) RETURN u",
+            "MATCH (u:User)-[:ACCESSED]->(f:File) RETURN u",
+            "MATCH (a)-[:ASSOCIATED_WITH]->(b) RETURN a",
+        ],
+    )
+    def test_unplannable_patterns(self, schema_mapper, query):
+        """Test that patterns without usable joins over known tables are not planned."""
+        assert plan_edge_sources(match_clause(query), schema_mapper, NODE_TABLES) is None
+
+
+class TestRendering:
+    """Test suite for preamble rendering."""
+
+    def test_table_pipeline(self):
+        """Test filters and projection order."""
+        assert table_pipeline("T", ["a > 1", "b < 2"], ["Id", "a"]) == [
+            "T",
+            "| where a > 1",
+            "| where b < 2",
+            "| project Id, a",
+        ]
+        assert table_pipeline("T") == ["T"]
+
+    def test_table_pipeline_sample(self):
+        """Test that sampling follows the filters and precedes the projection."""
+        assert table_pipeline("T", ["a > 1"], ["Id"], sample_rows=100) == [
+            "T",
+            "| where a > 1",
+            "| sample 100",
+            "| project Id",
+        ]
+
+    def test_only_referenced_tables_are_bound(self):
+        """Test that node tables come from the pattern, in order."""
+        edge = EdgeSource("LOGGED_IN", "IdentityInfo", "AccountName", "DeviceInfo", "UserName")
+        node_tables = {"IdentityInfo": "AccountObjectId", "DeviceInfo": "DeviceId"}
+
+        kql = render_graph_construction([edge], node_tables, {"DeviceInfo": ["x == 1"]})
+
+        assert kql.splitlines()[:3] == [
+            "let Nodes_IdentityInfo = materialize(IdentityInfo);",
+            "let Nodes_DeviceInfo = materialize(DeviceInfo",
+            "| where x == 1);",
+        ]
+        assert kql.endswith(
+            "Edges_LOGGED_IN\n| make-graph SourceId --> TargetId "
+            "with Nodes_IdentityInfo on AccountObjectId, Nodes_DeviceInfo on DeviceId"
+        )
+        assert "NetworkSession" not in kql
+
+    def test_nodes_only_graph(self):
+        """Test that a graph without edges still reads every node table."""
+        node_tables = {"IdentityInfo": "AccountObjectId", "DeviceInfo": "DeviceId"}
+
+        kql = render_graph_construction([], node_tables)
+
+        assert kql.splitlines() == [
+            "let Nodes_IdentityInfo = IdentityInfo;",
+            "let Nodes_DeviceInfo = DeviceInfo;",
+            EMPTY_EDGES,
+            "| make-graph SourceId --> TargetId "
+            "with Nodes_IdentityInfo on AccountObjectId, Nodes_DeviceInfo on DeviceId",
+        ]
@@ -4,7 +4,8 @@ import pytest
 from yellowstone.parser.ast_nodes import (
     MatchClause, PathExpression, NodePattern, RelationshipPattern, Identifier
 )
-from yellowstone.translator.graph_match import GraphMatchTranslator
+from yellowstone.parser import parse_query
+from yellowstone.translator.graph_match import GraphMatchTranslator, cycles_mode
 
 
 class TestGraphMatchTranslator:
@@ -81,7 +82,31 @@ class TestGraphMatchTranslator:
 
         result = self.translator.translate(match)
 
-        assert "-[r:KNOWS]->" in result
+        assert result == "graph-match (n)-[r]->(m) where r.EdgeType == 'KNOWS'"
+
+    def test_each_relationship_type_is_constrained(self):
+        """Test that hops of different types cannot match each other's edges."""
+        match_clause = parse_query(
+            "MATCH (u:User)-[:LOGGED_IN]->(d:Device), (u)-[:OWNS]->(o:Device) RETURN u"
+        ).match_clause
+
+        result = self.translator.translate(match_clause)
+
+        assert result == (
+            "graph-match (u:User)-[e1]->(d:Device), (u)-[e2]->(o:Device) "
+            "where e1.EdgeType == 'LOGGED_IN' and e2.EdgeType == 'OWNS'"
+        )
+
+    def test_generated_edge_names_avoid_pattern_variables(self):
+        """Test that generated edge variables skip names the pattern uses."""
+        match_clause = parse_query(
+            "MATCH (e1)-[:KNOWS]->(b)-[r:KNOWS*1..2]->(c) RETURN e1"
+        ).match_clause
+
+        assert self.translator.translate(match_clause) == (
+            "graph-match cycles=none (e1)-[e2]->(b)-[r*1..2]->(c) "
+            "where e2.EdgeType == 'KNOWS' and all(r, EdgeType == 'KNOWS')"
+        )
 
     def test_translate_relationship_incoming(self):
         """Test translation of incoming relationship."""
@@ -283,6 +308,27 @@ class TestGraphMatchTranslator:
 
         assert "-[r]->" in result
 
+    @pytest.mark.parametrize(
+        "length,expected",
+        [
+            ("1..3", "-[r*1..3]->"),
+            ("..5", "-[r*1..5]->"),
+            ("2", "-[r*2]->"),
+            ("*", "-[r*1..10]->"),
+            ("12..", "-[r*12]->"),
+        ],
+    )
+    def test_translate_variable_length_relationship(self, length, expected):
+        """Test that hop bounds are emitted as a graph-match range."""
+        node_n = NodePattern(variable=Identifier(name='n'))
+        node_m = NodePattern(variable=Identifier(name='m'))
+        rel = RelationshipPattern(variable=Identifier(name='r'), length=length)
+        match = MatchClause(paths=[PathExpression(nodes=[node_n, node_m], relationships=[rel])])
+
+        result = self.translator.translate(match)
+
+        assert expected in result
+
     def test_invalid_path_structure_raises(self):
         """Test that invalid path structure raises ValueError."""
         # Create path with mismatched nodes and relationships
@@ -297,3 +343,115 @@ class TestGraphMatchTranslator:
 
         with pytest.raises(ValueError):
             self.translator.translate(match)
+
+
+class TestShortestPaths:
+    """Test suite for graph-shortest-paths translation."""
+
+    def setup_method(self):
+        """Set up translator for each test."""
+        self.translator = GraphMatchTranslator()
+
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            (
+                "MATCH shortestPath((a:IP)-[:COMMUNICATES_WITH*..5]->(b:IP)) RETURN b",
+                "graph-shortest-paths (a:IP)-[e1*1..5]->(b:IP) "
+                "where all(e1, EdgeType == 'COMMUNICATES_WITH')",
+            ),
+            (
+                "MATCH p = shortestPath((a)-[*]-(b)) RETURN p",
+                "graph-shortest-paths (a)-[p*1..10]-(b)",
+            ),
+            (
+                "MATCH allShortestPaths((a)-[r:KNOWS]->(b)) RETURN a",
+                "graph-shortest-paths output=all (a)-[r*1]->(b) where all(r, EdgeType == 'KNOWS')",
+            ),
+            (
+                "MATCH p = shortestPath((u:User)-[:LOGGED_IN*]->(d:Device)) RETURN p",
+                "graph-shortest-paths (u:User)-[p*1..10]->(d:Device) "
+                "where all(p, EdgeType == 'LOGGED_IN')",
+            ),
+            (
+                "MATCH shortestPath((e1)-[:KNOWS*]->(b)) RETURN b",
+                "graph-shortest-paths (e1)-[e2*1..10]->(b) where all(e2, EdgeType == 'KNOWS')",
+            ),
+        ],
+    )
+    def test_shortest_path(self, query, expected):
+        """Test hop ranges, named paths, edge names and output=all."""
+        match_clause = parse_query(query).match_clause
+
+        assert self.translator.translate(match_clause) == expected
+
+    def test_edges_render_like_graph_match(self):
+        """Test that shortest paths and graph-match share one edge rendering."""
+        pattern = "(a:IP)-[:COMMUNICATES_WITH*1..3]->(b:IP)"
+        match = self.translator.translate(parse_query(f"MATCH {pattern} RETURN b").match_clause)
+        shortest = self.translator.translate(
+            parse_query(f"MATCH shortestPath({pattern}) RETURN b").match_clause
+        )
+
+        assert match.removeprefix("graph-match cycles=none ") == (
+            shortest.removeprefix("graph-shortest-paths ")
+        )
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH shortestPath((a)-[*]->(b)), (c) RETURN a",
+            "OPTIONAL MATCH shortestPath((a)-[*]->(b)) RETURN a",
+        ],
+    )
+    def test_shortest_path_must_stand_alone(self, query):
+        """Test that graph-shortest-paths cannot be combined or optional."""
+        with pytest.raises(ValueError, match="shortestPath"):
+            self.translator.translate(parse_query(query).match_clause)
+
+
+class TestPathCycles:
+    """Test suite for the graph-match cycles option."""
+
+    def setup_method(self):
+        """Set up translator for each test."""
+        self.translator = GraphMatchTranslator()
+
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            ("MATCH (a)-[:KNOWS]->(b) RETURN a", None),
+            ("MATCH (a)-[:KNOWS*1..3]->(b) RETURN a", "none"),
+            ("MATCH (a)-[:KNOWS*]->(b)-[:KNOWS]->(a) RETURN a", "unique_edges"),
+            ("MATCH (a)-[:KNOWS*1..3]->(b), (b)-[:OWNS]->(c) RETURN a", "unique_edges"),
+            ("MATCH (a)-[r:KNOWS*1..3]->(b), (c)-[r:KNOWS*1..3]->(d) RETURN a", "all"),
+        ],
+    )
+    def test_automatic_mode(self, query, expected):
+        """Test the mode chosen from variable-length and repeated variables."""
+        assert cycles_mode(parse_query(query).match_clause) == expected
+
+    def test_requested_mode_wins(self):
+        """Test that an explicit mode is used for any pattern."""
+        match_clause = parse_query("MATCH (a)-[:KNOWS]->(b) RETURN a").match_clause
+
+        assert cycles_mode(match_clause, "all") == "all"
+        with pytest.raises(ValueError, match="cycles"):
+            cycles_mode(match_clause, "some")
+
+    def test_translate_emits_mode(self):
+        """Test the option's position, including after the optional modifier."""
+        match_clause = parse_query("OPTIONAL MATCH (a)-[*1..2]->(b) RETURN a").match_clause
+
+        assert self.translator.translate(match_clause) == (
+            "graph-match(optional) cycles=none (a)-[*1..2]->(b)"
+        )
+        assert self.translator.translate(match_clause, "unique_edges").startswith(
+            "graph-match(optional) cycles=unique_edges "
+        )
+
+    def test_shortest_paths_have_no_mode(self):
+        """Test that graph-shortest-paths is emitted without a cycles option."""
+        match_clause = parse_query("MATCH shortestPath((a)-[*]->(b)) RETURN a").match_clause
+
+        assert "cycles" not in self.translator.translate(match_clause, "none")
@@ -0,0 +1,120 @@
+"""Tests for persistent graph snapshot selection."""
+
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from yellowstone.models import TranslationContext
+from yellowstone.parser import parse_query
+from yellowstone.schema.schema_mapper import SchemaMapper
+from yellowstone.translator.graph_snapshots import (
+    GraphSnapshotRef,
+    pattern_elements,
+    select_graph_snapshot,
+)
+
+GRAPHS = """
+graphs:
+  IdentityGraph:
+    labels: [User, Device]
+    relationships: [LOGGED_IN, OWNS]
+    snapshots:
+      hourly: {max_age: 1h}
+      daily: {max_age: 1d}
+  NetworkGraph:
+    labels: [IP]
+    relationships: [COMMUNICATES_WITH]
+    lookback: 1d
+    snapshots:
+      latest: {max_age: 15m}
+"""
+
+
+@pytest.fixture(scope="module")
+def schema_mapper(tmp_path_factory) -> SchemaMapper:
+    """Create a schema mapper over the default schema plus graph models."""
+    default = Path(SchemaMapper._get_default_schema_path())
+    directory = tmp_path_factory.mktemp("schema")
+    (directory / "schema.yaml").write_text(default.read_text() + GRAPHS)
+    shutil.copy(SchemaMapper.get_statistics_path(str(default)), directory / "schema.stats.yaml")
+    return SchemaMapper(schema_path=str(directory / "schema.yaml"))
+
+
+def select(schema_mapper, query: str, **context):
+    """Select a snapshot for a query under the given context settings."""
+    ctx = TranslationContext(user_id="u", tenant_id="t", permissions=[], **context)
+    return select_graph_snapshot(parse_query(query).match_clause, schema_mapper, ctx)
+
+
+class TestPatternElements:
+    """Test suite for label and relationship collection."""
+
+    def test_labels_through_variables(self):
+        """Test that labels given elsewhere in the MATCH cover bare variables."""
+        match_clause = parse_query(
+            "MATCH (u:User)-[:LOGGED_IN]->(d:Device), (u)-[:OWNS]->(d) RETURN u"
+        ).match_clause
+
+        assert pattern_elements(match_clause) == ({"User", "Device"}, {"LOGGED_IN", "OWNS"})
+
+    @pytest.mark.parametrize(
+        "query",
+        ["MATCH (u:User)-[:LOGGED_IN]->(d) RETURN u", "MATCH (u:User)-[]->(d:Device) RETURN u"],
+    )
+    def test_unconstrained_patterns(self, query):
+        """Test that unlabeled nodes and untyped relationships match anything."""
+        assert pattern_elements(parse_query(query).match_clause) is None
+
+
+class TestSelectGraphSnapshot:
+    """Test suite for snapshot selection."""
+
+    def test_freshest_covering_snapshot(self, schema_mapper):
+        """Test that the freshest snapshot of a covering model is chosen."""
+        result = select(schema_mapper, "MATCH (u:User)-[:LOGGED_IN]->(d:Device) RETURN u")
+
+        assert result == GraphSnapshotRef("IdentityGraph", "hourly", timedelta(hours=1))
+        assert result.render() == "graph('IdentityGraph', 'hourly')"
+
+    def test_staleness_threshold(self, schema_mapper):
+        """Test that snapshots older than the threshold are skipped."""
+        query = "MATCH (u:User)-[:OWNS]->(d:Device) RETURN u"
+
+        relaxed = select(schema_mapper, query, max_snapshot_staleness=timedelta(days=2))
+
+        assert relaxed.snapshot == "hourly"
+        assert select(schema_mapper, query, max_snapshot_staleness=timedelta(minutes=30)) is None
+        assert select(schema_mapper, query, max_snapshot_staleness=None) is None
+
+    def test_uncovered_patterns(self, schema_mapper):
+        """Test that labels or relationships outside every model need make-graph."""
+        assert select(schema_mapper, "MATCH (d:Device)-[:CONNECTED_TO]->(ip:IP) RETURN d") is None
+        assert select(schema_mapper, "MATCH (u:User)-[:ACCESSED]->(f:File) RETURN u") is None
+
+    def test_lookback_must_match(self, schema_mapper):
+        """Test that a snapshot serves only the window it holds."""
+        query = "MATCH (a:IP)-[:COMMUNICATES_WITH]->(b:IP) RETURN a"
+
+        assert select(schema_mapper, query) is None
+        assert select(schema_mapper, query, lookback=timedelta(days=1)).model == "NetworkGraph"
+        assert select(schema_mapper, query, lookback=timedelta(days=2)) is None
+
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            {"approximate": True, "sample_rows": 100},
+            {"time_range": (datetime(2024, 1, 1), datetime(2024, 1, 2))},
+        ],
+    )
+    def test_table_settings_rebuild(self, schema_mapper, settings):
+        """Test that sampling and absolute ranges keep make-graph."""
+        query = "MATCH (u:User)-[:LOGGED_IN]->(d:Device) RETURN u"
+
+        assert select(schema_mapper, query, **settings) is None
+
+    def test_schema_without_models(self):
+        """Test that schemas declaring no graph models never select one."""
+        match_clause = parse_query("MATCH (u:User) RETURN u").match_clause
+
+        assert select_graph_snapshot(match_clause, SchemaMapper()) is None
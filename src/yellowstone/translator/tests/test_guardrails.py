@@ -0,0 +1,277 @@
+"""Tests for query guardrails."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from yellowstone.models import TranslationContext
+from yellowstone.parser import parse_query
+from yellowstone.schema.schema_mapper import SchemaMapper
+from yellowstone.translator.cost_model import CostEstimator
+from yellowstone.translator.guardrails import (
+    GuardrailAction,
+    GuardrailEngine,
+    QueryBudget,
+)
+
+
+# Per-request latency limit roomy enough that only the rule under test fires
+ROOMY_MS = 10**30
+
+
+@pytest.fixture(scope="module")
+def estimator() -> CostEstimator:
+    """Create an estimator over the default schema and statistics."""
+    return CostEstimator(SchemaMapper())
+
+
+def evaluate(estimator: CostEstimator, query: str, budget: QueryBudget = None, **context):
+    """Evaluate a query against a budget for tenant 't'."""
+    engine = GuardrailEngine(estimator, tenant_budgets={"t": budget} if budget else None)
+    ctx = TranslationContext(user_id="u", tenant_id="t", permissions=[], **context)
+    return engine.evaluate(parse_query(query), ctx)
+
+
+def rules(decision) -> list[tuple[str, GuardrailAction]]:
+    """Return the (rule, action) pairs of a decision's violations."""
+    return [(violation.rule, violation.action) for violation in decision.violations]
+
+
+class TestPathLength:
+    """Test suite for variable-length path limits."""
+
+    def test_bounded_path_allowed(self, estimator):
+        """Test that hop ranges within the limit are left alone."""
+        decision = evaluate(
+            estimator,
+            "MATCH (a:IP)-[:COMMUNICATES_WITH*1..3]->(b:IP) RETURN a",
+            max_execution_time_ms=ROOMY_MS,
+        )
+
+        assert decision.action == GuardrailAction.ALLOW
+        assert decision.violations == []
+
+    @pytest.mark.parametrize(
+        "spec,rule,capped",
+        [
+            ("*", "unbounded_path", "1..10"),
+            ("*3..", "unbounded_path", "3..10"),
+            ("*2..40", "path_length", "2..10"),
+        ],
+    )
+    def test_long_paths_capped(self, estimator, spec, rule, capped):
+        """Test that unbounded and overlong ranges are clamped to max_path_hops."""
+        decision = evaluate(
+            estimator,
+            f"MATCH (a:IP)-[:COMMUNICATES_WITH{spec}]->(b:IP) RETURN a",
+            max_execution_time_ms=ROOMY_MS,
+        )
+
+        assert decision.action == GuardrailAction.CAP
+        assert rules(decision) == [(rule, GuardrailAction.CAP)]
+        assert decision.query.match_clause.paths[0].relationships[0].length == capped
+
+    def test_capping_lowers_estimate(self, estimator):
+        """Test that the decision's estimate reflects the capped query."""
+        unbounded = "MATCH (a:IP)-[:COMMUNICATES_WITH*]->(b:IP) RETURN a"
+        decision = evaluate(estimator, unbounded, QueryBudget(max_path_hops=2))
+
+        assert decision.estimate.matched_paths < estimator.estimate(
+            parse_query(unbounded)
+        ).matched_paths
+
+    def test_reject_action(self, estimator):
+        """Test budgets that reject unbounded paths instead of capping them."""
+        budget = QueryBudget(unbounded_path_action=GuardrailAction.REJECT)
+        decision = evaluate(estimator, "MATCH (a)-[*]->(b) RETURN a", budget)
+
+        assert not decision.allowed
+        assert rules(decision) == [("unbounded_path", GuardrailAction.REJECT)]
+
+    def test_minimum_beyond_limit_rejected(self, estimator):
+        """Test that ranges which cannot be capped are rejected."""
+        decision = evaluate(estimator, "MATCH (a)-[*20..]->(b) RETURN a")
+
+        assert decision.action == GuardrailAction.REJECT
+        assert decision.violations[0].details["limit"] == 10
+
+
+class TestCartesianProduct:
+    """Test suite for disconnected MATCH patterns."""
+
+    @pytest.mark.parametrize("suffix,rows", [("", 1000), (" LIMIT 5", 5)])
+    def test_capped_by_default(self, estimator, suffix, rows):
+        """Test that the default budget limits cartesian products to cap_rows."""
+        decision = evaluate(
+            estimator,
+            f"MATCH (u:User), (d:Device) RETURN u, d{suffix}",
+            max_execution_time_ms=ROOMY_MS,
+        )
+
+        assert decision.action == GuardrailAction.CAP
+        assert rules(decision) == [("cartesian_product", GuardrailAction.CAP)]
+        assert decision.violations[0].details == {"components": 2, "rows": rows}
+        assert decision.query.return_clause.limit == rows
+
+    def test_allow_action(self, estimator):
+        """Test budgets that leave cartesian products alone."""
+        budget = QueryBudget(cartesian_product_action=GuardrailAction.ALLOW)
+        decision = evaluate(
+            estimator,
+            "MATCH (u:User), (d:Device) RETURN u, d",
+            budget,
+            max_execution_time_ms=ROOMY_MS,
+        )
+
+        assert decision.violations == []
+        assert decision.query.return_clause.limit is None
+
+    def test_disconnected_paths_rejected(self, estimator):
+        """Test budgets that reject paths sharing no variable."""
+        budget = QueryBudget(cartesian_product_action=GuardrailAction.REJECT)
+        decision = evaluate(estimator, "MATCH (u:User), (d:Device) RETURN u, d", budget)
+
+        assert decision.action == GuardrailAction.REJECT
+        assert rules(decision) == [("cartesian_product", GuardrailAction.REJECT)]
+        assert decision.violations[0].details == {"components": 2}
+        assert "cartesian product" in decision.reason
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (u:User)-[:LOGGED_IN]->(d:Device), (d)-[:CONNECTED_TO]->(ip:IP) RETURN u",
+            "MATCH (u:User), (d:Device) WHERE u.username = d.name RETURN u, d",
+        ],
+    )
+    def test_connected_paths_allowed(self, estimator, query):
+        """Test that shared variables and WHERE joins connect paths."""
+        budget = QueryBudget(cartesian_product_action=GuardrailAction.REJECT)
+
+        assert evaluate(estimator, query, budget).allowed
+
+
+class TestResultRows:
+    """Test suite for result row caps."""
+
+    @pytest.mark.parametrize("suffix,limit", [("", 100), (" LIMIT 500", 100), (" LIMIT 5", 5)])
+    def test_limit_applied(self, estimator, suffix, limit):
+        """Test that missing or larger limits are lowered to max_result_rows."""
+        budget = QueryBudget(max_result_rows=100)
+        decision = evaluate(estimator, f"MATCH (u:User) RETURN u{suffix}", budget)
+
+        assert decision.query.return_clause.limit == limit
+        assert decision.estimate.result_rows == limit
+        assert decision.allowed
+
+
+class TestCostBudget:
+    """Test suite for estimated cost limits."""
+
+    QUERY = "MATCH (e:SecurityEvent) RETURN e"
+
+    def test_context_limit_capped_by_default(self, estimator):
+        """Test that the context's limit applies without a tenant budget."""
+        decision = evaluate(estimator, self.QUERY)
+
+        assert decision.action == GuardrailAction.CAP
+        assert rules(decision) == [("execution_time", GuardrailAction.CAP)]
+        assert decision.violations[0].details["limit"] == 60_000
+        assert decision.violations[0].details["rows"] == 1000
+        assert decision.query.return_clause.limit == 1000
+        assert decision.estimate.result_rows == 1000
+
+    def test_shortest_path_over_context_limit(self, estimator):
+        """Test that a costly shortest path is caught by the context's limit alone."""
+        decision = evaluate(
+            estimator, "MATCH p = shortestPath((u:User)-[:LOGGED_IN*]->(d:Device)) RETURN p"
+        )
+
+        assert ("execution_time", GuardrailAction.CAP) in rules(decision)
+        assert decision.query.return_clause.limit == 1000
+
+    def test_within_context_limit_allowed(self, estimator):
+        """Test that queries estimated within the context's limit are left alone."""
+        decision = evaluate(estimator, self.QUERY, max_execution_time_ms=ROOMY_MS)
+
+        assert decision.action == GuardrailAction.ALLOW
+
+    def test_over_budget_rejected(self, estimator):
+        """Test rejection with the estimate and limit in the details."""
+        budget = QueryBudget(over_budget_action=GuardrailAction.REJECT)
+        decision = evaluate(estimator, self.QUERY, budget)
+
+        assert rules(decision) == [("execution_time", GuardrailAction.REJECT)]
+        assert decision.violations[0].details["limit"] == 60_000
+        assert decision.violations[0].details["estimate"] > 60_000
+
+    @pytest.mark.parametrize("tenant_ms,context_ms", [(10_000_000, 1_000), (1_000, ROOMY_MS)])
+    def test_tighter_limit_applies(self, estimator, tenant_ms, context_ms):
+        """Test that the lower of the tenant and per-request limits applies."""
+        budget = QueryBudget(max_execution_time_ms=tenant_ms)
+        decision = evaluate(estimator, self.QUERY, budget, max_execution_time_ms=context_ms)
+
+        assert decision.violations[0].details["limit"] == 1_000
+
+    def test_scanned_rows_limit(self, estimator):
+        """Test the scanned-row budget."""
+        budget = QueryBudget(max_scanned_rows=1_000_000, over_budget_action=GuardrailAction.REJECT)
+        decision = evaluate(estimator, self.QUERY, budget, max_execution_time_ms=ROOMY_MS)
+
+        assert rules(decision) == [("scanned_rows", GuardrailAction.REJECT)]
+
+    def test_downgrade_narrows_lookback(self, estimator):
+        """Test that downgrades halve the requested lookback until the query fits."""
+        budget = QueryBudget(
+            max_execution_time_ms=60_000, over_budget_action=GuardrailAction.DOWNGRADE
+        )
+        decision = evaluate(estimator, self.QUERY, budget, lookback=timedelta(days=7))
+
+        assert decision.action == GuardrailAction.DOWNGRADE
+        assert decision.context.lookback == timedelta(hours=42)
+        assert decision.estimate.within_budget(60_000)
+        assert decision.violations[0].details["window"] == "42h"
+
+    def test_downgrade_keeps_range_end(self, estimator):
+        """Test that absolute ranges are narrowed toward their end."""
+        budget = QueryBudget(
+            max_execution_time_ms=60_000, over_budget_action=GuardrailAction.DOWNGRADE
+        )
+        end = datetime(2024, 1, 8)
+        decision = evaluate(
+            estimator, self.QUERY, budget, time_range=(datetime(2024, 1, 1), end)
+        )
+
+        assert decision.context.time_range == (end - timedelta(hours=42), end)
+
+    def test_downgrade_stops_at_min_lookback(self, estimator):
+        """Test that queries that cannot fit within min_lookback are rejected."""
+        budget = QueryBudget(
+            max_execution_time_ms=60_000,
+            over_budget_action=GuardrailAction.DOWNGRADE,
+            min_lookback=timedelta(days=3),
+        )
+        decision = evaluate(estimator, self.QUERY, budget)
+
+        assert decision.action == GuardrailAction.REJECT
+        assert decision.context.lookback is None
+
+    def test_untimed_tables_cannot_downgrade(self, estimator):
+        """Test that tables without a time column are rejected, not narrowed."""
+        budget = QueryBudget(max_scanned_rows=10, over_budget_action=GuardrailAction.DOWNGRADE)
+        decision = evaluate(estimator, "MATCH (u:User) RETURN u", budget)
+
+        assert decision.action == GuardrailAction.REJECT
+
+
+class TestTenantBudgets:
+    """Test suite for per-tenant budget selection."""
+
+    def test_budget_for_tenant(self, estimator):
+        """Test tenant budgets, the default budget and set_tenant_budget."""
+        strict = QueryBudget(max_path_hops=2)
+        engine = GuardrailEngine(estimator, tenant_budgets={"strict": strict})
+
+        assert engine.budget_for("strict") is strict
+        assert engine.budget_for("other") == QueryBudget()
+
+        engine.set_tenant_budget("other", strict)
+        assert engine.budget_for("other") is strict
@@ -0,0 +1,201 @@
+"""Tests for join-pipeline planning and rendering."""
+
+import pytest
+from yellowstone.models import TranslationContext
+from yellowstone.parser import parse_query
+from yellowstone.schema.schema_mapper import SchemaMapper
+from yellowstone.translator.cost_model import CostEstimator
+from yellowstone.translator.join_pipeline import (
+    JoinPlan,
+    JoinStep,
+    key_column,
+    match_table_name,
+    plan_join_pipeline,
+    render_join_pipeline,
+)
+
+
+@pytest.fixture(scope="module")
+def schema_mapper() -> SchemaMapper:
+    """Create a schema mapper over the default schema and statistics."""
+    return SchemaMapper()
+
+
+def plan(schema_mapper: SchemaMapper, query: str) -> JoinPlan:
+    """Plan a query over the default schema."""
+    context = TranslationContext(user_id="u", tenant_id="t", permissions=[])
+    return plan_join_pipeline(
+        parse_query(query), schema_mapper, CostEstimator(schema_mapper), context
+    )
+
+
+class TestPlanJoinPipeline:
+    """Test suite for join planning."""
+
+    def test_single_hop(self, schema_mapper):
+        """Test that a hop joins on the schema's join condition columns."""
+        result = plan(schema_mapper, "MATCH (u:User)-[:LOGGED_IN]->(d:Device) RETURN u")
+
+        assert result.tables == {"u": "IdentityInfo", "d": "DeviceInfo"}
+        assert result.keys == {"u": ["AccountName"], "d": ["UserName"]}
+        assert result.order == ["d", "u"]
+        assert (result.steps[0].left_column, result.steps[0].right_column) == (
+            "d_UserName", "u_AccountName"
+        )
+
+    def test_starts_from_smallest_variable(self, schema_mapper):
+        """Test that a selective filter moves its variable to the front."""
+        query = (
+            "MATCH (u:User)-[:LOGGED_IN]->(d:Device)-[:CONNECTED_TO]->(ip:IP) "
+            "WHERE u.username = 'alice' RETURN ip"
+        )
+
+        result = plan(schema_mapper, query)
+
+        assert result.order == ["u", "d", "ip"]
+        assert result.steps[0].left_rows == 1
+        assert [step.output_rows for step in result.steps] == sorted(
+            step.output_rows for step in result.steps
+        )
+
+    def test_greedy_order_prefers_smaller_join(self, schema_mapper):
+        """Test that the cheaper of two available hops is joined first."""
+        query = (
+            "MATCH (u:User)-[:LOGGED_IN]->(d:Device)-[:CONNECTED_TO]->(ip:IP) "
+            "WHERE d.device_name = 'host1' RETURN u, ip"
+        )
+
+        result = plan(schema_mapper, query)
+
+        assert result.order == ["d", "u", "ip"]
+
+    def test_incoming_relationship_is_oriented(self, schema_mapper):
+        """Test that right-to-left patterns join on the same columns."""
+        result = plan(schema_mapper, "MATCH (d:Device)<-[:LOGGED_IN]-(u:User) RETURN u")
+
+        assert result.keys == {"d": ["UserName"], "u": ["AccountName"]}
+
+    def test_anonymous_nodes_are_named(self, schema_mapper):
+        """Test that unnamed nodes get unique pipeline variables."""
+        result = plan(schema_mapper, "MATCH (node0:User)-[:LOGGED_IN]->(:Device) RETURN node0")
+
+        assert set(result.tables) == {"node0", "node1"}
+
+    def test_variables_shared_across_paths(self, schema_mapper):
+        """Test that comma-separated paths sharing a variable form one tree."""
+        result = plan(
+            schema_mapper,
+            "MATCH (u:User)-[:LOGGED_IN]->(d:Device), (d)-[:CONNECTED_TO]->(ip:IP) RETURN ip",
+        )
+
+        assert set(result.order) == {"u", "d", "ip"}
+        assert len(result.steps) == 2
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (u:User) RETURN u",
+            "MATCH (u:User)-[r]->(d:Device) RETURN u",
+            "MATCH (a:IP)-[:COMMUNICATES_WITH*1..3]->(b:IP) RETURN a",
+            "MATCH (a:IP)-[:COMMUNICATES_WITH]-(b:IP) RETURN a",
+            "MATCH (u:User)-[:LOGGED_IN]->(d) RETURN u",
+            "MATCH (u:User {username: 'a'})-[:LOGGED_IN]->(d:Device) RETURN u",
+            "MATCH (u:User)-[r:LOGGED_IN]->(d:Device) RETURN r",
+            "MATCH (d:Device)-[:LOGGED_IN]->(u:User) RETURN u",
+            "MATCH (u:User)-[:LOGGED_IN]->(d:Device), (a:User)-[:LOGGED_IN]->(b:Device) RETURN u",
+            "OPTIONAL MATCH (u:User)-[:LOGGED_IN]->(d:Device) RETURN u",
+            "MATCH shortestPath((u:User)-[:LOGGED_IN]->(d:Device)) RETURN u",
+        ],
+    )
+    def test_unsupported_patterns(self, schema_mapper, query):
+        """Test patterns left to make-graph."""
+        assert plan(schema_mapper, query) is None
+
+    def test_cycles_are_not_planned(self, schema_mapper):
+        """Test that a hop between already joined variables is rejected."""
+        query = (
+            "MATCH (u:User)-[:LOGGED_IN]->(d:Device), (u)-[:LOGGED_IN]->(d) RETURN u"
+        )
+
+        assert plan(schema_mapper, query) is None
+
+
+class TestRenderJoinPipeline:
+    """Test suite for join pipeline rendering."""
+
+    def test_render(self):
+        """Test source lets, packed rows and shuffle joins."""
+        join_plan = JoinPlan(
+            tables={"u": "IdentityInfo", "d": "DeviceInfo"},
+            keys={"u": ["AccountName"], "d": ["UserName"]},
+            start="u",
+            steps=[JoinStep("d", "u_AccountName", "d_UserName", 1, 20_000, 1)],
+        )
+
+        kql = render_join_pipeline(
+            join_plan,
+            {"u": ["AccountName == 'alice'"]},
+            {"IdentityInfo": ["AccountObjectId", "AccountName"]},
+        )
+
+        assert kql.split("\n") == [
+            "let Match_u = IdentityInfo",
+            "| where AccountName == 'alice'",
+            "| project AccountObjectId, AccountName",
+            "| project u = pack_all(), u_AccountName = AccountName;",
+            "let Match_d = DeviceInfo",
+            "| project d = pack_all(), d_UserName = UserName;",
+            "Match_u",
+            "| join kind=inner hint.strategy=shuffle (Match_d) "
+            "on $left.u_AccountName == $right.d_UserName",
+        ]
+
+    def test_identical_scans_are_shared(self):
+        """Test that variables reading a table the same way share one materialized scan."""
+        join_plan = JoinPlan(
+            tables={"d": "DeviceInfo", "u": "IdentityInfo", "v": "IdentityInfo"},
+            keys={"d": ["UserName"], "u": ["AccountName"], "v": ["AccountName"]},
+            start="d",
+            steps=[
+                JoinStep("u", "d_UserName", "u_AccountName", 1, 1, 1),
+                JoinStep("v", "d_UserName", "v_AccountName", 1, 1, 1),
+            ],
+        )
+
+        lines = render_join_pipeline(join_plan).split("\n")
+        unshared = render_join_pipeline(join_plan, materialize=False)
+
+        assert lines[2:7] == [
+            "let Scan_IdentityInfo = materialize(IdentityInfo);",
+            "let Match_u = Scan_IdentityInfo",
+            "| project u = pack_all(), u_AccountName = AccountName;",
+            "let Match_v = Scan_IdentityInfo",
+            "| project v = pack_all(), v_AccountName = AccountName;",
+        ]
+        assert "Scan_" not in unshared
+
+    def test_properties_copied_before_packing(self):
+        """Test that properties read after the joins are packed under their names."""
+        join_plan = JoinPlan(
+            tables={"u": "IdentityInfo", "d": "DeviceInfo"},
+            keys={"u": ["AccountName"], "d": ["UserName"]},
+            start="u",
+            steps=[JoinStep("d", "u_AccountName", "d_UserName", 1, 1, 1)],
+        )
+
+        lines = render_join_pipeline(
+            join_plan, variable_properties={"u": {"username": "AccountName"}}
+        ).split("\n")
+
+        assert lines[:3] == [
+            "let Match_u = IdentityInfo",
+            "| extend username = AccountName",
+            "| project u = pack_all(), u_AccountName = AccountName;",
+        ]
+        assert "extend" not in lines[3] + lines[4]
+
+    def test_names(self):
+        """Test the let and key column naming helpers."""
+        assert match_table_name("u") == "Match_u"
+        assert key_column("u", "AccountName") == "u_AccountName"
+        assert JoinPlan({}, {}, "a", []).join_sizes() == []
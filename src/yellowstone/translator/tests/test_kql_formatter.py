@@ -0,0 +1,75 @@
+"""Tests for canonical KQL formatting."""
+
+from yellowstone.translator.kql_formatter import format_kql, minify_kql
+
+QUERY = (
+    "let Nodes = materialize(IdentityInfo\n"
+    "|where  AccountName == 'alice'\n"
+    "| project AccountObjectId,AccountName );\n"
+    "\n"
+    "Nodes   \n"
+    "| make-graph SourceId --> TargetId with Nodes on AccountObjectId\n"
+    "| project   u.username , d.device_name"
+)
+
+
+class TestFormatKql:
+    """Test suite for the canonical layout."""
+
+    def test_normalizes_spacing(self):
+        """Test that whitespace is normalized but line breaks are kept."""
+        assert format_kql(QUERY) == (
+            "let Nodes = materialize(IdentityInfo\n"
+            "| where AccountName == 'alice'\n"
+            "| project AccountObjectId, AccountName);\n"
+            "Nodes\n"
+            "| make-graph SourceId --> TargetId with Nodes on AccountObjectId\n"
+            "| project u.username, d.device_name"
+        )
+
+    def test_brackets(self):
+        """Test that padding inside brackets is removed."""
+        assert format_kql("dynamic([ 'a' , 'b' ])") == "dynamic(['a', 'b'])"
+        assert format_kql("x in ( 1,2 )") == "x in (1, 2)"
+
+    def test_literals_preserved(self):
+        """Test that string literals are never changed."""
+        kql = "T\n| where Name == 'a  ,b' or Path == \"c:\\\\x  y\" or Note == 'it\\'s |x'"
+        assert format_kql(kql) == kql
+        assert minify_kql(kql) == (
+            "T|where Name == 'a  ,b' or Path == \"c:\\\\x  y\" or Note == 'it\\'s |x'"
+        )
+
+    def test_comments_dropped(self):
+        """Test that comments are removed, but not // inside literals."""
+        kql = "T // source\n// filter\n| where Url == 'http://host'"
+        assert format_kql(kql) == "T\n| where Url == 'http://host'"
+
+    def test_idempotent(self):
+        """Test that formatting formatted text does not change it."""
+        formatted = format_kql(QUERY)
+        assert format_kql(formatted) == formatted
+        assert format_kql("") == ""
+
+
+class TestMinifyKql:
+    """Test suite for the minified form."""
+
+    def test_single_line(self):
+        """Test that optional whitespace is removed."""
+        assert minify_kql(QUERY) == (
+            "let Nodes = materialize(IdentityInfo|where AccountName == 'alice'"
+            "|project AccountObjectId,AccountName);Nodes"
+            "|make-graph SourceId --> TargetId with Nodes on AccountObjectId"
+            "|project u.username,d.device_name"
+        )
+
+    def test_keeps_space_before_bracket(self):
+        """Test that spaces keeping keywords apart from brackets are kept."""
+        assert minify_kql("T\n| join kind=inner (U) on K") == "T|join kind=inner (U) on K"
+
+    def test_idempotent(self):
+        """Test that minifying minified text does not change it."""
+        minified = minify_kql(QUERY)
+        assert minify_kql(minified) == minified
+        assert minify_kql(format_kql(QUERY)) == minified
@@ -1,7 +1,13 @@
 """Tests for path translation."""
 
 import pytest
-from yellowstone.translator.paths import PathTranslator, PathLength
+from yellowstone.parser import parse_query
+from yellowstone.translator.paths import (
+    PathLength,
+    PathTranslator,
+    is_reachability_query,
+    referenced_variables,
+)
 
 
 class TestPathLength:
@@ -302,3 +308,46 @@ class TestPathTranslator:
         assert self.translator.relationship_direction_map['out'] == "->"
         assert self.translator.relationship_direction_map['in'] == "<-"
         assert self.translator.relationship_direction_map['both'] == "--"
+
+
+class TestReachability:
+    """Test suite for reachability query detection."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (a)-[*1..3]->(b) RETURN DISTINCT a, b",
+            "MATCH (a:IP)-[r:COMMUNICATES_WITH*]->(b:IP) WHERE a.ip = 'x' RETURN DISTINCT b.ip",
+            "MATCH (a)-[*..4]->(b) RETURN a, count(DISTINCT b) AS reached",
+            "MATCH (a)-[*..4]->(b) RETURN a, min(b.seen), collect(DISTINCT b.ip)",
+        ],
+    )
+    def test_reachability_queries(self, query):
+        """Test queries whose results ignore how many paths connect a pair."""
+        assert is_reachability_query(parse_query(query))
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (a)-[*1..3]->(b) RETURN a, b",
+            "MATCH (a)-[*1..3]->(b) RETURN DISTINCT count(*)",
+            "MATCH (a)-[r*1..3]->(b) RETURN DISTINCT r",
+            "MATCH p = (a)-[*1..3]->(b) RETURN DISTINCT p",
+            "MATCH (a)-[:KNOWS]->(b) RETURN DISTINCT b",
+            "MATCH (a)-[*]->(b)-[*]->(c) RETURN DISTINCT c",
+            "MATCH (a)-[*]->(b), (c) RETURN DISTINCT c",
+            "OPTIONAL MATCH (a)-[*]->(b) RETURN DISTINCT b",
+            "MATCH shortestPath((a)-[*]->(b)) RETURN DISTINCT b",
+        ],
+    )
+    def test_path_enumerating_queries(self, query):
+        """Test queries that count, return or need every path."""
+        assert not is_reachability_query(parse_query(query))
+
+    def test_referenced_variables(self):
+        """Test variables from WHERE, RETURN items and ORDER BY."""
+        query = parse_query(
+            "MATCH (a)-[r]->(b)-[:X]->(c) WHERE a.x = 1 RETURN count(b) AS n ORDER BY c.y"
+        )
+
+        assert referenced_variables(query) == {"a", "b", "c"}
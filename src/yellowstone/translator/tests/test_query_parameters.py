@@ -0,0 +1,107 @@
+"""Tests for query parameter declarations."""
+
+from datetime import datetime
+
+import pytest
+from yellowstone.parser import parse_query
+from yellowstone.translator.query_parameters import (
+    QueryParameter,
+    declare_parameters,
+    kql_parameter_name,
+    parameter_references,
+    render_declaration,
+    value_type,
+)
+
+SCHEMA_TYPES = {("User", "username"): "string", ("User", "age"): "int", ("Event", "at"): "datetime"}
+
+
+def declare(query: str, values=None) -> list[QueryParameter]:
+    """Declare the parameters of a query against the test schema types."""
+    return declare_parameters(
+        parse_query(query), values, lambda label, prop: SCHEMA_TYPES.get((label, prop))
+    )
+
+
+class TestParameterReferences:
+    """Test suite for finding parameter references."""
+
+    def test_references_in_reading_order(self):
+        """Test property map and WHERE references, with their compared property."""
+        ast = parse_query(
+            "MATCH (u:User {username: $name})-[:SEEN]->(e:Event) "
+            "WHERE $since < e.at AND u.age IN $ages RETURN u"
+        )
+
+        assert parameter_references(ast) == [
+            ("name", ("User", "username"), False),
+            ("since", ("Event", "at"), False),
+            ("ages", ("User", "age"), True),
+        ]
+
+    def test_unlabeled_references(self):
+        """Test that parameters without a labeled property have no target."""
+        ast = parse_query("MATCH (n) WHERE n.a = $a RETURN n")
+
+        assert parameter_references(ast) == [("a", None, False)]
+
+
+class TestDeclareParameters:
+    """Test suite for typing parameters."""
+
+    def test_schema_types(self):
+        """Test that parameters take the KQL type of their property."""
+        parameters = declare(
+            "MATCH (u:User)-[:SEEN]->(e:Event) WHERE u.age > $age AND e.at > $since "
+            "AND u.username IN $names RETURN u",
+            {"age": 30, "since": "2024-01-01", "names": ["a"]},
+        )
+
+        assert parameters == [
+            QueryParameter("age", "long"),
+            QueryParameter("since", "datetime"),
+            QueryParameter("names", "dynamic"),
+        ]
+
+    def test_value_types(self):
+        """Test typing parameters without a schema property from their values."""
+        assert value_type(True) == "bool"
+        assert value_type(3) == "long"
+        assert value_type(2.5) == "real"
+        assert value_type(datetime(2024, 1, 1)) == "datetime"
+        assert value_type(["a"]) == "dynamic"
+        assert declare("MATCH (n) WHERE n.a = $a RETURN n", {"a": "x"}) == [
+            QueryParameter("a", "string")
+        ]
+
+    def test_repeated_parameter_declared_once(self):
+        """Test that a parameter used twice is declared once."""
+        parameters = declare(
+            "MATCH (u:User) WHERE u.age > $n OR u.age < $n RETURN u", {"n": 30}
+        )
+
+        assert parameters == [QueryParameter("n", "long")]
+
+    def test_untyped_parameter(self):
+        """Test that a parameter with neither a property nor a typed value is rejected."""
+        with pytest.raises(ValueError, match=r"Cannot determine the type of parameter \$a"):
+            declare("MATCH (n) WHERE n.a = $a RETURN n", {"a": object()})
+
+    def test_missing_value(self):
+        """Test that every declared parameter needs a value."""
+        with pytest.raises(ValueError, match=r"No value supplied for parameter \$age, \$b"):
+            declare("MATCH (u:User) WHERE u.age > $age AND u.a = $b RETURN u", {"c": 1})
+
+    def test_render_declaration(self):
+        """Test the declare query_parameters statement."""
+        parameters = [QueryParameter("name", "string"), QueryParameter("since", "datetime")]
+
+        assert render_declaration(parameters) == (
+            "declare query_parameters(cypher_name:string, cypher_since:datetime);"
+        )
+        assert render_declaration([]) == ""
+
+    def test_kql_names_are_prefixed(self):
+        """Test that KQL names cannot collide with columns or keywords."""
+        assert kql_parameter_name("limit") == "cypher_limit"
+        assert QueryParameter("DeviceId", "string").kql_name == "cypher_DeviceId"
@@ -0,0 +1,162 @@
+"""Tests for literal-abstracted query templates."""
+
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+from yellowstone.parser import parse_query
+from yellowstone.parser.ast_nodes import Literal, Query, WhereClause
+from yellowstone.translator.query_template import (
+    QueryTemplate,
+    TemplateCache,
+    TemplateSlot,
+    UNTEMPLATABLE,
+    slot_placeholder,
+)
+
+
+class TestQueryTemplate:
+    """Test suite for QueryTemplate literal lifting."""
+
+    def test_lifts_where_literals_in_reading_order(self):
+        """Test that WHERE literals become numbered slots."""
+        template = QueryTemplate.from_query(
+            parse_query("MATCH (u:User) WHERE u.name = 'alice' AND u.age > 30 RETURN u")
+        )
+
+        assert template.slots == (
+            TemplateSlot(value="alice", value_type="string"),
+            TemplateSlot(value=30, value_type="number"),
+        )
+        conditions = template.skeleton.where_clause.conditions
+        assert conditions["operands"][0]["right"]["value"] == slot_placeholder(0)
+        assert conditions["operands"][1]["right"]["value"] == slot_placeholder(1)
+
+    def test_lifts_node_property_literals(self):
+        """Test that node property map literals become slots."""
+        template = QueryTemplate.from_query(
+            parse_query("MATCH (u:User {name: 'alice'}) RETURN u")
+        )
+
+        assert template.slots == (TemplateSlot(value="alice", value_type="string"),)
+        prop = template.skeleton.match_clause.paths[0].nodes[0].properties["name"]
+        assert prop == Literal(value=slot_placeholder(0), value_type="string")
+
+    def test_booleans_and_null_stay_in_skeleton(self):
+        """Test that boolean and null literals are not slotted."""
+        template = QueryTemplate.from_query(
+            parse_query("MATCH (u:User) WHERE u.active = true AND u.x <> null RETURN u")
+        )
+
+        assert template.slots == ()
+
+    def test_same_shape_shares_fingerprint(self):
+        """Test that queries differing only in literals share a fingerprint."""
+        first = QueryTemplate.from_query(
+            parse_query("MATCH (u:User) WHERE u.name = 'alice' RETURN u")
+        )
+        second = QueryTemplate.from_query(
+            parse_query("MATCH (u:User) WHERE u.name = 'bob' RETURN u")
+        )
+
+        assert first.fingerprint == second.fingerprint
+
+    def test_different_shape_differs(self):
+        """Test that structural and literal-type changes change the fingerprint."""
+        base = QueryTemplate.from_query(
+            parse_query("MATCH (u:User) WHERE u.name = 'alice' RETURN u")
+        )
+        other_property = QueryTemplate.from_query(
+            parse_query("MATCH (u:User) WHERE u.email = 'alice' RETURN u")
+        )
+        other_type = QueryTemplate.from_query(
+            parse_query("MATCH (u:User) WHERE u.name = 42 RETURN u")
+        )
+
+        assert base.fingerprint != other_property.fingerprint
+        assert base.fingerprint != other_type.fingerprint
+
+    def test_template_is_immutable(self):
+        """Test that templates cannot be changed once built."""
+        template = QueryTemplate.from_query(
+            parse_query("MATCH (u:User) WHERE u.name = 'alice' RETURN u")
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            template.slots = ()
+        with pytest.raises(TypeError):
+            template.slots[0] = TemplateSlot(value="bob", value_type="string")
+
+    def test_render_escapes_strings(self):
+        """Test that rendering escapes quotes in string slots."""
+        template = QueryTemplate.from_query(
+            parse_query("MATCH (u:User) WHERE u.name = 'alice' AND u.age > 3 RETURN u")
+        )
+        template = replace(
+            template,
+            slots=(TemplateSlot(value="o'brien", value_type="string"), *template.slots[1:]),
+        )
+
+        rendered = template.render(
+            f"where u.name == '{slot_placeholder(0)}' and u.age > {slot_placeholder(1)}"
+        )
+
+        assert rendered == "where u.name == 'o\\'brien' and u.age > 3"
+
+    def test_deep_condition_chain(self):
+        """Test that long condition chains are lifted without recursion."""
+        conditions = {"type": "literal", "value": "x0", "value_type": "string"}
+        for i in range(1, 5000):
+            conditions = {
+                "type": "logical",
+                "operator": "OR",
+                "left": conditions,
+                "right": {"type": "literal", "value": f"x{i}", "value_type": "string"},
+            }
+        base = parse_query("MATCH (n) RETURN n")
+        query = Query(
+            match_clause=base.match_clause,
+            where_clause=WhereClause(conditions=conditions),
+            return_clause=base.return_clause,
+        )
+
+        template = QueryTemplate.from_query(query)
+
+        assert len(template.slots) == 5000
+        assert template.slots[0].value == "x0"
+        assert template.slots[-1].value == "x4999"
+
+
+class TestTemplateCache:
+    """Test suite for TemplateCache."""
+
+    def test_hit_and_miss(self):
+        """Test basic cache accounting."""
+        cache = TemplateCache()
+        assert cache.get("abc") is None
+        cache.put("abc", "kql")
+        assert cache.get("abc") == "kql"
+
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+
+    def test_untemplatable_marker_is_a_hit(self):
+        """Test that the untemplatable marker is distinguishable from a miss."""
+        cache = TemplateCache()
+        cache.put("abc", UNTEMPLATABLE)
+        assert cache.get("abc") == UNTEMPLATABLE
+        assert cache.get("abc") is not None
+
+    def test_lru_eviction(self):
+        """Test that least recently used skeletons are evicted."""
+        cache = TemplateCache(max_size=1)
+        cache.put("a", "1")
+        cache.put("b", "2")
+
+        assert cache.get("a") is None
+        assert cache.stats().evictions == 1
+
+    def test_invalid_max_size(self):
+        """Test that a non-positive max_size is rejected."""
+        with pytest.raises(ValueError):
+            TemplateCache(max_size=-1)
@@ -0,0 +1,50 @@
+"""Tests for request property set statements."""
+
+from datetime import timedelta
+
+import pytest
+from yellowstone.models import TranslationContext
+from yellowstone.translator.request_properties import request_property_statements
+
+
+def make_context(**settings) -> TranslationContext:
+    """Create a context with the given request settings."""
+    return TranslationContext(user_id="u", tenant_id="t", permissions=[], **settings)
+
+
+class TestRequestPropertyStatements:
+    """Test suite for rendering request properties."""
+
+    def test_no_properties(self):
+        """Test that default contexts emit no statements."""
+        assert request_property_statements(make_context()) == []
+        assert request_property_statements(None) == []
+
+    def test_canonical_order(self):
+        """Test that statements are emitted in a fixed order and format."""
+        context = make_context(
+            take_max_records=500,
+            truncation_max_records=10_000,
+            results_cache_max_age=timedelta(minutes=5),
+        )
+
+        assert request_property_statements(context) == [
+            "set query_results_cache_max_age = time(5m);",
+            "set truncationmaxrecords = 10000;",
+            "set query_take_max_records = 500;",
+        ]
+
+    def test_no_truncation(self):
+        """Test the notruncation flag."""
+        context = make_context(no_truncation=True)
+
+        assert request_property_statements(context) == ["set notruncation;"]
+
+    def test_context_rejects_invalid_settings(self):
+        """Test validation of request settings."""
+        with pytest.raises(ValueError):
+            make_context(results_cache_max_age=timedelta(0))
+        with pytest.raises(ValueError):
+            make_context(take_max_records=0)
+        with pytest.raises(ValueError):
+            make_context(no_truncation=True, truncation_max_records=10)
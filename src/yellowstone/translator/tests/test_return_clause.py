@@ -1,7 +1,7 @@
 """Tests for RETURN clause translation."""
 
 import pytest
-from yellowstone.parser.ast_nodes import ReturnClause, Identifier, Property
+from yellowstone.parser.ast_nodes import AliasedExpression, Identifier, Property, ReturnClause
 from yellowstone.translator.return_clause import ReturnClauseTranslator
 
 
@@ -57,7 +57,7 @@ class TestReturnClauseTranslator:
 
         result = self.translator.translate(return_clause)
 
-        assert "distinct" in result
+        assert result == "summarize by n"
 
     def test_translate_limit(self):
         """Test translation with LIMIT clause."""
@@ -79,7 +79,10 @@ class TestReturnClauseTranslator:
 
         result = self.translator.translate(return_clause)
 
-        assert "offset 5" in result
+        assert result == (
+            "project n | serialize _row = row_number() | where _row > 5 | project-away _row"
+        )
+        assert "offset" not in result
 
     def test_translate_order_by_asc(self):
         """Test translation with ORDER BY ascending."""
@@ -187,7 +190,7 @@ class TestReturnClauseTranslator:
 
         result = self.translator.translate(return_clause)
 
-        assert "as total" in result
+        assert result == "summarize total = count()"
 
     def test_translate_literal_string(self):
         """Test translation of string literals."""
@@ -357,9 +360,11 @@ class TestReturnClauseTranslator:
 
     def test_translate_all_aggregation_functions(self):
         """Test translation of all supported aggregation functions."""
-        functions = ['COUNT', 'SUM', 'AVG', 'MIN', 'MAX']
+        functions = {
+            'COUNT': 'count()', 'SUM': 'sum(x)', 'AVG': 'avg(x)', 'MIN': 'min(x)', 'MAX': 'max(x)'
+        }
 
-        for func in functions:
+        for func, aggregate in functions.items():
             return_clause = ReturnClause(
                 items=[
                     {
@@ -370,7 +375,7 @@ class TestReturnClauseTranslator:
                 ]
             )
             result = self.translator.translate(return_clause)
-            assert 'project' in result
+            assert result == f"summarize {aggregate}"
 
     def test_limit_and_skip_together(self):
         """Test translation with both LIMIT and SKIP."""
@@ -382,8 +387,11 @@ class TestReturnClauseTranslator:
 
         result = self.translator.translate(return_clause)
 
-        assert "limit 10" in result
-        assert "offset 5" in result
+        # Only the rows up to SKIP + LIMIT are numbered
+        assert result == (
+            "project n | limit 15 | serialize _row = row_number() | where _row > 5"
+            " | project-away _row"
+        )
 
     def test_all_clauses_together(self):
         """Test translation with all optional clauses."""
@@ -399,7 +407,225 @@ class TestReturnClauseTranslator:
 
         result = self.translator.translate(return_clause)
 
-        assert "distinct" in result
-        assert "sort by" in result
-        assert "limit 20" in result
-        assert "offset 10" in result
+        assert result == (
+            "summarize by n, m | top 30 by n asc | serialize _row = row_number()"
+            " | where _row > 10 | project-away _row"
+        )
+
+
+class TestReturnStageRewrites:
+    """Test the operator shapes chosen for DISTINCT, ORDER BY, SKIP and LIMIT."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.translator = ReturnClauseTranslator()
+        self.order_by = [{'expression': 'n.age', 'direction': 'desc'}]
+
+    def test_order_by_with_limit_uses_top(self):
+        """Test that ORDER BY with LIMIT becomes top N instead of sort and limit."""
+        return_clause = ReturnClause(
+            items=[Identifier(name='n')], order_by=self.order_by, limit=10
+        )
+
+        result = self.translator.translate(return_clause)
+
+        assert result == "project n | top 10 by n.age desc"
+        assert "sort by" not in result
+
+    def test_order_by_without_limit_sorts(self):
+        """Test that ORDER BY alone keeps a full sort."""
+        return_clause = ReturnClause(items=[Identifier(name='n')], order_by=self.order_by)
+
+        assert self.translator.translate(return_clause) == "project n | sort by n.age desc"
+
+    def test_limit_without_order_by(self):
+        """Test that LIMIT alone stays a limit."""
+        return_clause = ReturnClause(items=[Identifier(name='n')], limit=10)
+
+        assert self.translator.translate(return_clause) == "project n | limit 10"
+
+    def test_skip_with_order_by_and_limit(self):
+        """Test that SKIP keeps SKIP + LIMIT top rows and drops the first ones."""
+        return_clause = ReturnClause(
+            items=[Identifier(name='n')], order_by=self.order_by, limit=10, skip=20
+        )
+
+        result = self.translator.translate(return_clause)
+
+        assert result == (
+            "project n | top 30 by n.age desc | serialize _row = row_number()"
+            " | where _row > 20 | project-away _row"
+        )
+
+    def test_skip_zero_is_ignored(self):
+        """Test that SKIP 0 adds no row numbering."""
+        return_clause = ReturnClause(items=[Identifier(name='n')], limit=5, skip=0)
+
+        assert self.translator.translate(return_clause) == "project n | limit 5"
+
+    def test_distinct_properties_use_summarize_by(self):
+        """Test that DISTINCT projections group by their items."""
+        return_clause = ReturnClause(
+            items=[
+                {'type': 'property', 'variable': 'n', 'property': 'role'},
+                {
+                    'type': 'alias',
+                    'expression': {'type': 'property', 'variable': 'n', 'property': 'dept'},
+                    'alias': 'department',
+                },
+            ],
+            distinct=True,
+            limit=5,
+        )
+
+        result = self.translator.translate(return_clause)
+
+        assert result == "summarize by n_role = n.role, department = n.dept | limit 5"
+
+    def test_distinct_with_order_by_sorts_by_alias(self):
+        """Test that DISTINCT with ORDER BY sorts by the grouped column's name."""
+        return_clause = ReturnClause(
+            items=[{'type': 'property', 'variable': 'u', 'property': 'username'}],
+            distinct=True,
+            order_by=[{'expression': 'u.username', 'direction': 'DESC'}],
+            limit=10,
+        )
+
+        result = self.translator.translate(return_clause)
+
+        assert result == "summarize by u_username = u.username | top 10 by u_username desc"
+
+    def test_projection_order_by_uses_column_name(self):
+        """Test that ORDER BY refers to a projected property by its column name."""
+        return_clause = ReturnClause(
+            items=[{'type': 'property', 'variable': 'u', 'property': 'username'}],
+            order_by=[{'expression': 'u.username', 'direction': 'ASC'}],
+        )
+
+        result = self.translator.translate(return_clause)
+
+        assert result == "project u.username | sort by u_username asc"
+
+    def test_distinct_with_aggregation_summarizes_once(self):
+        """Test that DISTINCT adds nothing to an aggregation, whose groups are distinct."""
+        return_clause = ReturnClause(
+            items=[{'type': 'function', 'name': 'count', 'arguments': ['n']}],
+            distinct=True,
+        )
+
+        assert self.translator.translate(return_clause) == "summarize count()"
+
+
+class TestAggregation:
+    """Test the summarize translation of aggregation functions."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.translator = ReturnClauseTranslator()
+
+    @staticmethod
+    def function(name, argument=None, distinct=False):
+        """Build a function return item over n.size, n, or no argument."""
+        arguments = {
+            None: [],
+            'n': [{'type': 'identifier', 'name': 'n'}],
+            'n.size': [{'type': 'property', 'variable': 'n', 'property': 'size'}],
+        }[argument]
+        return {'type': 'function', 'name': name, 'arguments': arguments, 'distinct': distinct}
+
+    @pytest.mark.parametrize(
+        "name,argument,distinct,expected",
+        [
+            ('count', None, False, 'count()'),
+            ('count', 'n', False, 'count()'),
+            ('count', 'n.size', False, 'countif(isnotnull(n.size))'),
+            ('count', 'n.size', True, 'count_distinct(n.size)'),
+            ('sum', 'n.size', False, 'sum(n.size)'),
+            ('collect', 'n.size', False, 'make_list(n.size)'),
+            ('collect', 'n.size', True, 'make_set(n.size)'),
+        ],
+    )
+    def test_aggregate_functions(self, name, argument, distinct, expected):
+        """Test the KQL aggregate chosen for each Cypher aggregate."""
+        return_clause = ReturnClause(items=[self.function(name, argument, distinct)])
+
+        assert self.translator.translate(return_clause) == f"summarize {expected}"
+
+    def test_group_keys_and_aliases(self):
+        """Test that non-aggregate items become by keys, with aliases as assignments."""
+        return_clause = ReturnClause(
+            items=[
+                Property(variable=Identifier(name='n'), property_name=Identifier(name='role')),
+                AliasedExpression(
+                    expression=self.function('count'), alias=Identifier(name='total')
+                ),
+                self.function('collect', 'n.size'),
+            ],
+            order_by=[{'expression': 'total', 'direction': 'DESC'}],
+            limit=3,
+        )
+
+        result = self.translator.translate(return_clause)
+
+        assert result == (
+            "summarize total = count(), make_list(n.size) by n_role = n.role | top 3 by total desc"
+        )
+
+    @pytest.mark.parametrize(
+        "accuracy,expected", [(None, "dcount(n.size)"), (3, "dcount(n.size, 3)")]
+    )
+    def test_approximate_distinct_count(self, accuracy, expected):
+        """Test that approximate mode counts distinct values with dcount."""
+        return_clause = ReturnClause(items=[self.function('count', 'n.size', distinct=True)])
+
+        result = self.translator.translate(
+            return_clause, approximate=True, dcount_accuracy=accuracy
+        )
+
+        assert result == f"summarize {expected}"
+        assert self.translator.approximations(return_clause, approximate=True) == ["dcount"]
+        assert self.translator.approximations(return_clause) == []
+
+    @pytest.mark.parametrize("name", ['percentileCont', 'percentileDisc'])
+    def test_percentiles(self, name):
+        """Test that percentiles become percentile() on KQL's 0-100 scale."""
+        function = self.function(name, 'n.size')
+        function['arguments'].append({'type': 'literal', 'value': 0.95, 'value_type': 'number'})
+        return_clause = ReturnClause(items=[function])
+
+        assert self.translator.translate(return_clause) == "summarize percentile(n.size, 95)"
+        assert self.translator.approximations(return_clause) == ["percentile"]
+
+    @pytest.mark.parametrize(
+        "name,accuracy,error",
+        [("dcount", None, 0.008), ("dcount", 0, 0.016), ("dcount", 4, 0.002),
+         ("percentile", None, 0.01)],
+    )
+    def test_approximation_error(self, name, accuracy, error):
+        """Test the relative error reported for each estimating aggregate."""
+        assert self.translator.approximation_error(name, accuracy) == error
+
+    @pytest.mark.parametrize("percentile", [[], [{'type': 'literal', 'value': 1.5}]])
+    def test_invalid_percentile_rejected(self, percentile):
+        """Test that percentiles outside 0-1, or missing, are rejected."""
+        function = self.function('percentileCont', 'n.size')
+        function['arguments'].extend(percentile)
+
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            self.translator.translate(ReturnClause(items=[function]))
+
+    def test_distinct_sum_rejected(self):
+        """Test that DISTINCT is refused where KQL has no distinct aggregate."""
+        return_clause = ReturnClause(items=[self.function('sum', 'n.size', distinct=True)])
+
+        with pytest.raises(ValueError, match="DISTINCT"):
+            self.translator.translate(return_clause)
+
+    def test_has_aggregation(self):
+        """Test aggregate detection through aliases."""
+        aliased = AliasedExpression(
+            expression=self.function('max', 'n'), alias=Identifier(name='m')
+        )
+
+        assert self.translator.has_aggregation(ReturnClause(items=[aliased]))
+        assert not self.translator.has_aggregation(ReturnClause(items=[Identifier(name='n')]))
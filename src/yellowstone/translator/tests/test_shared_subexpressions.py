@@ -0,0 +1,52 @@
+"""Tests for shared let bindings."""
+
+from yellowstone.translator.shared_subexpressions import LetPlan
+
+
+class TestLetPlan:
+    """Test suite for binding, sharing and materializing subexpressions."""
+
+    def test_repeated_references_are_materialized(self):
+        """Test that bindings used more than once downstream are materialized."""
+        lets = LetPlan()
+        nodes = lets.bind("Nodes_T", ["T", "| where x == 1"])
+        edges = lets.bind("Edges_R", [nodes, f"| join ({nodes}) on Id"])
+
+        assert lets.render([edges]) == [
+            "let Nodes_T = materialize(T",
+            "| where x == 1);",
+            "let Edges_R = Nodes_T",
+            "| join (Nodes_T) on Id;",
+            "Edges_R",
+        ]
+
+    def test_single_reference_is_inlined(self):
+        """Test that bindings used once stay plain lets."""
+        lets = LetPlan()
+        name = lets.bind("Nodes_T", ["T"])
+
+        assert lets.render([name, "| take 1"]) == ["let Nodes_T = T;", "Nodes_T", "| take 1"]
+
+    def test_references_match_whole_names(self):
+        """Test that a name inside a longer identifier is not a reference."""
+        lets = LetPlan()
+        lets.bind("Nodes_T", ["T"])
+
+        assert lets.references("Nodes_T", ["Nodes_TT", "Nodes_T_2", "Nodes_T"]) == 1
+
+    def test_identical_expressions_share_a_name(self):
+        """Test that equal expressions bind once and clashing names get suffixes."""
+        lets = LetPlan()
+
+        first = lets.bind("Scan_T", ["T", "| where x == 1"])
+        again = lets.bind("Scan_Other", ["T", "| where x == 1"])
+        other = lets.bind("Scan_T", ["T", "| where x == 2"])
+
+        assert (first, again, other) == ("Scan_T", "Scan_T", "Scan_T_2")
+
+    def test_materialize_disabled(self):
+        """Test that sharing can be rendered without materialize()."""
+        lets = LetPlan(materialize=False)
+        name = lets.bind("Nodes_T", ["T"])
+
+        assert lets.render([name, name]) == ["let Nodes_T = T;", "Nodes_T", "Nodes_T"]
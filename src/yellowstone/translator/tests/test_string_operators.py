@@ -0,0 +1,89 @@
+"""Tests for term-index-aware string operator selection."""
+
+import pytest
+from yellowstone.parser import parse_query
+from yellowstone.translator.string_operators import (
+    STRING_OPERATOR_COSTS,
+    select_string_operators,
+    string_operator,
+)
+
+
+def where(condition_text: str) -> dict:
+    """Parse a WHERE condition into its condition tree."""
+    return parse_query(f"MATCH (n) WHERE {condition_text} RETURN n").where_clause.conditions
+
+
+class TestStringOperator:
+    """Test suite for choosing an operator for one predicate."""
+
+    def test_exact_by_default(self):
+        """Test that CONTAINS scans and STARTS WITH checks the index, then scans."""
+        assert string_operator("CONTAINS", "admin") == ("contains_cs",)
+        assert string_operator("STARTS_WITH", "svc") == ("hasprefix_cs", "startswith_cs")
+
+    def test_other_literals_scan_case_sensitively(self):
+        """Test that non-terms, short terms and suffixes use _cs scans."""
+        assert string_operator("CONTAINS", "corp\\admin") == ("contains_cs",)
+        assert string_operator("STARTS_WITH", "ab") == ("startswith_cs",)
+        assert string_operator("STARTS_WITH", "svc-") == ("startswith_cs",)
+        assert string_operator("ENDS_WITH", "admin") == ("endswith_cs",)
+
+    def test_approximate_uses_whole_terms(self):
+        """Test that approximate matching looks whole terms up in the index."""
+        assert string_operator("CONTAINS", "admin", approximate=True) == ("has_cs",)
+        assert string_operator("CONTAINS", "a-b", approximate=True) == ("contains_cs",)
+        assert string_operator("STARTS_WITH", "svc", approximate=True) == (
+            "hasprefix_cs",
+            "startswith_cs",
+        )
+
+    def test_choice_is_cheapest(self):
+        """Test that term operators are cheaper than the scans they replace."""
+        assert STRING_OPERATOR_COSTS["has_cs"] < STRING_OPERATOR_COSTS["contains_cs"]
+        assert STRING_OPERATOR_COSTS["hasprefix_cs"] < STRING_OPERATOR_COSTS["startswith_cs"]
+        assert STRING_OPERATOR_COSTS["contains_cs"] < STRING_OPERATOR_COSTS["contains"]
+
+    def test_unknown_operator(self):
+        """Test that other operators are rejected."""
+        with pytest.raises(ValueError):
+            string_operator("=", "admin")
+
+
+class TestSelectStringOperators:
+    """Test suite for rewriting condition trees."""
+
+    def test_nested_predicates_rewritten(self):
+        """Test that predicates are rewritten at any depth without changing the input."""
+        conditions = where("n.a = 'admin' AND NOT (n.b CONTAINS 'admin' OR n.c ENDS WITH 'x')")
+
+        selected = select_string_operators(conditions)
+
+        negated = selected["operands"][1]["operands"][0]["operands"]
+        assert [operand["operator"] for operand in negated] == ["CONTAINS_CS", "ENDSWITH_CS"]
+        assert selected["operands"][0] == conditions["operands"][0]
+        assert conditions["operands"][1]["operands"][0]["operands"][0]["operator"] == "CONTAINS"
+
+    def test_prefix_becomes_conjunction(self):
+        """Test that an indexed prefix check is ANDed with the exact scan."""
+        selected = select_string_operators(where("n.a STARTS WITH 'svc'"))
+
+        assert selected["type"] == "logical" and selected["operator"] == "AND"
+        assert [operand["operator"] for operand in selected["operands"]] == [
+            "HASPREFIX_CS",
+            "STARTSWITH_CS",
+        ]
+        assert all(operand["right"]["value"] == "svc" for operand in selected["operands"])
+
+    def test_approximate_contains(self):
+        """Test that has_cs is only chosen when approximate matching is allowed."""
+        conditions = where("n.a CONTAINS 'admin'")
+
+        assert select_string_operators(conditions)["operator"] == "CONTAINS_CS"
+        assert select_string_operators(conditions, approximate=True)["operator"] == "HAS_CS"
+
+    def test_non_literal_operands_unchanged(self):
+        """Test that predicates against properties keep their operator."""
+        conditions = where("n.a CONTAINS n.b")
+
+        assert select_string_operators(conditions) == conditions
@@ -0,0 +1,92 @@
+"""Tests for time-window filter construction."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from yellowstone.models import TranslationContext
+from yellowstone.translator.time_window import (
+    context_window_key,
+    format_datetime,
+    format_timespan,
+    parse_timespan,
+    time_window_predicate,
+)
+
+
+def make_context(**kwargs) -> TranslationContext:
+    """Create a translation context with the given time settings."""
+    return TranslationContext(user_id="u", tenant_id="t", permissions=[], **kwargs)
+
+
+class TestFormatting:
+    """Test suite for KQL timespan and datetime literals."""
+
+    def test_format_timespan_uses_largest_whole_unit(self):
+        """Test timespan formatting."""
+        assert format_timespan(timedelta(days=7)) == "7d"
+        assert format_timespan(timedelta(hours=36)) == "36h"
+        assert format_timespan(timedelta(minutes=90)) == "90m"
+        assert format_timespan(timedelta(seconds=45)) == "45s"
+        assert format_timespan(timedelta(milliseconds=1500)) == "1500ms"
+
+    def test_parse_timespan(self):
+        """Test timespan parsing, the inverse of formatting."""
+        assert parse_timespan("7d") == timedelta(days=7)
+        assert parse_timespan("1.5h") == timedelta(minutes=90)
+        assert parse_timespan("500ms") == timedelta(milliseconds=500)
+        with pytest.raises(ValueError):
+            parse_timespan("7 days")
+
+    def test_format_datetime_in_utc(self):
+        """Test datetime formatting, including timezone conversion."""
+        assert format_datetime(datetime(2024, 1, 31)) == "datetime(2024-01-31T00:00:00Z)"
+        aware = datetime(2024, 1, 31, 2, 0, tzinfo=timezone(timedelta(hours=2)))
+        assert format_datetime(aware) == "datetime(2024-01-31T00:00:00Z)"
+
+
+class TestTimeWindowPredicate:
+    """Test suite for time_window_predicate."""
+
+    def test_lookback(self):
+        """Test a relative window ending now."""
+        assert (
+            time_window_predicate("TimeGenerated", lookback="7d")
+            == "TimeGenerated between (ago(7d) .. now())"
+        )
+
+    def test_time_range_takes_precedence(self):
+        """Test that an absolute range wins over a lookback."""
+        predicate = time_window_predicate(
+            "TimeGenerated",
+            lookback="7d",
+            time_range=(datetime(2024, 1, 1), datetime(2024, 1, 2)),
+        )
+
+        assert predicate == (
+            "TimeGenerated between "
+            "(datetime(2024-01-01T00:00:00Z) .. datetime(2024-01-02T00:00:00Z))"
+        )
+
+    def test_no_window(self):
+        """Test that no predicate is built without a window."""
+        assert time_window_predicate("TimeGenerated") is None
+
+
+class TestContextWindow:
+    """Test suite for context time-window settings."""
+
+    def test_context_window_key(self):
+        """Test that distinct windows produce distinct keys."""
+        assert context_window_key(None) == ""
+        assert context_window_key(make_context()) == ""
+        assert context_window_key(make_context(lookback=timedelta(days=1))) == "lookback=1d"
+        assert context_window_key(
+            make_context(time_range=(datetime(2024, 1, 1), datetime(2024, 1, 2)))
+        ).startswith("range=")
+
+    def test_context_rejects_invalid_windows(self):
+        """Test validation of lookback and time range."""
+        with pytest.raises(ValueError):
+            make_context(lookback=timedelta(0))
+        with pytest.raises(ValueError):
+            make_context(time_range=(datetime(2024, 1, 2), datetime(2024, 1, 1)))
@@ -274,7 +274,7 @@ class TestTranslationEdgeCases:
 
         result = self.translator.translate(query)
 
-        assert "distinct" in result.query
+        assert "summarize by n" in result.query
 
     def test_multiple_paths_in_match(self):
         """Test MATCH with multiple disjoint paths."""
@@ -1,6 +1,7 @@
 """Tests for WHERE clause translation."""
 
 import pytest
+from yellowstone.parser import parse_query
 from yellowstone.translator.where_clause import WhereClauseTranslator
 
 
@@ -226,6 +227,161 @@ class TestWhereClauseTranslator:
         assert "and" in result
         assert "or" in result
 
+    def test_translate_parenthesizes_or_inside_and(self):
+        """Test that looser-binding operands are parenthesized."""
+        conditions = parse_query(
+            "MATCH (n) WHERE n.a = 1 AND (n.b = 2 OR n.c = 3) AND NOT n.d = 4 RETURN n"
+        ).where_clause.conditions
+
+        result = self.translator.translate(conditions)
+
+        assert result == "n.a == 1 and (n.b == 2 or n.c == 3) and not(n.d == 4)"
+
+    def test_translate_and_inside_or_needs_no_parentheses(self):
+        """Test that tighter-binding operands are not parenthesized."""
+        conditions = parse_query(
+            "MATCH (n) WHERE n.a = 1 AND n.b = 2 OR n.c = 3 RETURN n"
+        ).where_clause.conditions
+
+        assert self.translator.translate(conditions) == "n.a == 1 and n.b == 2 or n.c == 3"
+
+    def test_translate_legacy_binary_format(self):
+        """Test that left/right logical nodes are still accepted."""
+        conditions = {
+            'type': 'logical',
+            'operator': 'AND',
+            'left': {'type': 'literal', 'value': True, 'value_type': 'boolean'},
+            'right': {
+                'type': 'logical',
+                'operator': 'OR',
+                'left': {'type': 'identifier', 'name': 'a'},
+                'right': {'type': 'identifier', 'name': 'b'},
+            },
+        }
+
+        assert self.translator.translate(conditions) == "true and (a or b)"
+
+    def test_translate_wide_condition(self):
+        """Test that an n-ary node with many operands translates in order."""
+        conditions = {
+            'type': 'logical',
+            'operator': 'OR',
+            'operands': [
+                {'type': 'literal', 'value': i, 'value_type': 'number'}
+                for i in range(50000)
+            ],
+        }
+
+        result = self.translator.translate(conditions)
+
+        assert result.startswith("0 or 1 or 2")
+        assert result.endswith("49998 or 49999")
+
+    def test_translate_deep_condition(self):
+        """Test that deeply nested conditions translate without recursion."""
+        conditions = {'type': 'identifier', 'name': 'x'}
+        for _ in range(20000):
+            conditions = {'type': 'logical', 'operator': 'NOT', 'operands': [conditions]}
+
+        result = self.translator.translate(conditions)
+
+        assert result.startswith("not(not(")
+        assert result.count("not(") == 20000
+
+    def test_translate_in_list(self):
+        """Test translation of IN against a literal list."""
+        conditions = parse_query(
+            "MATCH (n) WHERE n.status IN ['active', 'pending'] RETURN n"
+        ).where_clause.conditions
+
+        assert self.translator.translate(conditions) == "n.status in ('active', 'pending')"
+
+    def test_translate_collapses_equality_sets(self):
+        """Test that equality disjunctions on one property translate to in()."""
+        conditions = parse_query(
+            "MATCH (n) WHERE n.age > 3 AND (n.a = 1 OR n.a = 2 OR n.a = 3) RETURN n"
+        ).where_clause.conditions
+
+        assert self.translator.translate(conditions) == "n.age > 3 and n.a in (1, 2, 3)"
+
+    def test_collapsing_can_be_disabled(self):
+        """Test that in_set_min_size=None keeps equality terms."""
+        translator = WhereClauseTranslator(in_set_min_size=None)
+        conditions = parse_query(
+            "MATCH (n) WHERE n.a = 1 OR n.a = 2 OR n.a = 3 RETURN n"
+        ).where_clause.conditions
+
+        assert translator.translate(conditions) == "n.a == 1 or n.a == 2 or n.a == 3"
+
+    def test_translate_with_bindings_hoists_large_sets(self):
+        """Test that large string sets are hoisted into a datatable."""
+        translator = WhereClauseTranslator(in_set_hoist_threshold=3)
+        conditions = parse_query(
+            "MATCH (f) WHERE f.sha = 'a' OR f.sha = 'b' OR f.sha = 'c' OR f.size IN [1, 2, 3] "
+            "RETURN f"
+        ).where_clause.conditions
+
+        where_kql, bindings = translator.translate_with_bindings(conditions)
+
+        assert where_kql == "f.sha in (in_set_0) or f.size in (in_set_1)"
+        assert bindings == [
+            "let in_set_0 = datatable(value:string)['a', 'b', 'c'];",
+            "let in_set_1 = dynamic([1, 2, 3]);",
+        ]
+
+    def test_translate_with_bindings_keeps_small_sets_inline(self):
+        """Test that sets below the hoist threshold stay inline."""
+        conditions = parse_query(
+            "MATCH (n) WHERE n.a IN ['x', 'y'] RETURN n"
+        ).where_clause.conditions
+
+        where_kql, bindings = self.translator.translate_with_bindings(conditions)
+
+        assert where_kql == "n.a in ('x', 'y')"
+        assert bindings == []
+
+    def test_translate_typed_literals(self):
+        """Test rendering of literals typed against their column's schema type."""
+        when = {"type": "property", "variable": "e", "property": "timestamp"}
+        conditions = {
+            "type": "comparison",
+            "operator": ">",
+            "left": when,
+            "right": {"type": "literal", "value": "2024-01-01", "value_type": "datetime"},
+        }
+        tags = {
+            "type": "comparison",
+            "operator": "=",
+            "left": {"type": "property", "variable": "e", "property": "tags"},
+            "right": {
+                "type": "list",
+                "dynamic": True,
+                "items": [{"type": "literal", "value": 22, "value_type": "int"}],
+            },
+        }
+
+        assert self.translator.translate(conditions) == "e.timestamp > datetime(2024-01-01)"
+        assert self.translator.translate(tags) == "e.tags == dynamic([int(22)])"
+
+    def test_translate_string_operators(self):
+        """Test that Cypher string predicates and chosen KQL operators are emitted."""
+        conditions = parse_query(
+            "MATCH (n) WHERE n.a CONTAINS 'x' AND n.b STARTS WITH 'y' RETURN n"
+        ).where_clause.conditions
+        conditions["operands"][1]["operator"] = "HASPREFIX_CS"
+
+        assert (
+            self.translator.translate(conditions) == "n.a contains_cs 'x' and n.b hasprefix_cs 'y'"
+        )
+
+    def test_translate_parameters(self):
+        """Test that parameters are referenced by name."""
+        conditions = parse_query(
+            "MATCH (n) WHERE n.a = $a AND n.b IN $bs RETURN n"
+        ).where_clause.conditions
+
+        assert self.translator.translate(conditions) == "n.a == cypher_a and n.b in cypher_bs"
+
     def test_translate_raises_on_invalid_condition_type(self):
         """Test that translator raises on unsupported condition type."""
         conditions = {
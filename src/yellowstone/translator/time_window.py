@@ -0,0 +1,122 @@
+"""
+Time-window filters for source tables.
+
+Builds the ``between`` predicates that bound a table's datetime column, so
+Sentinel can prune time-partitioned extents instead of scanning the table's
+full retention. Windows come from the translation context (an absolute range or
+a lookback) or from a table's default lookback in the schema.
+
+Example:
+    >>> time_window_predicate("TimeGenerated", lookback="7d")
+    'TimeGenerated between (ago(7d) .. now())'
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from ..models import TranslationContext
+
+_TIMESPAN_LITERAL = re.compile(r"^(\d+(?:\.\d+)?)(ms|d|h|m|s)$")
+_TIMESPAN_UNITS = {
+    "d": timedelta(days=1),
+    "h": timedelta(hours=1),
+    "m": timedelta(minutes=1),
+    "s": timedelta(seconds=1),
+    "ms": timedelta(milliseconds=1),
+}
+
+
+def format_timespan(span: timedelta) -> str:
+    """Format a timedelta as a KQL timespan literal.
+
+    Args:
+        span: Positive duration
+
+    Returns:
+        Timespan in the largest whole unit (e.g. '7d', '36h', '90s', '1500ms')
+    """
+    milliseconds = round(span.total_seconds() * 1000)
+    for unit, size in (("d", 86_400_000), ("h", 3_600_000), ("m", 60_000), ("s", 1000)):
+        if milliseconds % size == 0:
+            return f"{milliseconds // size}{unit}"
+    return f"{milliseconds}ms"
+
+
+def parse_timespan(literal: str) -> timedelta:
+    """Parse a KQL timespan literal such as those used for default lookbacks.
+
+    Args:
+        literal: Timespan literal (e.g. '7d', '12h', '1.5h', '500ms')
+
+    Returns:
+        Equivalent timedelta
+
+    Raises:
+        ValueError: If the literal is not a number followed by d, h, m, s or ms
+    """
+    match = _TIMESPAN_LITERAL.match(literal or "")
+    if not match:
+        raise ValueError(f"Invalid KQL timespan: {literal!r}")
+    return float(match.group(1)) * _TIMESPAN_UNITS[match.group(2)]
+
+
+def format_datetime(value: datetime) -> str:
+    """Format a datetime as a KQL datetime literal in UTC.
+
+    Naive datetimes are taken to be UTC already.
+
+    Args:
+        value: Point in time
+
+    Returns:
+        KQL literal (e.g. 'datetime(2024-01-31T00:00:00Z)')
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return f"datetime({value.isoformat()}Z)"
+
+
+def time_window_predicate(
+    column: str,
+    lookback: Optional[str] = None,
+    time_range: Optional[tuple[datetime, datetime]] = None,
+) -> Optional[str]:
+    """Build a KQL predicate bounding ``column`` to a time window.
+
+    Args:
+        column: Datetime column name
+        lookback: KQL timespan for a window ending now
+        time_range: Absolute (start, end) window; takes precedence over lookback
+
+    Returns:
+        KQL predicate, or None if no window is given
+    """
+    if time_range is not None:
+        start, end = time_range
+        return f"{column} between ({format_datetime(start)} .. {format_datetime(end)})"
+    if lookback is not None:
+        return f"{column} between (ago({lookback}) .. now())"
+    return None
+
+
+def context_window_key(context: Optional[TranslationContext]) -> str:
+    """Describe the time window requested by a context.
+
+    Translations with different windows differ, so this is folded into cache
+    keys for translated output.
+
+    Args:
+        context: Translation context, or None
+
+    Returns:
+        Stable description of the window, or an empty string if none is set
+    """
+    if context is None:
+        return ""
+    if context.time_range is not None:
+        start, end = context.time_range
+        return f"range={format_datetime(start)}..{format_datetime(end)}"
+    if context.lookback is not None:
+        return f"lookback={format_timespan(context.lookback)}"
+    return ""
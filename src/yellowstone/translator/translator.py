@@ -185,7 +185,7 @@ class CypherToKQLTranslator:
 
         # Check for variable-length paths
         has_var_length = any(
-            any(rel.variable for rel in path.relationships)
+            any(rel.length for rel in path.relationships)
             for path in query.match_clause.paths
         )
 
@@ -211,7 +211,10 @@ class CypherToKQLTranslator:
         }
 
     def _count_conditions(self, conditions: dict) -> int:
-        """Recursively count conditions in WHERE clause.
+        """Count comparison and function conditions in a WHERE clause.
+
+        The tree is walked with an explicit stack, so very deep condition
+        trees do not hit the recursion limit.
 
         Args:
             conditions: Conditions dictionary
@@ -219,18 +222,19 @@ class CypherToKQLTranslator:
         Returns:
             Count of condition nodes
         """
-        if not conditions:
-            return 0
+        count = 0
+        stack = [conditions] if conditions else []
 
-        condition_type = conditions.get("type")
+        while stack:
+            node = stack.pop()
+            condition_type = node.get("type")
 
-        if condition_type == "logical":
-            operands = conditions.get("operands", [])
-            return sum(self._count_conditions(op) for op in operands)
-        elif condition_type in ("comparison", "function"):
-            return 1
-        else:
-            return 0
+            if condition_type == "logical":
+                stack.extend(op for op in node.get("operands", []) if op)
+            elif condition_type in ("comparison", "function"):
+                count += 1
+
+        return count
 
     def _has_aggregation_functions(self, return_clause: ReturnClause) -> bool:
         """Check if RETURN clause has aggregation functions.
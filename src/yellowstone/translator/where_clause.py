@@ -6,17 +6,44 @@ Handles translation of WHERE clause conditions, including:
 - Logical operators (AND becomes 'and', OR becomes 'or')
 - Property access and literals
 - Complex nested expressions
+- Equality sets (x = 'a' OR x = 'b' OR ... and x IN [...]) as ``in``, with
+  large sets hoisted into ``let`` statements
+- Literals typed against their column's schema type (datetime(), int(), real())
+- String predicates on the term index (has_cs, hasprefix_cs) where possible
+- Query parameters ($name) as references to declared KQL query parameters
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from ..parser.ast_nodes import Identifier, Literal, Property
+from .condition_optimizer import DEFAULT_IN_SET_MIN_SIZE, collapse_equality_sets
+from .query_parameters import kql_parameter_name
+from .string_operators import STRING_OPERATOR_COSTS
+
+# Binding strength of KQL logical operators; leaves and not() never need parentheses
+_LOGICAL_STRENGTH = {"OR": 1, "AND": 2}
+_ATOMIC = 3
 
 
 class WhereClauseTranslator:
     """Translates Cypher WHERE clauses to KQL where conditions."""
 
-    def __init__(self) -> None:
-        """Initialize the WHERE clause translator."""
+    def __init__(
+        self,
+        in_set_min_size: Optional[int] = DEFAULT_IN_SET_MIN_SIZE,
+        in_set_hoist_threshold: Optional[int] = 64,
+    ) -> None:
+        """Initialize the WHERE clause translator.
+
+        Args:
+            in_set_min_size: Minimum number of values for an equality
+                disjunction on one property to be collapsed into ``in``
+                (None disables collapsing)
+            in_set_hoist_threshold: Minimum number of values for an ``in`` set
+                to be hoisted into a ``let`` statement by
+                ``translate_with_bindings`` (None disables hoisting)
+        """
+        self.in_set_min_size = in_set_min_size
+        self.in_set_hoist_threshold = in_set_hoist_threshold
         self.operator_mapping = {
             "=": "==",
             "!=": "!=",
@@ -28,14 +55,23 @@ class WhereClauseTranslator:
             "OR": "or",
             "NOT": "not",
             "IN": "in",
-            "CONTAINS": "contains",
-            "STARTS_WITH": "startswith",
-            "ENDS_WITH": "endswith",
+            # Cypher string predicates are case-sensitive
+            "CONTAINS": "contains_cs",
+            "STARTS_WITH": "startswith_cs",
+            "ENDS_WITH": "endswith_cs",
         }
+        # KQL string operators chosen by select_string_operators; Cypher's own
+        # predicate names keep their case-sensitive mapping
+        for name in STRING_OPERATOR_COSTS:
+            if name.isidentifier():
+                self.operator_mapping.setdefault(name.upper(), name)
 
     def translate(self, conditions: Dict[str, Any]) -> str:
         """Translate WHERE clause conditions to KQL filter expression.
 
+        Value sets are always written inline; use ``translate_with_bindings``
+        to hoist large sets into ``let`` statements.
+
         Args:
             conditions: The conditions dictionary from WhereClause AST node.
                        Nested dictionary structure representing predicate tree.
@@ -47,19 +83,104 @@ class WhereClauseTranslator:
             ValueError: If conditions structure is invalid or unsupported
             KeyError: If required condition fields are missing
         """
+        return self._translate_root(conditions, None)
+
+    def translate_with_bindings(
+        self, conditions: Dict[str, Any], bindings: Optional[list[str]] = None
+    ) -> tuple[str, list[str]]:
+        """Translate WHERE clause conditions, hoisting large value sets.
+
+        ``in`` sets with at least ``in_set_hoist_threshold`` values are moved
+        into ``let`` statements, which must be placed before the tabular
+        expression that uses the returned filter:
+
+            let in_set_0 = datatable(value:string)['a', 'b', ...];
+            ...
+            | where f.sha in (in_set_0)
+
+        String sets become single-column datatables; other sets become
+        dynamic arrays.
+
+        Args:
+            conditions: The conditions dictionary from WhereClause AST node
+            bindings: Let statements from earlier filters of the same query;
+                new statements are appended so their names stay unique
+
+        Returns:
+            Tuple of (KQL where condition string, list of let statements)
+
+        Raises:
+            ValueError: If conditions structure is invalid or unsupported
+            KeyError: If required condition fields are missing
+        """
+        if bindings is None:
+            bindings = []
+        return self._translate_root(conditions, bindings), bindings
+
+    def _translate_root(self, conditions: Dict[str, Any], bindings: Optional[list[str]]) -> str:
+        """Validate, optimize, and translate a condition tree."""
         if not conditions:
             return ""
 
         if not isinstance(conditions, dict):
             raise ValueError(f"Conditions must be dictionary, got {type(conditions)}")
 
-        return self._translate_condition(conditions)
+        if self.in_set_min_size is not None:
+            conditions = collapse_equality_sets(conditions, self.in_set_min_size)
+
+        return self._translate_condition(conditions, bindings)
 
-    def _translate_condition(self, condition: Dict[str, Any]) -> str:
-        """Recursively translate a condition node.
+    def _translate_condition(
+        self, condition: Dict[str, Any], bindings: Optional[list[str]] = None
+    ) -> str:
+        """Translate a condition node.
+
+        Logical nodes are expanded with an explicit work stack instead of
+        recursion, so arbitrarily deep or wide condition trees translate
+        without hitting the recursion limit. Leaf nodes (comparisons,
+        properties, literals, ...) are translated directly.
 
         Args:
             condition: A condition dictionary with 'type' field
+            bindings: Collects hoisted ``let`` statements, or None to keep
+                value sets inline
+
+        Returns:
+            KQL expression string
+
+        Raises:
+            ValueError: If condition type is unsupported
+        """
+        # Work items are (node, operands); operands is None until the node's
+        # children have been scheduled. Results are (kql, binding strength).
+        work: list[tuple[Dict[str, Any], Any]] = [(condition, None)]
+        results: list[tuple[str, int]] = []
+
+        while work:
+            node, operands = work.pop()
+
+            if operands is not None:
+                count = len(operands)
+                parts = results[-count:]
+                del results[-count:]
+                results.append(self._join_logical(node["operator"].upper(), parts))
+            elif node.get("type") == "logical":
+                operands = self._logical_operands(node)
+                work.append((node, operands))
+                work.extend((operand, None) for operand in reversed(operands))
+            else:
+                results.append((self._translate_leaf(node, bindings), _ATOMIC))
+
+        return results[0][0]
+
+    def _translate_leaf(
+        self, condition: Dict[str, Any], bindings: Optional[list[str]] = None
+    ) -> str:
+        """Translate a non-logical condition node.
+
+        Args:
+            condition: A condition dictionary with 'type' field
+            bindings: Collects hoisted ``let`` statements, or None
 
         Returns:
             KQL expression string
@@ -70,25 +191,32 @@ class WhereClauseTranslator:
         condition_type = condition.get("type")
 
         if condition_type == "comparison":
-            return self._translate_comparison(condition)
-        elif condition_type == "logical":
-            return self._translate_logical(condition)
+            return self._translate_comparison(condition, bindings)
+        elif condition_type == "list":
+            return self._translate_list(condition)
         elif condition_type == "property":
             return self._translate_property(condition)
         elif condition_type == "literal":
             return self._translate_literal(condition)
         elif condition_type == "identifier":
             return self._translate_identifier(condition)
+        elif condition_type == "parameter":
+            # Declared under its KQL name with declare query_parameters
+            return kql_parameter_name(condition["name"])
         elif condition_type == "function":
             return self._translate_function(condition)
         else:
             raise ValueError(f"Unsupported condition type: {condition_type}")
 
-    def _translate_comparison(self, condition: Dict[str, Any]) -> str:
+    def _translate_comparison(
+        self, condition: Dict[str, Any], bindings: Optional[list[str]] = None
+    ) -> str:
         """Translate comparison expression (e.g., n.name = 'John').
 
         Args:
             condition: Comparison condition with 'operator', 'left', 'right'
+            bindings: Collects hoisted ``let`` statements for large ``in``
+                sets, or None to keep them inline
 
         Returns:
             KQL comparison expression (e.g., "n.name == 'John'")
@@ -103,10 +231,63 @@ class WhereClauseTranslator:
         kql_operator = self.operator_mapping.get(operator, operator)
 
         left = self._translate_condition(condition["left"])
-        right = self._translate_condition(condition["right"])
+
+        right_condition = condition["right"]
+        if (
+            bindings is not None
+            and operator == "IN"
+            and right_condition.get("type") == "list"
+            and self.in_set_hoist_threshold is not None
+            and len(right_condition.get("items", [])) >= self.in_set_hoist_threshold
+        ):
+            right = f"({self._hoist_list(right_condition, bindings)})"
+        else:
+            right = self._translate_condition(right_condition)
 
         return f"{left} {kql_operator} {right}"
 
+    def _translate_list(self, condition: Dict[str, Any]) -> str:
+        """Translate a list of values as a parenthesized ``in`` operand.
+
+        Args:
+            condition: List condition with 'items' field
+
+        Returns:
+            KQL value list (e.g., "('a', 'b')")
+
+        Raises:
+            KeyError: If required fields are missing
+        """
+        if "items" not in condition:
+            raise KeyError("List condition requires 'items' field")
+
+        values = ", ".join(self._translate_leaf(item) for item in condition["items"])
+        if condition.get("dynamic"):
+            # Compared with an array column (see type_literals)
+            return f"dynamic([{values}])"
+        return f"({values})"
+
+    def _hoist_list(self, condition: Dict[str, Any], bindings: list[str]) -> str:
+        """Move a list of values into a ``let`` statement.
+
+        Args:
+            condition: List condition with 'items' field
+            bindings: Let statements collected so far; the new one is appended
+
+        Returns:
+            Name bound by the new let statement
+        """
+        items = condition["items"]
+        values = ", ".join(self._translate_leaf(item) for item in items)
+        name = f"in_set_{len(bindings)}"
+
+        if all(item.get("value_type") == "string" for item in items):
+            bindings.append(f"let {name} = datatable(value:string)[{values}];")
+        else:
+            bindings.append(f"let {name} = dynamic([{values}]);")
+
+        return name
+
     def _translate_logical(self, condition: Dict[str, Any]) -> str:
         """Translate logical expression (AND, OR, NOT).
 
@@ -120,36 +301,66 @@ class WhereClauseTranslator:
         Raises:
             KeyError: If required fields are missing
         """
+        return self._translate_condition(condition)
+
+    def _logical_operands(self, condition: Dict[str, Any]) -> list:
+        """Validate a logical condition and return its operands.
+
+        Args:
+            condition: Logical condition with 'operator' and either 'operands' (list)
+                      or 'left'/'right' (binary format)
+
+        Returns:
+            List of operand condition dictionaries
+
+        Raises:
+            KeyError: If required fields are missing
+            ValueError: If the operand list is empty or NOT is not unary
+        """
         if "operator" not in condition:
             raise KeyError("Logical condition requires 'operator' field")
 
-        operator = condition["operator"].upper()
-        kql_operator = self.operator_mapping.get(operator, operator.lower())
-
         # Handle both formats: operands list or left/right binary
-        operands = []
         if "operands" in condition:
             operands = condition["operands"]
             if not isinstance(operands, list) or len(operands) == 0:
                 raise ValueError("Logical condition operands must be non-empty list")
         elif "left" in condition and "right" in condition:
-            # Binary format from parser (left, right)
+            # Legacy binary format (left, right)
             operands = [condition["left"], condition["right"]]
         else:
             raise KeyError("Logical condition requires either 'operands' or 'left'/'right' fields")
 
-        # Handle NOT specially (unary operator)
+        if condition["operator"].upper() == "NOT" and len(operands) != 1:
+            raise ValueError("NOT operator requires exactly one operand")
+
+        return operands
+
+    def _join_logical(self, operator: str, parts: list[tuple[str, int]]) -> tuple[str, int]:
+        """Combine translated operands under a logical operator.
+
+        Operands that bind more loosely than the operator (an 'or' inside an
+        'and') are parenthesized.
+
+        Args:
+            operator: Upper-case logical operator
+            parts: Translated operands with their binding strengths
+
+        Returns:
+            Combined KQL expression and its binding strength
+        """
         if operator == "NOT":
-            if len(operands) != 1:
-                raise ValueError("NOT operator requires exactly one operand")
-            operand = self._translate_condition(operands[0])
-            return f"not({operand})"
-
-        # Handle AND, OR (binary or multi-way operators)
-        translated_operands = [
-            self._translate_condition(operand) for operand in operands
-        ]
-        return f" {kql_operator} ".join(translated_operands)
+            return f"not({parts[0][0]})", _ATOMIC
+
+        kql_operator = self.operator_mapping.get(operator, operator.lower())
+        strength = _LOGICAL_STRENGTH.get(operator, _ATOMIC)
+        return (
+            f" {kql_operator} ".join(
+                f"({kql})" if part_strength < strength else kql
+                for kql, part_strength in parts
+            ),
+            strength,
+        )
 
     def _translate_property(self, condition: Dict[str, Any]) -> str:
         """Translate property access (e.g., n.name).
@@ -178,7 +389,8 @@ class WhereClauseTranslator:
             condition: Literal condition with 'value' and 'value_type' fields
 
         Returns:
-            KQL literal representation (strings quoted, numbers unquoted)
+            KQL literal representation (strings quoted, numbers unquoted, and
+            values typed by type_literals wrapped in datetime(), int() or real())
 
         Raises:
             KeyError: If required fields are missing
@@ -199,6 +411,8 @@ class WhereClauseTranslator:
             return "true" if value else "false"
         elif value_type == "null":
             return "null"
+        elif value_type in ("datetime", "int", "real"):
+            return f"{value_type}({value})"
         else:
             raise ValueError(f"Unsupported literal type: {value_type}")
 
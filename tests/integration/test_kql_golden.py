@@ -0,0 +1,151 @@
+"""
+Golden tests for generated KQL.
+
+Each query in CORPUS is translated and compared byte for byte with its file in
+``golden/``. The corpus is also translated in subprocesses under different
+``PYTHONHASHSEED`` values, which must all produce the same bytes: set or dict
+ordering leaking into the text would break downstream query caches.
+
+To regenerate the golden files after an intended output change, run:
+
+    YELLOWSTONE_UPDATE_GOLDENS=1 pytest tests/integration/test_kql_golden.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import pytest
+from yellowstone import CypherTranslator
+from yellowstone.models import CypherQuery, TranslationContext
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+HASH_SEEDS = ["0", "1", "42", "4242"]
+
+# Name -> (Cypher query, parameters, TranslationContext settings)
+CORPUS = {
+    "multi_hop": (
+        "MATCH (u:User)-[:LOGGED_IN]->(d:Device)-[:CONNECTED_TO]->(ip:IP) "
+        "WHERE u.risk_level = 'High' RETURN ip, u.username, d.device_name",
+        None,
+        {},
+    ),
+    "shared_node": (
+        "MATCH (u:User)-[:LOGGED_IN]->(d:Device), (v:User)-[:LOGGED_IN]->(d) "
+        "RETURN u.username, v.username, d.device_name",
+        None,
+        {},
+    ),
+    "self_join": (
+        "MATCH (a:IP)-[:COMMUNICATES_WITH]->(b:IP) RETURN a, b",
+        None,
+        {},
+    ),
+    "variable_length": (
+        "MATCH (a:IP)-[:COMMUNICATES_WITH*1..3]->(b:IP) "
+        "WHERE a.ip_address = '10.0.0.1' RETURN DISTINCT b.ip_address",
+        None,
+        {},
+    ),
+    "property_map": (
+        "MATCH (u:User {domain: 'corp'})-[r:LOGGED_IN]->(d:Device) "
+        "WHERE u.username = 'x' AND d.risk > 5 RETURN u, d",
+        None,
+        {},
+    ),
+    "aggregation": (
+        "MATCH (e:SecurityEvent) RETURN e.event_type, count(*) AS n",
+        None,
+        {},
+    ),
+    "in_list": (
+        "MATCH (u:User)-[:LOGGED_IN]->(d:Device)<-[:LOGGED_IN]-(v:User) "
+        "WHERE u.username IN ['a', 'b', 'c', 'd'] RETURN v.username",
+        None,
+        {},
+    ),
+    "string_predicates": (
+        "MATCH (u:User)-[:LOGGED_IN]->(d:Device) "
+        "WHERE u.username CONTAINS 'admin' AND d.device_name STARTS WITH 'wks' "
+        "RETURN u.username, d.device_name ORDER BY u.username LIMIT 10",
+        None,
+        {},
+    ),
+    "parameters": (
+        "MATCH (u:User)-[:LOGGED_IN]->(d:Device) "
+        "WHERE u.username = $user AND d.device_name IN $devices RETURN d.device_name",
+        {"user": "alice", "devices": ["ws1", "ws2"]},
+        {},
+    ),
+    "request_properties": (
+        "MATCH (u:User) WHERE u.username = 'alice' RETURN u.username",
+        None,
+        {"results_cache_max_age": timedelta(minutes=5), "take_max_records": 500},
+    ),
+    "minified": (
+        "MATCH (u:User)-[:LOGGED_IN]->(d:Device) "
+        "WHERE u.username = 'a b , c' RETURN u.username, d.device_name",
+        None,
+        {"minify": True},
+    ),
+}
+
+
+def render_corpus() -> dict[str, str]:
+    """Translate every corpus query with a fresh translator."""
+    translator = CypherTranslator(enable_ai=False)
+    rendered = {}
+    for name, (query, parameters, settings) in CORPUS.items():
+        context = TranslationContext(
+            user_id="golden", tenant_id="golden", permissions=["read"], **settings
+        )
+        cypher = CypherQuery(query=query, parameters=parameters or {})
+        rendered[name] = translator.translate(cypher, context).query
+    return rendered
+
+
+@pytest.fixture(scope="module")
+def rendered():
+    """Translate the corpus in this process, updating goldens if requested."""
+    rendered = render_corpus()
+    if os.environ.get("YELLOWSTONE_UPDATE_GOLDENS"):
+        GOLDEN_DIR.mkdir(exist_ok=True)
+        for name, kql in rendered.items():
+            (GOLDEN_DIR / f"{name}.kql").write_bytes(kql.encode() + b"\n")
+    return rendered
+
+
+class TestGoldenKql:
+    """Test suite pinning generated KQL byte for byte."""
+
+    @pytest.mark.parametrize("name", sorted(CORPUS))
+    def test_matches_golden(self, rendered, name):
+        """Test that the translation equals its golden file."""
+        golden = (GOLDEN_DIR / f"{name}.kql").read_bytes()
+        assert rendered[name].encode() + b"\n" == golden
+
+    def test_no_stale_goldens(self):
+        """Test that every golden file belongs to a corpus query."""
+        assert sorted(path.stem for path in GOLDEN_DIR.glob("*.kql")) == sorted(CORPUS)
+
+    def test_stable_across_hash_seeds(self, rendered):
+        """Test that output does not depend on string hash randomization."""
+        for seed in HASH_SEEDS:
+            result = subprocess.run(
+                [sys.executable, __file__],
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                capture_output=True,
+                check=True,
+            )
+            assert json.loads(result.stdout) == rendered, f"PYTHONHASHSEED={seed}"
+
+
+if __name__ == "__main__":
+    print(json.dumps(render_corpus()))
@@ -8,15 +8,20 @@ Tests end-to-end translation from Cypher queries to KQL using all components:
 - Main translator orchestration
 """
 
+import shutil
 import sys
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
+from datetime import datetime, timedelta
+
 import pytest
-from yellowstone import CypherTranslator, TranslationError
+from yellowstone import CypherTranslator, QueryRejectedError, TranslationError
 from yellowstone.models import CypherQuery, KQLQuery, TranslationContext, TranslationStrategy
+from yellowstone.schema.schema_mapper import SchemaMapper
+from yellowstone.translator.guardrails import GuardrailAction, QueryBudget
 
 
 @pytest.fixture
@@ -71,7 +76,8 @@ class TestBasicTranslation:
 
         assert "graph-match" in result.query.lower()
         assert "(n:User)" in result.query
-        assert "-[r:KNOWS]->" in result.query
+        assert "-[r]->" in result.query
+        assert "where r.EdgeType == 'KNOWS'" in result.query
         assert "(m:User)" in result.query
         assert "project n, m" in result.query
 
@@ -82,7 +88,7 @@ class TestBasicTranslation:
         result = translator.translate(cypher, context)
 
         assert "(n:User)" in result.query
-        assert "-[r:KNOWS]-" in result.query
+        assert "(n:User)-[r]-(m:User) where r.EdgeType == 'KNOWS'" in result.query
         assert "(m:User)" in result.query
 
     def test_incoming_relationship(self, translator, context):
@@ -92,7 +98,7 @@ class TestBasicTranslation:
         result = translator.translate(cypher, context)
 
         assert "(n:User)" in result.query
-        assert "<-[r:FOLLOWS]-" in result.query
+        assert "<-[r]-(m:User) where r.EdgeType == 'FOLLOWS'" in result.query
         assert "(m:User)" in result.query
 
 
@@ -148,6 +154,29 @@ class TestWhereClauseTranslation:
         assert "or" in result.query.lower()
         assert "n.role == 'superuser'" in result.query
 
+    def test_where_equality_set_uses_in(self, translator, context):
+        """Test that an OR of equalities on one property becomes in()."""
+        cypher = CypherQuery(
+            query="MATCH (n:User) WHERE n.role = 'a' OR n.role = 'b' OR n.role = 'c' RETURN n"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert "| where n.role in ('a', 'b', 'c')" in result.query
+
+    def test_where_large_value_set_is_hoisted(self, translator, context):
+        """Test that large value sets move into a let datatable before the table."""
+        terms = " OR ".join(f"n.username = 'user{i}'" for i in range(500))
+        cypher = CypherQuery(query=f"MATCH (n:User) WHERE {terms} RETURN n")
+
+        result = translator.translate(cypher, context)
+
+        lines = result.query.split("\n")
+        assert lines[0].startswith("let in_set_0 = datatable(value:string)['user0', 'user1',")
+        assert lines[1] == "IdentityInfo"
+        assert lines[2] == "| where AccountName in (in_set_0)"
+        assert len(result.query) < len(terms)
+
     def test_where_not_equals(self, translator, context):
         """Test WHERE clause with != operator."""
         cypher = CypherQuery(query="MATCH (n:User) WHERE n.status != 'inactive' RETURN n")
@@ -191,7 +220,17 @@ class TestReturnClauseTranslation:
 
         result = translator.translate(cypher, context)
 
-        assert "distinct project n.role" in result.query
+        assert result.query.endswith("| summarize by n_role = n.role")
+
+    def test_return_distinct_order_by(self, translator, context):
+        """Test RETURN DISTINCT with ORDER BY and LIMIT sorts by the grouped column."""
+        cypher = CypherQuery(
+            query="MATCH (n:User) RETURN DISTINCT n.role ORDER BY n.role DESC LIMIT 5"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert result.query.endswith("| summarize by n_role = n.role | top 5 by n_role desc")
 
     def test_return_limit(self, translator, context):
         """Test RETURN with LIMIT."""
@@ -202,12 +241,14 @@ class TestReturnClauseTranslation:
         assert "limit 10" in result.query
 
     def test_return_skip(self, translator, context):
-        """Test RETURN with SKIP (offset)."""
+        """Test RETURN with SKIP (row-number window)."""
         cypher = CypherQuery(query="MATCH (n:User) RETURN n SKIP 5")
 
         result = translator.translate(cypher, context)
 
-        assert "offset 5" in result.query
+        assert result.query.endswith(
+            "| project n | serialize _row = row_number() | where _row > 5 | project-away _row"
+        )
 
     def test_return_order_by_asc(self, translator, context):
         """Test RETURN with ORDER BY ascending."""
@@ -240,9 +281,10 @@ class TestComplexQueries:
         result = translator.translate(cypher, context)
 
         assert "(a:User)" in result.query
-        assert "-[r1:KNOWS]->" in result.query
+        assert "-[r1]->" in result.query
         assert "(b:User)" in result.query
-        assert "-[r2:KNOWS]->" in result.query
+        assert "-[r2]->" in result.query
+        assert "where r1.EdgeType == 'KNOWS' and r2.EdgeType == 'KNOWS'" in result.query
         assert "(c:User)" in result.query
         assert "project a, c" in result.query
 
@@ -261,15 +303,13 @@ class TestComplexQueries:
         # Check all components are present
         assert "graph-match" in result.query.lower()
         assert "(n:User)" in result.query
-        assert "-[r:CREATED]->" in result.query
+        assert "-[r]->" in result.query
+        assert "where r.EdgeType == 'CREATED'" in result.query
         assert "(p:Post)" in result.query
         assert "where" in result.query.lower()
         assert "n.verified" in result.query
         assert "p.published" in result.query
-        assert "project n.name, p.title" in result.query
-        assert "sort by" in result.query.lower()
-        assert "p.created desc" in result.query
-        assert "limit 20" in result.query
+        assert result.query.endswith("| project n.name, p.title | top 20 by p.created desc")
 
     def test_multiple_paths(self, translator, context):
         """Test translation with multiple comma-separated paths."""
@@ -280,9 +320,11 @@ class TestComplexQueries:
         result = translator.translate(cypher, context)
 
         assert "(n:User)" in result.query
-        assert "-[r:KNOWS]->" in result.query
+        assert "-[r]->" in result.query
+        assert "where r.EdgeType == 'KNOWS'" in result.query
         assert "(m:User)" in result.query
-        assert "(n)-[r2:LIKES]->" in result.query
+        assert "(n)-[r2]->" in result.query
+        assert "where r.EdgeType == 'KNOWS' and r2.EdgeType == 'LIKES'" in result.query
         assert "(p:Post)" in result.query
 
 
@@ -397,7 +439,8 @@ class TestEndToEndScenarios:
         assert "graph-match" in result.query.lower()
         assert "(me:User" in result.query
         assert "username: 'alice'" in result.query
-        assert "-[r:FRIENDS]->" in result.query
+        assert "-[r]->" in result.query
+        assert "where r.EdgeType == 'FRIENDS'" in result.query
         assert "(friend:User)" in result.query
         assert "project friend.username, friend.name" in result.query
 
@@ -414,15 +457,13 @@ class TestEndToEndScenarios:
         result = translator.translate(cypher, context)
 
         assert "(u:User)" in result.query
-        assert "-[r:CREATED]->" in result.query
+        assert "-[r]->" in result.query
+        assert "where r.EdgeType == 'CREATED'" in result.query
         assert "(p:Post)" in result.query
         assert "where" in result.query.lower()
         assert "u.status == 'active'" in result.query
         assert "p.views > 100" in result.query
-        assert "project u.username, p.title, p.views" in result.query
-        assert "sort by" in result.query.lower()
-        assert "p.views desc" in result.query
-        assert "limit 10" in result.query
+        assert "project u.username, p.title, p.views | top 10 by p_views desc" in result.query
 
     def test_find_shared_connections(self, translator, context):
         """Test: Find users who share connections."""
@@ -435,10 +476,1173 @@ class TestEndToEndScenarios:
         result = translator.translate(cypher, context)
 
         assert "(a:User)" in result.query
-        assert "-[r1:KNOWS]->" in result.query
+        assert "-[r1]->" in result.query
         assert "(mutual:User)" in result.query
-        assert "<-[r2:KNOWS]-" in result.query
+        assert "<-[r2]-" in result.query
         assert "(b:User)" in result.query
         assert "where" in result.query.lower()
         assert "a.id == 'user123'" in result.query
         assert "project b.name, mutual.name" in result.query
+
+
+class TestPredicatePushdown:
+    """Test that single-variable predicates filter source tables before make-graph."""
+
+    def test_single_variable_predicate_is_pushed_down(self, translator, context):
+        """Test that a mapped predicate becomes a source table filter."""
+        cypher = CypherQuery(query="MATCH (u:User) WHERE u.username = 'alice' RETURN u")
+
+        result = translator.translate(cypher, context)
+
+        assert result.query.split("\n")[:3] == [
+            "IdentityInfo",
+            "| where AccountName == 'alice'",
+            "| make-graph AccountObjectId with_node_id=AccountObjectId",
+        ]
+        assert "u.username" not in result.query
+
+    def test_cross_variable_and_unmapped_predicates_stay_in_graph(self, translator, context):
+        """Test that only pushable conjuncts leave the graph-match filter."""
+        cypher = CypherQuery(
+            query="MATCH (u:User)-[r:LOGGED_IN]->(d:Device) "
+            "WHERE u.username = 'alice' AND u.role = 'admin' AND u.domain = d.device_name "
+            "RETURN u, d"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert "= materialize(IdentityInfo\n| where AccountName == 'alice');" in result.query
+        assert "| where u.role == 'admin' and u.domain == d.device_name" in result.query
+
+    def test_disjunction_on_one_variable_is_pushed_down(self, translator, context):
+        """Test that an OR over one variable's properties is pushed as a whole."""
+        cypher = CypherQuery(
+            query="MATCH (u:User) WHERE u.username = 'a' OR u.email = 'b' RETURN u"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert "| where AccountName == 'a' or AccountUpn == 'b'" in result.query
+        assert "graph-match (u:User)\n| project" in result.query
+
+    def test_shared_table_is_not_filtered(self, translator, context):
+        """Test that predicates stay in the graph when another node uses the same table."""
+        cypher = CypherQuery(
+            query="MATCH (a:User)-[r:KNOWS]->(b:User) WHERE a.username = 'x' RETURN a, b"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert "IdentityInfo\n| make-graph" in result.query
+        assert "| where a.username == 'x'" in result.query
+
+    def test_optional_match_is_not_filtered(self, translator, context):
+        """Test that OPTIONAL MATCH predicates are not pushed down."""
+        cypher = CypherQuery(query="OPTIONAL MATCH (u:User) WHERE u.username = 'x' RETURN u")
+
+        result = translator.translate(cypher, context)
+
+        assert "| where u.username == 'x'" in result.query
+
+    def test_pushdown_can_be_disabled(self, context):
+        """Test that enable_predicate_pushdown=False keeps the graph filter."""
+        translator = CypherTranslator(enable_ai=False, enable_predicate_pushdown=False)
+        cypher = CypherQuery(query="MATCH (u:User) WHERE u.username = 'alice' RETURN u")
+
+        result = translator.translate(cypher, context)
+
+        assert "IdentityInfo\n| make-graph" in result.query
+        assert "| where u.username == 'alice'" in result.query
+
+
+class TestProjectionPruning:
+    """Test that source tables are projected to the columns the query uses."""
+
+    def test_projects_referenced_columns(self, translator, context):
+        """Test that RETURN, ORDER BY and WHERE properties are kept with the node id."""
+        cypher = CypherQuery(
+            query="MATCH (u:User)-[r:LOGGED_IN]->(d:Device) WHERE u.email = d.device_name "
+            "RETURN u.domain, d ORDER BY u.risk_level"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert result.query.split("\n")[:3] == [
+            "let Nodes_IdentityInfo = materialize(IdentityInfo",
+            "| project AccountObjectId, AccountDomain, AccountName, AccountRiskLevel, AccountUpn);",
+            "let Nodes_DeviceInfo = materialize(DeviceInfo);",
+        ]
+
+    def test_pushed_down_columns_are_dropped(self, translator, context):
+        """Test that columns used only by pushed-down filters are not projected."""
+        cypher = CypherQuery(query="MATCH (u:User) WHERE u.username = 'alice' RETURN u.email")
+
+        result = translator.translate(cypher, context)
+
+        assert result.query.split("\n")[:3] == [
+            "IdentityInfo",
+            "| where AccountName == 'alice'",
+            "| project AccountObjectId, AccountUpn",
+        ]
+
+    def test_whole_node_return_is_not_projected(self, translator, context):
+        """Test that returning a whole node keeps every column."""
+        result = translator.translate(CypherQuery(query="MATCH (u:User) RETURN u"), context)
+
+        assert "| project AccountObjectId" not in result.query
+
+    def test_unknown_property_is_not_projected(self, translator, context):
+        """Test that properties without a known column disable pruning for the table."""
+        cypher = CypherQuery(query="MATCH (u:User) RETURN u.role")
+
+        result = translator.translate(cypher, context)
+
+        assert "IdentityInfo\n| make-graph" in result.query
+
+    def test_raw_column_names_are_kept(self, translator, context):
+        """Test that properties naming a table column directly are kept."""
+        cypher = CypherQuery(query="MATCH (u:User) RETURN u.AccountSid")
+
+        result = translator.translate(cypher, context)
+
+        assert "| project AccountObjectId, AccountSid\n" in result.query
+
+    def test_pruning_can_be_disabled(self, context):
+        """Test that enable_projection_pruning=False keeps every column."""
+        translator = CypherTranslator(enable_ai=False, enable_projection_pruning=False)
+        cypher = CypherQuery(query="MATCH (u:User) RETURN u.email")
+
+        result = translator.translate(cypher, context)
+
+        assert "IdentityInfo\n| make-graph" in result.query
+
+
+class TestMultiTableGraph:
+    """Test that multi-label patterns build the graph from every node table."""
+
+    @pytest.fixture
+    def translator(self):
+        """Create a translator that always builds a graph."""
+        return CypherTranslator(enable_ai=False, enable_join_fallback=False)
+
+    def test_edge_table_from_schema_join(self, translator, context):
+        """Test that a relationship becomes an edge table joined on the schema keys."""
+        cypher = CypherQuery(
+            query="MATCH (u:User)-[r:LOGGED_IN]->(d:Device) RETURN u.username, d.device_name"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert result.query.split("\n")[:12] == [
+            "let Nodes_IdentityInfo = materialize(IdentityInfo",
+            "| project AccountObjectId, AccountName);",
+            "let Nodes_DeviceInfo = materialize(DeviceInfo",
+            "| project DeviceId, DeviceName, UserName);",
+            "let Edges_LOGGED_IN = Nodes_IdentityInfo",
+            "| project SourceId = AccountObjectId, JoinKey = AccountName",
+            "| join kind=inner (Nodes_DeviceInfo "
+            "| project TargetId = DeviceId, JoinKey = UserName) on JoinKey",
+            "| project SourceId, TargetId, EdgeType = 'LOGGED_IN';",
+            "Edges_LOGGED_IN",
+            "| make-graph SourceId --> TargetId "
+            "with Nodes_IdentityInfo on AccountObjectId, Nodes_DeviceInfo on DeviceId",
+            "| graph-match (u:User)-[r]->(d:Device) where r.EdgeType == 'LOGGED_IN'",
+            "| project u.username, d.device_name",
+        ]
+
+    def test_relationship_types_are_unioned(self, translator, context):
+        """Test that several relationship types are combined and only their tables read."""
+        cypher = CypherQuery(
+            query="MATCH (u:User)-[:LOGGED_IN]->(d:Device)-[:CONNECTED_TO]->(ip:IP) RETURN u, ip"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert "union Edges_LOGGED_IN, Edges_CONNECTED_TO\n| make-graph" in result.query
+        assert (
+            "with Nodes_IdentityInfo on AccountObjectId, Nodes_DeviceInfo on DeviceId, "
+            "Nodes_NetworkSession on RemoteIp"
+        ) in result.query
+        assert "FileEvents" not in result.query
+
+    def test_filters_apply_per_node_table(self, translator):
+        """Test that pushdown and time windows reach every node table."""
+        cypher = CypherQuery(
+            query="MATCH (d:Device)-[:CONNECTED_TO]->(ip:IP) "
+            "WHERE d.os_platform = 'Windows' AND ip.ip_address = '10.0.0.1' RETURN d, ip"
+        )
+        context = TranslationContext(
+            user_id="u", tenant_id="t", permissions=[], lookback=timedelta(days=7)
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert (
+            "let Nodes_DeviceInfo = materialize(DeviceInfo\n"
+            "| where TimeGenerated between (ago(7d) .. now())\n"
+            "| where OSPlatform == 'Windows');"
+        ) in result.query
+        assert (
+            "let Nodes_NetworkSession = materialize(NetworkSession\n"
+            "| where TimeGenerated between (ago(7d) .. now())\n"
+            "| where RemoteIp == '10.0.0.1');"
+        ) in result.query
+        assert (
+            "graph-match (d:Device)-[e1]->(ip:IP) where e1.EdgeType == 'CONNECTED_TO'\n| project"
+        ) in result.query
+
+    def test_untyped_relationship_across_tables_rejected(self, translator, context):
+        """Test that relationships without schema joins are not built from one table."""
+        cypher = CypherQuery(query="MATCH (u:User)-[r]->(d:Device) RETURN u, d")
+
+        with pytest.raises(TranslationError, match="Cannot build edges"):
+            translator.translate(cypher, context)
+
+    def test_disconnected_nodes_read_every_table(self, translator, context):
+        """Test that patterns without relationships build a graph of every node table."""
+        cypher = CypherQuery(query="MATCH (u:User), (d:Device) RETURN u, d")
+
+        result = translator.translate(cypher, context)
+
+        assert result.query.split("\n")[:4] == [
+            "let Nodes_IdentityInfo = IdentityInfo;",
+            "let Nodes_DeviceInfo = DeviceInfo;",
+            "datatable(SourceId: string, TargetId: string, EdgeType: string) []",
+            "| make-graph SourceId --> TargetId "
+            "with Nodes_IdentityInfo on AccountObjectId, Nodes_DeviceInfo on DeviceId",
+        ]
+
+    def test_relationship_types_constrain_shared_edge_table(self, translator, context):
+        """Test that each hop only matches edges of its own type."""
+        cypher = CypherQuery(
+            query="MATCH (u:User)-[:LOGGED_IN]->(d:Device), (u)-[:OWNS]->(o:Device) "
+            "RETURN u.username, d.device_name, o.device_name"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert "union Edges_LOGGED_IN, Edges_OWNS" in result.query
+        assert (
+            "| graph-match (u:User)-[e1]->(d:Device), (u)-[e2]->(o:Device) "
+            "where e1.EdgeType == 'LOGGED_IN' and e2.EdgeType == 'OWNS'\n"
+        ) in result.query
+
+
+class TestJoinFallback:
+    """Test that join pipelines replace make-graph when the cost model favors them."""
+
+    EVENT_CHAIN = (
+        "MATCH (u:User)-[:LOGGED_IN]->(d:Device)-[:CONNECTED_TO]->(ip:IP) "
+        "WHERE u.username = 'alice' AND u.risk_level = d.os_platform RETURN u.username, ip"
+    )
+
+    def test_large_tables_use_joins(self, translator, context):
+        """Test that chains over event tables become ordered shuffle joins."""
+        result = translator.translate(CypherQuery(query=self.EVENT_CHAIN), context)
+
+        assert result.strategy == TranslationStrategy.FALLBACK
+        assert "make-graph" not in result.query
+        assert result.query.split("\n")[-5:] == [
+            "Match_u",
+            "| join kind=inner hint.strategy=shuffle (Match_d) "
+            "on $left.u_AccountName == $right.d_UserName",
+            "| join kind=inner hint.strategy=shuffle (Match_ip) "
+            "on $left.d_DeviceId == $right.ip_DeviceId",
+            "| where u.risk_level == d.os_platform",
+            "| project u.username, ip | limit 1000",
+        ]
+        assert "let Match_u = IdentityInfo\n| where AccountName == 'alice'" in result.query
+        assert "let Match_ip = NetworkSession\n| project ip = pack_all()" in result.query
+
+    def test_property_values_survive_the_join(self, translator, context):
+        """Test that properties read after the joins are packed under their Cypher names."""
+        result = translator.translate(CypherQuery(query=self.EVENT_CHAIN), context)
+        match_u = result.query.split("let Match_d")[0]
+
+        assert result.strategy == TranslationStrategy.FALLBACK
+        assert match_u.split("\n")[-3:] == [
+            "| extend risk_level = AccountRiskLevel, username = AccountName",
+            "| project u = pack_all(), u_AccountName = AccountName;",
+            "",
+        ]
+        assert "| extend os_platform = OSPlatform\n| project d = pack_all()" in result.query
+        assert "| where u.risk_level == d.os_platform" in result.query
+        assert result.query.endswith("| project u.username, ip | limit 1000")
+
+    def test_joins_are_cheaper_than_graph(self, translator, context):
+        """Test that the join pipeline is only chosen with a lower estimate."""
+        graph_only = CypherTranslator(enable_ai=False, enable_join_fallback=False)
+        cypher = CypherQuery(query=self.EVENT_CHAIN)
+
+        joined = translator.translate(cypher, context)
+        graph = graph_only.translate(cypher, context)
+
+        assert graph.strategy == TranslationStrategy.FAST_PATH
+        assert joined.estimated_execution_time_ms < graph.estimated_execution_time_ms
+
+    def test_small_tables_keep_graph(self, translator, context):
+        """Test that entity-table patterns still use make-graph."""
+        result = translator.translate(
+            CypherQuery(query="MATCH (u:User)-[:LOGGED_IN]->(d:Device) RETURN u, d"), context
+        )
+
+        assert result.strategy == TranslationStrategy.FAST_PATH
+        assert "make-graph" in result.query
+
+
+class TestAggregation:
+    """Test that aggregates become summarize, on the source table where possible."""
+
+    def test_single_node_count_reads_table(self, translator, context):
+        """Test that counting one label summarizes its table without make-graph."""
+        result = translator.translate(
+            CypherQuery(query="MATCH (e:SecurityEvent) RETURN count(*)"), context
+        )
+
+        assert result.query.split("\n") == [
+            "SecurityEvent",
+            "| summarize count() | limit 1000",
+        ]
+
+    def test_group_keys_are_mapped_columns(self, translator, context):
+        """Test that grouping properties and filters use the table's columns."""
+        query = (
+            "MATCH (u:User) WHERE u.risk_level = 'high' "
+            "RETURN u.domain, count(u) AS users ORDER BY users DESC LIMIT 5"
+        )
+
+        result = translator.translate(CypherQuery(query=query), context)
+
+        assert result.query.split("\n") == [
+            "IdentityInfo",
+            "| where AccountRiskLevel == 'high'",
+            "| summarize users = count() by u_domain = AccountDomain | top 5 by users desc",
+        ]
+
+    def test_relationship_patterns_summarize_matches(self, translator, context):
+        """Test that aggregates over paths summarize after graph-match."""
+        query = "MATCH (u:User)-[:LOGGED_IN]->(d:Device) RETURN u.username, count(d) AS devices"
+
+        result = translator.translate(CypherQuery(query=query), context)
+
+        assert "make-graph" in result.query
+        assert result.query.endswith(
+            "| graph-match (u:User)-[e1]->(d:Device) where e1.EdgeType == 'LOGGED_IN'\n"
+            "| summarize devices = count() by u_username = u.username"
+        )
+
+    def test_pushdown_can_be_disabled(self, context):
+        """Test that disabling the pushdown keeps the graph translation."""
+        graph_only = CypherTranslator(enable_ai=False, enable_aggregation_pushdown=False)
+
+        result = graph_only.translate(
+            CypherQuery(query="MATCH (e:SecurityEvent) RETURN count(*)"), context
+        )
+
+        assert "graph-match" in result.query
+        assert result.query.endswith("| summarize count() | limit 1000")
+
+
+class TestApproximateMode:
+    """Test approximate aggregation and sampling for exploratory queries."""
+
+    QUERY = "MATCH (e:SecurityEvent) RETURN e.event_type, count(DISTINCT e.account) AS accounts"
+
+    @staticmethod
+    def approximate_context(**settings) -> TranslationContext:
+        """Create an approximate-mode context."""
+        return TranslationContext(
+            user_id="u", tenant_id="t", permissions=[], approximate=True, **settings
+        )
+
+    def test_exact_by_default(self, translator, context):
+        """Test that distinct counts are exact and results unmarked by default."""
+        result = translator.translate(CypherQuery(query=self.QUERY), context)
+
+        assert "accounts = count_distinct(Account)" in result.query
+        assert not result.approximate
+        assert result.approximations == []
+
+    def test_dcount_and_sampling(self, translator):
+        """Test dcount accuracy, sampling after filters and the approximation marker."""
+        context = self.approximate_context(
+            dcount_accuracy=2, sample_rows=10_000, lookback=timedelta(days=7)
+        )
+
+        result = translator.translate(CypherQuery(query=self.QUERY), context)
+
+        assert result.query.split("\n") == [
+            "SecurityEvent",
+            "| where TimeGenerated between (ago(7d) .. now())",
+            "| sample 10000",
+            "| summarize accounts = dcount(Account, 2) by e_event_type = Activity",
+        ]
+        assert result.approximate
+        assert result.approximations == ["dcount", "sample"]
+        assert result.confidence == round(0.95 * (1 - 0.004) * (1 - 0.2), 4)
+
+    def test_confidence_follows_dcount_accuracy(self, translator, context):
+        """Test that approximate results carry a lower confidence than exact ones."""
+        cypher = CypherQuery(query=self.QUERY)
+
+        exact = translator.translate(cypher, context)
+        confidences = [
+            translator.translate(cypher, self.approximate_context(dcount_accuracy=level)).confidence
+            for level in (0, None, 4)
+        ]
+
+        assert exact.confidence == 0.95
+        assert confidences == sorted(confidences)
+        assert confidences[1] == round(0.95 * (1 - 0.008), 4)
+        assert all(confidence < exact.confidence for confidence in confidences)
+
+    def test_sampling_lowers_confidence(self, translator):
+        """Test that sampled source tables lower confidence more than dcount alone."""
+        cypher = CypherQuery(query=self.QUERY)
+
+        unsampled = translator.translate(cypher, self.approximate_context())
+        sampled = translator.translate(cypher, self.approximate_context(sample_rows=1_000))
+
+        assert sampled.confidence < unsampled.confidence
+
+    def test_sampling_precedes_graph_construction(self, translator):
+        """Test that every node table is sampled before make-graph."""
+        query = "MATCH (u:User)-[:LOGGED_IN]->(d:Device) RETURN count(DISTINCT d.device_name)"
+
+        result = translator.translate(
+            CypherQuery(query=query), self.approximate_context(sample_rows=500)
+        )
+
+        assert "let Nodes_IdentityInfo = materialize(IdentityInfo\n| sample 500\n" in result.query
+        assert "let Nodes_DeviceInfo = materialize(DeviceInfo\n| sample 500\n" in result.query
+        assert result.query.endswith("| summarize dcount(d.device_name)")
+
+    def test_sampling_lowers_estimate(self, translator, context):
+        """Test that sampled queries are estimated cheaper."""
+        cypher = CypherQuery(query=self.QUERY)
+
+        exact = translator.translate(cypher, context)
+        sampled = translator.translate(cypher, self.approximate_context(sample_rows=1_000))
+
+        assert sampled.estimated_execution_time_ms < exact.estimated_execution_time_ms
+
+    def test_mode_is_part_of_template_key(self, translator, context):
+        """Test that exact and approximate translations are cached separately."""
+        cypher = CypherQuery(query=self.QUERY)
+
+        translator.translate(cypher, self.approximate_context())
+        result = translator.translate(cypher, context)
+
+        assert "count_distinct" in result.query
+
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            {"sample_rows": 100},
+            {"approximate": True, "sample_rows": 0},
+            {"approximate": True, "dcount_accuracy": 5},
+        ],
+    )
+    def test_invalid_settings(self, settings):
+        """Test that sampling requires approximate mode and settings are range-checked."""
+        with pytest.raises(ValueError):
+            TranslationContext(user_id="u", tenant_id="t", permissions=[], **settings)
+
+
+class TestShortestPaths:
+    """Test graph-shortest-paths for shortestPath() and reachability queries."""
+
+    REACHABLE = (
+        "MATCH (a:IP)-[:COMMUNICATES_WITH*1..4]->(b:IP) "
+        "WHERE a.ip_address = '10.0.0.1' RETURN DISTINCT b.ip_address"
+    )
+
+    def test_explicit_shortest_path(self, translator, context):
+        """Test that shortestPath() replaces graph-match and binds the named path."""
+        query = (
+            "MATCH p = shortestPath((a:IP)-[:COMMUNICATES_WITH*..5]->(b:IP)) "
+            "RETURN b.ip_address, p"
+        )
+
+        result = translator.translate(CypherQuery(query=query), context)
+
+        assert "graph-match" not in result.query
+        assert result.query.endswith(
+            "| graph-shortest-paths (a:IP)-[p*1..5]->(b:IP) "
+            "where all(p, EdgeType == 'COMMUNICATES_WITH')\n"
+            "| project b.ip_address, p | limit 1000"
+        )
+
+    def test_reachability_routed_automatically(self, translator, context):
+        """Test that DISTINCT reachability queries avoid path enumeration."""
+        result = translator.translate(CypherQuery(query=self.REACHABLE), context)
+
+        assert "graph-match" not in result.query
+        assert (
+            "| graph-shortest-paths (a:IP)-[e1*1..4]->(b:IP) "
+            "where all(e1, EdgeType == 'COMMUNICATES_WITH')"
+        ) in result.query
+        assert result.query.endswith(
+            "| summarize by b_ip_address = b.ip_address | limit 1000"
+        )
+
+    def test_path_counts_keep_graph_match(self, translator, context):
+        """Test that queries returning a row per path still enumerate paths."""
+        query = "MATCH (a:IP)-[:COMMUNICATES_WITH*1..4]->(b:IP) RETURN a.ip_address, b.ip_address"
+
+        result = translator.translate(CypherQuery(query=query), context)
+
+        assert "| graph-match cycles=none (a:IP)-[e1*1..4]->(b:IP) where" in result.query
+
+    def test_routing_lowers_estimate(self, translator, context):
+        """Test that routing can be disabled and is estimated cheaper."""
+        enumerating = CypherTranslator(enable_ai=False, enable_shortest_paths=False)
+        cypher = CypherQuery(
+            query="MATCH (a:IP)-[:COMMUNICATES_WITH*1..6]->(b:IP) "
+            "WHERE a.ip_address = '10.0.0.1' AND b.ip_address = '10.0.0.9' "
+            "RETURN DISTINCT b.ip_address"
+        )
+
+        routed = translator.translate(cypher, context)
+        enumerated = enumerating.translate(cypher, context)
+
+        assert "graph-match" in enumerated.query
+        assert routed.estimated_execution_time_ms < enumerated.estimated_execution_time_ms
+
+
+class TestPathCycles:
+    """Test the graph-match cycles option for variable-length patterns."""
+
+    QUERY = "MATCH (a:IP)-[:COMMUNICATES_WITH*1..4]->(b:IP) RETURN a.ip_address, b.ip_address"
+
+    def test_variable_length_defaults_to_no_cycles(self, translator, context):
+        """Test that variable-length paths may not revisit nodes by default."""
+        result = translator.translate(CypherQuery(query=self.QUERY), context)
+
+        assert "| graph-match cycles=none (a:IP)" in result.query
+
+    def test_fixed_length_keeps_default(self, translator, context):
+        """Test that fixed-length patterns are emitted without a cycles option."""
+        result = translator.translate(
+            CypherQuery(query="MATCH (u:User)-[:LOGGED_IN]->(d:Device) RETURN u, d"), context
+        )
+
+        assert "cycles=" not in result.query
+
+    def test_context_selects_mode(self, translator):
+        """Test per-query modes from the context, cached separately."""
+        cypher = CypherQuery(query=self.QUERY)
+
+        results = [
+            translator.translate(
+                cypher,
+                TranslationContext(user_id="u", tenant_id="t", permissions=[], path_cycles=mode),
+            ).query
+            for mode in (None, "unique_edges", "all", None)
+        ]
+
+        assert "cycles=none" in results[0] and "cycles=none" in results[3]
+        assert "cycles=unique_edges" in results[1]
+        assert "cycles=all" in results[2]
+
+    def test_invalid_mode(self):
+        """Test that unknown cycles modes are rejected."""
+        with pytest.raises(ValueError, match="path_cycles"):
+            TranslationContext(user_id="u", tenant_id="t", permissions=[], path_cycles="some")
+
+
+class TestGraphSnapshots:
+    """Test that covered patterns read persistent graph snapshots."""
+
+    QUERY = (
+        "MATCH (a:IP)-[:COMMUNICATES_WITH*1..3]->(b:IP) "
+        "WHERE a.ip_address = '10.0.0.1' RETURN a.ip_address, b.ip_address"
+    )
+
+    @pytest.fixture
+    def translator(self, tmp_path):
+        """Create a translator over a schema declaring a network graph model."""
+        default = Path(SchemaMapper._get_default_schema_path())
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(
+            default.read_text()
+            + "graphs:\n"
+            "  NetworkGraph:\n"
+            "    labels: [IP]\n"
+            "    relationships: [COMMUNICATES_WITH]\n"
+            "    snapshots: {hourly: {max_age: 1h}, daily: {max_age: 1d}}\n"
+        )
+        shutil.copy(SchemaMapper.get_statistics_path(str(default)), tmp_path / "schema.stats.yaml")
+        return CypherTranslator(schema_path=str(schema_file), enable_ai=False)
+
+    def test_snapshot_replaces_make_graph(self, translator, context):
+        """Test that the graph is read from a snapshot with all filters on graph-match."""
+        result = translator.translate(CypherQuery(query=self.QUERY), context)
+
+        assert result.query.split("\n") == [
+            "graph('NetworkGraph', 'hourly')",
+            "| graph-match cycles=none (a:IP)-[e1*1..3]->(b:IP) "
+            "where all(e1, EdgeType == 'COMMUNICATES_WITH')",
+            "| where a.ip_address == '10.0.0.1'",
+            "| project a.ip_address, b.ip_address",
+        ]
+        assert result.estimated_scanned_rows == 0
+
+    def test_staleness_threshold(self, translator):
+        """Test that stricter thresholds rebuild the graph, cached separately."""
+        cypher = CypherQuery(query=self.QUERY)
+
+        queries = [
+            translator.translate(
+                cypher,
+                TranslationContext(
+                    user_id="u", tenant_id="t", permissions=[], max_snapshot_staleness=staleness
+                ),
+            ).query
+            for staleness in (timedelta(days=1), timedelta(minutes=5), None)
+        ]
+
+        assert queries[0].startswith("graph('NetworkGraph', 'hourly')")
+        assert "make-graph" in queries[1] and "make-graph" in queries[2]
+
+    def test_uncovered_pattern_builds_graph(self, translator, context):
+        """Test that patterns outside every model keep make-graph."""
+        cypher = CypherQuery(query="MATCH (u:User)-[:KNOWS]->(v:User) RETURN u")
+
+        assert "make-graph" in translator.translate(cypher, context).query
+
+
+class TestSharedSubexpressions:
+    """Test that source tables read more than once are materialized."""
+
+    def test_multi_path_scans_are_shared(self, translator, context):
+        """Test that paths over the same label scan its table once."""
+        cypher = CypherQuery(
+            query="MATCH (u:User)-[:LOGGED_IN]->(d:Device), (v:User)-[:LOGGED_IN]->(d) "
+            "RETURN u.username, v.username, d.device_name"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert result.query.count("IdentityInfo") == 1 + result.query.count("Scan_IdentityInfo")
+        assert "let Scan_IdentityInfo = materialize(IdentityInfo" in result.query
+
+    def test_node_tables_are_materialized_once(self, context):
+        """Test that make-graph node tables are computed once, unless disabled."""
+        cypher = CypherQuery(query="MATCH (a:IP)-[:COMMUNICATES_WITH]->(b:IP) RETURN a, b")
+
+        shared = CypherTranslator(enable_ai=False, enable_join_fallback=False).translate(
+            cypher, context
+        )
+        inlined = CypherTranslator(
+            enable_ai=False, enable_join_fallback=False, enable_materialize=False
+        ).translate(cypher, context)
+
+        assert shared.query.startswith("let Nodes_NetworkSession = materialize(NetworkSession")
+        assert "materialize" not in inlined.query
+
+
+class TestTypedLiterals:
+    """Test that WHERE literals take the schema type of their column."""
+
+    def test_datetime_comparison_keeps_column_left(self, translator, context):
+        """Test that a date string compared with a datetime column becomes a datetime."""
+        cypher = CypherQuery(
+            query="MATCH (e:SecurityEvent) WHERE '2024-01-01' < e.timestamp RETURN e.event_id"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert "| where TimeGenerated > datetime(2024-01-01)" in result.query
+
+    def test_int_in_list(self, translator, context):
+        """Test that IN values compared with an int column are typed."""
+        cypher = CypherQuery(
+            query="MATCH (e:SecurityEvent) WHERE e.event_id IN ['4624', '4625'] "
+            "RETURN e.event_id"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert "| where EventID in (int(4624), int(4625))" in result.query
+
+    def test_typing_can_be_disabled(self, context):
+        """Test that enable_typed_literals=False keeps literals as written."""
+        cypher = CypherQuery(
+            query="MATCH (e:SecurityEvent) WHERE '2024-01-01' < e.timestamp RETURN e.event_id"
+        )
+
+        result = CypherTranslator(enable_ai=False, enable_typed_literals=False).translate(
+            cypher, context
+        )
+
+        assert "| where '2024-01-01' < TimeGenerated" in result.query
+
+
+class TestStringOperators:
+    """Test that string predicates use the term index where they can."""
+
+    def test_exact_by_default(self, translator, context):
+        """Test that CONTAINS scans and STARTS WITH adds a term-index check."""
+        cypher = CypherQuery(
+            query="MATCH (u:User) WHERE u.username CONTAINS 'admin' "
+            "OR u.username STARTS WITH 'svc' OR u.username ENDS WITH 'a-b' RETURN u.username"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert (
+            "| where AccountName contains_cs 'admin' "
+            "or AccountName hasprefix_cs 'svc' and AccountName startswith_cs 'svc' "
+            "or AccountName endswith_cs 'a-b'"
+        ) in result.query
+
+    def test_approximate_contains(self, context):
+        """Test that enable_approximate_contains=True uses has_cs on whole terms."""
+        cypher = CypherQuery(query="MATCH (u:User) WHERE u.username CONTAINS 'admin' RETURN u")
+
+        result = CypherTranslator(enable_ai=False, enable_approximate_contains=True).translate(
+            cypher, context
+        )
+
+        assert "| where AccountName has_cs 'admin'" in result.query
+
+    def test_property_operand_case_sensitive(self, translator, context):
+        """Test that CONTAINS against another property stays case-sensitive."""
+        cypher = CypherQuery(
+            query="MATCH (u:User) WHERE u.username CONTAINS u.domain RETURN u.username"
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert "contains_cs" in result.query
+        assert " contains " not in result.query
+
+
+class TestQueryParameters:
+    """Test that parameters are declared instead of inlined."""
+
+    def test_values_share_one_text(self, translator, context):
+        """Test that executions with different values translate to the same text."""
+        query = "MATCH (u:User) WHERE u.username = $name AND u.domain = $domain RETURN u"
+
+        alice = translator.translate(
+            CypherQuery(query=query, parameters={"name": "alice", "domain": "corp"}), context
+        )
+        bob = translator.translate(
+            CypherQuery(query=query, parameters={"name": "bob", "domain": "corp"}), context
+        )
+
+        assert alice.query == bob.query
+        assert alice.query.startswith(
+            "declare query_parameters(cypher_name:string, cypher_domain:string);\n"
+        )
+        assert "alice" not in alice.query
+        assert (alice.parameters, bob.parameters) == (
+            {"cypher_name": "alice", "cypher_domain": "corp"},
+            {"cypher_name": "bob", "cypher_domain": "corp"},
+        )
+
+    def test_typed_references(self, translator, context):
+        """Test schema-typed parameters in comparisons, IN lists and property maps."""
+        cypher = CypherQuery(
+            query="MATCH (e:SecurityEvent {event_type: $activity}) "
+            "WHERE $since < e.timestamp AND e.event_id IN $ids RETURN e.event_id",
+            parameters={"activity": "logon", "since": "2024-01-01", "ids": [4624, 4625]},
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert result.query.startswith(
+            "declare query_parameters(cypher_activity:string, cypher_since:datetime, "
+            "cypher_ids:dynamic);"
+        )
+        assert "| where TimeGenerated > cypher_since and EventID in cypher_ids" in result.query
+        assert "(e:SecurityEvent {event_type: cypher_activity})" in result.query
+
+    def test_column_and_keyword_names(self, translator, context):
+        """Test that parameters named like columns or keywords are not shadowed."""
+        cypher = CypherQuery(
+            query="MATCH (d:Device) WHERE d.device_id = $DeviceId AND d.device_name = $limit "
+            "RETURN d.device_name",
+            parameters={"DeviceId": "d1", "limit": "ws1"},
+        )
+
+        result = translator.translate(cypher, context)
+
+        assert "DeviceId == cypher_DeviceId and DeviceName == cypher_limit" in result.query
+        assert result.parameters == {"cypher_DeviceId": "d1", "cypher_limit": "ws1"}
+
+    def test_untyped_parameter_fails(self, translator, context):
+        """Test that a parameter that cannot be typed is a translation error."""
+        cypher = CypherQuery(query="MATCH (n) WHERE n.a = $a RETURN n", parameters={"a": None})
+
+        with pytest.raises(TranslationError, match=r"\$a"):
+            translator.translate(cypher, context)
+
+    def test_missing_value_fails(self, translator, context):
+        """Test that a declared parameter without a value is a translation error."""
+        cypher = CypherQuery(query="MATCH (u:User) WHERE u.username = $name RETURN u")
+
+        with pytest.raises(TranslationError, match=r"No value supplied for parameter \$name"):
+            translator.translate(cypher, context)
+
+
+class TestRequestProperties:
+    """Test that context request properties become set statements."""
+
+    def test_set_statements_lead_the_query(self, translator):
+        """Test that set statements precede parameter declarations and the query."""
+        context = TranslationContext(
+            user_id="u",
+            tenant_id="t",
+            permissions=[],
+            results_cache_max_age=timedelta(minutes=1),
+            take_max_records=1000,
+        )
+        cypher = CypherQuery(
+            query="MATCH (u:User) WHERE u.username = $name RETURN u", parameters={"name": "a"}
+        )
+
+        lines = translator.translate(cypher, context).query.split("\n")
+
+        assert lines[:3] == [
+            "set query_results_cache_max_age = time(1m);",
+            "set query_take_max_records = 1000;",
+            "declare query_parameters(cypher_name:string);",
+        ]
+
+    def test_cached_translations_keep_their_own_settings(self, translator, context):
+        """Test that templated translations do not reuse another context's statements."""
+        cypher = CypherQuery(query="MATCH (u:User) WHERE u.username = 'a' RETURN u")
+        cached = TranslationContext(
+            user_id="u", tenant_id="t", permissions=[], results_cache_max_age=timedelta(hours=1)
+        )
+
+        first = translator.translate(cypher, cached)
+        second = translator.translate(cypher, context)
+
+        assert first.query == "set query_results_cache_max_age = time(1h);\n" + second.query
+
+
+class TestCostEstimate:
+    """Test that translations carry a cost estimate."""
+
+    def test_estimate_is_populated(self, translator, context):
+        """Test that every translation reports scanned rows and latency."""
+        result = translator.translate(CypherQuery(query="MATCH (u:User) RETURN u"), context)
+
+        assert result.estimated_scanned_rows == 50000
+        assert result.estimated_execution_time_ms > 0
+
+    def test_estimate_follows_time_window(self, translator):
+        """Test that a shorter window lowers the estimate."""
+        cypher = CypherQuery(query="MATCH (e:SecurityEvent) RETURN e")
+        estimates = [
+            translator.translate(
+                cypher,
+                TranslationContext(user_id="u", tenant_id="t", permissions=[], lookback=window),
+            )
+            for window in (timedelta(days=1), timedelta(days=7))
+        ]
+
+        assert estimates[0].estimated_scanned_rows < estimates[1].estimated_scanned_rows
+        assert (
+            estimates[0].estimated_execution_time_ms < estimates[1].estimated_execution_time_ms
+        )
+
+    def test_estimate_cost_for_admission(self, translator, context):
+        """Test estimating without translating, against the context budget."""
+        cheap = translator.estimate_cost(
+            CypherQuery(query="MATCH (u:User) WHERE u.username = 'a' RETURN u"), context
+        )
+        costly = translator.estimate_cost(
+            CypherQuery(query="MATCH (a:IP)-[*]->(b:IP) RETURN a"), context
+        )
+
+        assert cheap.within_budget(context.max_execution_time_ms)
+        assert not costly.within_budget(context.max_execution_time_ms)
+
+    def test_over_budget_flagged(self, context):
+        """Test that the result records whether its estimate fits the context budget."""
+        translator = CypherTranslator(enable_ai=False, enable_guardrails=False)
+        cheap = translator.translate(
+            CypherQuery(query="MATCH (u:User) WHERE u.username = 'a' RETURN u"), context
+        )
+        costly = translator.translate(
+            CypherQuery(query="MATCH (e:SecurityEvent) RETURN e"), context
+        )
+
+        assert not cheap.over_budget
+        assert costly.over_budget
+        assert costly.estimated_execution_time_ms > context.max_execution_time_ms
+
+    def test_over_budget_refused(self, context):
+        """Test that the context's latency budget refuses queries estimated over it."""
+        translator = CypherTranslator(
+            enable_ai=False,
+            default_budget=QueryBudget(over_budget_action=GuardrailAction.REJECT),
+        )
+        cypher = CypherQuery(
+            query="MATCH p = shortestPath((u:User)-[:LOGGED_IN*]->(d:Device)) RETURN p"
+        )
+
+        with pytest.raises(QueryRejectedError) as excinfo:
+            translator.translate(cypher, context)
+
+        violation = excinfo.value.decision.violations[-1]
+        assert violation.rule == "execution_time"
+        assert violation.details["limit"] == context.max_execution_time_ms
+        assert violation.details["estimate"] > context.max_execution_time_ms
+
+    def test_estimate_cost_rejects_invalid_query(self, translator, context):
+        """Test that unparseable queries raise TranslationError."""
+        with pytest.raises(TranslationError):
+            translator.estimate_cost(CypherQuery(query="MATCH (n RETURN n"), context)
+
+
+class TestGuardrails:
+    """Test that guardrails cap, downgrade or reject queries before translation."""
+
+    def test_unbounded_path_capped(self, translator, context):
+        """Test that unbounded paths are translated with the hop limit."""
+        result = translator.translate(
+            CypherQuery(query="MATCH (a:IP)-[:COMMUNICATES_WITH*]->(b:IP) RETURN a"), context
+        )
+
+        assert "[e1*1..10]" in result.query
+        assert [v.rule for v in result.guardrail_violations] == [
+            "unbounded_path",
+            "execution_time",
+        ]
+
+    def test_cartesian_product_capped_by_default(self, translator, context):
+        """Test that disconnected patterns translate with a row limit and a reason."""
+        result = translator.translate(
+            CypherQuery(query="MATCH (u:User), (d:Device) RETURN u, d"), context
+        )
+
+        assert "graph-match" in result.query
+        assert result.query.endswith("| limit 1000")
+        assert [(v.rule, v.action) for v in result.guardrail_violations] == [
+            ("cartesian_product", GuardrailAction.CAP),
+            ("execution_time", GuardrailAction.CAP),
+        ]
+        assert "cartesian product" in result.guardrail_violations[0].message
+
+    def test_over_context_limit_capped(self, translator, context):
+        """Test that the context's latency limit caps queries without a tenant budget."""
+        result = translator.translate(
+            CypherQuery(query="MATCH (e:SecurityEvent) RETURN e"), context
+        )
+
+        violation = result.guardrail_violations[0]
+        assert result.query.endswith("| limit 1000")
+        assert (violation.rule, violation.action) == ("execution_time", GuardrailAction.CAP)
+        assert violation.details["limit"] == context.max_execution_time_ms
+
+    def test_cartesian_product_rejected(self, context):
+        """Test that rejections raise with the structured decision."""
+        translator = CypherTranslator(
+            enable_ai=False,
+            default_budget=QueryBudget(cartesian_product_action=GuardrailAction.REJECT),
+        )
+        with pytest.raises(QueryRejectedError) as excinfo:
+            translator.translate(
+                CypherQuery(query="MATCH (u:User), (d:Device) RETURN u, d"), context
+            )
+
+        assert isinstance(excinfo.value, TranslationError)
+        assert excinfo.value.decision.violations[0].rule == "cartesian_product"
+
+    def test_tenant_budget(self, context):
+        """Test that each tenant's budget applies to its own queries."""
+        translator = CypherTranslator(
+            enable_ai=False,
+            tenant_budgets={
+                "small": QueryBudget(
+                    max_result_rows=100,
+                    max_execution_time_ms=60_000,
+                    over_budget_action=GuardrailAction.DOWNGRADE,
+                )
+            },
+        )
+        cypher = CypherQuery(query="MATCH (e:SecurityEvent) RETURN e")
+        small = TranslationContext(user_id="u", tenant_id="small", permissions=[])
+
+        downgraded = translator.translate(cypher, small)
+        default = translator.translate(cypher, context)
+
+        assert "ago(4050m)" in downgraded.query
+        assert downgraded.query.endswith("| limit 100")
+        assert downgraded.estimated_execution_time_ms <= 60_000
+        assert "TimeGenerated" not in default.query
+        assert default.query.endswith("| limit 1000")
+        assert [v.rule for v in default.guardrail_violations] == ["execution_time"]
+
+    def test_guardrails_disabled(self, context):
+        """Test that disabled guardrails translate queries unchanged."""
+        translator = CypherTranslator(enable_ai=False, enable_guardrails=False)
+        result = translator.translate(
+            CypherQuery(query="MATCH (u:User), (d:Device) RETURN u, d"), context
+        )
+
+        assert "graph-match (u:User), (d:Device)" in result.query
+
+    def test_unbounded_hops_capped_without_guardrails(self, context):
+        """Test that unbounded paths still get a finite hop range."""
+        translator = CypherTranslator(enable_ai=False, enable_guardrails=False)
+        result = translator.translate(
+            CypherQuery(query="MATCH (a:IP)-[:COMMUNICATES_WITH*]->(b:IP) RETURN b"), context
+        )
+
+        assert "*1..10]" in result.query
+
+
+class TestTimeWindow:
+    """Test that source tables are bounded to a time window before make-graph."""
+
+    def test_context_lookback(self, translator):
+        """Test that a context lookback filters the source table first."""
+        context = TranslationContext(
+            user_id="u", tenant_id="t", permissions=[], lookback=timedelta(hours=12)
+        )
+        cypher = CypherQuery(query="MATCH (u:User) WHERE u.username = 'alice' RETURN u")
+
+        result = translator.translate(cypher, context)
+
+        assert result.query.split("\n")[:3] == [
+            "IdentityInfo",
+            "| where TimeGenerated between (ago(12h) .. now())",
+            "| where AccountName == 'alice'",
+        ]
+
+    def test_context_time_range(self, translator):
+        """Test that an absolute range is emitted as datetime literals."""
+        context = TranslationContext(
+            user_id="u",
+            tenant_id="t",
+            permissions=[],
+            time_range=(datetime(2024, 3, 1), datetime(2024, 3, 2)),
+        )
+        cypher = CypherQuery(query="MATCH (u:User) RETURN u")
+
+        result = translator.translate(cypher, context)
+
+        assert (
+            "| where TimeGenerated between "
+            "(datetime(2024-03-01T00:00:00Z) .. datetime(2024-03-02T00:00:00Z))"
+        ) in result.query
+
+    def test_no_window_by_default(self, translator, context):
+        """Test that the default schema bounds no table when the context sets no window."""
+        for query in ("MATCH (u:User) RETURN u", "MATCH (e:SecurityEvent) RETURN e"):
+            result = translator.translate(CypherQuery(query=query), context)
+
+            assert "TimeGenerated" not in result.query
+
+    def test_schema_default_lookback_opt_in(self, tmp_path, context):
+        """Test that a tenant schema can set a default lookback for its event tables."""
+        default = Path(SchemaMapper._get_default_schema_path())
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text(
+            default.read_text().replace(
+                "    retention_days: 90\n    time_column: TimeGenerated\n",
+                "    retention_days: 90\n    time_column: TimeGenerated\n"
+                "    default_lookback: 7d\n",
+            )
+        )
+        translator = CypherTranslator(schema_path=str(schema_file), enable_ai=False)
+        cypher = CypherQuery(query="MATCH (e:SecurityEvent) RETURN e")
+
+        result = translator.translate(cypher, context)
+        widened = translator.translate(
+            cypher,
+            TranslationContext(
+                user_id="u", tenant_id="t", permissions=[], lookback=timedelta(days=30)
+            ),
+        )
+
+        assert "SecurityEvent\n| where TimeGenerated between (ago(7d) .. now())" in result.query
+        assert "ago(30d)" in widened.query
+
+    def test_window_is_part_of_template_key(self, translator):
+        """Test that cached translations are not shared across windows."""
+        cypher = CypherQuery(query="MATCH (u:User) RETURN u")
+        for hours in (1, 2):
+            context = TranslationContext(
+                user_id="u", tenant_id="t", permissions=[], lookback=timedelta(hours=hours)
+            )
+            result = translator.translate(cypher, context)
+            assert f"ago({hours}h)" in result.query
+
+        assert translator.template_cache.stats().hits == 0
+
+
+class TestParseCaching:
+    """Test that the translator reuses parsed ASTs."""
+
+    def test_repeated_query_hits_parse_cache(self, translator, context):
+        """Test that translating the same query twice hits the parse cache."""
+        cypher = CypherQuery(query="MATCH (n:User) WHERE n.username = 'cache_probe' RETURN n")
+
+        translator.translate(cypher, context)
+        hits_before = translator.parse_cache.stats().hits
+        second = translator.translate(cypher, context)
+
+        assert translator.parse_cache.stats().hits == hits_before + 1
+        assert "graph-match" in second.query
+
+    def test_parse_cache_can_be_disabled(self, context):
+        """Test that the parse cache is optional."""
+        translator = CypherTranslator(enable_ai=False, enable_parse_cache=False)
+        result = translator.translate(CypherQuery(query="MATCH (n:User) RETURN n"), context)
+
+        assert translator.parse_cache is None
+        assert "graph-match" in result.query
+
+
+class TestTemplateCaching:
+    """Test that same-shape queries share one skeleton translation."""
+
+    def test_literal_variants_reuse_skeleton(self, translator, context):
+        """Test that queries differing only in literals hit the template cache."""
+        alice = translator.translate(
+            CypherQuery(query="MATCH (u:User) WHERE u.username = 'alice' RETURN u"), context
+        )
+        bob = translator.translate(
+            CypherQuery(query="MATCH (u:User) WHERE u.username = 'bob' RETURN u"), context
+        )
+
+        assert translator.template_cache.stats().hits == 1
+        assert "'alice'" in alice.query
+        assert "'bob'" in bob.query
+        assert bob.query == alice.query.replace("'alice'", "'bob'")
+
+    def test_hoisted_value_sets_are_templated(self, translator, context):
+        """Test that hoisted sets are filled from the cached skeleton."""
+        def sweep(prefix: str) -> CypherQuery:
+            terms = " OR ".join(f"n.username = '{prefix}{i}'" for i in range(100))
+            return CypherQuery(query=f"MATCH (n:User) WHERE {terms} RETURN n")
+
+        translator.translate(sweep("a"), context)
+        result = translator.translate(sweep("b"), context)
+        direct = CypherTranslator(enable_ai=False, enable_template_cache=False)
+
+        assert translator.template_cache.stats().hits == 1
+        assert result.query == direct.translate(sweep("b"), context).query
+
+    def test_templated_output_matches_direct(self, context):
+        """Test that cached translations equal uncached ones."""
+        query = (
+            "MATCH (u:User {domain: 'corp'})-[r:LOGGED_IN]->(d:Device) "
+            "WHERE u.username = \"o'brien\" AND d.risk > 5 RETURN u, d"
+        )
+        cached = CypherTranslator(enable_ai=False)
+        direct = CypherTranslator(enable_ai=False, enable_template_cache=False)
+
+        cached.translate(CypherQuery(query=query.replace("corp", "warmup")), context)
+        result = cached.translate(CypherQuery(query=query), context)
+
+        assert cached.template_cache.stats().hits == 1
+        assert result.query == direct.translate(CypherQuery(query=query), context).query